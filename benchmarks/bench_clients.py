@@ -0,0 +1,325 @@
+"""
+Benchmark : End-to-End Throughput and Latency of the Clients and Modules.
+
+Runs the `module_utils` sub-clients and the modules against the local Data Plane API stub
+(optionally with an injected latency), for configurations of 10, 1k and 10k objects, and
+reports, per operation : the number of operations, the total time, the throughput and
+the p50 / p95 / p99 latencies. The stub requests and reloads counts close each size.
+
+Modules are run in-process (like AnsiballZ runs them on the target host), per object for
+the single-object modules (limited by --module-runs) and once for the whole set for the
+reconciliation modules (the whole configuration module is timed planning, then applying its plan file).
+
+Usage:
+    python benchmarks/bench_clients.py [--sizes 10,1000,10000] [--latency 0] [--reload-delay 5] [--module-runs 100] [--workers 10]
+"""
+
+import argparse
+import base64
+import contextlib
+import importlib
+import io
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+# Collection Root
+COLLECTION_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+# Make the Collection Plugins importable
+sys.path.insert(0, COLLECTION_ROOT)
+
+from benchmarks.stub_api import StubApi   # noqa: E402
+from plugins.module_utils.haproxy import Client   # noqa: E402
+from plugins.module_utils.models import Acl, Backend, Server   # noqa: E402
+
+# Collection Package (Modules are imported through it, like Ansible does)
+COLLECTION_PACKAGE = "ansible_collections.kube_cloud.haproxy"
+
+# Stub Credentials
+CREDENTIALS = dict(api_version="v2", username="admin", password="admin")
+
+# Row Format
+ROW = "{0:>6} {1:<30} {2:>7} {3:>9} {4:>10} {5:>9} {6:>9} {7:>9}"
+
+
+# Print a Result Row
+def report(size: int, label: str, timings: list, total: float = None, count: int = None):
+
+    # Total Time (Sum of the Operations if not Measured as a Whole)
+    total = total if total is not None else sum(timings)
+
+    # Number of Objects Processed
+    count = count if count is not None else len(timings)
+
+    # Latency Percentiles (Milliseconds)
+    if len(timings) > 1:
+        percentiles = statistics.quantiles(timings, n=100, method="inclusive")
+        p50, p95, p99 = (1000 * percentiles[position] for position in (49, 94, 98))
+    else:
+        p50 = p95 = p99 = 1000 * timings[0]
+
+    # Print Row
+    print(ROW.format(size, label, count, "{0:.3f}".format(total), "{0:.1f}".format(count / total),
+                     "{0:.2f}".format(p50), "{0:.2f}".format(p95), "{0:.2f}".format(p99)))
+
+
+# Time each Call of an Operation
+def measure(size: int, label: str, calls):
+
+    # Operations Timings
+    timings = []
+
+    # Execute Calls
+    for call in calls:
+        started = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - started)
+
+    # Print Result
+    report(size, label, timings)
+
+
+# Time a Bulk Operation (Throughput in Objects per Second)
+def measure_bulk(size: int, label: str, count: int, call):
+
+    # Execute Call
+    started = time.perf_counter()
+    call()
+    elapsed = time.perf_counter() - started
+
+    # Print Result
+    report(size, label, [elapsed], total=elapsed, count=count)
+
+
+# Run a Module in-process and Return its Result
+def run_module(name: str, args: dict):
+
+    # Ansible Module Utilities (imported on use : only the module benchmarks need Ansible)
+    from ansible.module_utils import basic
+
+    # Inject Module Arguments
+    basic._ANSIBLE_ARGS = json.dumps({"ANSIBLE_MODULE_ARGS": args}).encode()
+    basic._ANSIBLE_PROFILE = "legacy"
+
+    # Import Module
+    module = importlib.import_module("{0}.plugins.modules.{1}".format(COLLECTION_PACKAGE, name))
+
+    # Run Module (Result is printed on Standard Output, then the Module exits)
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        try:
+            module.main()
+        except SystemExit:
+            pass
+
+    # Decode Result
+    result = json.loads(output.getvalue())
+
+    # If Module Failed
+    if result.get("failed"):
+        raise RuntimeError("[{0}] - {1}".format(name, result.get("msg")))
+
+    # Return Result
+    return result
+
+
+# Write a (Fake) PEM Certificate File
+def write_certificate(path: str, position: int):
+
+    # Certificate Body (Unique per Position)
+    der = position.to_bytes(8, "big") * 64
+
+    # Write PEM
+    with open(path, "w") as pem:
+        pem.write("-----BEGIN CERTIFICATE-----\n{0}\n-----END CERTIFICATE-----\n".format(base64.b64encode(der).decode()))
+
+
+# Benchmark the Sub-Clients
+def bench_clients(size: int, client: Client, workers: int, directory: str):
+
+    # Names
+    backends = ["app{0}".format(position) for position in range(size)]
+    servers = ["srv{0}".format(position) for position in range(size)]
+
+    # Backends
+    measure(size, "backend.create_backend", [
+        lambda name=name: client.backend.create_backend(backend=Backend(name=name), transaction_id="", force_reload=False)
+        for name in backends
+    ])
+    measure(size, "backend.get_backend", [lambda name=name: client.backend.get_backend(name=name) for name in backends])
+    measure(size, "backend.get_backends", [client.backend.get_backends] * 5)
+
+    # Servers (in a Single Backend)
+    measure(size, "server.create_server", [
+        lambda position=position, name=name: client.server.create_server(
+            server=Server(name=name, address="10.0.{0}.{1}".format(position // 256 % 256, position % 256), port=8080),
+            transaction_id="",
+            parent_name="app0",
+            force_reload=False
+        )
+        for position, name in enumerate(servers)
+    ])
+    measure(size, "server.get_server", [lambda name=name: client.server.get_server(name=name, parent_name="app0") for name in servers])
+    measure(size, "server.get_servers", [lambda: client.server.get_servers(parent_name="app0")] * 5)
+    measure(size, "server.update_server", [
+        lambda name=name: client.server.update_server(
+            name=name,
+            server=Server(name=name, address="10.1.0.1", port=8080, weight=50),
+            transaction_id="",
+            parent_name="app0",
+            force_reload=False
+        )
+        for name in servers
+    ])
+    measure(size, "server.get_runtime_servers", [lambda: client.server.get_runtime_servers(backend="app0")] * 5)
+
+    # Servers Batch (All Updates in a Single Transaction)
+    def batch():
+        with client.transaction.batch(force_reload=True, max_workers=workers) as transaction_batch:
+            for name in servers:
+                transaction_batch.server.update_server(
+                    name=name,
+                    server=Server(name=name, address="10.2.0.1", port=8080, weight=100),
+                    parent_name="app0",
+                    parent_type="backend"
+                )
+    measure_bulk(size, "transaction.batch (update)", size, batch)
+
+    # ACLs (Index-Addressed, in a Single Backend)
+    measure(size, "acl.create_acl", [
+        lambda position=position: client.acl.create_acl(
+            acl=Acl(acl_name="acl{0}".format(position), criterion="path_beg", index=position, value="/{0}".format(position)),
+            transaction_id="",
+            parent_name="app0",
+            force_reload=False
+        )
+        for position in range(size)
+    ])
+    measure(size, "acl.get_acl", [lambda position=position: client.acl.get_acl(index=position, parent_name="app0") for position in range(size)])
+
+    # ACLs List Reconciliation (One ACL Inserted at the Head : a Single Insert, not one Write per Shifted Index)
+    measure_bulk(size, "acl.reconcile_acls (insert)", size, lambda: client.acl.reconcile_acls(
+        acls=[Acl(acl_name="head", criterion="path_beg", index=0, value="/")] + [
+            Acl(acl_name="acl{0}".format(position), criterion="path_beg", index=position + 1, value="/{0}".format(position))
+            for position in range(size)
+        ],
+        transaction_id="",
+        parent_name="app0"
+    ))
+
+    # SSL Certificates
+    certificates = os.path.join(directory, "certificates")
+    os.makedirs(certificates)
+    for position in range(size):
+        write_certificate(os.path.join(certificates, "cert{0}.pem".format(position)), position)
+    measure(size, "ssl_certificate.create", [
+        lambda position=position: client.ssl_certificate.create_certificate(
+            name="cert{0}.pem".format(position),
+            path=os.path.join(certificates, "cert{0}.pem".format(position)),
+            force_reload=False
+        )
+        for position in range(size // 2)
+    ])
+
+    # SSL Certificates Synchronization (the other Half is Missing)
+    measure_bulk(size, "ssl_certificate.sync", size, lambda: client.ssl_certificate.apply_sync(
+        changes=client.ssl_certificate.plan_sync(directory=certificates, max_workers=workers),
+        max_workers=workers
+    ))
+
+    # Servers Deletion
+    measure(size, "server.delete_server", [
+        lambda name=name: client.server.delete_server(name=name, transaction_id="", parent_name="app0", force_reload=False)
+        for name in servers
+    ])
+
+
+# Benchmark the Modules
+def bench_modules(size: int, base_url: str, module_runs: int, workers: int):
+
+    # Module Connection Arguments
+    connection = dict(CREDENTIALS, base_url=base_url)
+
+    # Names
+    servers = ["mod{0}".format(position) for position in range(size)]
+
+    # Server Module (one Run per Server, like a Loop)
+    measure(size, "module server (create)", [
+        lambda name=name: run_module("server", dict(
+            connection,
+            name=name,
+            parent_name="app0",
+            parent_type="backend",
+            address="10.3.0.1",
+            port=8080,
+            state="present",
+            force_reload=False
+        ))
+        for name in servers[:module_runs]
+    ])
+
+    # Servers Module (one Run for all the Servers)
+    measure_bulk(size, "module servers (reconcile)", size, lambda: run_module("servers", dict(
+        connection,
+        parent_name="app0",
+        parent_type="backend",
+        servers=[dict(name=name, address="10.4.0.1", port=8080, weight=10) for name in servers],
+        max_parallel=workers
+    )))
+
+    # Whole Configuration Module (Plan Computed once, then Applied as is)
+    with tempfile.TemporaryDirectory() as directory:
+        configuration = dict(
+            connection,
+            max_parallel=workers,
+            plan_file=os.path.join(directory, "plan.json"),
+            backends=[dict(name="cfg0", servers=[dict(name=name, address="10.5.0.1", port=8080) for name in servers])]
+        )
+        measure_bulk(size, "module haproxy_config plan", size, lambda: run_module("haproxy_config", dict(configuration, mode="plan")))
+        measure_bulk(size, "module haproxy_config apply", size, lambda: run_module("haproxy_config", dict(configuration, mode="apply_plan")))
+
+
+def main():
+
+    # Parse Arguments
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10,1000,10000", help="comma separated numbers of objects")
+    parser.add_argument("--latency", type=float, default=0.0, help="injected latency of the stub, in milliseconds")
+    parser.add_argument("--reload-delay", type=float, default=5.0, help="delayed reload delay of the stub, in seconds")
+    parser.add_argument("--module-runs", type=int, default=100, help="maximum number of runs of the single-object modules")
+    parser.add_argument("--workers", type=int, default=10, help="concurrent requests of the batches and synchronizations")
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as python_path:
+
+        # Expose the Collection as 'kube_cloud.haproxy' (for the Modules)
+        os.makedirs(os.path.join(python_path, "ansible_collections", "kube_cloud"))
+        os.symlink(os.path.abspath(COLLECTION_ROOT), os.path.join(python_path, "ansible_collections", "kube_cloud", "haproxy"))
+        sys.path.insert(0, python_path)
+
+        # Print Header
+        print(ROW.format("size", "operation", "objects", "total (s)", "objects/s", "p50 (ms)", "p95 (ms)", "p99 (ms)"))
+
+        # Iterate on Sizes
+        for size in (int(size) for size in arguments.sizes.split(",")):
+
+            # Fresh Stub per Size
+            with StubApi(latency=arguments.latency / 1000, reload_delay=arguments.reload_delay) as api, tempfile.TemporaryDirectory() as directory:
+
+                # Build Client
+                client = Client(base_url=api.base_url, **CREDENTIALS)
+
+                # Run Benchmarks
+                bench_clients(size, client, arguments.workers, directory)
+                bench_modules(size, api.base_url, arguments.module_runs, arguments.workers)
+
+                # Print Stub Counters
+                print("{0:>6} stub : {1} requests, {2} reloads".format(size, sum(api.state.requests.values()), api.state.reloads))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Benchmark : Module Startup Cost (Import and Client Build).
+
+Each plugin (module or lookup) is imported in a fresh interpreter, like AnsiballZ does
+once per host and per task, then its HA Proxy Client is built. The cost of the shared
+baseline (Python, `ansible.module_utils.basic` and `requests`) is measured the same way
+and reported apart, so the remaining time is the collection's own startup cost.
+
+Usage:
+    python benchmarks/bench_import.py [--runs 7] [--plugin server --plugin transaction]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+# Collection Root
+COLLECTION_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+# Collection Package
+COLLECTION_PACKAGE = "ansible_collections.kube_cloud.haproxy"
+
+# Baseline Imports (Paid by every Module, whatever the Collection does)
+BASELINE = "import ansible.module_utils.basic, requests"
+
+# Probe run in a Fresh Interpreter (Prints Import and Client Build Times)
+PROBE = """
+import time
+{baseline}
+started = time.perf_counter()
+import {package}.plugins.{kind}.{plugin}
+imported = time.perf_counter()
+from {package}.plugins.module_utils.haproxy import Client
+client = Client(base_url="http://127.0.0.1:5555", api_version="v2", username="admin", password="admin")
+getattr(client, "{sub_client}")
+built = time.perf_counter()
+print(imported - started, built - imported)
+"""
+
+# Sub-Client used by each Plugin (the others are never built)
+SUB_CLIENTS = {
+    "acl": "acl",
+    "backend": "backend",
+    "backend_switching_rule": "besr",
+    "bind": "bind",
+    "clean_transactions": "transaction",
+    "frontend": "frontend",
+    "http_request_rule": "request_rule",
+    "server": "server",
+    "servers": "server",
+    "ssl_certificate": "ssl_certificate",
+    "transaction": "transaction",
+    "reload": "reload",
+    "cert_lookup": "ssl_certificate",
+    "tx_lookup": "transaction"
+}
+
+
+# List Plugins of a Kind (modules, lookup)
+def plugins(kind: str):
+
+    # Plugin Directory
+    directory = os.path.join(COLLECTION_ROOT, "plugins", kind)
+
+    # Return Plugin Names
+    return sorted(name[:-3] for name in os.listdir(directory) if name.endswith(".py") and not name.startswith("_"))
+
+
+# Run Python Code in a Fresh Interpreter and Return its Output Numbers
+def probe(code: str, python_path: str):
+
+    # Interpreter Environment (Bytecode Cache Enabled, like on a Managed Host after the first Run)
+    environment = {key: value for key, value in os.environ.items() if key != "PYTHONDONTWRITEBYTECODE"}
+    environment["PYTHONPATH"] = python_path
+
+    # Run Interpreter
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+        env=environment
+    ).stdout
+
+    # Return Numbers
+    return [float(value) for value in output.split()]
+
+
+def main():
+
+    # Parse Arguments
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--plugin", action="append", default=None)
+    arguments = parser.parse_args()
+
+    # Number of Runs per Measure
+    runs = max(1, arguments.runs)
+
+    with tempfile.TemporaryDirectory() as python_path:
+
+        # Expose the Collection as 'kube_cloud.haproxy'
+        os.makedirs(os.path.join(python_path, "ansible_collections", "kube_cloud"))
+        os.symlink(os.path.abspath(COLLECTION_ROOT), os.path.join(python_path, "ansible_collections", "kube_cloud", "haproxy"))
+
+        # Baseline (Interpreter, Ansible and Requests)
+        baseline = [
+            probe("import time; started = time.perf_counter(); {0}; print(time.perf_counter() - started)".format(BASELINE), python_path)[0]
+            for _ in range(runs)
+        ]
+        print("{0:<28} {1:>9.1f} ms".format("baseline (ansible, requests)", 1000 * statistics.median(baseline)))
+        print("{0:<28} {1:>12} {2:>12}".format("plugin", "import (ms)", "client (ms)"))
+
+        # Iterate on Plugins
+        for kind in ("modules", "lookup"):
+            for plugin in plugins(kind):
+
+                # If Plugin is not Selected
+                if arguments.plugin and plugin not in arguments.plugin:
+                    continue
+
+                # Probe Code
+                code = PROBE.format(baseline=BASELINE, package=COLLECTION_PACKAGE, kind=kind, plugin=plugin,
+                                    sub_client=SUB_CLIENTS.get(plugin, "configuration"))
+
+                # Measure (Warm up the Bytecode Cache First)
+                probe(code, python_path)
+                timings = [probe(code, python_path) for _ in range(runs)]
+
+                # Print Medians
+                print("{0:<28} {1:>12.1f} {2:>12.1f}".format(
+                    plugin,
+                    1000 * statistics.median(timing[0] for timing in timings),
+                    1000 * statistics.median(timing[1] for timing in timings)
+                ))
+
+
+if __name__ == "__main__":
+    main()
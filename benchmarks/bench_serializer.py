@@ -0,0 +1,101 @@
+"""
+Benchmark : Model Serialization (Request Payloads).
+
+Serializes Server models to request payloads with `filter_none` (the serializer used
+by every write of the sub-clients), and compares it with the historical
+`dataclasses.asdict` based implementation. Also reports the size of one model.
+
+Usage:
+    python benchmarks/bench_serializer.py [--objects 100000]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+from dataclasses import asdict
+
+# Make the Collection Plugins importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from plugins.module_utils.commons import filter_none   # noqa: E402
+from plugins.module_utils.enums import EnableDisableEnum, Requirement   # noqa: E402
+from plugins.module_utils.models import Server, Backend, Balance   # noqa: E402
+from plugins.module_utils.enums import LoadBalancingAlgorithm   # noqa: E402
+
+
+# Historical Serializer (Deep Copy, then drop None Fields)
+def filter_none_asdict(instance):
+    return {name: value for name, value in asdict(instance).items() if value is not None}
+
+
+# Measure Throughput of a Serializer
+def measure(label: str, serializer, instances: list):
+
+    # Start Timer
+    started = time.perf_counter()
+
+    # Serialize Instances
+    for instance in instances:
+        serializer(instance)
+
+    # Elapsed Time
+    elapsed = time.perf_counter() - started
+
+    # Print Result
+    print("{0:<32} {1:>8} objects in {2:>7.3f}s : {3:>10.0f} objects/s".format(label, len(instances), elapsed, len(instances) / elapsed))
+
+
+# Measure Memory of Model Instances
+def footprint(factory, count: int):
+
+    # Trace Allocations
+    tracemalloc.start()
+    instances = [factory(position) for position in range(count)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # Return Bytes per Instance
+    return size / len(instances)
+
+
+def main():
+
+    # Parse Arguments
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--objects", type=int, default=100000)
+    arguments = parser.parse_args()
+
+    # Build Server Models (a realistic Subset of Fields)
+    def server(position: int):
+        return Server(
+            name="srv{0}".format(position),
+            address="10.0.{0}.{1}".format(position // 256 % 256, position % 256),
+            port=8080,
+            weight=100,
+            check=EnableDisableEnum.ENABLED,
+            verify=Requirement.NONE,
+            maxconn=1000
+        )
+
+    # Build Backend Models (Nested Model)
+    def backend(position: int):
+        return Backend(name="app{0}".format(position), balance=Balance(algorithm=LoadBalancingAlgorithm.ROUNDROBIN))
+
+    # Servers
+    servers = [server(position) for position in range(arguments.objects)]
+    print("Server : {0:.0f} bytes per model".format(footprint(server, 10000)))
+    measure("Server filter_none (asdict)", filter_none_asdict, servers)
+    measure("Server filter_none", filter_none, servers)
+
+    # Backends
+    backends = [backend(position) for position in range(arguments.objects // 10)]
+    print("Backend : {0:.0f} bytes per model".format(footprint(backend, 10000)))
+    measure("Backend filter_none (asdict)", filter_none_asdict, backends)
+    measure("Backend filter_none", filter_none, backends)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark : Per-Call Connections vs Shared Keep-Alive Session.
+
+Measures requests/second of server lookups against the local Data Plane API stub,
+first with one connection per call (module-level `requests.get`, the historical
+behaviour), then through the pooled session shared by the `Client` sub-clients.
+
+Usage:
+    python benchmarks/bench_session.py [--requests 2000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import requests
+
+# Make the Collection Plugins importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from benchmarks.stub_api import StubApi   # noqa: E402
+from plugins.module_utils.haproxy import Client   # noqa: E402
+from plugins.module_utils.models import Server   # noqa: E402
+
+
+# Measure Throughput of a Callable
+def measure(label: str, count: int, call):
+
+    # Start Timer
+    started = time.perf_counter()
+
+    # Execute Calls
+    for _ in range(count):
+        call()
+
+    # Elapsed Time
+    elapsed = time.perf_counter() - started
+
+    # Print Result
+    print("{0:<32} {1:>8} requests in {2:>7.3f}s : {3:>9.1f} req/s".format(label, count, elapsed, count / elapsed))
+
+
+def main():
+
+    # Parse Arguments
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    arguments = parser.parse_args()
+
+    with StubApi() as api:
+
+        # Build Client
+        client = Client(base_url=api.base_url, api_version="v2", username="admin", password="admin")
+
+        # Seed one Server
+        client.server.create_server(
+            server=Server(name="srv1", address="127.0.0.1", port=8080),
+            transaction_id="",
+            parent_name="app",
+            parent_type="backend"
+        )
+
+        # Server URL
+        url = "{0}/v2/services/haproxy/configuration/servers/srv1?parent_type=backend&parent_name=app".format(api.base_url)
+
+        # One Connection per Call
+        measure(
+            "requests.get (new connection)",
+            arguments.requests,
+            lambda: requests.get(url, auth=client.auth)
+        )
+
+        # Shared Keep-Alive Session
+        measure(
+            "Client.server (pooled session)",
+            arguments.requests,
+            lambda: client.server.get_server(name="srv1", parent_name="app", parent_type="backend")
+        )
+
+
+if __name__ == "__main__":
+    main()
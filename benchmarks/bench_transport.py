@@ -0,0 +1,107 @@
+"""
+Benchmark : Loopback TCP vs Unix Domain Socket Transport.
+
+Measures the per-call latency (p50 / p95 / p99) and the throughput of server lookups
+and updates made through the `Client` against the local Data Plane API stub, first
+listening on loopback TCP (http://127.0.0.1), then on a Unix domain socket
+(unix:///path/to/socket), both with keep-alive sessions.
+
+Usage:
+    python benchmarks/bench_transport.py [--requests 5000]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+# Make the Collection Plugins importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from benchmarks.stub_api import StubApi   # noqa: E402
+from plugins.module_utils.haproxy import Client   # noqa: E402
+from plugins.module_utils.models import Server   # noqa: E402
+
+
+# Measure Latency and Throughput of a Callable
+def measure(label: str, count: int, call):
+
+    # Calls Timings
+    timings = []
+
+    # Execute Calls
+    for _ in range(count):
+        started = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - started)
+
+    # Latency Percentiles (Microseconds)
+    percentiles = statistics.quantiles(timings, n=100, method="inclusive")
+
+    # Print Result
+    print("{0:<28} {1:>8} requests : {2:>9.1f} req/s  p50 {3:>7.0f} us  p95 {4:>7.0f} us  p99 {5:>7.0f} us".format(
+        label,
+        count,
+        count / sum(timings),
+        1e6 * percentiles[49],
+        1e6 * percentiles[94],
+        1e6 * percentiles[98]
+    ))
+
+
+# Benchmark a Transport
+def bench(transport: str, api: StubApi, count: int):
+
+    # Build Client
+    client = Client(base_url=api.base_url, api_version="v2", username="admin", password="admin")
+
+    # Seed one Server
+    client.server.create_server(
+        server=Server(name="srv1", address="127.0.0.1", port=8080),
+        transaction_id="",
+        parent_name="app",
+        parent_type="backend"
+    )
+
+    # Lookups
+    measure(
+        "{0} get_server".format(transport),
+        count,
+        lambda: client.server.get_server(name="srv1", parent_name="app", parent_type="backend")
+    )
+
+    # Updates (Versioned Writes)
+    measure(
+        "{0} update_server".format(transport),
+        count,
+        lambda: client.server.update_server(
+            name="srv1",
+            server=Server(name="srv1", address="127.0.0.1", port=8080, weight=10),
+            transaction_id="",
+            parent_name="app",
+            parent_type="backend",
+            force_reload=False
+        )
+    )
+
+
+def main():
+
+    # Parse Arguments
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000)
+    arguments = parser.parse_args()
+
+    # Loopback TCP
+    with StubApi() as api:
+        bench("tcp", api, arguments.requests)
+
+    # Unix Domain Socket
+    with tempfile.TemporaryDirectory() as directory, StubApi(socket_path=os.path.join(directory, "dataplane.sock")) as api:
+        bench("unix", api, arguments.requests)
+
+
+if __name__ == "__main__":
+    main()
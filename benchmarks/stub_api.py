@@ -0,0 +1,720 @@
+"""
+Local stand-in for the HAProxy Data Plane API (v2), used by the benchmarks.
+
+Implemented endpoints : configuration version, configuration objects (backends,
+frontends, servers, binds, ACLs, rules...), transactions, runtime servers,
+SSL certificates storage and reloads. Objects are stored in memory and addressed by their
+collection, their parent and their name (or index : inserting or deleting
+an ACL or a rule shifts the following ones, like HAProxy does).
+
+Every response can be delayed (injected latency), requests are counted by
+endpoint, and reloads (forced, or delayed and coalesced) are counted. Changes
+made without forced reload share a delayed reload (run after the reload delay),
+whose ID is returned in the Reload-ID header.
+
+Usage:
+    with StubApi(latency=0.002) as api:
+        client = Client(base_url=api.base_url, api_version='v2', username='admin', password='admin')
+        ...
+        print(api.state.requests, api.state.reloads)
+"""
+
+import base64
+import binascii
+import collections
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from socketserver import ThreadingMixIn, UnixStreamServer
+from urllib.parse import urlsplit, parse_qs
+
+
+# Configuration URI Prefix
+CONFIGURATION_PREFIX = "/v2/services/haproxy/configuration/"
+
+# Runtime Servers URI Prefix
+RUNTIME_SERVERS_PREFIX = "/v2/services/haproxy/runtime/servers"
+
+# Transactions URI Prefix
+TRANSACTIONS_PREFIX = "/v2/services/haproxy/transactions"
+
+# Reloads URI Prefix
+RELOADS_PREFIX = "/v2/services/haproxy/reloads"
+
+# SSL Certificates Storage URI Prefix
+CERTIFICATES_PREFIX = "/v2/services/haproxy/storage/ssl_certificates"
+
+# Index-Addressed Collections (Inserts and Deletes shift the following Entries)
+INDEXED_COLLECTIONS = ("acls", "http_request_rules", "http_response_rules", "backend_switching_rules", "server_switching_rules")
+
+
+class StubState:
+    """
+    In-Memory Data Plane API State.
+    """
+
+    def __init__(self):
+
+        # Configuration Version
+        self.version = 1
+
+        # Objects by (collection, parent) => {key: object}
+        self.objects = {}
+
+        # Transactions by ID
+        self.transactions = {}
+
+        # Transactions Staged Sections by ID => {(collection, parent): {key: object}}
+        self.staged = {}
+
+        # Runtime Servers Administrative States by (backend, name)
+        self.runtime = {}
+
+        # SSL Certificates by Storage Name => {storage_name, file, sha256_finger_print}
+        self.certificates = {}
+
+        # Requests Count by Endpoint ("METHOD /endpoint")
+        self.requests = collections.Counter()
+
+        # Number of Reloads (Forced Reloads, and Delayed Reloads once Coalesced)
+        self.reloads = 0
+
+        # Delay of the Delayed Reloads (seconds)
+        self.reload_delay = 0.0
+
+        # Reloads by ID => {id, status, reload_timestamp}
+        self.history = {}
+
+        # Pending Delayed Reload ID (Changes made without Forced Reload) and Due Time
+        self.pending_reload = None
+        self.pending_due = 0.0
+
+        # State Lock
+        self.lock = threading.Lock()
+
+    def bump(self):
+
+        # Increment Configuration Version
+        self.version += 1
+
+    def reload(self, forced):
+
+        # Run the Due Delayed Reload
+        self.flush_reload()
+
+        # If Reload is Forced
+        if forced:
+
+            # Reload Now (the Pending Delayed Reload is part of it)
+            self.reloads += 1
+            self.flush_reload(due=True, counted=True)
+            return None
+
+        # If no Delayed Reload is Pending
+        if self.pending_reload is None:
+
+            # Schedule Delayed Reload (Coalesced with the next Delayed Reloads)
+            self.pending_reload = "{0}-{1}".format(time.strftime("%Y-%m-%d"), len(self.history) + 1)
+            self.pending_due = time.monotonic() + self.reload_delay
+            self.history[self.pending_reload] = {"id": self.pending_reload, "status": "in_progress"}
+
+        # Return Delayed Reload ID
+        return self.pending_reload
+
+    def flush_reload(self, due=False, counted=False):
+
+        # If no Delayed Reload is Due
+        if self.pending_reload is None or not (due or time.monotonic() >= self.pending_due):
+            return
+
+        # Run the Pending Delayed Reload
+        self.reloads += 0 if counted else 1
+        self.history[self.pending_reload].update(status="succeeded", reload_timestamp=int(time.time()))
+        self.pending_reload = None
+
+    def section(self, collection, parent, transaction_id=None):
+
+        # Committed Section
+        if not transaction_id:
+            return self.objects.setdefault((collection, parent), {})
+
+        # Staged Sections of the Transaction (None if the Transaction is not in progress)
+        staged = self.staged.get(transaction_id)
+        if staged is None:
+            return None
+
+        # Copy the Committed Section on First Write
+        if (collection, parent) not in staged:
+            staged[(collection, parent)] = dict(self.objects.get((collection, parent), {}))
+
+        # Return Staged Section
+        return staged[(collection, parent)]
+
+    def view(self, collection, parent, transaction_id=None):
+
+        # Committed Section, or Section as Staged in the Transaction
+        staged = self.staged.get(transaction_id, {}) if transaction_id else {}
+        return staged.get((collection, parent), self.objects.get((collection, parent), {}))
+
+
+def shift(objects, start, offset):
+
+    # Re-Key the Entries from the Start Index (Index-Addressed Collections)
+    moved = sorted((int(key) for key in objects if int(key) >= start), reverse=offset > 0)
+    for index in moved:
+        entry = objects.pop(str(index))
+        objects[str(index + offset)] = dict(entry, index=index + offset)
+
+
+def forced(query):
+
+    # Force Reload Query Parameter (True, true, 1)
+    return str(query.get("force_reload")).lower() in ("true", "1")
+
+
+def fingerprint(content):
+
+    # Leaf Certificate of the PEM Content
+    pem = content.split(b"-----BEGIN CERTIFICATE-----", 1)[-1].split(b"-----END CERTIFICATE-----", 1)[0]
+
+    try:
+
+        # SHA-256 of the DER Encoding (Upper Case, like the Data Plane API)
+        return hashlib.sha256(base64.b64decode(b"".join(pem.split()), validate=True)).hexdigest().upper()
+
+    except (binascii.Error, ValueError):
+
+        # Not a Certificate
+        return None
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """
+    Data Plane API Request Handler (HTTP/1.1 keep-alive).
+    """
+
+    # Keep Connections Alive
+    protocol_version = "HTTP/1.1"
+
+    # Send Headers and Body without Nagle Delays
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+
+        # Silence Access Logs
+        pass
+
+    def count(self):
+
+        # Endpoint (Path without Query, Object Names and Transaction IDs)
+        path = urlsplit(self.path).path
+        for prefix in (TRANSACTIONS_PREFIX, CERTIFICATES_PREFIX, RUNTIME_SERVERS_PREFIX, RELOADS_PREFIX):
+            if path.startswith(prefix):
+                path = prefix
+                break
+        else:
+            if path.startswith(CONFIGURATION_PREFIX):
+                path = CONFIGURATION_PREFIX + path[len(CONFIGURATION_PREFIX):].split("/")[0]
+
+        with self.server.state.lock:
+
+            # Count Request
+            self.server.state.requests["{0} {1}".format(self.command, path)] += 1
+
+            # Run the Due Delayed Reload
+            self.server.state.flush_reload()
+
+    def parse_request(self):
+
+        # Parse Request Line and Headers
+        if not super().parse_request():
+            return False
+
+        # Reset Delayed Reload ID (Connections are Kept Alive)
+        self.reload_id = None
+
+        # Count Request
+        self.count()
+
+        # Request Parsed
+        return True
+
+    def send_json(self, status, payload=None):
+
+        # Injected Latency
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        # Encode Payload
+        body = json.dumps(payload).encode() if payload is not None else b""
+
+        # Send Response
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Configuration-Version", str(self.server.state.version))
+        if self.reload_id:
+            self.send_header("Reload-ID", self.reload_id)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def read_json(self):
+
+        # Read Body
+        length = int(self.headers.get("Content-Length") or 0)
+
+        # Decode Body
+        return json.loads(self.rfile.read(length)) if length else None
+
+    def route(self):
+
+        # Split URL
+        parts = urlsplit(self.path)
+
+        # Parse Query
+        query = {key: values[0] for key, values in parse_qs(parts.query).items()}
+
+        # If Path is not a Configuration Path
+        if not parts.path.startswith(CONFIGURATION_PREFIX):
+            return None, None, None, query
+
+        # Split Configuration Path
+        segments = parts.path[len(CONFIGURATION_PREFIX):].strip("/").split("/")
+
+        # Extract Parent
+        parent = query.get("parent_name") or query.get("frontend") or query.get("backend")
+
+        # Return Route
+        return segments[0], (segments[1] if len(segments) > 1 else None), parent, query
+
+    def runtime_server(self, method):
+
+        # Split URL
+        parts = urlsplit(self.path)
+
+        # Backend and Server Name
+        backend = parse_qs(parts.query).get("backend", [None])[0]
+        name = parts.path[len(RUNTIME_SERVERS_PREFIX):].strip("/")
+
+        with self.server.state.lock:
+
+            # Configured Servers of the Backend
+            servers = self.server.state.objects.get(("servers", backend), {})
+
+            # Runtime View of a Server
+            def view(server):
+                return {
+                    "name": server["name"],
+                    "address": server.get("address"),
+                    "port": server.get("port"),
+                    "admin_state": self.server.state.runtime.get((backend, server["name"]), "ready"),
+                    "operational_state": "up"
+                }
+
+            # List Runtime Servers
+            if not name:
+                return self.send_json(200, [view(server) for server in servers.values()])
+
+            # Server not Found
+            if name not in servers:
+                return self.send_json(404, {"code": 404, "message": "{0} not found".format(name)})
+
+            # Change Administrative State (No Version Change)
+            if method == "PUT":
+                payload = self.read_json() or {}
+                if payload.get("admin_state"):
+                    self.server.state.runtime[(backend, name)] = payload["admin_state"]
+
+            # Return Runtime Server
+            return self.send_json(200, view(servers[name]))
+
+    def certificate(self, method):
+
+        # Split URL
+        parts = urlsplit(self.path)
+
+        # Parse Query
+        query = {key: values[0] for key, values in parse_qs(parts.query).items()}
+
+        # Storage Name
+        name = parts.path[len(CERTIFICATES_PREFIX):].strip("/")
+
+        # Certificates
+        certificates = self.server.state.certificates
+
+        # List Certificates (Names only, like the Storage Listing)
+        if method == "GET" and not name:
+            with self.server.state.lock:
+                return self.send_json(200, [
+                    {"storage_name": certificate["storage_name"], "file": certificate["file"]} for certificate in certificates.values()
+                ])
+
+        # Get Certificate
+        if method == "GET":
+            with self.server.state.lock:
+                certificate = certificates.get(name)
+            if certificate is None:
+                return self.send_json(404, {"code": 404, "message": "{0} not found".format(name)})
+            return self.send_json(200, certificate)
+
+        # Delete Certificate
+        if method == "DELETE":
+            with self.server.state.lock:
+                removed = certificates.pop(name, None)
+                if removed is not None:
+                    self.reload_id = self.server.state.reload(forced(query))
+            if removed is None:
+                return self.send_json(404, {"code": 404, "message": "{0} not found".format(name)})
+            return self.send_json(204)
+
+        # Read Body
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+        # If Certificate is Uploaded (Multipart Form)
+        if method == "POST":
+
+            # Extract File Name and Content of the First Part
+            header, _, content = body.partition(b"\r\n\r\n")
+            name = header.split(b'filename="', 1)[-1].split(b'"', 1)[0].decode()
+            content = content.rsplit(b"\r\n--", 1)[0]
+
+        else:
+
+            # Raw Content
+            content = body
+
+        with self.server.state.lock:
+
+            # Conflict on Create
+            if method == "POST" and name in certificates:
+                return self.send_json(409, {"code": 409, "message": "{0} already exists".format(name)})
+
+            # Not Found on Replace
+            if method == "PUT" and name not in certificates:
+                return self.send_json(404, {"code": 404, "message": "{0} not found".format(name)})
+
+            # Store Certificate
+            certificates[name] = {
+                "storage_name": name,
+                "file": "/etc/haproxy/ssl/{0}".format(name),
+                "sha256_finger_print": fingerprint(content)
+            }
+            self.reload_id = self.server.state.reload(forced(query))
+
+        # Return Certificate
+        return self.send_json(201 if method == "POST" else 200, certificates[name])
+
+    def do_GET(self):
+
+        # Get Reloads
+        if self.path.startswith(RELOADS_PREFIX):
+            reload_id = urlsplit(self.path).path[len(RELOADS_PREFIX):].strip("/")
+            with self.server.state.lock:
+                if not reload_id:
+                    return self.send_json(200, list(self.server.state.history.values()))
+                reload = self.server.state.history.get(reload_id)
+            if reload is None:
+                return self.send_json(404, {"code": 404, "message": "reload {0} not found".format(reload_id)})
+            return self.send_json(200, reload)
+
+        # Get SSL Certificates
+        if self.path.startswith(CERTIFICATES_PREFIX):
+            return self.certificate("GET")
+
+        # Get Runtime Servers
+        if self.path.startswith(RUNTIME_SERVERS_PREFIX):
+            return self.runtime_server("GET")
+
+        # Get Transactions
+        if self.path.startswith(TRANSACTIONS_PREFIX):
+            return self.transaction("GET")
+
+        # Route Request
+        collection, key, parent, query = self.route()
+
+        # Configuration Version
+        if collection == "version":
+            return self.send_json(200, self.server.state.version)
+
+        # Unknown Path
+        if collection is None:
+            return self.send_json(404, {"code": 404, "message": "not found"})
+
+        # Read Objects (as Staged in the Transaction if any)
+        with self.server.state.lock:
+            objects = self.server.state.view(collection, parent, query.get("transaction_id"))
+
+            # List Objects (Index-Addressed Objects in Index Order)
+            if key is None:
+                entries = [objects[key] for key in sorted(objects, key=int)] if collection in INDEXED_COLLECTIONS else list(objects.values())
+                return self.send_json(200, {"_version": self.server.state.version, "data": entries})
+
+            # Find Object
+            instance = objects.get(key)
+
+        # Object not Found
+        if instance is None:
+            return self.send_json(404, {"code": 404, "message": "{0} not found".format(key)})
+
+        # Return Object
+        return self.send_json(200, {"_version": self.server.state.version, "data": instance})
+
+    def write(self, create):
+
+        # Route Request
+        collection, key, parent, query = self.route()
+
+        # Read Payload
+        payload = self.read_json() or {}
+
+        # Object Key (Index-Addressed Objects, like Rules, are keyed by their Index)
+        key = key if key is not None else str(payload["index"] if "index" in payload else payload.get("name"))
+
+        with self.server.state.lock:
+
+            # Objects of the Parent (Staged in the Transaction if any)
+            objects = self.server.state.section(collection, parent, query.get("transaction_id"))
+
+            # Transaction not Found
+            if objects is None:
+                return self.send_json(404, {"code": 404, "message": "transaction {0} not found".format(query["transaction_id"])})
+
+            # Version Conflict
+            if "version" in query and int(query["version"]) != self.server.state.version:
+                return self.send_json(409, {"code": 409, "message": "version mismatch"})
+
+            # Insert on Create (Index-Addressed Objects : the following Entries shift up)
+            if create and collection in INDEXED_COLLECTIONS:
+                shift(objects, int(key), 1)
+
+            # Conflict on Create
+            if create and key in objects:
+                return self.send_json(409, {"code": 409, "message": "{0} already exists".format(key)})
+
+            # Not Found on Update
+            if not create and key not in objects:
+                return self.send_json(404, {"code": 404, "message": "{0} not found".format(key)})
+
+            # Store Object
+            objects[key] = payload
+
+            # Bump Version and Reload (Outside Transactions)
+            if "transaction_id" not in query:
+                self.server.state.bump()
+                self.reload_id = self.server.state.reload(forced(query))
+
+        # Return Object
+        return self.send_json(201 if create else 200, payload)
+
+    def transaction(self, method):
+
+        # Split URL
+        parts = urlsplit(self.path)
+
+        # Parse Query
+        query = {key: values[0] for key, values in parse_qs(parts.query).items()}
+
+        # Transaction ID
+        transaction_id = parts.path[len(TRANSACTIONS_PREFIX):].strip("/")
+
+        with self.server.state.lock:
+
+            # Transactions
+            transactions = self.server.state.transactions
+
+            # Start Transaction
+            if method == "POST":
+
+                # Version Conflict
+                if int(query.get("version", 0)) != self.server.state.version:
+                    return self.send_json(409, {"code": 409, "message": "version mismatch"})
+
+                # Register Transaction
+                transaction = {"id": str(uuid.uuid4()), "_version": self.server.state.version, "status": "in_progress"}
+                transactions[transaction["id"]] = transaction
+                self.server.state.staged[transaction["id"]] = {}
+                return self.send_json(201, transaction)
+
+            # List Transactions
+            if method == "GET" and not transaction_id:
+                return self.send_json(200, [tx for tx in transactions.values() if tx["status"] == "in_progress"])
+
+            # Find Transaction
+            transaction = transactions.get(transaction_id)
+
+            # Transaction not Found
+            if transaction is None or transaction["status"] != "in_progress":
+                return self.send_json(404, {"code": 404, "message": "transaction {0} not found".format(transaction_id)})
+
+            # Get Transaction
+            if method == "GET":
+                return self.send_json(200, transaction)
+
+            # Commit Transaction
+            if method == "PUT":
+
+                # Version Conflict (Configuration changed since the Transaction started)
+                if transaction["_version"] != self.server.state.version:
+                    return self.send_json(409, {"code": 409, "message": "version mismatch, transaction is outdated"})
+
+                # Apply Staged Sections
+                self.server.state.objects.update(self.server.state.staged.pop(transaction_id))
+                transaction["status"] = "success"
+                self.server.state.bump()
+                self.reload_id = self.server.state.reload(forced(query))
+                return self.send_json(200 if forced(query) else 202, transaction)
+
+            # Cancel Transaction
+            self.server.state.staged.pop(transaction_id, None)
+            transaction["status"] = "cancelled"
+            return self.send_json(204)
+
+    def do_POST(self):
+
+        # Upload SSL Certificate
+        if self.path.startswith(CERTIFICATES_PREFIX):
+            return self.certificate("POST")
+
+        # Start Transaction
+        if self.path.startswith(TRANSACTIONS_PREFIX):
+            return self.transaction("POST")
+
+        # Create Object
+        self.write(create=True)
+
+    def do_PUT(self):
+
+        # Replace SSL Certificate
+        if self.path.startswith(CERTIFICATES_PREFIX):
+            return self.certificate("PUT")
+
+        # Change Runtime Server
+        if self.path.startswith(RUNTIME_SERVERS_PREFIX):
+            return self.runtime_server("PUT")
+
+        # Commit Transaction
+        if self.path.startswith(TRANSACTIONS_PREFIX):
+            return self.transaction("PUT")
+
+        # Replace Object
+        self.write(create=False)
+
+    def do_DELETE(self):
+
+        # Delete SSL Certificate
+        if self.path.startswith(CERTIFICATES_PREFIX):
+            return self.certificate("DELETE")
+
+        # Cancel Transaction
+        if self.path.startswith(TRANSACTIONS_PREFIX):
+            return self.transaction("DELETE")
+
+        # Route Request
+        collection, key, parent, query = self.route()
+
+        with self.server.state.lock:
+
+            # Objects of the Parent (Staged in the Transaction if any)
+            objects = self.server.state.section(collection, parent, query.get("transaction_id"))
+
+            # Remove Object
+            removed = objects.pop(key, None) if objects is not None else None
+
+            # Close the Gap (Index-Addressed Objects : the following Entries shift down)
+            if removed is not None and collection in INDEXED_COLLECTIONS:
+                shift(objects, int(key) + 1, -1)
+
+            # Bump Version and Reload (Outside Transactions)
+            if removed is not None and "transaction_id" not in query:
+                self.server.state.bump()
+                self.reload_id = self.server.state.reload(forced(query))
+
+        # Not Found
+        if removed is None:
+            return self.send_json(404, {"code": 404, "message": "{0} not found".format(key)})
+
+        # Deleted
+        return self.send_json(204)
+
+
+class UnixStubHandler(StubHandler):
+
+    # No Nagle Algorithm on Unix Domain Sockets
+    disable_nagle_algorithm = False
+
+
+class ThreadingUnixHTTPServer(ThreadingMixIn, UnixStreamServer):
+
+    # Serve Threads are Daemons
+    daemon_threads = True
+
+
+class StubApi:
+    """
+    Threaded Data Plane API Stub Server (context manager), listening on TCP, or on a
+    Unix domain socket if a socket path is provided.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0, reload_delay: float = 0.0,
+                 socket_path: str = None):
+
+        # Initialize Socket Path
+        self.socket_path = socket_path
+
+        # Build Server (Unix Domain Socket or TCP)
+        if socket_path:
+            self.server = ThreadingUnixHTTPServer(socket_path, UnixStubHandler)
+        else:
+            self.server = ThreadingHTTPServer((host, port), StubHandler)
+
+        # Injected Latency of every Response (seconds)
+        self.server.latency = latency
+
+        # Serve Threads are Daemons
+        self.server.daemon_threads = True
+
+        # Attach State
+        self.server.state = StubState()
+
+        # Delay of the Delayed Reloads (seconds)
+        self.server.state.reload_delay = reload_delay
+
+        # Server Thread
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+
+        # Return Base URL
+        if self.socket_path:
+            return "unix://{0}".format(self.socket_path)
+        return "http://{0}:{1}".format(*self.server.server_address)
+
+    @property
+    def state(self):
+
+        # Return State
+        return self.server.state
+
+    def __enter__(self):
+
+        # Start Server
+        self.thread.start()
+
+        # Return Stub
+        return self
+
+    def __exit__(self, *exc_info):
+
+        # Stop Server
+        self.server.shutdown()
+        self.server.server_close()
+
+        # Remove Socket
+        if self.socket_path and os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
@@ -0,0 +1,135 @@
+# (c) 2024, Jean-Jacques ETUNE NGI <jetune@kube-cloud.com>
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+
+DOCUMENTATION = '''
+---
+name: tx_cleanup
+type: aggregate
+version_added: "2.4.0"
+short_description: Cancel the uncommitted HA Proxy Dataplane API Transactions at the end of the run
+description:
+  - Cancels the Transactions started by the 'kube_cloud.haproxy.tx_lookup' lookup with 'auto_cancel' enabled,
+    which are still in progress (not committed) at the end of the run
+  - The lookups never store their credentials, the Transactions are cancelled with the credentials of the callback
+    options (the same credentials are used for all the Dataplane APIs)
+requirements:
+  - requests
+  - Enable the callback in the Ansible configuration ('callbacks_enabled = kube_cloud.haproxy.tx_cleanup')
+author: Jean-Jacques ETUNE NGI (@jetune) <jetune@kube-cloud.com>
+options:
+  registry_dir:
+    description:
+      - The Transactions registry directory (the 'registry_dir' of the lookups)
+      - Defaults to the Ansible local temporary directory of the run
+    type: str
+    env:
+      - name: ANSIBLE_HAPROXY_TX_REGISTRY_DIR
+    ini:
+      - section: callback_tx_cleanup
+        key: registry_dir
+  username:
+    description:
+      - The HA Proxy Dataplane API Admin Username the Transactions are cancelled with
+      - Without credentials, the uncommitted Transactions are reported but not cancelled
+    type: str
+    env:
+      - name: ANSIBLE_HAPROXY_TX_CLEANUP_USERNAME
+    ini:
+      - section: callback_tx_cleanup
+        key: username
+  password:
+    description:
+      - The HA Proxy Dataplane API Password the Transactions are cancelled with
+    type: str
+    env:
+      - name: ANSIBLE_HAPROXY_TX_CLEANUP_PASSWORD
+'''
+
+from ansible import constants as C
+from ansible.plugins.callback import CallbackBase
+from ..module_utils.haproxy import Client
+from ..module_utils.transaction_registry import TransactionRegistry, default_registry_dir
+
+try:
+    from requests import RequestException  # type: ignore
+    IMPORTS_OK = True
+except ImportError:
+    IMPORTS_OK = False
+
+
+class CallbackModule(CallbackBase):
+
+    # Callback Definition
+    CALLBACK_VERSION = 2.0
+    CALLBACK_TYPE = 'aggregate'
+    CALLBACK_NAME = 'kube_cloud.haproxy.tx_cleanup'
+    CALLBACK_NEEDS_ENABLED = True
+
+    # Cancel a Transaction if still in Progress (Return True if Cancelled)
+    def cancel(self, entry: dict):
+
+        # Build Client
+        client = Client(
+            base_url=entry['base_url'],
+            api_version=entry['api_version'],
+            username=self.get_option('username'),
+            password=self.get_option('password')
+        ).transaction
+
+        try:
+
+            # If Transaction is not in Progress (Committed or Cancelled)
+            if client.get_transaction(transaction_id=entry['id']).get('status') != 'in_progress':
+                return False
+
+            # Cancel Transaction
+            client.cancel_transaction(transaction_id=entry['id'])
+
+            # Cancelled
+            return True
+
+        except RequestException:
+
+            # Transaction is Gone (or API Unreachable)
+            return False
+
+    # End of the Run
+    def v2_playbook_on_stats(self, stats):
+
+        # Build Registry
+        registry = TransactionRegistry(directory=self.get_option('registry_dir') or default_registry_dir(C.DEFAULT_LOCAL_TMP))
+
+        with registry.lock():
+
+            # Iterate on Auto-Cancelled Transactions
+            for entry in [entry for entry in registry.entries() if entry.get('auto_cancel')]:
+
+                # If the Callback has no Credentials
+                if not self.get_option('username') or not self.get_option('password'):
+
+                    # Display Uncancelled Transaction
+                    self._display.warning("HA Proxy Transaction [{0}] of play [{1}] on {2} not cancelled : no tx_cleanup credentials".format(
+                        entry['id'],
+                        entry['play'],
+                        entry['base_url']
+                    ))
+
+                # If Transaction is Cancelled
+                elif self.cancel(entry):
+
+                    # Display Cancelled Transaction
+                    self._display.display("HA Proxy Transaction [{0}] of play [{1}] on {2} was not committed : cancelled".format(
+                        entry['id'],
+                        entry['play'],
+                        entry['base_url']
+                    ))
+
+            # Clear Registry
+            registry.clear()
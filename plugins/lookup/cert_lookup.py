@@ -38,34 +38,177 @@ options:
   name:
     description:
       - The Certificate Name
-    required: true
+      - Required, unless 'names' (or terms) are provided
+    required: false
+    type: str
+  names:
+    description:
+      - The Certificates Names (bulk mode, the lookup terms are added to them)
+      - All the certificates are read from a single listing of the certificates storage
+    required: false
+    type: list
+    elements: str
+    version_added: "2.4.0"
+  cache_ttl:
+    description:
+      - The time to live (in seconds) of the cached certificates, 0 (the default) to disable the cache
+      - Certificates are cached on the controller, by Dataplane API base URL, credentials and name, and shared by all the hosts
+      - The cache is not invalidated by certificate uploads, a certificate changed during the run (by the
+        M(kube_cloud.haproxy.ssl_certificate) module for instance) is served stale until its entry expires
+    required: false
+    default: 0
+    type: int
+    version_added: "2.4.0"
+  cache_dir:
+    description:
+      - The cache directory (on the controller)
+      - Defaults to the Ansible local temporary directory of the run, so the cache lasts for the run
+    required: false
     type: str
+    version_added: "2.4.0"
 '''
 
 EXAMPLES = r'''
 - name: "Get HA Proxy Certificate"
   ansible.builtin.debug: msg="{{item}}"
   crt: "{{ lookup('kube_cloud.haproxy.cert_lookup', base_url='http://localhost:5555', username: 'adm', password: 'adm', api_version='v2', name='test.pem') }}"
+
+- name: "Get HA Proxy Certificates (Single Listing)"
+  ansible.builtin.debug: msg="{{item}}"
+  crts: "{{ query('kube_cloud.haproxy.cert_lookup', 'a.pem', 'b.pem', base_url='http://localhost:5555', username: 'adm', password: 'adm', api_version='v2') }}"
 '''
 
 RETURN = '''
 _raw:
-  description: HA Proxy Certificate Details
-  type: dict
+  description: HA Proxy Certificate Details (one per requested name, in bulk mode)
+  type: list
+  elements: dict
 '''
 
 
+import hashlib
+
+from ansible import constants as C
+from ansible.errors import AnsibleLookupError
 from ansible.plugins.lookup import LookupBase
+from ..module_utils.cache import FileCache
+from ..module_utils.commons import unwrap_data
 from ..module_utils.haproxy import haproxy_client
 
+# Default Certificates Cache Time To Live (seconds, Cache Disabled)
+DEFAULT_CACHE_TTL = 0
+
 
 class LookupModule(LookupBase):
 
+    # Build the Controller Cache (None if Disabled)
+    def build_cache(self, kwargs: dict):
+
+        # Time To Live
+        ttl = kwargs.get('cache_ttl', DEFAULT_CACHE_TTL)
+
+        # If Cache is Disabled
+        if not ttl or int(ttl) <= 0:
+            return None
+
+        # Return Cache (Run Temporary Directory by Default, shared by the Forked Workers)
+        return FileCache(
+            directory=kwargs.get('cache_dir') or "{0}/haproxy_cert_lookup".format(C.DEFAULT_LOCAL_TMP),
+            ttl=int(ttl)
+        )
+
+    # Build the Cache Key Scope (Base URL, Version and Credentials Digest : Entries are never shared across Credentials)
+    def cache_scope(self, client):
+
+        # Credentials Digest (Credentials are never part of the Key in Clear)
+        credentials = hashlib.sha256("{0}:{1}".format(client.auth.username, client.auth.password).encode('utf-8')).hexdigest()
+
+        # Return Scope
+        return "{0}|{1}|{2}".format(client.base_url, client.api_version, credentials)
+
+    # Get a Certificate (Cached by Base URL, Credentials and Name)
+    def get_certificate(self, client, cache, name: str):
+
+        # Cache Key
+        key = "certificate|{0}|{1}".format(self.cache_scope(client), name)
+
+        # Find Cached Certificate
+        certificate = cache.get(key) if cache is not None else None
+
+        # If Certificate is not Cached
+        if certificate is None:
+
+            # Get Certificate
+            certificate = unwrap_data(client.get_certificate(name=name))
+
+            # If Cache is Enabled
+            if cache is not None:
+
+                # Cache Certificate
+                cache.set(key, certificate)
+
+        # Return Certificate
+        return certificate
+
+    # Get Certificates from a single Listing (Cached by Base URL and Credentials)
+    def get_certificates(self, client, cache, names: list):
+
+        # Cache Key
+        key = "certificates|{0}".format(self.cache_scope(client))
+
+        # Find Cached Listing
+        certificates = cache.get(key) if cache is not None else None
+
+        # If Listing is not Cached
+        if certificates is None:
+
+            # List Certificates
+            certificates = unwrap_data(client.get_certificates()) or []
+
+            # If Cache is Enabled
+            if cache is not None:
+
+                # Cache Listing
+                cache.set(key, certificates)
+
+        # Certificates by Name
+        certificates = {certificate.get('storage_name'): certificate for certificate in certificates}
+
+        # Missing Certificates
+        missing = [name for name in names if name not in certificates]
+
+        # If any Certificate is Missing
+        if missing:
+
+            # Raise Lookup Error
+            raise AnsibleLookupError("[Cert Lookup] - Certificates Not Found : {0}".format(', '.join(missing)))
+
+        # Return Certificates (Requested Order)
+        return [certificates[name] for name in names]
+
     # Execute Plugin
     def run(self, terms, variables, **kwargs):
 
         # Build Client
         client = haproxy_client(kwargs).ssl_certificate
 
-        # Create and return Transaction
-        return [client.get_certificate(name=kwargs["name"])]
+        # Build Cache
+        cache = self.build_cache(kwargs)
+
+        # Requested Names (Bulk Mode)
+        names = list(terms or []) + list(kwargs.get('names') or [])
+
+        # If Bulk Mode
+        if names:
+
+            # Return Certificates from a single Listing
+            return self.get_certificates(client, cache, names)
+
+        # If Name is not Provided
+        if not kwargs.get('name'):
+
+            # Raise Lookup Error
+            raise AnsibleLookupError("[Cert Lookup] - 'name' or 'names' is required")
+
+        # Return Certificate
+        return [self.get_certificate(client, cache, kwargs['name'])]
@@ -35,12 +35,49 @@ options:
     required: false
     default: 'v2'
     type: str
+  play:
+    description:
+      - The key of the Transaction reuse scope
+      - All the evaluations of the lookup for the same Dataplane API and play key return the same Transaction,
+        as long as it is in progress (a new one is started once it is committed or cancelled)
+    required: false
+    default: The current play name
+    type: str
+    version_added: "2.4.0"
+  reuse:
+    description:
+      - Reuse the in-progress Transaction of the play instead of starting a new one on each evaluation
+    required: false
+    default: true
+    type: bool
+    version_added: "2.4.0"
+  auto_cancel:
+    description:
+      - Cancel the Transaction at the end of the run if it is still in progress (not committed)
+      - Needs the 'kube_cloud.haproxy.tx_cleanup' callback to be enabled, with its own Dataplane API credentials
+        (its 'username' and 'password' options)
+      - The lookup credentials are never written to the Transactions registry
+    required: false
+    default: false
+    type: bool
+    version_added: "2.4.0"
+  registry_dir:
+    description:
+      - The Transactions registry directory (on the controller)
+      - Defaults to the Ansible local temporary directory of the run
+    required: false
+    type: str
+    version_added: "2.4.0"
 '''
 
 EXAMPLES = r'''
 - name: "Create HA Proxy Dataplane API Transaction"
   ansible.builtin.debug: msg="{{item}}"
   transaction: "{{ lookup('kube_cloud.haproxy.tx_lookup', base_url='http://localhost:5555', username: 'admin', password: 'admin', api_version='v2') }}"
+
+- name: "Get the Play HA Proxy Dataplane API Transaction (Cancelled at the End of the Run if not Committed)"
+  ansible.builtin.set_fact:
+    transaction: "{{ lookup('kube_cloud.haproxy.tx_lookup', base_url='http://localhost:5555', username: 'admin', password: 'admin', auto_cancel=true) }}"
 '''
 
 RETURN = '''
@@ -50,17 +87,81 @@ _raw:
 '''
 
 
+from ansible import constants as C
 from ansible.plugins.lookup import LookupBase
 from ..module_utils.haproxy import haproxy_client
+from ..module_utils.transaction_registry import TransactionRegistry, default_registry_dir
+
+try:
+    from requests import HTTPError  # type: ignore
+    IMPORTS_OK = True
+except ImportError:
+    IMPORTS_OK = False
 
 
 class LookupModule(LookupBase):
 
+    # Find the Registered Transaction if still in Progress
+    def find_transaction(self, client, entry: dict):
+
+        # If no Transaction is Registered
+        if not entry:
+            return None
+
+        try:
+
+            # Get Transaction
+            transaction = client.get_transaction(transaction_id=entry['id'])
+
+        except HTTPError:
+
+            # Transaction is Gone
+            return None
+
+        # Return Transaction if still in Progress
+        return transaction if transaction.get('status') == 'in_progress' else None
+
     # Execute Plugin
     def run(self, terms, variables, **kwargs):
 
         # Build Client
         client = haproxy_client(kwargs).transaction
 
-        # Create and return Transaction
-        return [client.create_transaction()]
+        # If Transaction is not Reused
+        if not kwargs.get('reuse', True):
+
+            # Create and return Transaction
+            return [client.create_transaction()]
+
+        # Play Key
+        play = kwargs.get('play') or (variables or {}).get('ansible_play_name') or ''
+
+        # Build Registry
+        registry = TransactionRegistry(directory=kwargs.get('registry_dir') or default_registry_dir(C.DEFAULT_LOCAL_TMP))
+
+        # Serialize Concurrent Evaluations (Forked Workers)
+        with registry.lock():
+
+            # Find Play Transaction
+            transaction = self.find_transaction(client, registry.find(client.base_url, client.api_version, play))
+
+            # If Play Transaction is in Progress
+            if transaction:
+
+                # Return Play Transaction
+                return [transaction]
+
+            # Create Transaction
+            transaction = client.create_transaction()
+
+            # Register Transaction (Cancelled at the End of the Run by the Cleanup Callback, with its own Credentials)
+            registry.register(dict(
+                base_url=client.base_url,
+                api_version=client.api_version,
+                play=play,
+                id=transaction['id'],
+                auto_cancel=bool(kwargs.get('auto_cancel'))
+            ))
+
+        # Return Transaction
+        return [transaction]
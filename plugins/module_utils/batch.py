@@ -0,0 +1,419 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from concurrent.futures import ThreadPoolExecutor
+
+from .client_acls import AclClient
+from .client_backend_switching_rules import BackendSwitchingRuleClient
+from .client_backends import BackendClient
+from .client_binds import BindClient
+from .client_frontends import FrontendClient
+from .client_http_request_rules import HttpRequestRuleClient
+from .client_servers import ServerClient
+from .commons import DEFAULT_POOL_SIZE
+
+try:
+    from requests import RequestException  # type: ignore
+    IMPORTS_OK = True
+except ImportError:
+    IMPORTS_OK = False
+
+
+# Default Number of Concurrent Requests of a Batch (Fits the Default Connection Pool)
+DEFAULT_BATCH_WORKERS = DEFAULT_POOL_SIZE
+
+
+class BatchSubClient:
+    """
+    Queuing view of a Sub-Client inside a Transaction Batch.
+
+    Calling a write method (create_*, update_*, delete_*) queues the operation in the batch
+    instead of executing it; the Transaction ID is injected when the batch is flushed.
+
+    Attributes:
+        batch (TransactionBatch): The owning batch.
+        name (str): The Sub-Client name (see TransactionBatch.SUB_CLIENTS).
+    """
+
+    # Write Methods Prefixes
+    WRITE_PREFIXES = ('create_', 'update_', 'delete_')
+
+    def __init__(self, batch, name: str):
+        """
+        Initializes the Batch Sub-Client.
+
+        Args:
+            batch (TransactionBatch): The owning batch.
+            name (str): The Sub-Client name.
+        """
+
+        # Initialize Batch
+        self.batch = batch
+
+        # Initialize Sub-Client Name
+        self.name = name
+
+    def __getattr__(self, method: str):
+        """
+        Get a queuing function for a write method of the Sub-Client.
+
+        Args:
+            method (str): The write method name.
+
+        Returns:
+            The function queuing the operation (called with the method keyword arguments, without transaction_id).
+
+        Raises:
+            AttributeError: If the method is not a write method of the Sub-Client.
+        """
+
+        # If Method is not a Write Method of the Sub-Client
+        if not method.startswith(self.WRITE_PREFIXES) or not hasattr(self.batch.SUB_CLIENTS[self.name][0], method):
+
+            # Raise Attribute Exception
+            raise AttributeError("[TransactionBatch] - '{0}.{1}' is not a batchable write operation".format(self.name, method))
+
+        # Queue Operation
+        def queue(**kwargs):
+            self.batch.queue(self.name, method, kwargs)
+
+        # Return Queuing Function
+        return queue
+
+
+class TransactionBatch:
+    """
+    Batch of write operations applied inside a single Transaction.
+
+    Used as a context manager : the Transaction is opened on enter, the operations queued
+    from any Sub-Client (batch.server.create_server(...), batch.acl.update_acl(...)...) are
+    flushed on exit, then the Transaction is committed once (single reload). If the block,
+    the flush or the commit fails (whatever the error), the Transaction is cancelled.
+
+    Operations are flushed by dependency level (backends and frontends, then servers, binds
+    and ACLs, then rules; deletes of name-addressed objects run after, children first).
+    Inside a level, operations run concurrently, except the operations on index-addressed
+    objects (ACLs, rules) of the same parent : creates, updates and deletes alike share one
+    lane, at the level of the object, and run in queue order (as each one shifts the indexes
+    the next ones are addressed with).
+
+    Attributes:
+        transaction (TransactionClient): The Transaction Client.
+        transaction_id (str): The Transaction ID (set on enter).
+        force_reload (bool): Force reload HAProxy Configuration on commit.
+        max_workers (int): The maximum number of concurrent requests.
+        version (int): The Configuration Version the Transaction must be based on (any if None).
+        operations (list): The queued operations.
+        results (list): The operations results, in queue order (set on flush).
+    """
+
+    # Sub-Clients (Class, Dependency Level, Index-Addressed)
+    SUB_CLIENTS = {
+        'backend': (BackendClient, 0, False),
+        'frontend': (FrontendClient, 0, False),
+        'server': (ServerClient, 1, False),
+        'bind': (BindClient, 1, False),
+        'acl': (AclClient, 1, True),
+        'request_rule': (HttpRequestRuleClient, 2, True),
+        'besr': (BackendSwitchingRuleClient, 2, True)
+    }
+
+    # Number of Dependency Levels
+    LEVELS = 3
+
+    def __init__(self, transaction, force_reload: bool = True, max_workers: int = DEFAULT_BATCH_WORKERS, transaction_id: str = None,
+                 version: int = None):
+        """
+        Initializes the Transaction Batch.
+
+        Args:
+            transaction (TransactionClient): The Transaction Client.
+            force_reload (bool): Force reload HAProxy Configuration on commit.
+            max_workers (int): The maximum number of concurrent requests.
+            transaction_id (str): An already started Transaction to use (neither committed nor cancelled by the batch).
+            version (int): The Configuration Version the Transaction must be based on (any if None). As a
+                           Transaction only commits on the version it is based on, nothing is applied if the
+                           configuration moved away from it.
+        """
+
+        # Initialize Transaction Client
+        self.transaction = transaction
+
+        # Initialize Transaction
+        self.transaction_id = transaction_id
+
+        # Is the Transaction owned by the Batch
+        self.owned_transaction = not transaction_id
+
+        # Initialize Force Reload
+        self.force_reload = force_reload
+
+        # Initialize Parallelism
+        self.max_workers = max(1, max_workers)
+
+        # Initialize Expected Configuration Version
+        self.version = version
+
+        # Initialize Operations
+        self.operations = []
+
+        # Initialize Results
+        self.results = []
+
+        # Initialize Sub-Clients (Built on First Flush)
+        self.clients = {}
+
+    def __getattr__(self, name: str):
+        """
+        Get the queuing view of a Sub-Client.
+
+        Args:
+            name (str): The Sub-Client name (backend, frontend, server, bind, acl, request_rule, besr).
+
+        Returns:
+            BatchSubClient: The queuing view of the Sub-Client.
+
+        Raises:
+            AttributeError: If the name is not a batchable Sub-Client.
+        """
+
+        # If Name is not a Batchable Sub-Client
+        if name not in self.SUB_CLIENTS:
+
+            # Raise Attribute Exception
+            raise AttributeError("[TransactionBatch] - '{0}' is not a batchable sub-client".format(name))
+
+        # Return Queuing View
+        return BatchSubClient(self, name)
+
+    def __enter__(self):
+
+        # If Transaction is owned by the Batch
+        if self.owned_transaction:
+
+            # Start Transaction
+            transaction = self.transaction.create_transaction()
+            self.transaction_id = transaction['id']
+
+        # Else if the Configuration Version is Expected
+        elif self.version is not None:
+
+            # Get Provided Transaction
+            transaction = self.transaction.get_transaction(transaction_id=self.transaction_id)
+
+        # If the Transaction is not based on the Expected Configuration Version
+        if self.version is not None and transaction.get('_version') != self.version:
+
+            # Cancel Transaction
+            self.cancel()
+
+            # Raise Value Exception
+            raise ValueError(
+                "[TransactionBatch] - Configuration Version moved (expected : {0}, current : {1})".format(
+                    self.version,
+                    transaction.get('_version')
+                )
+            )
+
+        # Return Batch
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+
+        # If the Block Failed
+        if exc_type is not None:
+
+            # Cancel Transaction
+            self.cancel()
+
+            # Propagate Exception
+            return False
+
+        try:
+
+            # Flush Operations
+            self.flush()
+
+            # If Transaction is owned by the Batch
+            if self.owned_transaction:
+
+                # Commit Transaction (Single Reload)
+                self.transaction.commit_transaction(transaction_id=self.transaction_id, force_reload=self.force_reload)
+
+        except Exception:
+
+            # Cancel Transaction (API, Connection or any other Worker Error)
+            self.cancel()
+
+            # Propagate Exception
+            raise
+
+        # Do not Suppress Exceptions
+        return False
+
+    def queue(self, name: str, method: str, kwargs: dict, level: int = None):
+        """
+        Queue a write operation.
+
+        Args:
+            name (str): The Sub-Client name.
+            method (str): The write method name.
+            kwargs (dict): The method keyword arguments (without transaction_id).
+            level (int): The flush level, overriding the one of the method.
+        """
+
+        # Add Operation
+        self.operations.append(dict(client=name, method=method, kwargs=kwargs, level=level))
+
+    def client(self, name: str):
+        """
+        Get a Sub-Client sharing the Transaction Client session and configuration.
+
+        Args:
+            name (str): The Sub-Client name.
+
+        Returns:
+            The Sub-Client.
+        """
+
+        # If Sub-Client is not Built
+        if name not in self.clients:
+
+            # Build Sub-Client
+            self.clients[name] = self.SUB_CLIENTS[name][0](
+                base_url=self.transaction.base_url,
+                api_version=self.transaction.api_version,
+                auth=self.transaction.auth,
+                session=self.transaction.session,
+                timeout=self.transaction.timeout,
+                configuration=self.transaction.configuration
+            )
+
+        # Return Sub-Client
+        return self.clients[name]
+
+    def level(self, operation: dict):
+        """
+        Get the flush level of an operation (creates and updates by dependency, then deletes children first,
+        but the deletes of index-addressed objects, which stay in the lane of their parent).
+
+        Args:
+            operation (dict): The queued operation.
+
+        Returns:
+            int: The flush level.
+        """
+
+        # If the Level is Forced
+        if operation.get('level') is not None:
+
+            # Return Forced Level
+            return operation['level']
+
+        # Dependency Level and Addressing of the Sub-Client
+        level, indexed = self.SUB_CLIENTS[operation['client']][1:]
+
+        # Return Level (Name-Addressed Deletes after Creates and Updates, in Reverse Dependency Order)
+        return (2 * self.LEVELS - 1 - level) if operation['method'].startswith('delete_') and not indexed else level
+
+    def lane(self, position: int, operation: dict):
+        """
+        Get the lane of an operation (operations of a lane run in queue order).
+
+        Args:
+            position (int): The operation position in the queue.
+            operation (dict): The queued operation.
+
+        Returns:
+            tuple: The lane key.
+        """
+
+        # If Sub-Client is not Index-Addressed
+        if not self.SUB_CLIENTS[operation['client']][2]:
+
+            # Own Lane
+            return ('operation', position)
+
+        # Parent Lane (Indexes of a Parent depend on each other)
+        kwargs = operation['kwargs']
+        return (operation['client'], kwargs.get('parent_type'), kwargs.get('parent_name', kwargs.get('frontend_name')))
+
+    def execute(self, operation: dict):
+        """
+        Execute a queued operation in the Transaction.
+
+        Args:
+            operation (dict): The queued operation.
+
+        Returns:
+            The operation result.
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails.
+        """
+
+        # Call Sub-Client Method
+        return getattr(self.client(operation['client']), operation['method'])(
+            transaction_id=self.transaction_id,
+            **operation['kwargs']
+        )
+
+    def flush(self):
+        """
+        Execute all the queued operations in the Transaction.
+
+        Returns:
+            list: The operations results, in queue order.
+
+        Raises:
+            requests.exceptions.HTTPError: If any API request fails (remaining levels are not executed).
+        """
+
+        # Initialize Results
+        results = [None] * len(self.operations)
+
+        # Run the Operations of a Lane in Queue Order
+        def run_lane(positions: list):
+            for position in positions:
+                results[position] = self.execute(self.operations[position])
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+
+            # Iterate on Levels
+            for level in range(2 * self.LEVELS):
+
+                # Group Level Operations by Lane
+                lanes = {}
+                for position, operation in enumerate(self.operations):
+                    if self.level(operation) == level:
+                        lanes.setdefault(self.lane(position, operation), []).append(position)
+
+                # Run Lanes Concurrently (Raise the first Error)
+                for future in [executor.submit(run_lane, positions) for positions in lanes.values()]:
+                    future.result()
+
+        # Keep and Return Results
+        self.results = results
+        self.operations = []
+        return results
+
+    def cancel(self):
+        """
+        Cancel the Transaction (if owned by the batch), ignoring cancel errors.
+        """
+
+        # If Transaction is not owned by the Batch or not Started
+        if not self.owned_transaction or not self.transaction_id:
+
+            # Nothing to Cancel
+            return
+
+        try:
+
+            # Cancel Transaction
+            self.transaction.cancel_transaction(transaction_id=self.transaction_id)
+
+        except RequestException:
+
+            # Ignore Cancel Error (Reported Error is the Batch Error)
+            pass
@@ -0,0 +1,599 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from .models import Server, Backend, Frontend, Bind, Acl, HttpRequestRule, BackendSwitchingRule
+from .models import Balance, HttpHealthCheck, HttpCheckParams, ForwardFor, PostgresSqlCheckParams
+from .enums import WebSocketProtocol, Requirement, EnableDisableEnum, SSLVersion, FrontendLevel
+from .enums import ProxyProtocol, LoadBalancingAlgorithm, HealthCheckType, AdvancedHealthCheckType
+from .enums import MatchType, TimeoutStatus, ErrorStatus, OkStatus, HttpMethod
+from .enums import HttpRequestRuleType, ConditionType, LogLevel
+from .enums import HttpRequestRuleNormalizerType, IPProtocol, RedirectType
+
+
+# Build Requested Server from Configuration
+def build_requested_server(params: dict) -> Server:
+
+    # Base Parameters Name
+    base_param_names = [
+        "name", "address", "port",
+        "verifyhost", "weight", "track", "health_check_address",
+        "health_check_port", "max_reuse", "maxconn", "maxqueue",
+        "minconn", "npn", "fall", "rise", "inter", "fastinter",
+        "error_limit", "pool_low_conn", "pool_max_conn",
+        "pool_purge_delay", "proto", "redir", "resolve_opts",
+        "resolvers", "ssl_cafile", "ssl_certificate", "tcp_ut"
+    ]
+
+    # Build Requested Instance
+    server = Server(
+        **{k: v for k, v in params.items() if v is not None and k in base_param_names}
+    )
+
+    # Initialize Enums
+    server.verify = Requirement.create(params.get('verify', None))
+    server.ws = WebSocketProtocol.create(params.get('ws', None))
+    server.check = EnableDisableEnum.create(params.get('check', None))
+    server.maintenance = EnableDisableEnum.create(params.get('maintenance', None))
+    server.no_sslv3 = EnableDisableEnum.create(params.get('no_sslv3', None))
+    server.no_tlsv10 = EnableDisableEnum.create(params.get('no_tlsv10', None))
+    server.no_tlsv11 = EnableDisableEnum.create(params.get('no_tlsv11', None))
+    server.no_tlsv12 = EnableDisableEnum.create(params.get('no_tlsv12', None))
+    server.no_tlsv13 = EnableDisableEnum.create(params.get('no_tlsv13', None))
+    server.no_verifyhost = EnableDisableEnum.create(params.get('no_verifyhost', None))
+    server.stick = EnableDisableEnum.create(params.get('stick', None))
+    server.tfo = EnableDisableEnum.create(params.get('tfo', None))
+    server.send_proxy_v2_ssl = EnableDisableEnum.create(params.get('send_proxy_v2_ssl', None))
+    server.send_proxy_v2_ssl_cn = EnableDisableEnum.create(params.get('send_proxy_v2_ssl_cn', None))
+    server.ssl_reuse = EnableDisableEnum.create(params.get('ssl_reuse', None))
+    server.ssl = EnableDisableEnum.create(params.get('ssl', None))
+    server.ssl_max_ver = SSLVersion.create(params.get('ssl_max_ver', None))
+    server.ssl_min_ver = SSLVersion.create(params.get('ssl_min_ver', None))
+
+    # Build Requested Instance
+    return server
+
+
+# Build Server Fields Arguments Specification (Single Server and Servers List Entries)
+def build_server_specification() -> dict:
+
+    # Return Server Fields Specification
+    return dict(
+        name=dict(type='str', required=True),
+        address=dict(type='str', required=True),
+        port=dict(type='int', required=True),
+        verify=dict(type='str', required=False, choices=Requirement.names()),
+        verifyhost=dict(type='str', required=False),
+        weight=dict(type='int', required=False),
+        track=dict(type='str', required=False),
+        ws=dict(type='str', required=False, choices=WebSocketProtocol.names()),
+        check=dict(type='str', required=False, choices=EnableDisableEnum.names()),
+        health_check_address=dict(type='str', required=False),
+        health_check_port=dict(type='int', required=False),
+        max_reuse=dict(type='int', required=False),
+        maxconn=dict(type='int', required=False),
+        maxqueue=dict(type='int', required=False),
+        minconn=dict(type='int', required=False),
+        npn=dict(type='str', required=False),
+        fall=dict(type='int', required=False),
+        rise=dict(type='int', required=False),
+        inter=dict(type='int', required=False),
+        fastinter=dict(type='int', required=False),
+        error_limit=dict(type='int', required=False),
+        pool_low_conn=dict(type='int', required=False),
+        pool_max_conn=dict(type='int', required=False),
+        pool_purge_delay=dict(type='int', required=False),
+        proto=dict(type='str', required=False),
+        redir=dict(type='str', required=False),
+        resolve_opts=dict(type='str', required=False),
+        resolvers=dict(type='str', required=False),
+        ssl_cafile=dict(type='str', required=False),
+        ssl_certificate=dict(type='str', required=False),
+        tcp_ut=dict(type='int', required=False),
+        maintenance=dict(type='str', required=False, choices=EnableDisableEnum.names()),
+        no_sslv3=dict(type='str', required=False, choices=EnableDisableEnum.names()),
+        no_tlsv10=dict(type='str', required=False, choices=EnableDisableEnum.names()),
+        no_tlsv11=dict(type='str', required=False, choices=EnableDisableEnum.names()),
+        no_tlsv12=dict(type='str', required=False, choices=EnableDisableEnum.names()),
+        no_tlsv13=dict(type='str', required=False, choices=EnableDisableEnum.names()),
+        no_verifyhost=dict(type='str', required=False, choices=EnableDisableEnum.names()),
+        stick=dict(type='str', required=False, choices=EnableDisableEnum.names()),
+        tfo=dict(type='str', required=False, choices=EnableDisableEnum.names()),
+        send_proxy_v2_ssl=dict(type='str', required=False, choices=EnableDisableEnum.names()),
+        send_proxy_v2_ssl_cn=dict(type='str', required=False, choices=EnableDisableEnum.names()),
+        ssl_reuse=dict(type='str', required=False, choices=EnableDisableEnum.names()),
+        ssl=dict(type='str', required=False, choices=EnableDisableEnum.names()),
+        ssl_max_ver=dict(type='str', required=False, choices=SSLVersion.names()),
+        ssl_min_ver=dict(type='str', required=False, choices=SSLVersion.names())
+    )
+
+
+# Build Requested Backend from Configuration
+def build_requested_backend(params: dict) -> Backend:
+
+    # Base Parameters Name
+    base_param_names = [
+        "name", "bind_process", "check_timeout", "connect_timeout",
+        "description", "disabled", "enabled", "external_check_command",
+        "external_check_path", "fullconn", "queue_timeout", "retries",
+        "retry_on", "server_fin_timeout", "server_state_file_name",
+        "server_timeout", "srvtcpka_cnt", "srvtcpka_idle", "srvtcpka_intvl",
+    ]
+
+    # Build Requested Instance
+    backend = Backend(
+        **{k: v for k, v in params.items() if v is not None and k in base_param_names}
+    )
+
+    # Optional Initialization : mode
+    backend.mode = ProxyProtocol.create(params.get('mode', None))
+    backend.adv_check = AdvancedHealthCheckType.create(params.get('adv_check', None))
+    backend.abortonclose = EnableDisableEnum.create(params.get('abortonclose', None))
+    backend.accept_invalid_http_response = EnableDisableEnum.create(params.get('accept_invalid_http_response', None))
+    backend.allbackups = EnableDisableEnum.create(params.get('allbackups', None))
+    backend.checkcache = EnableDisableEnum.create(params.get('checkcache', None))
+    backend.external_check = EnableDisableEnum.create(params.get('external_check', None))
+    backend.nolinger = EnableDisableEnum.create(params.get('nolinger', None))
+    backend.prefer_last_server = EnableDisableEnum.create(params.get('prefer_last_server', None))
+    backend.splice_auto = EnableDisableEnum.create(params.get('splice_auto', None))
+    backend.splice_request = EnableDisableEnum.create(params.get('splice_request', None))
+    backend.splice_response = EnableDisableEnum.create(params.get('splice_response', None))
+    backend.spop_check = EnableDisableEnum.create(params.get('spop_check', None))
+    backend.srvtcpka = EnableDisableEnum.create(params.get('srvtcpka', None))
+    backend.independent_streams = EnableDisableEnum.create(params.get('independent_streams', None))
+    backend.log_health_checks = EnableDisableEnum.create(params.get('log_health_checks', None))
+
+    # Optional Initialization : balance
+    if params.get('balance', None) is not None:
+
+        # Extract balance
+        p_balance = params['balance']
+
+        # Initialize Object
+        backend.balance = Balance(
+            algorithm=LoadBalancingAlgorithm.create(p_balance.get('algorithm', None)),
+            hash_expression=p_balance.get('hash_expression', None),
+            hdr_name=p_balance.get('hdr_name', None),
+            hdr_use_domain_only=p_balance.get('hdr_use_domain_only', None),
+            random_draws=p_balance.get('random_draws', None),
+            rdp_cookie_name=p_balance.get('rdp_cookie_name', None),
+            uri_depth=p_balance.get('uri_depth', None),
+            uri_len=p_balance.get('uri_len', None),
+            uri_path_only=p_balance.get('uri_path_only', None),
+            uri_whole=p_balance.get('uri_whole', None),
+            url_param=p_balance.get('url_param', None),
+            url_param_check_post=p_balance.get('url_param_check_post', None),
+            url_param_max_wait=p_balance.get('url_param_max_wait', None)
+        )
+
+    # Optional Initialization : httpchk
+    if params.get('httpchk', None) is not None:
+
+        # Extract httpchk
+        p_httpchk = params['httpchk']
+
+        # Initialize Object
+        backend.adv_check = AdvancedHealthCheckType.HTTPCHK
+        backend.httpchk = HttpHealthCheck(
+            type=HealthCheckType.create(p_httpchk.get('type', None)),
+            method=p_httpchk.get('method', None),
+            uri=p_httpchk.get('uri', None),
+            uri_log_format=p_httpchk.get('uri_log_format', None),
+            var_expr=p_httpchk.get('var_expr', None),
+            var_format=p_httpchk.get('var_format', None),
+            var_name=p_httpchk.get('var_name', None),
+            var_scope=p_httpchk.get('var_scope', None),
+            version=p_httpchk.get('version', None),
+            via_socks4=p_httpchk.get('via_socks4', None),
+            port=p_httpchk.get('port', None),
+            port_string=p_httpchk.get('port_string', None),
+            proto=p_httpchk.get('proto', None),
+            send_proxy=p_httpchk.get('send_proxy', None),
+            sni=p_httpchk.get('sni', None),
+            ssl=p_httpchk.get('ssl', None),
+            status_code=p_httpchk.get('status_code', None),
+            tout_status=TimeoutStatus.create(p_httpchk.get('tout_status', None)),
+            match=MatchType.create(p_httpchk.get('match', None)),
+            headers=p_httpchk.get('headers', None),
+            body=p_httpchk.get('body', None),
+            body_log_format=p_httpchk.get('body_log_format', None),
+            check_comment=p_httpchk.get('check_comment', None),
+            default=p_httpchk.get('default', None),
+            error_status=ErrorStatus.create(p_httpchk.get('error_status', None)),
+            ok_status=OkStatus.create(p_httpchk.get('ok_status', None))
+        )
+
+    # Optional Initialization : httpchk_params
+    if params.get('httpchk_params', None) is not None:
+
+        # Extract httpchk_params
+        p_httpchk_params = params['httpchk_params']
+
+        # Initialize Object
+        backend.adv_check = AdvancedHealthCheckType.HTTPCHK
+        backend.httpchk_params = HttpCheckParams(
+            method=HttpMethod.create(p_httpchk_params.get('method', None)),
+            uri=p_httpchk_params.get('uri', None),
+            version=p_httpchk_params.get('version', None)
+        )
+
+    # Optional Initialization : pgsql_check_params
+    if params.get('pgsql_check_params', None) is not None:
+
+        # Extract pgsql_check_params
+        p_pgsql_check_params = params['pgsql_check_params']
+
+        # Initialize Object
+        backend.adv_check = AdvancedHealthCheckType.PGSQL_CHECK
+        backend.pgsql_check_params = PostgresSqlCheckParams(
+            username=p_pgsql_check_params.get('username', None)
+        )
+
+    # Optional Initialization : forwardfor
+    if params.get('forwardfor', None) is not None:
+
+        # Extract ForwardedFor
+        p_formwardfor = params['forwardfor']
+
+        # Initialize Object
+        backend.forwardfor = ForwardFor(
+            enabled=EnableDisableEnum.create(p_formwardfor.get('enabled', None)),
+            header=p_formwardfor.get('header', None),
+            ifnone=p_formwardfor.get('ifnone', None)
+        )
+
+    # Return Backend
+    return backend
+
+
+# Build Backend Fields Arguments Specification (Single Backend and Backends List Entries)
+def build_backend_specification() -> dict:
+
+    # Return Backend Fields Specification
+    return dict(
+        name=dict(type='str', required=True),
+        mode=dict(type='str', required=False, default='HTTP', choices=ProxyProtocol.names()),
+        adv_check=dict(type='str', required=False, choices=AdvancedHealthCheckType.names()),
+        balance=dict(type='dict', required=False, default=None),
+        httpchk=dict(type='dict', required=False, default=None),
+        httpchk_params=dict(type='dict', required=False, default=None),
+        pgsql_check_params=dict(type='dict', required=False, default=None),
+        ignore_persist=dict(type='dict', required=False, default=None),
+        abortonclose=dict(type='str', required=False, choices=EnableDisableEnum.names()),
+        accept_invalid_http_response=dict(type='str', required=False, choices=EnableDisableEnum.names()),
+        allbackups=dict(type='str', required=False, choices=EnableDisableEnum.names()),
+        checkcache=dict(type='str', required=False, choices=EnableDisableEnum.names()),
+        external_check=dict(type='str', required=False, choices=EnableDisableEnum.names()),
+        nolinger=dict(type='str', required=False, choices=EnableDisableEnum.names()),
+        prefer_last_server=dict(type='str', required=False, choices=EnableDisableEnum.names()),
+        splice_auto=dict(type='str', required=False, choices=EnableDisableEnum.names()),
+        splice_request=dict(type='str', required=False, choices=EnableDisableEnum.names()),
+        splice_response=dict(type='str', required=False, choices=EnableDisableEnum.names()),
+        spop_check=dict(type='str', required=False, choices=EnableDisableEnum.names()),
+        srvtcpka=dict(type='str', required=False, choices=EnableDisableEnum.names()),
+        independent_streams=dict(type='str', required=False, choices=EnableDisableEnum.names()),
+        log_health_checks=dict(type='str', required=False, choices=EnableDisableEnum.names()),
+        bind_process=dict(type='str', required=False),
+        check_timeout=dict(type='int', required=False),
+        connect_timeout=dict(type='int', required=False),
+        description=dict(type='str', required=False),
+        disabled=dict(type='bool', required=False),
+        enabled=dict(type='bool', required=False),
+        external_check_command=dict(type='str', required=False),
+        external_check_path=dict(type='str', required=False),
+        fullconn=dict(type='int', required=False),
+        queue_timeout=dict(type='int', required=False),
+        retries=dict(type='int', required=False),
+        retry_on=dict(type='str', required=False),
+        server_fin_timeout=dict(type='int', required=False),
+        server_state_file_name=dict(type='str', required=False),
+        server_timeout=dict(type='int', required=False),
+        srvtcpka_cnt=dict(type='int', required=False),
+        srvtcpka_idle=dict(type='int', required=False),
+        srvtcpka_intvl=dict(type='int', required=False),
+        forwardfor=dict(type='dict', required=False, default=None)
+    )
+
+
+# Build Requested Frontend from Configuration
+def build_requested_frontend(params: dict) -> Frontend:
+
+    # Base Parameters Name
+    base_param_names = [
+        "name",
+        "default_backend",
+        "log_format",
+        "description",
+        "log_format_sd",
+        "log_tag",
+        "maxconn",
+        "enabled",
+        "error_log_format",
+        "httplog"
+    ]
+
+    # Build Requested Instance
+    frontend = Frontend(
+        **{k: v for k, v in params.items() if v is not None and k in base_param_names}
+    )
+
+    # Optional Initialization : mode
+    frontend.mode = ProxyProtocol.create(params.get('mode', None))
+
+    # Optional Initialization : logsap
+    frontend.logsap = EnableDisableEnum.create(params.get('logsap', None))
+
+    # Optional Initialization : httpslog
+    frontend.httpslog = EnableDisableEnum.create(params.get('httpslog', None))
+
+    # Optional Initialization : forwardfor
+    if params.get('forwardfor', None):
+
+        # Extract ForwardedFor
+        p_formwardfor = params['forwardfor']
+
+        # Initialize Object
+        frontend.forwardfor = ForwardFor(
+            enabled=EnableDisableEnum.create(p_formwardfor.get('enabled', None)),
+            header=p_formwardfor.get('header', None),
+            ifnone=p_formwardfor.get('ifnone', None)
+        )
+
+    # Return Frontend
+    return frontend
+
+
+# Build Frontend Fields Arguments Specification (Single Frontend and Frontends List Entries)
+def build_frontend_specification() -> dict:
+
+    # Return Frontend Fields Specification
+    return dict(
+        name=dict(type='str', required=True),
+        mode=dict(type='str', required=False, default='HTTP', choices=['HTTP', 'TCP']),
+        default_backend=dict(type='str', required=False, default=None),
+        log_format=dict(type='str', required=False, default=None),
+        description=dict(type='str', required=False, default=None),
+        log_format_sd=dict(type='str', required=False, default=None),
+        log_tag=dict(type='str', required=False, default=None),
+        logsap=dict(type='str', required=False, default=None, choices=['enabled', 'disabled']),
+        maxconn=dict(type='int', required=False, default=None),
+        enabled=dict(type='bool', required=False, default=None),
+        httplog=dict(type='bool', required=False, default=None),
+        httpslog=dict(type='str', required=False, default=None),
+        error_log_format=dict(type='str', required=False, default=None),
+        forwardfor=dict(type='dict', required=False, default=None)
+    )
+
+
+# Build Requested Bind from Configuration
+def build_requested_bind(params: dict) -> Bind:
+
+    # Base Parameters Name
+    base_param_names = [
+        "name", "address", "port", "maxconn", "ssl", "ssl_cafile", "ssl_certificate", "strict_sni",
+        "tcp_user_timeout", "tfo", "thread", "tls_ticket_keys", "transparent", "uid", "user", "v4v6",
+        "v6only", "no_alpn", "no_ca_names", "no_sslv3", "no_tls_tickets", "no_tlsv10", "no_tlsv11",
+        "no_tlsv12", "no_tlsv13", "force_sslv3", "force_tlsv10", "force_tlsv11", "force_tlsv12",
+        "force_tlsv13", "generate_certificates", "crt_list", "ca_ignore_err", "ca_sign_file", "ca_sign_pass",
+        "ca_verify_file", "ciphers", "ciphersuites", "client_sigalgs", "crl_file", "crt_ignore_err",
+        "curves", "defer_accept", "accept_proxy", "allow_0rtt", "alpn"
+    ]
+
+    # Build Requested Instance
+    bind = Bind(
+        **{k: v for k, v in params.items() if v is not None and k in base_param_names}
+    )
+
+    # Optional Initialization : verify
+    bind.verify = Requirement.create(params.get('verify', None))
+
+    # Optional Initialization : ssl_max_ver
+    bind.ssl_max_ver = SSLVersion.create(params.get('ssl_max_ver', None))
+
+    # Optional Initialization : ssl_min_ver
+    bind.ssl_min_ver = SSLVersion.create(params.get('ssl_min_ver', None))
+
+    # Optional Initialization : level
+    bind.level = FrontendLevel.create(params.get('level', None))
+
+    # Return Bind
+    return bind
+
+
+# Build Bind Fields Arguments Specification (Single Bind and Binds List Entries)
+def build_bind_specification() -> dict:
+
+    # Return Bind Fields Specification
+    return dict(
+        name=dict(type='str', required=True),
+        address=dict(type='str', required=False),
+        port=dict(type='int', required=False),
+        maxconn=dict(type='int', required=False),
+        ssl=dict(type='bool', required=False),
+        ssl_cafile=dict(type='str', required=False),
+        ssl_certificate=dict(type='str', required=False),
+        strict_sni=dict(type='bool', required=False),
+        tcp_user_timeout=dict(type='int', required=False),
+        tfo=dict(type='bool', required=False),
+        thread=dict(type='str', required=False),
+        tls_ticket_keys=dict(type='str', required=False, no_log=True),
+        transparent=dict(type='bool', required=False),
+        uid=dict(type='str', required=False),
+        user=dict(type='str', required=False),
+        v4v6=dict(type='bool', required=False),
+        v6only=dict(type='bool', required=False),
+        no_alpn=dict(type='bool', required=False),
+        no_ca_names=dict(type='bool', required=False),
+        no_sslv3=dict(type='bool', required=False),
+        no_tls_tickets=dict(type='bool', required=False),
+        no_tlsv10=dict(type='bool', required=False),
+        no_tlsv11=dict(type='bool', required=False),
+        no_tlsv12=dict(type='bool', required=False),
+        no_tlsv13=dict(type='bool', required=False),
+        force_sslv3=dict(type='bool', required=False),
+        force_tlsv10=dict(type='bool', required=False),
+        force_tlsv11=dict(type='bool', required=False),
+        force_tlsv12=dict(type='bool', required=False),
+        force_tlsv13=dict(type='bool', required=False),
+        generate_certificates=dict(type='bool', required=False),
+        crt_list=dict(type='str', required=False),
+        ca_ignore_err=dict(type='str', required=False),
+        ca_sign_file=dict(type='str', required=False),
+        ca_sign_pass=dict(type='str', required=False, no_log=True),
+        ca_verify_file=dict(type='str', required=False),
+        ciphers=dict(type='str', required=False),
+        ciphersuites=dict(type='str', required=False),
+        client_sigalgs=dict(type='str', required=False),
+        crl_file=dict(type='str', required=False),
+        crt_ignore_err=dict(type='str', required=False),
+        curves=dict(type='str', required=False),
+        defer_accept=dict(type='str', required=False),
+        accept_proxy=dict(type='bool', required=False),
+        allow_0rtt=dict(type='bool', required=False),
+        alpn=dict(type='str', required=False),
+        verify=dict(type='str', required=False, choices=[enum.value for enum in Requirement]),
+        ssl_max_ver=dict(type='str', required=False, choices=[enum.value for enum in SSLVersion]),
+        ssl_min_ver=dict(type='str', required=False, choices=[enum.value for enum in SSLVersion]),
+        level=dict(type='str', required=False, choices=[enum.value for enum in FrontendLevel])
+    )
+
+
+# Build Requested Http Request Rule from Configuration
+def build_requested_http_request_rule(params: dict) -> HttpRequestRule:
+
+    # Base Parameters Name
+    base_param_names = [
+        "index", "acl_file", "acl_keyfmt", "auth_realm", "bandwidth_limit_limit",
+        "bandwidth_limit_name", "bandwidth_limit_period", "capture_id", "capture_len",
+        "capture_sample", "cond_test", "deny_status", "expr", "hdr_format", "hdr_match",
+        "hdr_method", "hdr_name", "hint_format", "hint_name", "lua_action", "lua_params",
+        "map_file", "map_keyfmt", "map_valuefmt", "mark_value", "method_fmt", "nice_value",
+        "normalizer_full", "normalizer_strict", "path_fmt", "path_match", "redir_code",
+        "redir_option", "redir_value", "resolvers", "return_content", "return_content_type",
+        "return_status_code"
+    ]
+
+    # Build Requested Instance
+    rule = HttpRequestRule(
+        **{k: v for k, v in params.items() if v is not None and k in base_param_names}
+    )
+
+    # Optional Initialization : mode
+    rule.type = HttpRequestRuleType.create(params.get('type', None))
+    rule.cond = ConditionType.create(params.get('cond', None))
+    rule.log_level = LogLevel.create(params.get('log_level', None))
+    rule.normalizer = HttpRequestRuleNormalizerType.create(params.get('normalizer', None))
+    rule.protocol = IPProtocol.create(params.get('protocol', None))
+    rule.redir_type = RedirectType.create(params.get('redir_type', None))
+
+    # Build Requested Instance
+    return rule
+
+
+# Build Requested Http Request Rules List from Configuration
+def build_requested_http_request_rules(entries: list) -> list:
+
+    # Build Requested Instances (Indexed by their Position)
+    return [build_requested_http_request_rule(dict(entry, index=position)) for position, entry in enumerate(entries)]
+
+
+# Build Http Request Rule Fields Arguments Specification (Single Rule, and Rules List Entries where the type is required)
+def build_http_request_rule_specification(entry: bool = False) -> dict:
+
+    # Return Http Request Rule Fields Specification
+    return dict(
+        type=dict(type='str', required=entry, choices=HttpRequestRuleType.names()),
+        acl_file=dict(type='str', required=False),
+        acl_keyfmt=dict(type='str', required=False, no_log=True),
+        auth_realm=dict(type='str', required=False),
+        bandwidth_limit_limit=dict(type='str', required=False),
+        bandwidth_limit_name=dict(type='str', required=False),
+        bandwidth_limit_period=dict(type='str', required=False),
+        capture_id=dict(type='int', required=False),
+        capture_len=dict(type='int', required=False),
+        capture_sample=dict(type='str', required=False),
+        cond=dict(type='str', required=False, choices=ConditionType.names()),
+        cond_test=dict(type='str', required=False),
+        deny_status=dict(type='int', required=False),
+        expr=dict(type='str', required=False),
+        hdr_format=dict(type='str', required=False),
+        hdr_match=dict(type='str', required=False),
+        hdr_method=dict(type='str', required=False),
+        hdr_name=dict(type='str', required=False),
+        hint_format=dict(type='str', required=False),
+        hint_name=dict(type='str', required=False),
+        log_level=dict(type='str', required=False, choices=LogLevel.names()),
+        lua_action=dict(type='str', required=False),
+        lua_params=dict(type='str', required=False),
+        map_file=dict(type='str', required=False),
+        map_keyfmt=dict(type='str', required=False, no_log=True),
+        map_valuefmt=dict(type='str', required=False),
+        mark_value=dict(type='str', required=False),
+        method_fmt=dict(type='str', required=False),
+        nice_value=dict(type='int', required=False),
+        normalizer=dict(type='str', required=False, choices=HttpRequestRuleNormalizerType.names()),
+        normalizer_full=dict(type='bool', required=False),
+        normalizer_strict=dict(type='bool', required=False),
+        path_fmt=dict(type='str', required=False),
+        path_match=dict(type='str', required=False),
+        protocol=dict(type='str', required=False, choices=IPProtocol.names()),
+        redir_code=dict(type='int', required=False),
+        redir_option=dict(type='str', required=False),
+        redir_type=dict(type='str', required=False, choices=RedirectType.names()),
+        redir_value=dict(type='str', required=False),
+        resolvers=dict(type='str', required=False),
+        return_content=dict(type='str', required=False),
+        return_content_type=dict(type='str', required=False),
+        return_status_code=dict(type='int', required=False)
+    )
+
+
+# Build Requested ACLs List from Configuration
+def build_requested_acls(entries: list) -> list:
+
+    # Build Requested Instances (Indexed by their Position)
+    return [
+        Acl(
+            acl_name=entry['acl_name'],
+            criterion=entry['criterion'],
+            index=position,
+            value=entry.get('value', None)
+        )
+        for position, entry in enumerate(entries)
+    ]
+
+
+# Build ACL Fields Arguments Specification (ACLs List Entries)
+def build_acl_specification() -> dict:
+
+    # Return ACL Fields Specification
+    return dict(
+        acl_name=dict(type='str', required=True),
+        criterion=dict(type='str', required=True),
+        value=dict(type='str', required=False)
+    )
+
+
+# Build Requested Backend Switching Rules List from Configuration
+def build_requested_backend_switching_rules(entries: list) -> list:
+
+    # Build Requested Instances (Indexed by their Position)
+    return [
+        BackendSwitchingRule(
+            cond=ConditionType.create(entry.get('cond', None)),
+            cond_test=entry.get('cond_test', None),
+            index=position,
+            name=entry['name']
+        )
+        for position, entry in enumerate(entries)
+    ]
+
+
+# Build Backend Switching Rule Fields Arguments Specification (Rules List Entries)
+def build_backend_switching_rule_specification() -> dict:
+
+    # Return Backend Switching Rule Fields Specification
+    return dict(
+        name=dict(type='str', required=True),
+        cond=dict(type='str', required=False, choices=['if', 'unless']),
+        cond_test=dict(type='str', required=False)
+    )
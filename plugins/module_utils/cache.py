@@ -0,0 +1,146 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+
+class FileCache:
+    """
+    JSON File Cache shared by the processes of a play (modules, lookups).
+
+    Each entry is stored in its own file (named from the SHA-256 of its key), and
+    written atomically, so concurrent readers never see a partial entry.
+
+    Attributes:
+        directory (str): The cache directory.
+        ttl (float): The entries time to live in seconds (entries never expire if None).
+    """
+
+    # Cache File Extension
+    FILE_EXTENSION = ".json"
+
+    def __init__(self, directory: str, ttl: float = None):
+        """
+        Initializes the File Cache.
+
+        Args:
+            directory (str): The cache directory (created if it does not exist).
+            ttl (float): The entries time to live in seconds (entries never expire if None).
+        Raises:
+            ValueError: If the directory is not provided.
+        """
+
+        # If Directory is not Provided
+        if not directory:
+
+            # Raise Value Exception
+            raise ValueError("[FileCache] - Initialization failed : 'directory' is required")
+
+        # Initialize Directory
+        self.directory = os.path.expanduser(directory)
+
+        # Initialize Time To Live
+        self.ttl = ttl
+
+        # Create Directory (Private to the User)
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+
+    def path(self, key: str):
+        """
+        Get the file path of an entry.
+
+        Args:
+            key (str): The entry key.
+
+        Returns:
+            str: The entry file path.
+        """
+
+        # Return Hashed File Path
+        return os.path.join(self.directory, hashlib.sha256(key.encode('utf-8')).hexdigest() + self.FILE_EXTENSION)
+
+    def get(self, key: str, default=None):
+        """
+        Get an entry value.
+
+        Args:
+            key (str): The entry key.
+            default: The value returned if the entry is missing, expired or unreadable.
+
+        Returns:
+            The entry value.
+        """
+
+        # Entry File Path
+        path = self.path(key)
+
+        try:
+
+            # If Entry is Expired
+            if self.ttl is not None and time.time() - os.path.getmtime(path) > self.ttl:
+
+                # Return Default Value
+                return default
+
+            # Read Entry
+            with open(path, 'r', encoding='utf-8') as entry_file:
+
+                # Return Entry Value
+                return json.load(entry_file)
+
+        except (OSError, ValueError):
+
+            # Return Default Value
+            return default
+
+    def set(self, key: str, value):
+        """
+        Set an entry value (atomic write).
+
+        Args:
+            key (str): The entry key.
+            value: The entry value (JSON serializable).
+        """
+
+        # Write Entry in a Temporary File of the Cache Directory
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+
+        try:
+
+            # Write Entry Value
+            with os.fdopen(file_descriptor, 'w', encoding='utf-8') as entry_file:
+                json.dump(value, entry_file)
+
+            # Replace Entry File
+            os.replace(temporary_path, self.path(key))
+
+        except (OSError, TypeError, ValueError):
+
+            # Remove Temporary File
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+            # Re-Raise Exception
+            raise
+
+    def delete(self, key: str):
+        """
+        Delete an entry.
+
+        Args:
+            key (str): The entry key.
+        """
+
+        try:
+
+            # Remove Entry File
+            os.remove(self.path(key))
+
+        except FileNotFoundError:
+
+            # Entry does not exist
+            pass
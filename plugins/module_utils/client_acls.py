@@ -1,15 +1,10 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-from .commons import filter_none, is_2xx
+from .commons import filter_none, is_2xx, build_session
 from .models import Acl
 from .client_configurations import ConfigurationClient
-
-try:
-    import requests
-    IMPORTS_OK = True
-except ImportError:
-    IMPORTS_OK = False
+from .reconcile import reconcile, ordered_entries, without_entries
 
 
 class AclClient:
@@ -42,7 +37,7 @@ class AclClient:
     # URL Format
     URL_TEMPLATE = "{base_url}/{version}/{uri}"
 
-    def __init__(self, base_url: str, api_version: str, auth):
+    def __init__(self, base_url: str, api_version: str, auth, session=None, timeout: float = None, configuration=None):
         """
         Initializes the HAProxyClient with the given base URL and credentials.
 
@@ -50,6 +45,9 @@ class AclClient:
             base_url (str): The base URL (scheme://host:port) of the HAProxy Data Plane API.
             api_version (str): The HAProxy Data Plane API Version (v1 or v2)
             auth (HTTPBasicAuth): The Authentication Configuration
+            session (requests.Session): The Shared HTTP Session (a dedicated one is built if not provided)
+            timeout (float): The HTTP Requests Timeout in seconds
+            configuration (ConfigurationClient): The Shared Configuration Client (a dedicated one is built if not provided)
         Raises:
             ValueError: If any of the required parameters are not provided.
         """
@@ -75,17 +73,30 @@ class AclClient:
         # Initialize Basic Authentication
         self.auth = auth
 
-        # Initialize Configuration Client
-        self.configuration = ConfigurationClient(
+        # Initialize HTTP Session (Shared Connection Pool)
+        self.session = session if session is not None else build_session()
+
+        # Initialize Requests Timeout
+        self.timeout = timeout
+
+        # Initialize Configuration Client (Shared Configuration Version Cache)
+        self.configuration = configuration if configuration is not None else ConfigurationClient(
             base_url=base_url,
             api_version=api_version,
-            auth=auth
+            auth=auth,
+            session=self.session,
+            timeout=timeout
         )
 
-    def get_acls(self):
+    def get_acls(self, parent_name: str = None, parent_type: str = 'backend', transaction_id: str = None):
         """
         Retrieves the list of Acls from the HAProxy Data Plane API.
 
+        Args:
+            parent_name (str): The name of the Acls Parent (all the Acls if not provided)
+            parent_type (str): The Type of the Acls Parent
+            transaction_id (str): Started Transaction ID (the Acls as changed in the Transaction)
+
         Returns:
             list: A list of Acls in JSON format.
 
@@ -93,15 +104,38 @@ class AclClient:
             requests.exceptions.HTTPError: If the API request fails.
         """
 
+        # Configuration Snapshot
+        snapshot = self.configuration.snapshot
+
+        # If a Configuration Snapshot is Set and the committed Acls of a Parent are Requested
+        if snapshot is not None and parent_name and not transaction_id:
+
+            # Return Acls from Snapshot (Same format as the API)
+            return {'_version': self.configuration.version, 'data': snapshot.get_section('acls', parent_name, parent_type)}
+
+        # Initialize URI
+        acls_uri = self.ACLS_URI
+
+        # If Parent is Provided
+        if parent_name:
+
+            # Initialize URI (Acls of the Parent, in the Transaction if Provided)
+            acls_uri = (self.ACL_URI_TEMPLATE_TX if transaction_id else self.GET_ACL_URI_TEMPLATE).format(
+                acl_uri=self.ACLS_URI,
+                transaction_id=transaction_id,
+                parent_name=parent_name,
+                parent_type=parent_type
+            )
+
         # Build the Operation URL
         url = self.URL_TEMPLATE.format(
             base_url=self.base_url,
-            uri=self.ACLS_URI,
+            uri=acls_uri,
             version=self.api_version
         )
 
         # Execute Request
-        response = requests.get(url, auth=self.auth)
+        response = self.session.get(url, auth=self.auth, timeout=self.timeout)
 
         # If Object Exists
         if is_2xx(response.status_code):
@@ -124,12 +158,21 @@ class AclClient:
             parent_type (str): The Type of the Acl Parent
 
         Returns:
-            dict: Details of Acl in JSON format.
+            dict: Details of Acl in JSON format (None if it does not exist in the Configuration Snapshot).
 
         Raises:
             requests.exceptions.HTTPError: If the API request fails.
         """
 
+        # Configuration Snapshot
+        snapshot = self.configuration.snapshot
+
+        # If a Configuration Snapshot is Set
+        if snapshot is not None:
+
+            # Return Acl from Snapshot (None if it does not exist)
+            return snapshot.get_object('acls', index, parent_name, parent_type)
+
         # Build the Operation URL
         url = self.URL_TEMPLATE.format(
             base_url=self.base_url,
@@ -142,7 +185,7 @@ class AclClient:
         )
 
         # Execute Request
-        response = requests.get(url, auth=self.auth)
+        response = self.session.get(url, auth=self.auth, timeout=self.timeout)
 
         # If Object Exists
         if is_2xx(response.status_code):
@@ -186,13 +229,10 @@ class AclClient:
 
         else:
 
-            # Get Configuration Version
-            config_version = self.configuration.get_configuration_version()
-
             # Initialize URI
             create_acl_uri = self.ACL_URI_TEMPLATE_VERSION.format(
                 acl_uri=self.ACLS_URI,
-                config_version=config_version,
+                config_version=self.configuration.VERSION_PLACEHOLDER,
                 force_reload=force_reload,
                 parent_name=parent_name,
                 parent_type=parent_type
@@ -206,13 +246,13 @@ class AclClient:
         )
 
         # Execute Request
-        response = requests.post(
+        response = self.configuration.execute(
+            'POST',
             url=url,
             json=filter_none(acl),
             headers={
                 "Content-Type": self.CONTENT_TYPE_JSON
-            },
-            auth=self.auth
+            }
         )
 
         # If Object Exists
@@ -258,13 +298,10 @@ class AclClient:
 
         else:
 
-            # Get Configuration Version
-            config_version = self.configuration.get_configuration_version()
-
             # Initialize URI
             create_acl_uri = self.ACL_URI_TEMPLATE_VERSION.format(
                 acl_uri=self.ACL_URI.format(index=index),
-                config_version=config_version,
+                config_version=self.configuration.VERSION_PLACEHOLDER,
                 force_reload=force_reload,
                 parent_name=parent_name,
                 parent_type=parent_type
@@ -278,13 +315,13 @@ class AclClient:
         )
 
         # Execute Request
-        response = requests.put(
+        response = self.configuration.execute(
+            'PUT',
             url=url,
             json=filter_none(acl),
             headers={
                 "Content-Type": self.CONTENT_TYPE_JSON
-            },
-            auth=self.auth
+            }
         )
 
         # If Object Exists
@@ -298,6 +335,62 @@ class AclClient:
             # Raise Exception
             response.raise_for_status()
 
+    def reconcile_acls(self, acls: list, transaction_id: str, parent_name: str, parent_type: str = 'backend',
+                       force_reload: bool = True, absent: bool = False, check_mode: bool = False):
+        """
+        Make the ordered Acls of a Parent match the given list, with the fewest writes, in a single Transaction.
+
+        The Acls list is fetched once, and only the inserts, updates and deletes of the
+        minimal edit script are sent (instead of one write per shifted index).
+
+        Args:
+            acls (list): The requested Acls (Acl), in order (their index is their position).
+            transaction_id (str): Started Transaction ID (a dedicated Transaction is used if not provided)
+            parent_name (str): The name of the Acls Parent
+            parent_type (str): The Type of the Parent
+            force_reload (bool): Force Reload HA Proxy Configuration (used if no Transaction ID Provided)
+            absent (bool): Remove the given Acls from the Parent instead (the other Acls are kept, in order)
+            check_mode (bool): Only compute the operations
+
+        Returns:
+            dict: The outcome ({'operations', 'before', 'after'}, see reconcile.reconcile).
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails.
+        """
+
+        # Existing Acls (as changed in the Transaction if Provided)
+        existing = ordered_entries(self.get_acls(parent_name=parent_name, parent_type=parent_type, transaction_id=transaction_id))
+
+        # Reconcile Acls
+        return reconcile(
+            client=self,
+            existing=existing,
+            requested=without_entries(existing, acls) if absent else acls,
+            create=lambda index, entry, transaction_id: self.create_acl(
+                acl=entry,
+                transaction_id=transaction_id,
+                parent_name=parent_name,
+                parent_type=parent_type
+            ),
+            update=lambda index, entry, transaction_id: self.update_acl(
+                index=index,
+                acl=entry,
+                transaction_id=transaction_id,
+                parent_name=parent_name,
+                parent_type=parent_type
+            ),
+            delete=lambda index, transaction_id: self.delete_acl(
+                index=index,
+                transaction_id=transaction_id,
+                parent_name=parent_name,
+                parent_type=parent_type
+            ),
+            transaction_id=transaction_id,
+            force_reload=force_reload,
+            check_mode=check_mode
+        )
+
     def delete_acl(self, index: int, transaction_id: str, parent_name: str, parent_type: str = 'backend', force_reload: bool = True):
         """
         Delete a Acl on HAProxy API.
@@ -326,13 +419,10 @@ class AclClient:
 
         else:
 
-            # Get Configuration Version
-            config_version = self.configuration.get_configuration_version()
-
             # Initialize URI
             create_acl_uri = self.ACL_URI_TEMPLATE_VERSION.format(
                 acl_uri=self.ACL_URI.format(index=index),
-                config_version=config_version,
+                config_version=self.configuration.VERSION_PLACEHOLDER,
                 force_reload=force_reload,
                 parent_name=parent_name,
                 parent_type=parent_type
@@ -346,12 +436,12 @@ class AclClient:
         )
 
         # Execute Request
-        response = requests.delete(
+        response = self.configuration.execute(
+            'DELETE',
             url=url,
             headers={
                 "Content-Type": self.CONTENT_TYPE_JSON
-            },
-            auth=self.auth
+            }
         )
 
         # If Object Exists
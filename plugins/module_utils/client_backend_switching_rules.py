@@ -1,15 +1,10 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-from .commons import filter_none, is_2xx
+from .commons import filter_none, is_2xx, build_session
 from .models import BackendSwitchingRule
 from .client_configurations import ConfigurationClient
-
-try:
-    import requests
-    IMPORTS_OK = True
-except ImportError:
-    IMPORTS_OK = False
+from .reconcile import reconcile, ordered_entries, without_entries
 
 
 class BackendSwitchingRuleClient:
@@ -42,7 +37,7 @@ class BackendSwitchingRuleClient:
     # URL Format
     URL_TEMPLATE = "{base_url}/{version}/{uri}"
 
-    def __init__(self, base_url: str, api_version: str, auth):
+    def __init__(self, base_url: str, api_version: str, auth, session=None, timeout: float = None, configuration=None):
         """
         Initializes the HAProxyClient with the given base URL and credentials.
 
@@ -50,6 +45,9 @@ class BackendSwitchingRuleClient:
             base_url (str): The base URL (scheme://host:port) of the HAProxy Data Plane API.
             api_version (str): The HAProxy Data Plane API Version (v1 or v2)
             auth (HTTPBasicAuth): The Authentication Configuration
+            session (requests.Session): The Shared HTTP Session (a dedicated one is built if not provided)
+            timeout (float): The HTTP Requests Timeout in seconds
+            configuration (ConfigurationClient): The Shared Configuration Client (a dedicated one is built if not provided)
         Raises:
             ValueError: If any of the required parameters are not provided.
         """
@@ -75,17 +73,29 @@ class BackendSwitchingRuleClient:
         # Initialize Basic Authentication
         self.auth = auth
 
-        # Initialize Configuration Client
-        self.configuration = ConfigurationClient(
+        # Initialize HTTP Session (Shared Connection Pool)
+        self.session = session if session is not None else build_session()
+
+        # Initialize Requests Timeout
+        self.timeout = timeout
+
+        # Initialize Configuration Client (Shared Configuration Version Cache)
+        self.configuration = configuration if configuration is not None else ConfigurationClient(
             base_url=base_url,
             api_version=api_version,
-            auth=auth
+            auth=auth,
+            session=self.session,
+            timeout=timeout
         )
 
-    def get_backend_switching_rules(self):
+    def get_backend_switching_rules(self, frontend_name: str = None, transaction_id: str = None):
         """
         Retrieves the list of BackendSwitchingRules from the HAProxy Data Plane API.
 
+        Args:
+            frontend_name (str): The name of the Frontend Parent (all the BackendSwitchingRules if not provided)
+            transaction_id (str): Started Transaction ID (the BackendSwitchingRules as changed in the Transaction)
+
         Returns:
             list: A list of BackendSwitchingRules in JSON format.
 
@@ -93,15 +103,37 @@ class BackendSwitchingRuleClient:
             requests.exceptions.HTTPError: If the API request fails.
         """
 
+        # Configuration Snapshot
+        snapshot = self.configuration.snapshot
+
+        # If a Configuration Snapshot is Set and the committed BackendSwitchingRules of a Frontend are Requested
+        if snapshot is not None and frontend_name and not transaction_id:
+
+            # Return BackendSwitchingRules from Snapshot (Same format as the API)
+            return {'_version': self.configuration.version, 'data': snapshot.get_section('backend_switching_rules', frontend_name)}
+
+        # Initialize URI
+        besrs_uri = self.BACKEND_SWITCHING_RULES_URI
+
+        # If Frontend is Provided
+        if frontend_name:
+
+            # Initialize URI (BackendSwitchingRules of the Frontend, in the Transaction if Provided)
+            besrs_uri = (self.BACKEND_SWITCHING_RULE_URI_TEMPLATE_TX if transaction_id else self.GET_BACKEND_SWITCHING_RULE_URI_TEMPLATE).format(
+                besr_uri=self.BACKEND_SWITCHING_RULES_URI,
+                transaction_id=transaction_id,
+                frontend_name=frontend_name
+            )
+
         # Build the Operation URL
         url = self.URL_TEMPLATE.format(
             base_url=self.base_url,
-            uri=self.BACKEND_SWITCHING_RULES_URI,
+            uri=besrs_uri,
             version=self.api_version
         )
 
         # Execute Request
-        response = requests.get(url, auth=self.auth)
+        response = self.session.get(url, auth=self.auth, timeout=self.timeout)
 
         # If Object Exists
         if is_2xx(response.status_code):
@@ -123,12 +155,21 @@ class BackendSwitchingRuleClient:
             frontend_name (str): The name of the Frontend Parent
 
         Returns:
-            dict: Details of BackendSwitchingRule in JSON format.
+            dict: Details of BackendSwitchingRule in JSON format (None if it does not exist in the Configuration Snapshot).
 
         Raises:
             requests.exceptions.HTTPError: If the API request fails.
         """
 
+        # Configuration Snapshot
+        snapshot = self.configuration.snapshot
+
+        # If a Configuration Snapshot is Set
+        if snapshot is not None:
+
+            # Return BackendSwitchingRule from Snapshot (None if it does not exist)
+            return snapshot.get_object('backend_switching_rules', index, frontend_name)
+
         # Build the Operation URL
         url = self.URL_TEMPLATE.format(
             base_url=self.base_url,
@@ -140,7 +181,7 @@ class BackendSwitchingRuleClient:
         )
 
         # Execute Request
-        response = requests.get(url, auth=self.auth)
+        response = self.session.get(url, auth=self.auth, timeout=self.timeout)
 
         # If Object Exists
         if is_2xx(response.status_code):
@@ -182,13 +223,10 @@ class BackendSwitchingRuleClient:
 
         else:
 
-            # Get Configuration Version
-            config_version = self.configuration.get_configuration_version()
-
             # Initialize URI
             create_besr_uri = self.BACKEND_SWITCHING_RULE_URI_TEMPLATE_VERSION.format(
                 besr_uri=self.BACKEND_SWITCHING_RULES_URI,
-                config_version=config_version,
+                config_version=self.configuration.VERSION_PLACEHOLDER,
                 force_reload=force_reload,
                 frontend_name=frontend_name
             )
@@ -201,13 +239,13 @@ class BackendSwitchingRuleClient:
         )
 
         # Execute Request
-        response = requests.post(
+        response = self.configuration.execute(
+            'POST',
             url=url,
             json=filter_none(besr),
             headers={
                 "Content-Type": self.CONTENT_TYPE_JSON
-            },
-            auth=self.auth
+            }
         )
 
         # If Object Exists
@@ -251,13 +289,10 @@ class BackendSwitchingRuleClient:
 
         else:
 
-            # Get Configuration Version
-            config_version = self.configuration.get_configuration_version()
-
             # Initialize URI
             create_besr_uri = self.BACKEND_SWITCHING_RULE_URI_TEMPLATE_VERSION.format(
                 besr_uri=self.BACKEND_SWITCHING_RULE_URI.format(index=index),
-                config_version=config_version,
+                config_version=self.configuration.VERSION_PLACEHOLDER,
                 force_reload=force_reload,
                 frontend_name=frontend_name
             )
@@ -270,13 +305,13 @@ class BackendSwitchingRuleClient:
         )
 
         # Execute Request
-        response = requests.put(
+        response = self.configuration.execute(
+            'PUT',
             url=url,
             json=filter_none(besr),
             headers={
                 "Content-Type": self.CONTENT_TYPE_JSON
-            },
-            auth=self.auth
+            }
         )
 
         # If Object Exists
@@ -290,6 +325,58 @@ class BackendSwitchingRuleClient:
             # Raise Exception
             response.raise_for_status()
 
+    def reconcile_backend_switching_rules(self, besrs: list, transaction_id: str, frontend_name: str,
+                                          force_reload: bool = True, absent: bool = False, check_mode: bool = False):
+        """
+        Make the ordered BackendSwitchingRules of a Frontend match the given list, with the fewest writes, in a single Transaction.
+
+        The BackendSwitchingRules list is fetched once, and only the inserts, updates and deletes of the
+        minimal edit script are sent (instead of one write per shifted index).
+
+        Args:
+            besrs (list): The requested BackendSwitchingRules (BackendSwitchingRule), in order (their index is their position).
+            transaction_id (str): Started Transaction ID (a dedicated Transaction is used if not provided)
+            frontend_name (str): The name of the Frontend Parent
+            force_reload (bool): Force Reload HA Proxy Configuration (used if no Transaction ID Provided)
+            absent (bool): Remove the given BackendSwitchingRules from the Frontend instead (the other ones are kept, in order)
+            check_mode (bool): Only compute the operations
+
+        Returns:
+            dict: The outcome ({'operations', 'before', 'after'}, see reconcile.reconcile).
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails.
+        """
+
+        # Existing BackendSwitchingRules (as changed in the Transaction if Provided)
+        existing = ordered_entries(self.get_backend_switching_rules(frontend_name=frontend_name, transaction_id=transaction_id))
+
+        # Reconcile BackendSwitchingRules
+        return reconcile(
+            client=self,
+            existing=existing,
+            requested=without_entries(existing, besrs) if absent else besrs,
+            create=lambda index, entry, transaction_id: self.create_backend_switching_rule(
+                besr=entry,
+                transaction_id=transaction_id,
+                frontend_name=frontend_name
+            ),
+            update=lambda index, entry, transaction_id: self.update_backend_switching_rule(
+                index=index,
+                besr=entry,
+                transaction_id=transaction_id,
+                frontend_name=frontend_name
+            ),
+            delete=lambda index, transaction_id: self.delete_backend_switching_rule(
+                index=index,
+                transaction_id=transaction_id,
+                frontend_name=frontend_name
+            ),
+            transaction_id=transaction_id,
+            force_reload=force_reload,
+            check_mode=check_mode
+        )
+
     def delete_backend_switching_rule(self, index: int, transaction_id: str, frontend_name: str, force_reload: bool = True):
         """
         Delete a BackendSwitchingRule on HAProxy API.
@@ -317,13 +404,10 @@ class BackendSwitchingRuleClient:
 
         else:
 
-            # Get Configuration Version
-            config_version = self.configuration.get_configuration_version()
-
             # Initialize URI
             create_besr_uri = self.BACKEND_SWITCHING_RULE_URI_TEMPLATE_VERSION.format(
                 besr_uri=self.BACKEND_SWITCHING_RULE_URI.format(index=index),
-                config_version=config_version,
+                config_version=self.configuration.VERSION_PLACEHOLDER,
                 force_reload=force_reload,
                 frontend_name=frontend_name
             )
@@ -336,12 +420,12 @@ class BackendSwitchingRuleClient:
         )
 
         # Execute Request
-        response = requests.delete(
+        response = self.configuration.execute(
+            'DELETE',
             url=url,
             headers={
                 "Content-Type": self.CONTENT_TYPE_JSON
-            },
-            auth=self.auth
+            }
         )
 
         # If Object Exists
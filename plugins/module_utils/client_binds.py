@@ -1,15 +1,10 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-from .commons import filter_none, is_2xx
+from .commons import filter_none, is_2xx, build_session
 from .models import Bind
 from .client_configurations import ConfigurationClient
-
-try:
-    import requests
-    IMPORTS_OK = True
-except ImportError:
-    IMPORTS_OK = False
+from .upsert import upsert
 
 
 class BindClient:
@@ -42,7 +37,7 @@ class BindClient:
     # URL Format
     URL_TEMPLATE = "{base_url}/{version}/{uri}"
 
-    def __init__(self, base_url: str, api_version: str, auth):
+    def __init__(self, base_url: str, api_version: str, auth, session=None, timeout: float = None, configuration=None):
         """
         Initializes the HAProxyClient with the given base URL and credentials.
 
@@ -50,6 +45,9 @@ class BindClient:
             base_url (str): The base URL (scheme://host:port) of the HAProxy Data Plane API.
             api_version (str): The HAProxy Data Plane API Version (v1 or v2)
             auth (HTTPBasicAuth): The Authentication Configuration
+            session (requests.Session): The Shared HTTP Session (a dedicated one is built if not provided)
+            timeout (float): The HTTP Requests Timeout in seconds
+            configuration (ConfigurationClient): The Shared Configuration Client (a dedicated one is built if not provided)
         Raises:
             ValueError: If any of the required parameters are not provided.
         """
@@ -75,11 +73,19 @@ class BindClient:
         # Initialize Basic Authentication
         self.auth = auth
 
-        # Initialize Configuration Client
-        self.configuration = ConfigurationClient(
+        # Initialize HTTP Session (Shared Connection Pool)
+        self.session = session if session is not None else build_session()
+
+        # Initialize Requests Timeout
+        self.timeout = timeout
+
+        # Initialize Configuration Client (Shared Configuration Version Cache)
+        self.configuration = configuration if configuration is not None else ConfigurationClient(
             base_url=base_url,
             api_version=api_version,
-            auth=auth
+            auth=auth,
+            session=self.session,
+            timeout=timeout
         )
 
     def get_binds(self):
@@ -101,7 +107,7 @@ class BindClient:
         )
 
         # Execute Request
-        response = requests.get(url, auth=self.auth)
+        response = self.session.get(url, auth=self.auth, timeout=self.timeout)
 
         # If Object Exists
         if is_2xx(response.status_code):
@@ -124,12 +130,21 @@ class BindClient:
             parent_type (str): The Type of the Parent
 
         Returns:
-            dict: Details of Bind in JSON format.
+            dict: Details of Bind in JSON format (None if it does not exist in the Configuration Snapshot).
 
         Raises:
             requests.exceptions.HTTPError: If the API request fails.
         """
 
+        # Configuration Snapshot
+        snapshot = self.configuration.snapshot
+
+        # If a Configuration Snapshot is Set
+        if snapshot is not None:
+
+            # Return Bind from Snapshot (None if it does not exist)
+            return snapshot.get_object('binds', name, parent_name, parent_type)
+
         # Build the Operation URL
         url = self.URL_TEMPLATE.format(
             base_url=self.base_url,
@@ -142,7 +157,7 @@ class BindClient:
         )
 
         # Execute Request
-        response = requests.get(url, auth=self.auth)
+        response = self.session.get(url, auth=self.auth, timeout=self.timeout)
 
         # If Object Exists
         if is_2xx(response.status_code):
@@ -186,13 +201,10 @@ class BindClient:
 
         else:
 
-            # Get Configuration Version
-            config_version = self.configuration.get_configuration_version()
-
             # Initialize URI
             create_bind_uri = self.BIND_URI_TEMPLATE_VERSION.format(
                 bind_uri=self.BINDS_URI,
-                config_version=config_version,
+                config_version=self.configuration.VERSION_PLACEHOLDER,
                 force_reload=force_reload,
                 parent_name=parent_name,
                 parent_type=parent_type
@@ -206,13 +218,13 @@ class BindClient:
         )
 
         # Execute Request
-        response = requests.post(
+        response = self.configuration.execute(
+            'POST',
             url=url,
             json=filter_none(bind),
             headers={
                 "Content-Type": self.CONTENT_TYPE_JSON
-            },
-            auth=self.auth
+            }
         )
 
         # If Object Exists
@@ -258,13 +270,10 @@ class BindClient:
 
         else:
 
-            # Get Configuration Version
-            config_version = self.configuration.get_configuration_version()
-
             # Initialize URI
             create_bind_uri = self.BIND_URI_TEMPLATE_VERSION.format(
                 bind_uri=self.BIND_URI.format(name=name),
-                config_version=config_version,
+                config_version=self.configuration.VERSION_PLACEHOLDER,
                 force_reload=force_reload,
                 parent_name=parent_name,
                 parent_type=parent_type
@@ -278,13 +287,13 @@ class BindClient:
         )
 
         # Execute Request
-        response = requests.put(
+        response = self.configuration.execute(
+            'PUT',
             url=url,
             json=filter_none(bind),
             headers={
                 "Content-Type": self.CONTENT_TYPE_JSON
-            },
-            auth=self.auth
+            }
         )
 
         # If Object Exists
@@ -298,6 +307,52 @@ class BindClient:
             # Raise Exception
             response.raise_for_status()
 
+    def upsert_bind(self, bind: Bind, transaction_id: str, parent_name: str, parent_type: str = 'frontend', force_reload: bool = True):
+        """
+        Create a Bind on HAProxy API, or update it if it already exists (create-first upsert).
+
+        A new Bind costs a single write; an existing one is looked up and updated only if it differs.
+
+        Args:
+            bind (Bind): The Bind to create or update.
+            transaction_id (str): Started Transaction ID
+            parent_name (str): The name of the Bind Parent
+            parent_type (str): The Type of the Parent
+            force_reload (bool): Force Reload HA Proxy Configuration (used if no Transaction ID Provided)
+
+        Returns:
+            dict: The outcome ({'action' : created, updated or unchanged, 'before', 'after', 'changes'}).
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails.
+        """
+
+        # Create First, then Update on Conflict
+        return upsert(
+            requested=bind,
+            create=lambda: self.create_bind(
+                bind=bind,
+                transaction_id=transaction_id,
+                parent_name=parent_name,
+                parent_type=parent_type,
+                force_reload=force_reload
+            ),
+            get=lambda: self.get_bind(
+                name=bind.name,
+                parent_name=parent_name,
+                parent_type=parent_type
+            ),
+            update=lambda: self.update_bind(
+                name=bind.name,
+                bind=bind,
+                transaction_id=transaction_id,
+                parent_name=parent_name,
+                parent_type=parent_type,
+                force_reload=force_reload
+            ),
+            configuration=self.configuration
+        )
+
     def delete_bind(self, name: str, transaction_id: str, parent_name: str, parent_type: str = 'frontend', force_reload: bool = True):
         """
         Delete a Bind on HAProxy API.
@@ -326,13 +381,10 @@ class BindClient:
 
         else:
 
-            # Get Configuration Version
-            config_version = self.configuration.get_configuration_version()
-
             # Initialize URI
             create_bind_uri = self.BIND_URI_TEMPLATE_VERSION.format(
                 bind_uri=self.BIND_URI.format(name=name),
-                config_version=config_version,
+                config_version=self.configuration.VERSION_PLACEHOLDER,
                 force_reload=force_reload,
                 parent_name=parent_name,
                 parent_type=parent_type
@@ -346,12 +398,12 @@ class BindClient:
         )
 
         # Execute Request
-        response = requests.delete(
+        response = self.configuration.execute(
+            'DELETE',
             url=url,
             headers={
                 "Content-Type": self.CONTENT_TYPE_JSON
-            },
-            auth=self.auth
+            }
         )
 
         # If Object Exists
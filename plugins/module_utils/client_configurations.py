@@ -1,13 +1,7 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-from .commons import is_2xx
-
-try:
-    import requests
-    IMPORTS_OK = True
-except ImportError:
-    IMPORTS_OK = False
+from .commons import is_2xx, build_session
 
 
 class ConfigurationClient:
@@ -17,15 +11,26 @@ class ConfigurationClient:
     Attributes:
         base_url (str): The base URL of the HAProxy Data Plane API.
         auth (HTTPBasicAuth): The HTTP basic authentication credentials.
+        version (int): The cached Configuration Version (None if unknown).
+        snapshot (ConfigurationSnapshot): The Configuration Snapshot serving the lookups (None if disabled).
     """
 
     # Backends URI
     CONFIG_VERSION_URI = "services/haproxy/configuration/version"
 
+    # Configuration Version Response Header
+    CONFIG_VERSION_HEADER = "Configuration-Version"
+
+    # Configuration Version Placeholder (resolved when the request is executed)
+    VERSION_PLACEHOLDER = "__CONFIGURATION_VERSION__"
+
+    # Number of Retries on Configuration Version Conflict
+    VERSION_CONFLICT_RETRIES = 2
+
     # URL Format
     URL_TEMPLATE = "{base_url}/{version}/{uri}"
 
-    def __init__(self, base_url: str, api_version: str, auth):
+    def __init__(self, base_url: str, api_version: str, auth, session=None, timeout: float = None):
         """
         Initializes the HAProxyClient with the given base URL and credentials.
 
@@ -33,6 +38,8 @@ class ConfigurationClient:
             base_url (str): The base URL (scheme://host:port) of the HAProxy Data Plane API.
             api_version (str): The HAProxy Data Plane API Version (v1 or v2)
             auth (HTTPBasicAuth): The Authentication Configuration
+            session (requests.Session): The Shared HTTP Session (a dedicated one is built if not provided)
+            timeout (float): The HTTP Requests Timeout in seconds
         Raises:
             ValueError: If any of the required parameters are not provided.
         """
@@ -58,10 +65,28 @@ class ConfigurationClient:
         # Initialize Basic Authentication
         self.auth = auth
 
-    def get_configuration_version(self):
+        # Initialize HTTP Session (Shared Connection Pool)
+        self.session = session if session is not None else build_session()
+
+        # Initialize Requests Timeout
+        self.timeout = timeout
+
+        # Initialize Configuration Version Cache
+        self.version = None
+
+        # Initialize Configuration Snapshot (Lookups are served by the API if None)
+        self.snapshot = None
+
+    def get_configuration_version(self, refresh: bool = False):
         """
         Get HAProxy Configuration Version.
 
+        The version is cached and kept up to date from the write responses, so it is
+        only fetched from the API when unknown or when a refresh is requested.
+
+        Args:
+            refresh (bool): Ignore the cached version and fetch it from the API.
+
         Returns:
             integer: Configuration Version.
 
@@ -69,6 +94,12 @@ class ConfigurationClient:
             requests.exceptions.HTTPError: If the API request fails.
         """
 
+        # If Cached Version is usable
+        if not refresh and self.version is not None:
+
+            # Return Cached Version
+            return self.version
+
         # Build the Operation URL
         url = self.URL_TEMPLATE.format(
             base_url=self.base_url,
@@ -77,15 +108,129 @@ class ConfigurationClient:
         )
 
         # Execute Request
-        response = requests.get(url, auth=self.auth)
+        response = self.session.get(url, auth=self.auth, timeout=self.timeout)
 
         # If Object Exists
         if is_2xx(response.status_code):
 
-            # Return JSON
-            return response.json()
+            # Cache and Return Version
+            self.version = response.json()
+            return self.version
 
         else:
 
             # Raise Exception
             response.raise_for_status()
+
+    def track_version(self, response):
+        """
+        Update the cached Configuration Version from a write response.
+
+        Args:
+            response (requests.Response): The write response.
+        """
+
+        # If Write Failed
+        if not is_2xx(response.status_code):
+
+            # Keep Cached Version
+            return
+
+        # Extract Version Header
+        header_version = response.headers.get(self.CONFIG_VERSION_HEADER)
+
+        # If Header is not Provided
+        if not header_version:
+
+            # Cached Version is Outdated
+            self.version = None
+            return
+
+        try:
+
+            # Cache Version
+            self.version = int(header_version)
+
+        except ValueError:
+
+            # Cached Version is Unknown
+            self.version = None
+
+    def is_version_conflict(self, response):
+        """
+        Check if a response is a Configuration Version conflict (and not an 'already exists' conflict).
+
+        Args:
+            response (requests.Response): The write response.
+
+        Returns:
+            bool: True if the response is a Configuration Version conflict.
+        """
+
+        # If Status is not Conflict
+        if response.status_code != 409:
+
+            # Not a Conflict
+            return False
+
+        try:
+
+            # Extract Error Message
+            message = str(response.json().get("message", "")).lower()
+
+        except (ValueError, AttributeError):
+
+            # No Error Message
+            message = ""
+
+        # Return Version Conflict Status
+        return "version" in message and "exist" not in message
+
+    def execute(self, method: str, url: str, **kwargs):
+        """
+        Execute a Request, resolving the Configuration Version placeholder of the URL if any.
+
+        Versioned requests use the cached Configuration Version, are retried with a refreshed
+        version on version conflicts, and update the cache from the response.
+
+        Args:
+            method (str): The HTTP Method.
+            url (str): The Request URL (may contain VERSION_PLACEHOLDER).
+            kwargs: The Request Arguments (json, data, headers, files...).
+
+        Returns:
+            requests.Response: The Response.
+        """
+
+        # If URL does not depend on the Configuration Version
+        if self.VERSION_PLACEHOLDER not in url:
+
+            # Execute Request
+            return self.session.request(method, url, auth=self.auth, timeout=self.timeout, **kwargs)
+
+        # Iterate on Attempts
+        for attempt in range(self.VERSION_CONFLICT_RETRIES + 1):
+
+            # Get Configuration Version (Refreshed after a Conflict)
+            config_version = self.get_configuration_version(refresh=attempt > 0)
+
+            # Execute Request
+            response = self.session.request(
+                method,
+                url.replace(self.VERSION_PLACEHOLDER, str(config_version)),
+                auth=self.auth,
+                timeout=self.timeout,
+                **kwargs
+            )
+
+            # If not a Version Conflict
+            if not self.is_version_conflict(response):
+
+                # Stop Attempts
+                break
+
+        # Update Cached Version
+        self.track_version(response)
+
+        # Return Response
+        return response
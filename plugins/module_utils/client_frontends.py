@@ -1,15 +1,10 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-from .commons import filter_none, is_2xx
+from .commons import filter_none, is_2xx, build_session
 from .models import Frontend
 from .client_configurations import ConfigurationClient
-
-try:
-    import requests
-    IMPORTS_OK = True
-except ImportError:
-    IMPORTS_OK = False
+from .upsert import upsert
 
 
 class FrontendClient:
@@ -39,7 +34,7 @@ class FrontendClient:
     # URL Format
     URL_TEMPLATE = "{base_url}/{version}/{uri}"
 
-    def __init__(self, base_url: str, api_version: str, auth):
+    def __init__(self, base_url: str, api_version: str, auth, session=None, timeout: float = None, configuration=None):
         """
         Initializes the HAProxyClient with the given base URL and credentials.
 
@@ -47,6 +42,9 @@ class FrontendClient:
             base_url (str): The base URL (scheme://host:port) of the HAProxy Data Plane API.
             api_version (str): The HAProxy Data Plane API Version (v1 or v2)
             auth (HTTPBasicAuth): The Authentication Configuration
+            session (requests.Session): The Shared HTTP Session (a dedicated one is built if not provided)
+            timeout (float): The HTTP Requests Timeout in seconds
+            configuration (ConfigurationClient): The Shared Configuration Client (a dedicated one is built if not provided)
         Raises:
             ValueError: If any of the required parameters are not provided.
         """
@@ -72,11 +70,19 @@ class FrontendClient:
         # Initialize Basic Authentication
         self.auth = auth
 
-        # Initialize Configuration Client
-        self.configuration = ConfigurationClient(
+        # Initialize HTTP Session (Shared Connection Pool)
+        self.session = session if session is not None else build_session()
+
+        # Initialize Requests Timeout
+        self.timeout = timeout
+
+        # Initialize Configuration Client (Shared Configuration Version Cache)
+        self.configuration = configuration if configuration is not None else ConfigurationClient(
             base_url=base_url,
             api_version=api_version,
-            auth=auth
+            auth=auth,
+            session=self.session,
+            timeout=timeout
         )
 
     def get_frontends(self):
@@ -98,7 +104,7 @@ class FrontendClient:
         )
 
         # Execute Request
-        response = requests.get(url, auth=self.auth)
+        response = self.session.get(url, auth=self.auth, timeout=self.timeout)
 
         # If Object Exists
         if is_2xx(response.status_code):
@@ -119,12 +125,21 @@ class FrontendClient:
             name (str): The name of the frontend to retrieve details for.
 
         Returns:
-            dict: Details of Frontend in JSON format.
+            dict: Details of Frontend in JSON format (None if it does not exist in the Configuration Snapshot).
 
         Raises:
             requests.exceptions.HTTPError: If the API request fails.
         """
 
+        # Configuration Snapshot
+        snapshot = self.configuration.snapshot
+
+        # If a Configuration Snapshot is Set
+        if snapshot is not None:
+
+            # Return Frontend from Snapshot (None if it does not exist)
+            return snapshot.get_object('frontends', name)
+
         # Build the Operation URL
         url = self.URL_TEMPLATE.format(
             base_url=self.base_url,
@@ -133,7 +148,7 @@ class FrontendClient:
         )
 
         # Execute Request
-        response = requests.get(url, auth=self.auth)
+        response = self.session.get(url, auth=self.auth, timeout=self.timeout)
 
         # If Object Exists
         if is_2xx(response.status_code):
@@ -173,13 +188,10 @@ class FrontendClient:
 
         else:
 
-            # Get Configuration Version
-            config_version = self.configuration.get_configuration_version()
-
             # Initialize URI
             create_frontend_uri = self.FRONTEND_URI_TEMPLATE_VERSION.format(
                 frontend_uri=self.FRONTENDS_URI,
-                config_version=config_version,
+                config_version=self.configuration.VERSION_PLACEHOLDER,
                 force_reload=force_reload
             )
 
@@ -191,13 +203,13 @@ class FrontendClient:
         )
 
         # Execute Request
-        response = requests.post(
+        response = self.configuration.execute(
+            'POST',
             url=url,
             json=filter_none(frontend),
             headers={
                 "Content-Type": self.CONTENT_TYPE_JSON
-            },
-            auth=self.auth
+            }
         )
 
         # If Object Exists
@@ -239,13 +251,10 @@ class FrontendClient:
 
         else:
 
-            # Get Configuration Version
-            config_version = self.configuration.get_configuration_version()
-
             # Initialize URI
             create_frontend_uri = self.FRONTEND_URI_TEMPLATE_VERSION.format(
                 frontend_uri=self.FRONTEND_URI.format(name=name),
-                config_version=config_version,
+                config_version=self.configuration.VERSION_PLACEHOLDER,
                 force_reload=force_reload
             )
 
@@ -257,13 +266,13 @@ class FrontendClient:
         )
 
         # Execute Request
-        response = requests.put(
+        response = self.configuration.execute(
+            'PUT',
             url=url,
             json=filter_none(frontend),
             headers={
                 "Content-Type": self.CONTENT_TYPE_JSON
-            },
-            auth=self.auth
+            }
         )
 
         # If Object Exists
@@ -277,6 +286,44 @@ class FrontendClient:
             # Raise Exception
             response.raise_for_status()
 
+    def upsert_frontend(self, frontend: Frontend, transaction_id: str, force_reload: bool = True):
+        """
+        Create a Frontend on HAProxy API, or update it if it already exists (create-first upsert).
+
+        A new Frontend costs a single write; an existing one is looked up and updated only if it differs.
+
+        Args:
+            frontend (Frontend): The Frontend to create or update.
+            transaction_id (str): Started Transaction ID
+            force_reload (bool): Force Reload HA Proxy Configuration (used if no Transaction ID Provided)
+
+        Returns:
+            dict: The outcome ({'action' : created, updated or unchanged, 'before', 'after', 'changes'}).
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails.
+        """
+
+        # Create First, then Update on Conflict
+        return upsert(
+            requested=frontend,
+            create=lambda: self.create_frontend(
+                frontend=frontend,
+                transaction_id=transaction_id,
+                force_reload=force_reload
+            ),
+            get=lambda: self.get_frontend(
+                name=frontend.name
+            ),
+            update=lambda: self.update_frontend(
+                name=frontend.name,
+                frontend=frontend,
+                transaction_id=transaction_id,
+                force_reload=force_reload
+            ),
+            configuration=self.configuration
+        )
+
     def delete_frontend(self, name: str, transaction_id: str, force_reload: bool = True):
         """
         Delete a Frontend on HAProxy API.
@@ -301,13 +348,10 @@ class FrontendClient:
 
         else:
 
-            # Get Configuration Version
-            config_version = self.configuration.get_configuration_version()
-
             # Initialize URI
             create_frontend_uri = self.FRONTEND_URI_TEMPLATE_VERSION.format(
                 frontend_uri=self.FRONTEND_URI.format(name=name),
-                config_version=config_version,
+                config_version=self.configuration.VERSION_PLACEHOLDER,
                 force_reload=force_reload
             )
 
@@ -319,12 +363,12 @@ class FrontendClient:
         )
 
         # Execute Request
-        response = requests.delete(
+        response = self.configuration.execute(
+            'DELETE',
             url=url,
             headers={
                 "Content-Type": self.CONTENT_TYPE_JSON
-            },
-            auth=self.auth
+            }
         )
 
         # If Object Exists
@@ -1,15 +1,10 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-from .commons import filter_none, is_2xx
+from .commons import filter_none, is_2xx, build_session
 from .models import HttpRequestRule
 from .client_configurations import ConfigurationClient
-
-try:
-    import requests
-    IMPORTS_OK = True
-except ImportError:
-    IMPORTS_OK = False
+from .reconcile import reconcile, ordered_entries, without_entries
 
 
 class HttpRequestRuleClient:
@@ -42,7 +37,7 @@ class HttpRequestRuleClient:
     # URL Format
     URL_TEMPLATE = "{base_url}/{version}/{uri}"
 
-    def __init__(self, base_url: str, api_version: str, auth):
+    def __init__(self, base_url: str, api_version: str, auth, session=None, timeout: float = None, configuration=None):
         """
         Initializes the HAProxyClient with the given base URL and credentials.
 
@@ -50,6 +45,9 @@ class HttpRequestRuleClient:
             base_url (str): The base URL (scheme://host:port) of the HAProxy Data Plane API.
             api_version (str): The HAProxy Data Plane API Version (v1 or v2)
             auth (HTTPBasicAuth): The Authentication Configuration
+            session (requests.Session): The Shared HTTP Session (a dedicated one is built if not provided)
+            timeout (float): The HTTP Requests Timeout in seconds
+            configuration (ConfigurationClient): The Shared Configuration Client (a dedicated one is built if not provided)
         Raises:
             ValueError: If any of the required parameters are not provided.
         """
@@ -75,17 +73,30 @@ class HttpRequestRuleClient:
         # Initialize Basic Authentication
         self.auth = auth
 
-        # Initialize Configuration Client
-        self.configuration = ConfigurationClient(
+        # Initialize HTTP Session (Shared Connection Pool)
+        self.session = session if session is not None else build_session()
+
+        # Initialize Requests Timeout
+        self.timeout = timeout
+
+        # Initialize Configuration Client (Shared Configuration Version Cache)
+        self.configuration = configuration if configuration is not None else ConfigurationClient(
             base_url=base_url,
             api_version=api_version,
-            auth=auth
+            auth=auth,
+            session=self.session,
+            timeout=timeout
         )
 
-    def get_rules(self):
+    def get_rules(self, parent_name: str = None, parent_type: str = 'backend', transaction_id: str = None):
         """
         Retrieves the list of HttpRequestRules from the HAProxy Data Plane API.
 
+        Args:
+            parent_name (str): The name of the HttpRequestRules Parent (all the HttpRequestRules if not provided)
+            parent_type (str): The Type of the HttpRequestRules Parent
+            transaction_id (str): Started Transaction ID (the HttpRequestRules as changed in the Transaction)
+
         Returns:
             list: A list of HttpRequestRules in JSON format.
 
@@ -93,15 +104,38 @@ class HttpRequestRuleClient:
             requests.exceptions.HTTPError: If the API request fails.
         """
 
+        # Configuration Snapshot
+        snapshot = self.configuration.snapshot
+
+        # If a Configuration Snapshot is Set and the committed HttpRequestRules of a Parent are Requested
+        if snapshot is not None and parent_name and not transaction_id:
+
+            # Return HttpRequestRules from Snapshot (Same format as the API)
+            return {'_version': self.configuration.version, 'data': snapshot.get_section('http_request_rules', parent_name, parent_type)}
+
+        # Initialize URI
+        http_rq_rules_uri = self.HTTP_RQ_RULES_URI
+
+        # If Parent is Provided
+        if parent_name:
+
+            # Initialize URI (HttpRequestRules of the Parent, in the Transaction if Provided)
+            http_rq_rules_uri = (self.RQ_RULE_URI_TEMPLATE_TX if transaction_id else self.GET_RQ_RULE_URI_TEMPLATE).format(
+                http_rq_rule_uri=self.HTTP_RQ_RULES_URI,
+                transaction_id=transaction_id,
+                parent_name=parent_name,
+                parent_type=parent_type
+            )
+
         # Build the Operation URL
         url = self.URL_TEMPLATE.format(
             base_url=self.base_url,
-            uri=self.HTTP_RQ_RULES_URI,
+            uri=http_rq_rules_uri,
             version=self.api_version
         )
 
         # Execute Request
-        response = requests.get(url, auth=self.auth)
+        response = self.session.get(url, auth=self.auth, timeout=self.timeout)
 
         # If Object Exists
         if is_2xx(response.status_code):
@@ -124,12 +158,21 @@ class HttpRequestRuleClient:
             parent_type (str): The Type of the HttpRequestRule Parent
 
         Returns:
-            dict: Details of HttpRequestRule in JSON format.
+            dict: Details of HttpRequestRule in JSON format (None if it does not exist in the Configuration Snapshot).
 
         Raises:
             requests.exceptions.HTTPError: If the API request fails.
         """
 
+        # Configuration Snapshot
+        snapshot = self.configuration.snapshot
+
+        # If a Configuration Snapshot is Set
+        if snapshot is not None:
+
+            # Return Rule from Snapshot (None if it does not exist)
+            return snapshot.get_object('http_request_rules', index, parent_name, parent_type)
+
         # Build the Operation URL
         url = self.URL_TEMPLATE.format(
             base_url=self.base_url,
@@ -142,7 +185,7 @@ class HttpRequestRuleClient:
         )
 
         # Execute Request
-        response = requests.get(url, auth=self.auth)
+        response = self.session.get(url, auth=self.auth, timeout=self.timeout)
 
         # If Object Exists
         if is_2xx(response.status_code):
@@ -186,13 +229,10 @@ class HttpRequestRuleClient:
 
         else:
 
-            # Get Configuration Version
-            config_version = self.configuration.get_configuration_version()
-
             # Initialize URI
             create_http_rq_rule_uri = self.RQ_RULE_URI_TEMPLATE_VERSION.format(
                 http_rq_rule_uri=self.HTTP_RQ_RULES_URI,
-                config_version=config_version,
+                config_version=self.configuration.VERSION_PLACEHOLDER,
                 force_reload=force_reload,
                 parent_name=parent_name,
                 parent_type=parent_type
@@ -206,13 +246,13 @@ class HttpRequestRuleClient:
         )
 
         # Execute Request
-        response = requests.post(
+        response = self.configuration.execute(
+            'POST',
             url=url,
             json=filter_none(rule),
             headers={
                 "Content-Type": self.CONTENT_TYPE_JSON
-            },
-            auth=self.auth
+            }
         )
 
         # If Object Exists
@@ -258,13 +298,10 @@ class HttpRequestRuleClient:
 
         else:
 
-            # Get Configuration Version
-            config_version = self.configuration.get_configuration_version()
-
             # Initialize URI
             create_http_rq_rule_uri = self.RQ_RULE_URI_TEMPLATE_VERSION.format(
                 http_rq_rule_uri=self.RQ_RULE_URI.format(index=index),
-                config_version=config_version,
+                config_version=self.configuration.VERSION_PLACEHOLDER,
                 force_reload=force_reload,
                 parent_name=parent_name,
                 parent_type=parent_type
@@ -278,13 +315,13 @@ class HttpRequestRuleClient:
         )
 
         # Execute Request
-        response = requests.put(
+        response = self.configuration.execute(
+            'PUT',
             url=url,
             json=filter_none(rule),
             headers={
                 "Content-Type": self.CONTENT_TYPE_JSON
-            },
-            auth=self.auth
+            }
         )
 
         # If Object Exists
@@ -298,6 +335,62 @@ class HttpRequestRuleClient:
             # Raise Exception
             response.raise_for_status()
 
+    def reconcile_rules(self, rules: list, transaction_id: str, parent_name: str, parent_type: str = 'backend',
+                        force_reload: bool = True, absent: bool = False, check_mode: bool = False):
+        """
+        Make the ordered HttpRequestRules of a Parent match the given list, with the fewest writes, in a single Transaction.
+
+        The HttpRequestRules list is fetched once, and only the inserts, updates and deletes of the
+        minimal edit script are sent (instead of one write per shifted index).
+
+        Args:
+            rules (list): The requested HttpRequestRules (HttpRequestRule), in order (their index is their position).
+            transaction_id (str): Started Transaction ID (a dedicated Transaction is used if not provided)
+            parent_name (str): The name of the HttpRequestRules Parent
+            parent_type (str): The Type of the Parent
+            force_reload (bool): Force Reload HA Proxy Configuration (used if no Transaction ID Provided)
+            absent (bool): Remove the given HttpRequestRules from the Parent instead (the other ones are kept, in order)
+            check_mode (bool): Only compute the operations
+
+        Returns:
+            dict: The outcome ({'operations', 'before', 'after'}, see reconcile.reconcile).
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails.
+        """
+
+        # Existing HttpRequestRules (as changed in the Transaction if Provided)
+        existing = ordered_entries(self.get_rules(parent_name=parent_name, parent_type=parent_type, transaction_id=transaction_id))
+
+        # Reconcile HttpRequestRules
+        return reconcile(
+            client=self,
+            existing=existing,
+            requested=without_entries(existing, rules) if absent else rules,
+            create=lambda index, entry, transaction_id: self.create_rule(
+                rule=entry,
+                transaction_id=transaction_id,
+                parent_name=parent_name,
+                parent_type=parent_type
+            ),
+            update=lambda index, entry, transaction_id: self.update_rule(
+                index=index,
+                rule=entry,
+                transaction_id=transaction_id,
+                parent_name=parent_name,
+                parent_type=parent_type
+            ),
+            delete=lambda index, transaction_id: self.delete_rule(
+                index=index,
+                transaction_id=transaction_id,
+                parent_name=parent_name,
+                parent_type=parent_type
+            ),
+            transaction_id=transaction_id,
+            force_reload=force_reload,
+            check_mode=check_mode
+        )
+
     def delete_rule(self, index: int, transaction_id: str, parent_name: str, parent_type: str = 'backend', force_reload: bool = True):
         """
         Delete a HttpRequestRule on HAProxy API.
@@ -326,13 +419,10 @@ class HttpRequestRuleClient:
 
         else:
 
-            # Get Configuration Version
-            config_version = self.configuration.get_configuration_version()
-
             # Initialize URI
             create_http_rq_rule_uri = self.RQ_RULE_URI_TEMPLATE_VERSION.format(
                 http_rq_rule_uri=self.RQ_RULE_URI.format(index=index),
-                config_version=config_version,
+                config_version=self.configuration.VERSION_PLACEHOLDER,
                 force_reload=force_reload,
                 parent_name=parent_name,
                 parent_type=parent_type
@@ -346,12 +436,12 @@ class HttpRequestRuleClient:
         )
 
         # Execute Request
-        response = requests.delete(
+        response = self.configuration.execute(
+            'DELETE',
             url=url,
             headers={
                 "Content-Type": self.CONTENT_TYPE_JSON
-            },
-            auth=self.auth
+            }
         )
 
         # If Object Exists
@@ -0,0 +1,216 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import time
+
+from .client_configurations import ConfigurationClient
+from .commons import is_2xx, build_session
+
+
+# Default Maximum Time waiting for a Reload (seconds)
+DEFAULT_RELOAD_TIMEOUT = 60
+
+# Default Interval between two Reload Status Polls (seconds)
+DEFAULT_RELOAD_INTERVAL = 1.0
+
+
+class ReloadClient:
+    """
+    Client for interacting with the HAProxy Data Plane API for Reloads.
+
+    Changes made without forced reload are applied by a delayed reload of the Data Plane API
+    (all the changes made within the reload delay share it); the write responses carry the
+    ID of that reload (Reload-ID header), which can be waited on with this client.
+
+    Attributes:
+        base_url (str): The base URL of the HAProxy Data Plane API.
+        auth (HTTPBasicAuth): The HTTP basic authentication credentials.
+    """
+
+    # Reload Status : Pending (Delayed Reload not Run Yet)
+    STATUS_IN_PROGRESS = "in_progress"
+
+    # Reload Status : Failed
+    STATUS_FAILED = "failed"
+
+    # Reloads URI
+    RELOADS_URI = "services/haproxy/reloads"
+
+    # Reload URI
+    RELOAD_URI = "services/haproxy/reloads/{reload_id}"
+
+    # URL Format
+    URL_TEMPLATE = "{base_url}/{version}/{uri}"
+
+    def __init__(self, base_url: str, api_version: str, auth, session=None, timeout: float = None, configuration=None):
+        """
+        Initializes the ReloadClient with the given base URL and credentials.
+
+        Args:
+            base_url (str): The base URL (scheme://host:port) of the HAProxy Data Plane API.
+            api_version (str): The HAProxy Data Plane API Version (v1 or v2)
+            auth (HTTPBasicAuth): The Authentication Configuration
+            session (requests.Session): The Shared HTTP Session (a dedicated one is built if not provided)
+            timeout (float): The HTTP Requests Timeout in seconds
+            configuration (ConfigurationClient): The Shared Configuration Client (a dedicated one is built if not provided)
+        Raises:
+            ValueError: If any of the required parameters are not provided.
+        """
+
+        # If Base URL is not Provided
+        if not base_url:
+
+            # Raise Value Exception
+            raise ValueError("[ReloadClient] - Initialization failed : 'base_url' is required")
+
+        # If auth is not Provided
+        if not auth:
+
+            # Raise Value Exception
+            raise ValueError("[ReloadClient] - Initialization failed : 'auth' is required")
+
+        # Initialize Base URL
+        self.base_url = base_url.rstrip('/')
+
+        # Initialize Version
+        self.api_version = api_version if api_version else "v2"
+
+        # Initialize Basic Authentication
+        self.auth = auth
+
+        # Initialize HTTP Session (Shared Connection Pool)
+        self.session = session if session is not None else build_session()
+
+        # Initialize Requests Timeout
+        self.timeout = timeout
+
+        # Initialize Configuration Client (Shared Configuration Version Cache)
+        self.configuration = configuration if configuration is not None else ConfigurationClient(
+            base_url=base_url,
+            api_version=api_version,
+            auth=auth,
+            session=self.session,
+            timeout=timeout
+        )
+
+    def get_reloads(self):
+        """
+        Get the HAProxy Reloads (the pending delayed reload and the last ones).
+
+        Returns:
+            list: The Reloads ({'id', 'status', 'reload_timestamp', 'response'}).
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails.
+        """
+
+        # Build the Operation URL
+        url = self.URL_TEMPLATE.format(
+            base_url=self.base_url,
+            uri=self.RELOADS_URI,
+            version=self.api_version
+        )
+
+        # Execute Request
+        response = self.session.get(url, auth=self.auth, timeout=self.timeout)
+
+        # If Request Succeeded
+        if is_2xx(response.status_code):
+
+            # Return JSON
+            return response.json()
+
+        else:
+
+            # Raise Exception
+            response.raise_for_status()
+
+    def get_reload(self, reload_id: str):
+        """
+        Get a HAProxy Reload.
+
+        Args:
+            reload_id (str): The Reload ID.
+
+        Returns:
+            dict: The Reload ({'id', 'status', 'reload_timestamp', 'response'}).
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails.
+        """
+
+        # Build the Operation URL
+        url = self.URL_TEMPLATE.format(
+            base_url=self.base_url,
+            uri=self.RELOAD_URI.format(reload_id=reload_id),
+            version=self.api_version
+        )
+
+        # Execute Request
+        response = self.session.get(url, auth=self.auth, timeout=self.timeout)
+
+        # If Request Succeeded
+        if is_2xx(response.status_code):
+
+            # Return JSON
+            return response.json()
+
+        else:
+
+            # Raise Exception
+            response.raise_for_status()
+
+    def get_pending_reloads(self):
+        """
+        Get the IDs of the HAProxy Reloads not run yet.
+
+        Returns:
+            list: The pending Reloads IDs.
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails.
+        """
+
+        # Return Pending Reloads IDs
+        return [reload['id'] for reload in self.get_reloads() or [] if reload.get('status') == self.STATUS_IN_PROGRESS]
+
+    def wait_reload(self, reload_id: str, timeout: float = DEFAULT_RELOAD_TIMEOUT, interval: float = DEFAULT_RELOAD_INTERVAL):
+        """
+        Wait for a HAProxy Reload to run (succeed or fail).
+
+        Args:
+            reload_id (str): The Reload ID.
+            timeout (float): The maximum waiting time in seconds.
+            interval (float): The interval between two status polls in seconds.
+
+        Returns:
+            dict: The Reload, once run ({'id', 'status', 'reload_timestamp', 'response'}).
+
+        Raises:
+            ValueError: If the Reload is still pending after the timeout.
+            requests.exceptions.HTTPError: If the API request fails.
+        """
+
+        # Deadline
+        deadline = time.monotonic() + timeout
+
+        # Poll Reload Status
+        while True:
+
+            # Get Reload
+            reload = self.get_reload(reload_id=reload_id)
+
+            # If Reload has Run
+            if reload.get('status') != self.STATUS_IN_PROGRESS:
+
+                # Return Reload
+                return reload
+
+            # If Deadline is Reached
+            if time.monotonic() + interval > deadline:
+
+                # Raise Value Exception
+                raise ValueError("[ReloadClient] - Reload '{0}' still in progress after {1}s".format(reload_id, timeout))
+
+            # Wait before next Poll
+            time.sleep(interval)
@@ -1,15 +1,10 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-from .commons import filter_none, is_2xx
-from .models import Server
+from .commons import filter_none, is_2xx, build_session
+from .models import Server, RuntimeServer
 from .client_configurations import ConfigurationClient
-
-try:
-    import requests
-    IMPORTS_OK = True
-except ImportError:
-    IMPORTS_OK = False
+from .upsert import upsert
 
 
 class ServerClient:
@@ -39,10 +34,19 @@ class ServerClient:
     # Server URI Template with Config Version and Force Reload
     SERVER_URI_TEMPLATE_VERSION = "{server_uri}?version={config_version}&force_reload={force_reload}&parent_type={parent_type}&parent_name={parent_name}"
 
+    # Runtime Servers URI
+    RUNTIME_SERVERS_URI = "services/haproxy/runtime/servers"
+
+    # Runtime Server URI
+    RUNTIME_SERVER_URI = "services/haproxy/runtime/servers/{name}"
+
+    # Runtime Server URI Template
+    RUNTIME_SERVER_URI_TEMPLATE = "{runtime_server_uri}?backend={backend}"
+
     # URL Format
     URL_TEMPLATE = "{base_url}/{version}/{uri}"
 
-    def __init__(self, base_url: str, api_version: str, auth):
+    def __init__(self, base_url: str, api_version: str, auth, session=None, timeout: float = None, configuration=None):
         """
         Initializes the HAProxyClient with the given base URL and credentials.
 
@@ -50,6 +54,9 @@ class ServerClient:
             base_url (str): The base URL (scheme://host:port) of the HAProxy Data Plane API.
             api_version (str): The HAProxy Data Plane API Version (v1 or v2)
             auth (HTTPBasicAuth): The Authentication Configuration
+            session (requests.Session): The Shared HTTP Session (a dedicated one is built if not provided)
+            timeout (float): The HTTP Requests Timeout in seconds
+            configuration (ConfigurationClient): The Shared Configuration Client (a dedicated one is built if not provided)
         Raises:
             ValueError: If any of the required parameters are not provided.
         """
@@ -75,17 +82,29 @@ class ServerClient:
         # Initialize Basic Authentication
         self.auth = auth
 
-        # Initialize Configuration Client
-        self.configuration = ConfigurationClient(
+        # Initialize HTTP Session (Shared Connection Pool)
+        self.session = session if session is not None else build_session()
+
+        # Initialize Requests Timeout
+        self.timeout = timeout
+
+        # Initialize Configuration Client (Shared Configuration Version Cache)
+        self.configuration = configuration if configuration is not None else ConfigurationClient(
             base_url=base_url,
             api_version=api_version,
-            auth=auth
+            auth=auth,
+            session=self.session,
+            timeout=timeout
         )
 
-    def get_servers(self):
+    def get_servers(self, parent_name: str = None, parent_type: str = 'backend'):
         """
         Retrieves the list of Servers from the HAProxy Data Plane API.
 
+        Args:
+            parent_name (str): The name of the Servers Parent (all Servers if not provided)
+            parent_type (str): The Type of the Parent
+
         Returns:
             list: A list of Servers in JSON format.
 
@@ -93,15 +112,38 @@ class ServerClient:
             requests.exceptions.HTTPError: If the API request fails.
         """
 
+        # Configuration Snapshot
+        snapshot = self.configuration.snapshot
+
+        # If Parent is Provided and a Configuration Snapshot is Set
+        if parent_name and snapshot is not None:
+
+            # Return Servers from Snapshot (Same format as the API)
+            servers = snapshot.get_section('servers', parent_name, parent_type)
+            return {'_version': self.configuration.version, 'data': servers}
+
+        # Get Servers URI
+        get_servers_uri = self.SERVERS_URI
+
+        # If Parent is Provided
+        if parent_name:
+
+            # Initialize URI
+            get_servers_uri = self.GET_SERVER_URI_TEMPLATE.format(
+                server_uri=self.SERVERS_URI,
+                parent_type=parent_type,
+                parent_name=parent_name
+            )
+
         # Build the Operation URL
         url = self.URL_TEMPLATE.format(
             base_url=self.base_url,
-            uri=self.SERVERS_URI,
+            uri=get_servers_uri,
             version=self.api_version
         )
 
         # Execute Request
-        response = requests.get(url, auth=self.auth)
+        response = self.session.get(url, auth=self.auth, timeout=self.timeout)
 
         # If Object Exists
         if is_2xx(response.status_code):
@@ -124,12 +166,21 @@ class ServerClient:
             parent_type (str): The Type of the Parent
 
         Returns:
-            dict: Details of Server in JSON format.
+            dict: Details of Server in JSON format (None if it does not exist in the Configuration Snapshot).
 
         Raises:
             requests.exceptions.HTTPError: If the API request fails.
         """
 
+        # Configuration Snapshot
+        snapshot = self.configuration.snapshot
+
+        # If a Configuration Snapshot is Set
+        if snapshot is not None:
+
+            # Return Server from Snapshot (None if it does not exist)
+            return snapshot.get_object('servers', name, parent_name, parent_type)
+
         # Build the Operation URL
         url = self.URL_TEMPLATE.format(
             base_url=self.base_url,
@@ -142,7 +193,7 @@ class ServerClient:
         )
 
         # Execute Request
-        response = requests.get(url, auth=self.auth)
+        response = self.session.get(url, auth=self.auth, timeout=self.timeout)
 
         # If Object Exists
         if is_2xx(response.status_code):
@@ -186,13 +237,10 @@ class ServerClient:
 
         else:
 
-            # Get Configuration Version
-            config_version = self.configuration.get_configuration_version()
-
             # Initialize URI
             create_server_uri = self.SERVER_URI_TEMPLATE_VERSION.format(
                 server_uri=self.SERVERS_URI,
-                config_version=config_version,
+                config_version=self.configuration.VERSION_PLACEHOLDER,
                 force_reload=force_reload,
                 parent_name=parent_name,
                 parent_type=parent_type
@@ -206,13 +254,13 @@ class ServerClient:
         )
 
         # Execute Request
-        response = requests.post(
+        response = self.configuration.execute(
+            'POST',
             url=url,
             json=filter_none(server),
             headers={
                 "Content-Type": self.CONTENT_TYPE_JSON
-            },
-            auth=self.auth
+            }
         )
 
         # If Object Exists
@@ -258,13 +306,10 @@ class ServerClient:
 
         else:
 
-            # Get Configuration Version
-            config_version = self.configuration.get_configuration_version()
-
             # Initialize URI
             create_server_uri = self.SERVER_URI_TEMPLATE_VERSION.format(
                 server_uri=self.SERVER_URI.format(name=name),
-                config_version=config_version,
+                config_version=self.configuration.VERSION_PLACEHOLDER,
                 force_reload=force_reload,
                 parent_name=parent_name,
                 parent_type=parent_type
@@ -278,13 +323,13 @@ class ServerClient:
         )
 
         # Execute Request
-        response = requests.put(
+        response = self.configuration.execute(
+            'PUT',
             url=url,
             json=filter_none(server),
             headers={
                 "Content-Type": self.CONTENT_TYPE_JSON
-            },
-            auth=self.auth
+            }
         )
 
         # If Object Exists
@@ -298,6 +343,52 @@ class ServerClient:
             # Raise Exception
             response.raise_for_status()
 
+    def upsert_server(self, server: Server, transaction_id: str, parent_name: str, parent_type: str = 'backend', force_reload: bool = True):
+        """
+        Create a Server on HAProxy API, or update it if it already exists (create-first upsert).
+
+        A new Server costs a single write; an existing one is looked up and updated only if it differs.
+
+        Args:
+            server (Server): The Server to create or update.
+            transaction_id (str): Started Transaction ID
+            parent_name (str): The name of the Server Parent
+            parent_type (str): The Type of the Parent
+            force_reload (bool): Force Reload HA Proxy Configuration (used if no Transaction ID Provided)
+
+        Returns:
+            dict: The outcome ({'action' : created, updated or unchanged, 'before', 'after', 'changes'}).
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails.
+        """
+
+        # Create First, then Update on Conflict
+        return upsert(
+            requested=server,
+            create=lambda: self.create_server(
+                server=server,
+                transaction_id=transaction_id,
+                parent_name=parent_name,
+                parent_type=parent_type,
+                force_reload=force_reload
+            ),
+            get=lambda: self.get_server(
+                name=server.name,
+                parent_name=parent_name,
+                parent_type=parent_type
+            ),
+            update=lambda: self.update_server(
+                name=server.name,
+                server=server,
+                transaction_id=transaction_id,
+                parent_name=parent_name,
+                parent_type=parent_type,
+                force_reload=force_reload
+            ),
+            configuration=self.configuration
+        )
+
     def delete_server(self, name: str, transaction_id: str, parent_name: str, parent_type: str = 'backend', force_reload: bool = True):
         """
         Delete a Server on HAProxy API.
@@ -327,13 +418,10 @@ class ServerClient:
 
         else:
 
-            # Get Configuration Version
-            config_version = self.configuration.get_configuration_version()
-
             # Initialize URI
             create_server_uri = self.SERVER_URI_TEMPLATE_VERSION.format(
                 server_uri=self.SERVER_URI.format(name=name),
-                config_version=config_version,
+                config_version=self.configuration.VERSION_PLACEHOLDER,
                 force_reload=force_reload,
                 parent_name=parent_name,
                 parent_type=parent_type
@@ -347,12 +435,12 @@ class ServerClient:
         )
 
         # Execute Request
-        response = requests.delete(
+        response = self.configuration.execute(
+            'DELETE',
             url=url,
             headers={
                 "Content-Type": self.CONTENT_TYPE_JSON
-            },
-            auth=self.auth
+            }
         )
 
         # If Object Exists
@@ -360,3 +448,129 @@ class ServerClient:
 
             # Raise Exception
             response.raise_for_status()
+
+    def get_runtime_servers(self, backend: str):
+        """
+        Retrieves the runtime state of the Servers of a Backend from the HAProxy Data Plane API.
+
+        Args:
+            backend (str): The name of the Servers Backend
+
+        Returns:
+            list: A list of Runtime Servers in JSON format.
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails.
+        """
+
+        # Build the Operation URL
+        url = self.URL_TEMPLATE.format(
+            base_url=self.base_url,
+            uri=self.RUNTIME_SERVER_URI_TEMPLATE.format(
+                runtime_server_uri=self.RUNTIME_SERVERS_URI,
+                backend=backend
+            ),
+            version=self.api_version
+        )
+
+        # Execute Request
+        response = self.session.get(url, auth=self.auth, timeout=self.timeout)
+
+        # If Object Exists
+        if is_2xx(response.status_code):
+
+            # Return JSON
+            return response.json()
+
+        else:
+
+            # Raise Exception
+            response.raise_for_status()
+
+    def get_runtime_server(self, name: str, backend: str):
+        """
+        Retrieves the runtime state of a Server from the HAProxy Data Plane API.
+
+        Args:
+            name (str): The Server Name
+            backend (str): The name of the Server Backend
+
+        Returns:
+            dict: Runtime Server in JSON format (name, address, port, admin_state, operational_state).
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails.
+        """
+
+        # Build the Operation URL
+        url = self.URL_TEMPLATE.format(
+            base_url=self.base_url,
+            uri=self.RUNTIME_SERVER_URI_TEMPLATE.format(
+                runtime_server_uri=self.RUNTIME_SERVER_URI.format(name=name),
+                backend=backend
+            ),
+            version=self.api_version
+        )
+
+        # Execute Request
+        response = self.session.get(url, auth=self.auth, timeout=self.timeout)
+
+        # If Object Exists
+        if is_2xx(response.status_code):
+
+            # Return JSON
+            return response.json()
+
+        else:
+
+            # Raise Exception
+            response.raise_for_status()
+
+    def update_runtime_server(self, runtime_server: RuntimeServer, backend: str):
+        """
+        Update the runtime state of a Server (applied immediately, without reloading HAProxy).
+
+        The runtime state is not written to the configuration, so it is lost on the next reload.
+
+        Args:
+            runtime_server (RuntimeServer): The requested runtime state.
+            backend (str): The name of the Server Backend
+
+        Returns:
+            dict: Runtime Server in JSON format.
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails.
+        """
+
+        # Build the Operation URL
+        url = self.URL_TEMPLATE.format(
+            base_url=self.base_url,
+            uri=self.RUNTIME_SERVER_URI_TEMPLATE.format(
+                runtime_server_uri=self.RUNTIME_SERVER_URI.format(name=runtime_server.name),
+                backend=backend
+            ),
+            version=self.api_version
+        )
+
+        # Execute Request
+        response = self.session.put(
+            url,
+            auth=self.auth,
+            timeout=self.timeout,
+            json=filter_none(runtime_server),
+            headers={
+                "Content-Type": self.CONTENT_TYPE_JSON
+            }
+        )
+
+        # If Object Exists
+        if is_2xx(response.status_code):
+
+            # Return JSON
+            return response.json()
+
+        else:
+
+            # Raise Exception
+            response.raise_for_status()
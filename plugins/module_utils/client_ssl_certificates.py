@@ -1,17 +1,171 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import base64
+import binascii
+import fnmatch
+import hashlib
+import os
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
 from .client_configurations import ConfigurationClient
-from .commons import is_2xx
+from .commons import is_2xx, build_session, unwrap_data, DEFAULT_POOL_SIZE
 
 try:
-    import requests
-    import os
+    from requests import HTTPError  # type: ignore
     IMPORTS_OK = True
 except ImportError:
     IMPORTS_OK = False
 
 
+# Upload Chunk Size (bytes)
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Default Number of Concurrent Certificate Operations (Fits the Default Connection Pool)
+DEFAULT_SYNC_WORKERS = DEFAULT_POOL_SIZE
+
+# PEM Certificate Markers
+PEM_CERTIFICATE_BEGIN = b"-----BEGIN CERTIFICATE-----"
+PEM_CERTIFICATE_END = b"-----END CERTIFICATE-----"
+
+
+# Compute the Fingerprint of a Local PEM Certificate
+def certificate_fingerprint(path: str):
+    """
+    Compute the SHA-256 fingerprint of the first certificate of a PEM file (the leaf certificate).
+
+    The fingerprint is the digest of the certificate DER encoding, the one reported by the Data
+    Plane API ('sha256_finger_print'). The file is read line by line, up to the end of the first
+    certificate, so bundles with big chains are not loaded in memory.
+
+    Args:
+        path (str): The PEM file path.
+
+    Returns:
+        str: The fingerprint (lower case hexadecimal), or None if the file holds no valid certificate.
+    """
+
+    # Initialize Certificate Lines
+    lines = None
+
+    with open(path, 'rb') as file:
+
+        # Iterate on File Lines
+        for line in file:
+
+            # Strip Line
+            line = line.strip()
+
+            # If Certificate Starts
+            if line == PEM_CERTIFICATE_BEGIN:
+                lines = []
+
+            # If Certificate Ends
+            elif line == PEM_CERTIFICATE_END and lines is not None:
+                break
+
+            # If inside the Certificate
+            elif lines is not None:
+                lines.append(line)
+
+        # If no Certificate was Found
+        else:
+            return None
+
+    try:
+
+        # Return Digest of the DER Encoding
+        return hashlib.sha256(base64.b64decode(b"".join(lines), validate=True)).hexdigest()
+
+    except (binascii.Error, ValueError):
+
+        # Invalid Certificate
+        return None
+
+
+# Normalize a Fingerprint reported by the Data Plane API
+def normalize_fingerprint(fingerprint: str):
+    """
+    Normalize a fingerprint (case and ':' separators).
+
+    Args:
+        fingerprint (str): The fingerprint.
+
+    Returns:
+        str: The lower case hexadecimal fingerprint, or None if not provided.
+    """
+
+    # Return Normalized Fingerprint
+    return fingerprint.replace(':', '').strip().lower() if fingerprint else None
+
+
+class MultipartFileUpload:
+    """
+    Streamed 'multipart/form-data' body holding one file.
+
+    The file is read by chunks while the request is sent. The body length is known in
+    advance, so the request is sent with a Content-Length (not chunked).
+
+    Attributes:
+        field (str): The form field name.
+        filename (str): The uploaded file name.
+        path (str): The local file path.
+        boundary (str): The multipart boundary.
+    """
+
+    def __init__(self, field: str, filename: str, path: str):
+        """
+        Initializes the Multipart Body.
+
+        Args:
+            field (str): The form field name.
+            filename (str): The uploaded file name.
+            path (str): The local file path.
+        """
+
+        # Initialize Field, File Name and Path
+        self.field = field
+        self.filename = filename
+        self.path = path
+
+        # Initialize Boundary
+        self.boundary = uuid.uuid4().hex
+
+        # Part Header and Body Trailer
+        self.header = (
+            '--{0}\r\nContent-Disposition: form-data; name="{1}"; filename="{2}"\r\n'
+            'Content-Type: application/octet-stream\r\n\r\n'
+        ).format(self.boundary, field, filename).encode()
+        self.trailer = '\r\n--{0}--\r\n'.format(self.boundary).encode()
+
+    @property
+    def content_type(self):
+
+        # Return Content Type
+        return "multipart/form-data; boundary={0}".format(self.boundary)
+
+    def __len__(self):
+
+        # Return Body Length
+        return len(self.header) + os.path.getsize(self.path) + len(self.trailer)
+
+    def __iter__(self):
+
+        # Send Part Header
+        yield self.header
+
+        with open(self.path, 'rb') as file:
+
+            # Send File by Chunks
+            for chunk in iter(lambda: file.read(UPLOAD_CHUNK_SIZE), b''):
+                yield chunk
+
+        # Send Trailer
+        yield self.trailer
+
+
 class SslCertificateClient:
     """
     Client for interacting with the HAProxy Data Plane API for SSL Certificates Storage.
@@ -36,7 +190,7 @@ class SslCertificateClient:
     # URL Format
     URL_TEMPLATE = "{base_url}/{version}/{uri}"
 
-    def __init__(self, base_url: str, api_version: str, auth):
+    def __init__(self, base_url: str, api_version: str, auth, session=None, timeout: float = None, configuration=None):
         """
         Initializes the HAProxyClient with the given base URL and credentials.
 
@@ -44,6 +198,9 @@ class SslCertificateClient:
             base_url (str): The base URL (scheme://host:port) of the HAProxy Data Plane API.
             api_version (str): The HAProxy Data Plane API Version (v1 or v2)
             auth (HTTPBasicAuth): The Authentication Configuration
+            session (requests.Session): The Shared HTTP Session (a dedicated one is built if not provided)
+            timeout (float): The HTTP Requests Timeout in seconds
+            configuration (ConfigurationClient): The Shared Configuration Client (a dedicated one is built if not provided)
         Raises:
             ValueError: If any of the required parameters are not provided.
         """
@@ -69,11 +226,19 @@ class SslCertificateClient:
         # Initialize Basic Authentication
         self.auth = auth
 
-        # Initialize Configuration Client
-        self.configuration = ConfigurationClient(
+        # Initialize HTTP Session (Shared Connection Pool)
+        self.session = session if session is not None else build_session()
+
+        # Initialize Requests Timeout
+        self.timeout = timeout
+
+        # Initialize Configuration Client (Shared Configuration Version Cache)
+        self.configuration = configuration if configuration is not None else ConfigurationClient(
             base_url=base_url,
             api_version=api_version,
-            auth=auth
+            auth=auth,
+            session=self.session,
+            timeout=timeout
         )
 
     def get_certificates(self):
@@ -95,7 +260,7 @@ class SslCertificateClient:
         )
 
         # Execute Request
-        response = requests.get(url, auth=self.auth)
+        response = self.session.get(url, auth=self.auth, timeout=self.timeout)
 
         # If Object Exists
         if is_2xx(response.status_code):
@@ -130,7 +295,7 @@ class SslCertificateClient:
         )
 
         # Execute Request
-        response = requests.get(url, auth=self.auth)
+        response = self.session.get(url, auth=self.auth, timeout=self.timeout)
 
         # If Object Exists
         if is_2xx(response.status_code):
@@ -143,6 +308,34 @@ class SslCertificateClient:
             # Raise Exception
             response.raise_for_status()
 
+    def is_identical(self, certificate: dict, path: str):
+        """
+        Check if a local PEM file holds the same certificate as a stored SSL Certificate.
+
+        The SHA-256 fingerprint of the local leaf certificate is compared with the one reported
+        by the Data Plane API ('sha256_finger_print'). The private key and the chain are not part
+        of the fingerprint.
+
+        Args:
+            certificate (dict): The stored SSL Certificate, as returned by get_certificate.
+            path (str): The Certificate Local Path.
+
+        Returns:
+            bool: True if both fingerprints are known and equal.
+        """
+
+        # Remote Fingerprint (Reported by recent Data Plane API Versions only)
+        remote = normalize_fingerprint((unwrap_data(certificate) or {}).get('sha256_finger_print'))
+
+        # If Remote Fingerprint is Unknown or Local File is Missing
+        if not remote or not path or not os.path.isfile(path.strip()):
+
+            # Cannot Tell
+            return False
+
+        # Compare Fingerprints
+        return certificate_fingerprint(path.strip()) == remote
+
     def create_certificate(self, name: str, path: str, force_reload: bool = True):
         """
         Create a Server on HAProxy API.
@@ -177,10 +370,8 @@ class SslCertificateClient:
             # Raise Custom Error
             raise FileNotFoundError("File to Upload is Not Found : {path}".format(path=path))
 
-        # Prepare File to Upload
-        files = {
-            'file_upload': (name.strip(), open(path.strip(), 'rb'))
-        }
+        # Prepare Streamed Body (the File is read while Sending)
+        body = MultipartFileUpload(field='file_upload', filename=name.strip(), path=path.strip())
 
         # Build the Operation URL
         url = self.URL_TEMPLATE.format(
@@ -192,19 +383,16 @@ class SslCertificateClient:
             version=self.api_version
         )
 
-        try:
-
-            # Execute Request
-            response = requests.post(
-                url=url,
-                files=files,
-                auth=self.auth
-            )
-
-        finally:
-
-            # Close File
-            files['file_upload'][1].close()
+        # Execute Request
+        response = self.session.post(
+            url=url,
+            data=body,
+            headers={
+                'Content-Type': body.content_type
+            },
+            auth=self.auth,
+            timeout=self.timeout
+        )
 
         # If Object Exists
         if is_2xx(response.status_code):
@@ -251,12 +439,6 @@ class SslCertificateClient:
             # Raise Custom Error
             raise FileNotFoundError("File to Upload is Not Found : {path}".format(path=path))
 
-        # Read Fie content
-        with open(path.strip(), 'r') as file:
-
-            # Read Content
-            certificate_content = file.read()
-
         # Build the Operation URL
         url = self.URL_TEMPLATE.format(
             base_url=self.base_url,
@@ -272,8 +454,11 @@ class SslCertificateClient:
             'Content-Type': 'text/plain'
         }
 
-        # Execute request
-        response = requests.put(url, data=certificate_content, headers=headers, auth=self.auth)
+        # Open File (Streamed while Sending)
+        with open(path.strip(), 'rb') as file:
+
+            # Execute request
+            response = self.session.put(url, data=file, headers=headers, auth=self.auth, timeout=self.timeout)
 
         # If Object Exists
         if is_2xx(response.status_code):
@@ -317,7 +502,7 @@ class SslCertificateClient:
         )
 
         # Execute Request
-        response = requests.delete(url, auth=self.auth)
+        response = self.session.delete(url, auth=self.auth, timeout=self.timeout)
 
         # If Object Exists
         if is_2xx(response.status_code):
@@ -332,3 +517,163 @@ class SslCertificateClient:
 
             # Raise Exception
             response.raise_for_status()
+
+    def plan_sync(self, directory: str, pattern: str = '*.pem', delete: bool = False, max_workers: int = DEFAULT_SYNC_WORKERS):
+        """
+        Compute the changes synchronizing the SSL Certificates Storage with a local directory.
+
+        The Storage is listed once, and the local files are fingerprinted concurrently. A local file
+        is uploaded if its certificate is missing, or if its fingerprint differs from (or cannot be
+        compared with) the stored one.
+
+        Args:
+            directory (str): The local directory holding the PEM files (the file name is the storage name).
+            pattern (str): The file name pattern of the local PEM files.
+            delete (bool): Also delete the stored certificates without local file.
+            max_workers (int): The maximum number of concurrent fingerprint computations and requests.
+
+        Returns:
+            list: The changes, as {'name', 'path', 'action'} (action : 'create', 'update', 'delete' or 'none').
+
+        Raises:
+            ValueError: If the directory does not exist.
+            requests.exceptions.HTTPError: If the Storage listing fails.
+        """
+
+        # If Directory does not Exist
+        if not directory or not os.path.isdir(directory):
+
+            # Raise Value Exception
+            raise ValueError("[SSLCertificateClient] - Directory not found : '{0}'".format(directory))
+
+        # Local Files by Storage Name
+        local = {
+            name: os.path.join(directory, name)
+            for name in sorted(os.listdir(directory))
+            if fnmatch.fnmatch(name, pattern) and os.path.isfile(os.path.join(directory, name))
+        }
+
+        # Stored Certificates by Storage Name (Listed Once)
+        remote = {
+            certificate.get('storage_name'): certificate
+            for certificate in (unwrap_data(self.get_certificates()) or []) if certificate.get('storage_name')
+        }
+
+        # Stored Certificates to Compare, whose Fingerprint is not Listed
+        unlisted = [name for name in local if name in remote and not remote[name].get('sha256_finger_print')]
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+
+            # Get Unlisted Fingerprints Concurrently (Older APIs only list Names)
+            for name, certificate in zip(unlisted, executor.map(self.get_certificate, unlisted)):
+                remote[name] = unwrap_data(certificate) or remote[name]
+
+            # Fingerprint Local Files Concurrently (only the Stored Ones need a Comparison)
+            compared = [name for name in local if name in remote]
+            fingerprints = dict(zip(compared, executor.map(certificate_fingerprint, [local[name] for name in compared])))
+
+        # Initialize Changes
+        changes = []
+
+        # Iterate on Local Files
+        for name, path in local.items():
+
+            # If Certificate is not Stored
+            if name not in remote:
+                action = 'create'
+
+            # If Stored Certificate is Identical
+            elif fingerprints[name] and fingerprints[name] == normalize_fingerprint(remote[name].get('sha256_finger_print')):
+                action = 'none'
+
+            # Stored Certificate Differs (or cannot be Compared)
+            else:
+                action = 'update'
+
+            # Add Change
+            changes.append(dict(name=name, path=path, action=action))
+
+        # If Stored Certificates without Local File are Deleted
+        if delete:
+
+            # Add Deletes
+            changes.extend(dict(name=name, path=None, action='delete') for name in sorted(remote) if name not in local)
+
+        # Return Changes
+        return changes
+
+    def apply_sync(self, changes: list, force_reload: bool = True, max_workers: int = DEFAULT_SYNC_WORKERS):
+        """
+        Apply the changes computed by plan_sync, with a single reload.
+
+        All the changes but one are applied concurrently without forcing a reload (the Data Plane
+        API coalesces them in its delayed reload). If a forced reload is requested, the last change
+        is then applied alone and carries it.
+
+        Args:
+            changes (list): The changes (see plan_sync).
+            force_reload (bool): Force reload HA Proxy Configuration once, after all the changes.
+            max_workers (int): The maximum number of concurrent requests.
+
+        Returns:
+            list: The changes, with their outcome ('applied', 'error' and 'elapsed' in seconds).
+        """
+
+        # Apply one Change and Build its Outcome
+        def apply(change: dict, reload: bool = False):
+
+            # Start Time
+            start = time.monotonic()
+
+            try:
+
+                # If Certificate is Created
+                if change['action'] == 'create':
+                    self.create_certificate(name=change['name'], path=change['path'], force_reload=reload)
+
+                # If Certificate is Updated
+                elif change['action'] == 'update':
+                    self.update_certificate(name=change['name'], path=change['path'], force_reload=reload)
+
+                # If Certificate is Deleted
+                else:
+                    self.delete_certificate(name=change['name'], force_reload=reload)
+
+                # Return Success Outcome
+                return dict(change, applied=True, error=None, elapsed=round(time.monotonic() - start, 3))
+
+            except (HTTPError, OSError, ValueError) as error:
+
+                # Return Failure Outcome
+                return dict(change, applied=False, error=str(error), elapsed=round(time.monotonic() - start, 3))
+
+        # Effective Changes
+        effective = [change for change in changes if change['action'] != 'none']
+
+        # If no Change
+        if not effective:
+
+            # Return Unchanged Outcomes
+            return [dict(change, applied=False, error=None, elapsed=0.0) for change in changes]
+
+        # Changes Applied without Reload (the Last one carries the Forced Reload)
+        concurrent = effective[:-1] if force_reload else effective
+
+        # Apply Changes Concurrently
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(concurrent) or 1))) as executor:
+            outcomes = list(executor.map(apply, concurrent))
+
+        # If a Forced Reload is Requested
+        if force_reload:
+
+            # Apply Last Change with the Reload
+            outcomes.append(apply(effective[-1], reload=True))
+
+        # Outcomes by Name and Action
+        applied = {(outcome['name'], outcome['action']): outcome for outcome in outcomes}
+
+        # Return Outcomes (Changes Order)
+        return [
+            applied.get((change['name'], change['action']), dict(change, applied=False, error=None, elapsed=0.0))
+            for change in changes
+        ]
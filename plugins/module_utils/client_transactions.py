@@ -1,16 +1,23 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 from .client_configurations import ConfigurationClient
-from .commons import is_2xx
+from .commons import is_2xx, build_session, DEFAULT_POOL_SIZE
 
 try:
-    import requests
+    from requests import RequestException  # type: ignore
     IMPORTS_OK = True
 except ImportError:
     IMPORTS_OK = False
 
 
+# Default Number of Concurrent Cancel Requests (Fits the Default Connection Pool)
+DEFAULT_CANCEL_WORKERS = DEFAULT_POOL_SIZE
+
+
 class TransactionClient:
     """
     Client for interacting with the HAProxy Data Plane API for Transactions.
@@ -38,7 +45,7 @@ class TransactionClient:
     # URL Format
     URL_TEMPLATE = "{base_url}/{version}/{uri}"
 
-    def __init__(self, base_url: str, api_version: str, auth):
+    def __init__(self, base_url: str, api_version: str, auth, session=None, timeout: float = None, configuration=None):
         """
         Initializes the HAProxyClient with the given base URL and credentials.
 
@@ -46,6 +53,9 @@ class TransactionClient:
             base_url (str): The base URL (scheme://host:port) of the HAProxy Data Plane API.
             api_version (str): The HAProxy Data Plane API Version (v1 or v2)
             auth (HTTPBasicAuth): The Authentication Configuration
+            session (requests.Session): The Shared HTTP Session (a dedicated one is built if not provided)
+            timeout (float): The HTTP Requests Timeout in seconds
+            configuration (ConfigurationClient): The Shared Configuration Client (a dedicated one is built if not provided)
         Raises:
             ValueError: If any of the required parameters are not provided.
         """
@@ -71,11 +81,19 @@ class TransactionClient:
         # Initialize Basic Authentication
         self.auth = auth
 
-        # Initialize Configuration Client
-        self.configuration = ConfigurationClient(
+        # Initialize HTTP Session (Shared Connection Pool)
+        self.session = session if session is not None else build_session()
+
+        # Initialize Requests Timeout
+        self.timeout = timeout
+
+        # Initialize Configuration Client (Shared Configuration Version Cache)
+        self.configuration = configuration if configuration is not None else ConfigurationClient(
             base_url=base_url,
             api_version=api_version,
-            auth=auth
+            auth=auth,
+            session=self.session,
+            timeout=timeout
         )
 
     def create_transaction(self):
@@ -89,18 +107,15 @@ class TransactionClient:
             requests.exceptions.HTTPError: If the API request fails.
         """
 
-        # Get Configuration Version
-        config_version = self.configuration.get_configuration_version()
-
-        # Build the Operation URL
+        # Build the Operation URL (Configuration Version resolved at Execution)
         url = self.URL_TEMPLATE.format(
             base_url=self.base_url,
-            uri=self.TRANSACTION_BY_VERSION_URI.format(config_version=config_version),
+            uri=self.TRANSACTION_BY_VERSION_URI.format(config_version=self.configuration.VERSION_PLACEHOLDER),
             version=self.api_version
         )
 
         # Execute Request
-        response = requests.post(url, auth=self.auth)
+        response = self.configuration.execute('POST', url)
 
         # If Object Exists
         if is_2xx(response.status_code):
@@ -143,7 +158,7 @@ class TransactionClient:
         )
 
         # Execute Request
-        response = requests.get(url, auth=self.auth)
+        response = self.session.get(url, auth=self.auth, timeout=self.timeout)
 
         # If Object Exists
         if is_2xx(response.status_code):
@@ -176,7 +191,7 @@ class TransactionClient:
         )
 
         # Execute Request
-        response = requests.get(url, auth=self.auth)
+        response = self.session.get(url, auth=self.auth, timeout=self.timeout)
 
         # If Object Exists
         if is_2xx(response.status_code):
@@ -211,7 +226,10 @@ class TransactionClient:
         )
 
         # Execute Request
-        response = requests.put(url, auth=self.auth)
+        response = self.session.put(url, auth=self.auth, timeout=self.timeout)
+
+        # Update Cached Configuration Version (Changed by the Commit)
+        self.configuration.track_version(response)
 
         # If Object Exists
         if is_2xx(response.status_code):
@@ -245,7 +263,7 @@ class TransactionClient:
         )
 
         # Execute Request
-        response = requests.delete(url, auth=self.auth)
+        response = self.session.delete(url, auth=self.auth, timeout=self.timeout)
 
         # If Object Exists
         if not is_2xx(response.status_code):
@@ -253,31 +271,126 @@ class TransactionClient:
             # Raise Exception
             response.raise_for_status()
 
-    def cancel_transactions(self, config_version: str = ''):
+    def batch(self, force_reload: bool = True, max_workers: int = DEFAULT_POOL_SIZE, transaction_id: str = None, version: int = None):
+        """
+        Build a Transaction Batch (context manager) applying queued operations in a single Transaction.
+
+        Operations run by dependency level, concurrently inside a level; the operations on the ACLs
+        (or on the rules) of a parent, deletes included, run in queue order.
+
+        Usage:
+            with client.transaction.batch(force_reload=True) as batch:
+                batch.server.create_server(server=server, parent_name='app', parent_type='backend')
+                batch.acl.update_acl(index=0, acl=acl, parent_name='app', parent_type='backend')
+
+        Args:
+            force_reload (bool): Force reload HAProxy Configuration on commit.
+            max_workers (int): The maximum number of concurrent requests.
+            transaction_id (str): An already started Transaction to use (neither committed nor cancelled by the batch).
+            version (int): The Configuration Version the Transaction must be based on (any if None).
+
+        Returns:
+            TransactionBatch: The Transaction Batch.
+        """
+
+        # Import Batch on Use (it imports all the Sub-Clients and their Models)
+        from .batch import TransactionBatch
+
+        # Return Batch
+        return TransactionBatch(
+            transaction=self,
+            force_reload=force_reload,
+            max_workers=max_workers,
+            transaction_id=transaction_id,
+            version=version
+        )
+
+    def filter_transactions(self, transactions: list, status: list = None, min_version_lag: int = None):
+        """
+        Filter Transactions by status and by age.
+
+        The Data Plane API does not timestamp Transactions, so the age of a Transaction is
+        its version lag : the number of Configuration Versions committed since it started.
+        A Transaction lagging behind can no longer be committed.
+
+        Args:
+            transactions (list): The Transactions (JSON format).
+            status (list): The accepted Transaction status (all if None or empty).
+            min_version_lag (int): The minimum version lag (all if None).
+
+        Returns:
+            list: The matching Transactions.
+
+        Raises:
+            requests.exceptions.HTTPError: If the Configuration Version request fails.
+        """
+
+        # Current Configuration Version (Only needed to compute version lags)
+        current_version = self.configuration.get_configuration_version(refresh=True) if min_version_lag is not None else None
+
+        # Return Matching Transactions
+        return [
+            tx for tx in (transactions or [])
+            if (not status or tx.get("status") in status) and (
+                min_version_lag is None or current_version - int(tx.get("_version") or 0) >= min_version_lag
+            )
+        ]
+
+    def cancel_transactions(self, config_version: str = '', status: list = None, min_version_lag: int = None,
+                            max_workers: int = DEFAULT_CANCEL_WORKERS, dry_run: bool = False):
         """
         Cancel All in-progress HAProxy Data Plane API Transaction and Details.
 
+        Transactions are cancelled concurrently, on a bounded thread pool sharing the HTTP session.
+
+        Args:
+            config_version (str): The Transactions Configuration Version (all if empty).
+            status (list): The Transactions status to cancel (all if None or empty).
+            min_version_lag (int): The minimum version lag of the Transactions to cancel (see filter_transactions).
+            max_workers (int): The maximum number of concurrent cancel requests.
+            dry_run (bool): Only return the Transactions that would be cancelled.
+
+        Returns:
+            list: The matching Transactions, with their cancel outcome ('cancelled', 'error' and 'elapsed' in seconds).
+
         Raises:
-            requests.exceptions.HTTPError: If the API request fails.
+            requests.exceptions.HTTPError: If the Transactions listing fails.
         """
 
-        # Get Active Transactions
-        active_transactions = self.get_transactions(config_version=config_version)
+        # Get Matching Transactions
+        transactions = self.filter_transactions(
+            transactions=self.get_transactions(config_version=config_version),
+            status=status,
+            min_version_lag=min_version_lag
+        )
 
-        # Cleaned Transactionx
-        cleaned_transations = []
+        # If Dry Run or no Transaction
+        if dry_run or not transactions:
 
-        # If There are Transations
-        if active_transactions:
+            # Return Matching Transactions
+            return [dict(tx, cancelled=False, error=None, elapsed=0.0) for tx in transactions]
 
-            # Iterate
-            for tx in active_transactions:
+        # Cancel one Transaction and Build its Outcome
+        def cancel(tx: dict):
+
+            # Start Time
+            start = time.monotonic()
+
+            try:
 
                 # Cancel Transaction
                 self.cancel_transaction(transaction_id=tx["id"])
 
-                # Add Cleaned TX to Array
-                cleaned_transations.append(tx)
+                # Return Success Outcome
+                return dict(tx, cancelled=True, error=None, elapsed=round(time.monotonic() - start, 3))
+
+            except RequestException as request_error:
+
+                # Return Failure Outcome (API, Connection or Timeout Error : the other Transactions are still Cancelled)
+                return dict(tx, cancelled=False, error=str(request_error), elapsed=round(time.monotonic() - start, 3))
+
+        # Cancel Transactions Concurrently
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(transactions)))) as executor:
 
-        # Return List of Cleaned TX
-        return cleaned_transations
+            # Return Outcomes (Listing Order)
+            return list(executor.map(cancel, transactions))
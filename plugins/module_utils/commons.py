@@ -1,8 +1,121 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-from dataclasses import asdict
-from typing import Dict, Any
+from dataclasses import fields
+from typing import Dict, Any, Tuple
+
+from .transport import UnixSocketAdapter, HTTP_UNIX_SCHEME
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    IMPORTS_OK = True
+except ImportError:
+    IMPORTS_OK = False
+
+
+# Default HTTP Connection Pool Size
+DEFAULT_POOL_SIZE = 10
+
+# Default Number of Retries (Connection Errors and Gateway Errors)
+DEFAULT_MAX_RETRIES = 3
+
+# Default Retry Backoff Factor (seconds)
+DEFAULT_BACKOFF_FACTOR = 0.3
+
+# Default HTTP Requests Timeout (seconds)
+DEFAULT_TIMEOUT = 60
+
+
+# Scalar Types (kept as is in Payloads, String Enums included)
+SCALAR_TYPES = (str, int, float)
+
+# Model Field Names by Model Class (Computed Once per Class)
+MODEL_FIELDS = {}
+
+
+# Return the Field Names of a Model Class
+def model_fields(model: type) -> Tuple[str, ...]:
+    """
+    Return the field names of a model (dataclass) class, computed once per class.
+
+    Args:
+        model (type): The model class.
+
+    Returns:
+        Tuple[str, ...]: The field names, in declaration order.
+    """
+
+    # Find Known Field Names
+    names = MODEL_FIELDS.get(model)
+
+    # If Field Names are not Known
+    if names is None:
+
+        # Compute and Keep Field Names
+        names = MODEL_FIELDS[model] = tuple(item.name for item in fields(model))
+
+    # Return Field Names
+    return names
+
+
+# Convert a Value to its Payload Form
+def serialize(value: Any) -> Any:
+    """
+    Convert a value to its payload form, without deep copies.
+
+    Models and dictionaries become dictionaries without None fields (at any depth),
+    lists and tuples become lists; other values (strings, numbers, enums) are kept as is.
+
+    Args:
+        value (Any): The value to convert.
+
+    Returns:
+        Any: The payload value.
+    """
+
+    # If Value is a Scalar (Strings, String Enums, Numbers)
+    if isinstance(value, SCALAR_TYPES):
+
+        # Return Value
+        return value
+
+    # If Value is a Model
+    if hasattr(type(value), '__dataclass_fields__') and not isinstance(value, type):
+
+        # Initialize Payload
+        payload = {}
+
+        # Iterate on Model Fields
+        for name in model_fields(type(value)):
+
+            # Field Value
+            item = getattr(value, name)
+
+            # If Field is Set
+            if item is not None:
+
+                # Add Field (Scalars are kept as is)
+                payload[name] = item if isinstance(item, SCALAR_TYPES) else serialize(item)
+
+        # Return Payload
+        return payload
+
+    # If Value is a Dictionary
+    if isinstance(value, dict):
+
+        # Return Items that are not None
+        return {key: serialize(item) for key, item in value.items() if item is not None}
+
+    # If Value is a List
+    if isinstance(value, (list, tuple)):
+
+        # Return Items
+        return [serialize(item) for item in value]
+
+    # Return Value
+    return value
 
 
 # Build and Return Payload from Dict Object
@@ -11,20 +124,100 @@ def filter_none(instance: Any) -> Dict[str, Any]:
     """
     Filter All fields with None Value
 
-    Only includes fields that are not None and handles nested dataclasses and lists.
+    Only includes fields that are not None (nested models included) and handles nested dataclasses and lists.
 
     Args:
-        instance (Any): The dataclass instance to convert.
+        instance (Any): The dataclass instance (or dictionary) to convert.
 
     Returns:
         Dict[str, Any]: The resulting dictionary payload.
     """
 
     # Return Payload
-    return {name: value for name, value in asdict(instance).items() if value is not None}
+    return serialize(instance)
 
 
 # Check if Http Status Code is OK
 def is_2xx(status_code: int):
 
     return (200 <= status_code < 300)
+
+
+# Extract Payload from Data Plane API Response
+def unwrap_data(payload: Any) -> Any:
+    """
+    Extract the payload of a Data Plane API response.
+
+    Data Plane API v2 wraps configuration objects and lists in a '{"_version": ..., "data": ...}' envelope.
+
+    Args:
+        payload (Any): The decoded response.
+
+    Returns:
+        Any: The wrapped data if the payload is an envelope, else the payload itself.
+    """
+
+    # If Payload is an Envelope
+    if isinstance(payload, dict) and "data" in payload and "_version" in payload:
+
+        # Return Wrapped Data
+        return payload["data"]
+
+    # Return Payload
+    return payload
+
+
+# Build and Return Keep-Alive HTTP Session
+def build_session(pool_size: int = DEFAULT_POOL_SIZE, max_retries: int = DEFAULT_MAX_RETRIES,
+                  backoff_factor: float = DEFAULT_BACKOFF_FACTOR):
+    """
+    Build a keep-alive HTTP Session backed by a connection pool and a retry policy.
+
+    Retries apply to connection errors and to gateway errors (502, 503, 504) on
+    idempotent methods only, so creations (POST) are never sent twice. Unix domain
+    socket URLs (see transport.transport_url) get their own pools with the same policy.
+
+    Args:
+        pool_size (int): The maximum number of pooled connections per host.
+        max_retries (int): The maximum number of retries.
+        backoff_factor (float): The retry backoff factor (seconds).
+
+    Returns:
+        requests.Session: The HTTP Session.
+    """
+
+    # Build Retry Policy
+    retry = Retry(
+        total=max_retries,
+        connect=max_retries,
+        read=0,
+        status=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset(['GET', 'PUT', 'DELETE']),
+        raise_on_status=False
+    )
+
+    # Build Pooled Adapter
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=retry
+    )
+
+    # Build Session
+    session = requests.Session()
+
+    # Mount Adapter on HTTP and HTTPS Schemes
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+
+    # Mount Unix Domain Socket Adapter
+    session.mount(HTTP_UNIX_SCHEME, UnixSocketAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=retry
+    ))
+
+    # Return Session
+    return session
@@ -0,0 +1,602 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+import os
+import tempfile
+
+from concurrent.futures import ThreadPoolExecutor
+
+from .commons import filter_none, DEFAULT_POOL_SIZE
+from .diff import build_diff, canonicalize, compute_diff
+from .reconcile import edit_script, ACTION_INSERT, ACTION_UPDATE
+from .snapshot import ConfigurationSnapshot
+
+
+# Configuration Object Kinds (Batch Sub-Client, Snapshot Section, Model Argument, Write Methods Suffix, Flush Level)
+KINDS = {
+    'backend': dict(client='backend', section='backends', argument='backend', suffix='backend', level=0),
+    'frontend': dict(client='frontend', section='frontends', argument='frontend', suffix='frontend', level=0),
+    'server': dict(client='server', section='servers', argument='server', suffix='server', level=1),
+    'bind': dict(client='bind', section='binds', argument='bind', suffix='bind', level=1),
+    'acl': dict(client='acl', section='acls', argument='acl', suffix='acl', level=1),
+    'http_request_rule': dict(client='request_rule', section='http_request_rules', argument='rule', suffix='rule', level=2),
+    'backend_switching_rule': dict(
+        client='besr', section='backend_switching_rules', argument='besr', suffix='backend_switching_rule', level=2
+    )
+}
+
+# Name-Addressed Child Kinds (Children of each Parent Kind)
+NAMED_CHILDREN = {
+    'backend': ('server',),
+    'frontend': ('bind',)
+}
+
+# Index-Addressed Child Kinds (Ordered Lists of each Parent Kind)
+LIST_CHILDREN = {
+    'backend': ('acl', 'http_request_rule'),
+    'frontend': ('acl', 'http_request_rule', 'backend_switching_rule')
+}
+
+# Plan File Format Version
+PLAN_FORMAT = 1
+
+# Maximum Configuration Reads of a Plan (all its Sections must be read at the same Configuration Version)
+MAX_READ_ATTEMPTS = 3
+
+# Plan Actions (Name-Addressed Objects)
+ACTION_CREATE = 'create'
+ACTION_CHANGE = 'update'
+ACTION_REMOVE = 'delete'
+
+
+# Build a Plan Operation (Serializable Batch Operation)
+def build_operation(kind: str, action: str, parent_type: str = None, parent_name: str = None, key=None, instance=None, level: int = None):
+    """
+    Build a plan operation : a batch write operation whose arguments are plain JSON values.
+
+    Args:
+        kind (str): The object kind (see KINDS).
+        action (str): The write action (create, update or delete).
+        parent_type (str): The parent type (children only).
+        parent_name (str): The parent name (children only).
+        key (str | int): The object name or index (update and delete only).
+        instance: The requested object (create and update only).
+        level (int): The forced flush level (index-addressed edit scripts only).
+
+    Returns:
+        dict: The operation ({'client', 'method', 'kwargs', 'level'}).
+    """
+
+    # Kind Definition
+    definition = KINDS[kind]
+
+    # Parent Arguments (Backend Switching Rules only have a Frontend)
+    if kind == 'backend_switching_rule':
+        kwargs = dict(frontend_name=parent_name)
+    elif parent_name is not None:
+        kwargs = dict(parent_name=parent_name, parent_type=parent_type)
+    else:
+        kwargs = {}
+
+    # Object Key (Index for Index-Addressed Objects)
+    if action != ACTION_CREATE:
+        kwargs['index' if isinstance(key, int) else 'name'] = key
+
+    # Object Payload
+    if instance is not None:
+        kwargs[definition['argument']] = filter_none(instance)
+
+    # Return Operation
+    return dict(
+        client=definition['client'],
+        method="{0}_{1}".format(action, definition['suffix']),
+        kwargs=kwargs,
+        level=level
+    )
+
+
+# Build the Path of a Configuration Object (Changes Report and Diff Key)
+def object_path(kind: str, key, parent_type: str = None, parent_name: str = None) -> str:
+    """
+    Build the path of a configuration object (backend/app, backend/app/server/app1, frontend/www/acl).
+
+    Args:
+        kind (str): The object kind.
+        key (str | int): The object name (None for a whole ordered list).
+        parent_type (str): The parent type (children only).
+        parent_name (str): The parent name (children only).
+
+    Returns:
+        str: The object path.
+    """
+
+    # Path Segments
+    segments = [parent_type, parent_name, kind] if parent_name is not None else [kind]
+
+    # Return Path
+    return '/'.join(str(segment) for segment in segments + ([key] if key is not None else []))
+
+
+# Read the Sections of the Configuration the Requested Parents touch
+def read_sections(load, parents: list, max_workers: int = DEFAULT_POOL_SIZE):
+    """
+    Read, concurrently, the parent sections, then the children sections of the existing requested parents.
+
+    Args:
+        load (callable): The section loader ((collection, parent_name, parent_type) -> {'version', 'data'}).
+        parents (list): The requested parents (see plan_configuration).
+        max_workers (int): The maximum number of concurrent requests.
+
+    Returns:
+        tuple: The parent sections ({kind: section}), the existing parents ({kind: {name: payload}})
+               and the children sections ({(kind, name, child kind): section}).
+
+    Raises:
+        requests.exceptions.HTTPError: If the API requests fail.
+    """
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+
+        # Existing Backends and Frontends Sections
+        parent_sections = dict(zip(('backend', 'frontend'), executor.map(
+            lambda kind: load(KINDS[kind]['section'], None, None),
+            ('backend', 'frontend')
+        )))
+
+        # Existing Backends and Frontends (by Name)
+        existing_parents = {kind: {instance['name']: instance for instance in section['data']} for kind, section in parent_sections.items()}
+
+        # Children Sections of the Existing Requested Parents
+        sections = [
+            (parent['kind'], parent['instance'].name, kind)
+            for parent in parents if parent['instance'].name in existing_parents[parent['kind']]
+            for kind in parent['children']
+        ]
+
+        # Existing Children Sections
+        children_sections = dict(zip(sections, executor.map(
+            lambda section: load(KINDS[section[2]]['section'], section[1], section[0]),
+            sections
+        )))
+
+    # Return Sections
+    return parent_sections, existing_parents, children_sections
+
+
+# Fetch the Existing Configuration of the Requested Parents
+def fetch_configuration(snapshot: ConfigurationSnapshot, parents: list, max_workers: int = DEFAULT_POOL_SIZE, transaction: dict = None):
+    """
+    Fetch, concurrently and once, the sections of the configuration a set of requested parents touches.
+
+    The Configuration Version is fetched first, and every section must have been read at it :
+    if the configuration moves while reading, the sections are read again (at most
+    MAX_READ_ATTEMPTS times), so the result is a consistent view of a single version.
+
+    If a Transaction is provided, the sections are read through it (its pending changes included),
+    once, at the Configuration Version the Transaction is based on.
+
+    Args:
+        snapshot (ConfigurationSnapshot): The Configuration Snapshot.
+        parents (list): The requested parents (see plan_configuration).
+        max_workers (int): The maximum number of concurrent requests.
+        transaction (dict): The Transaction the sections are read through ({'id', '_version'}), if any.
+
+    Returns:
+        tuple: The Configuration Version the sections were read at, the existing parents
+               ({kind: {name: payload}}) and children ({(kind, name, child kind): [payloads]}).
+
+    Raises:
+        ValueError: If the Configuration Version kept moving while reading.
+        requests.exceptions.HTTPError: If the API requests fail.
+    """
+
+    # If the Sections are Read through a Transaction
+    if transaction is not None:
+
+        # Read Transaction Sections (never Cached : they hold the Transaction Pending Changes)
+        _, existing_parents, children_sections = read_sections(
+            lambda collection, parent_name, parent_type: snapshot.fetch_section(
+                collection, parent_name, parent_type, transaction_id=transaction['id']
+            ),
+            parents,
+            max_workers
+        )
+
+        # Return Existing Configuration (as Staged in the Transaction)
+        return transaction['_version'], existing_parents, {key: section['data'] for key, section in children_sections.items()}
+
+    # Iterate on Read Attempts
+    for _ in range(MAX_READ_ATTEMPTS):
+
+        # Configuration Version the Sections must be Read at
+        version = snapshot.configuration.get_configuration_version(refresh=True)
+
+        # Read Sections (Snapshot ones, if Known at the Configuration Version)
+        parent_sections, existing_parents, children_sections = read_sections(snapshot.load_section, parents, max_workers)
+
+        # If all the Sections were Read at the Configuration Version
+        if all(section['version'] == version for section in list(parent_sections.values()) + list(children_sections.values())):
+
+            # Return Existing Configuration
+            return version, existing_parents, {key: section['data'] for key, section in children_sections.items()}
+
+    # Raise Value Exception
+    raise ValueError("[ConfigurationPlan] - Configuration Version kept moving while reading the configuration ({0} attempts)".format(
+        MAX_READ_ATTEMPTS
+    ))
+
+
+# Compute the Plan of a Requested Configuration
+def plan_configuration(client, parents: list, purge: bool = False, max_workers: int = DEFAULT_POOL_SIZE, transaction_id: str = None):
+    """
+    Compute the changes turning the live configuration into a requested one.
+
+    The requested configuration is a dependency graph : backends and frontends, then their
+    servers, binds and ACLs, then their HTTP request rules and backend switching rules. It
+    is diffed against a single snapshot of the configuration sections it touches, and the
+    changes are returned as batch operations, each tagged with its dependency level, so they
+    can be applied level by level, concurrently inside a level, in a single Transaction.
+
+    Args:
+        client (haproxy.Client): The HA Proxy Client.
+        parents (list): The requested backends and frontends, as {'kind', 'instance', 'children'} dictionaries,
+                        the children being {'server' or 'bind' : {name: model}, 'acl', 'http_request_rule'
+                        or 'backend_switching_rule' : [models, in order]} (unlisted child kinds are left as is).
+        purge (bool): Delete the existing servers and binds of the requested parents that are not requested.
+        max_workers (int): The maximum number of concurrent requests.
+        transaction_id (str): The Transaction the changes will be applied in : the configuration is then read
+                              through it, so the changes already staged in it are taken into account.
+
+    Returns:
+        dict: The plan ({'version', 'operations', 'changes', 'diff'}), the version being the Configuration
+              Version the plan was computed against.
+
+    Raises:
+        ValueError: If the Configuration Version kept moving while reading the configuration.
+        requests.exceptions.HTTPError: If the API requests fail.
+    """
+
+    # Configuration Snapshot (Shared one if Set)
+    snapshot = client.configuration.snapshot if client.configuration.snapshot is not None else ConfigurationSnapshot(client.configuration)
+
+    # Transaction the Configuration is Read through (if Provided)
+    transaction = client.transaction.get_transaction(transaction_id) if transaction_id else None
+
+    # Fetch Existing Configuration
+    version, existing_parents, existing_children = fetch_configuration(snapshot, parents, max_workers, transaction)
+
+    # Initialize Plan
+    operations, changes, diff = [], [], dict(before={}, after={})
+
+    # Record a Change
+    def record(kind, action, key, before, after, fields, parent_type=None, parent_name=None):
+        path = object_path(kind, key, parent_type, parent_name)
+        changes.append(dict(kind=kind, path=path, action=action, fields=fields))
+        object_diff = build_diff(before, after)
+        diff['before'][path] = object_diff['before']
+        diff['after'][path] = object_diff['after']
+
+    # Iterate on Requested Parents
+    for parent in parents:
+
+        # Parent Kind, Name and Existing Instance
+        kind, instance = parent['kind'], parent['instance']
+        existing = existing_parents[kind].get(instance.name)
+
+        # If Parent don't exists
+        if existing is None:
+
+            # Create Parent
+            operations.append(build_operation(kind, ACTION_CREATE, instance=instance))
+            record(kind, ACTION_CREATE, instance.name, None, instance, sorted(filter_none(instance)))
+
+        else:
+
+            # Compute Changed Fields
+            fields = compute_diff(existing, instance)
+
+            # If Parent Changed
+            if fields:
+
+                # Update Parent
+                operations.append(build_operation(kind, ACTION_CHANGE, key=instance.name, instance=instance))
+                record(kind, ACTION_CHANGE, instance.name, existing, instance, sorted(fields))
+
+        # Iterate on Requested Name-Addressed Children
+        for child_kind in NAMED_CHILDREN[kind]:
+
+            # If Children are not Requested
+            if child_kind not in parent['children']:
+                continue
+
+            # Requested and Existing Children (by Name)
+            requested = parent['children'][child_kind]
+            current = {child['name']: child for child in existing_children.get((kind, instance.name, child_kind), [])}
+
+            # Iterate on Requested Children
+            for name, child in requested.items():
+
+                # If Child don't exists
+                if name not in current:
+
+                    # Create Child
+                    operations.append(build_operation(child_kind, ACTION_CREATE, kind, instance.name, instance=child))
+                    record(child_kind, ACTION_CREATE, name, None, child, sorted(filter_none(child)), kind, instance.name)
+                    continue
+
+                # Compute Changed Fields
+                fields = compute_diff(current[name], child)
+
+                # If Child Changed
+                if fields:
+
+                    # Update Child
+                    operations.append(build_operation(child_kind, ACTION_CHANGE, kind, instance.name, key=name, instance=child))
+                    record(child_kind, ACTION_CHANGE, name, current[name], child, sorted(fields), kind, instance.name)
+
+            # If Unlisted Children must be Deleted
+            if purge:
+
+                # Iterate on Unlisted Children
+                for name in sorted(set(current) - set(requested)):
+
+                    # Delete Child
+                    operations.append(build_operation(child_kind, ACTION_REMOVE, kind, instance.name, key=name))
+                    record(child_kind, ACTION_REMOVE, name, current[name], None, [], kind, instance.name)
+
+        # Iterate on Requested Index-Addressed Lists
+        for child_kind in LIST_CHILDREN[kind]:
+
+            # If List is not Requested
+            if child_kind not in parent['children']:
+                continue
+
+            # Existing and Requested Lists
+            current = sorted(existing_children.get((kind, instance.name, child_kind), []), key=lambda entry: entry.get('index', 0))
+            requested = parent['children'][child_kind]
+
+            # Compute Edit Script
+            script = edit_script(current, requested)
+
+            # If List Changed
+            if not script:
+                continue
+
+            # Iterate on Edit Script (Kept in Queue Order, at the Level of the Kind)
+            for step in script:
+
+                # Queue Step
+                operations.append(build_operation(
+                    child_kind,
+                    ACTION_CREATE if step['action'] == ACTION_INSERT else ACTION_CHANGE if step['action'] == ACTION_UPDATE else ACTION_REMOVE,
+                    kind,
+                    instance.name,
+                    key=step['index'],
+                    instance=step['after'],
+                    level=KINDS[child_kind]['level']
+                ))
+
+            # Record List Change
+            path = object_path(child_kind, None, kind, instance.name)
+            changes.append(dict(
+                kind=child_kind,
+                path=path,
+                action=ACTION_CHANGE,
+                fields=["{0} {1}".format(step['action'], step['index']) for step in script]
+            ))
+            diff['before'][path] = canonicalize(current)
+            diff['after'][path] = [filter_none(entry) for entry in requested]
+
+    # Return Plan
+    return dict(
+        version=version,
+        operations=operations,
+        changes=changes,
+        diff=diff
+    )
+
+
+# Serialize a Plan (Compact JSON)
+def dump_plan(plan: dict, base_url: str) -> str:
+    """
+    Serialize a plan as compact JSON, keyed by the Configuration Version it was computed against.
+
+    Only what applying the plan needs is kept (the diff is left out).
+
+    Args:
+        plan (dict): The plan (see plan_configuration).
+        base_url (str): The Dataplane API Base URL the plan was computed on.
+
+    Returns:
+        str: The serialized plan.
+    """
+
+    # Return Compact JSON
+    return json.dumps(
+        dict(
+            format=PLAN_FORMAT,
+            base_url=base_url,
+            version=plan['version'],
+            operations=plan['operations'],
+            changes=plan['changes']
+        ),
+        separators=(',', ':'),
+        sort_keys=True
+    )
+
+
+# Deserialize a Plan
+def load_plan(content: str, base_url: str = None) -> dict:
+    """
+    Deserialize a plan serialized by dump_plan.
+
+    Args:
+        content (str): The serialized plan.
+        base_url (str): The Dataplane API Base URL the plan is applied on (not checked if None).
+
+    Returns:
+        dict: The plan ({'format', 'base_url', 'version', 'operations', 'changes'}).
+
+    Raises:
+        ValueError: If the content is not a plan, or the plan was computed on another Dataplane API.
+    """
+
+    # Decode Plan (Raise ValueError if not JSON)
+    plan = json.loads(content)
+
+    # If Content is not a Supported Plan
+    if not isinstance(plan, dict) or plan.get('format') != PLAN_FORMAT or not isinstance(plan.get('operations'), list):
+
+        # Raise Value Exception
+        raise ValueError("[ConfigurationPlan] - Unsupported plan (format : {0})".format(
+            plan.get('format') if isinstance(plan, dict) else None
+        ))
+
+    # If Plan was Computed on another Dataplane API
+    if base_url is not None and str(plan.get('base_url')).rstrip('/') != base_url.rstrip('/'):
+
+        # Raise Value Exception
+        raise ValueError("[ConfigurationPlan] - Plan was computed on '{0}', not on '{1}'".format(plan.get('base_url'), base_url))
+
+    # Return Plan
+    return plan
+
+
+# Write a Plan File (Atomic Write)
+def write_plan(path: str, plan: dict, base_url: str):
+    """
+    Write a plan file (see dump_plan), replacing it atomically.
+
+    Args:
+        path (str): The plan file path (its directory is created if missing).
+        plan (dict): The plan (see plan_configuration).
+        base_url (str): The Dataplane API Base URL the plan was computed on.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+
+    # Plan File Directory
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    # Write Plan in a Temporary File of the Plan Directory
+    file_descriptor, temporary_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+
+    try:
+
+        # Write Plan
+        with os.fdopen(file_descriptor, 'w', encoding='utf-8') as plan_file:
+            plan_file.write(dump_plan(plan, base_url))
+
+        # Replace Plan File
+        os.replace(temporary_path, path)
+
+    except OSError:
+
+        # Remove Temporary File
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+
+        # Re-Raise Exception
+        raise
+
+
+# Read a Plan File
+def read_plan(path: str, base_url: str = None) -> dict:
+    """
+    Read a plan file written by write_plan.
+
+    Args:
+        path (str): The plan file path.
+        base_url (str): The Dataplane API Base URL the plan is applied on (not checked if None).
+
+    Returns:
+        dict: The plan (see load_plan).
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is not a plan, or the plan was computed on another Dataplane API.
+    """
+
+    # Read and Decode Plan
+    with open(path, 'r', encoding='utf-8') as plan_file:
+        return load_plan(plan_file.read(), base_url)
+
+
+# Check that the Configuration did not Move since a Plan was Computed
+def check_plan_version(client, plan: dict):
+    """
+    Check that the live Configuration Version is still the one a plan was computed against.
+
+    Args:
+        client (haproxy.Client): The HA Proxy Client.
+        plan (dict): The plan.
+
+    Raises:
+        ValueError: If the Configuration Version moved.
+        requests.exceptions.HTTPError: If the API request fails.
+    """
+
+    # Fetch Current Configuration Version
+    current_version = client.configuration.get_configuration_version(refresh=True)
+
+    # If Configuration Version Moved
+    if current_version != plan['version']:
+
+        # Raise Value Exception
+        raise ValueError("[ConfigurationPlan] - Configuration Version moved (plan : {0}, current : {1})".format(
+            plan['version'],
+            current_version
+        ))
+
+
+# Apply a Plan in a single Transaction
+def apply_plan(client, plan: dict, transaction_id: str = None, force_reload: bool = True, max_workers: int = DEFAULT_POOL_SIZE,
+               check_version: bool = False):
+    """
+    Apply the operations of a plan in a single Transaction, dependency level by dependency level,
+    the operations of a level running concurrently (the index-addressed ones of a parent in order).
+
+    Args:
+        client (haproxy.Client): The HA Proxy Client.
+        plan (dict): The plan (see plan_configuration).
+        transaction_id (str): An already started Transaction to use (a Transaction is started and committed if None).
+        force_reload (bool): Force reload HAProxy Configuration on commit.
+        max_workers (int): The maximum number of concurrent requests.
+        check_version (bool): Refuse to apply the plan if the Configuration Version moved since it was computed
+                              (the Transaction must be based on the plan version, so it cannot commit otherwise).
+
+    Returns:
+        str: The Transaction ID (the provided one, if the plan is empty).
+
+    Raises:
+        ValueError: If the version is checked and the Configuration Version moved (nothing is applied).
+        requests.exceptions.HTTPError: If the API requests fail (the started Transaction is cancelled).
+    """
+
+    # If Plan is Empty
+    if not plan['operations']:
+
+        # Check Configuration Version
+        if check_version:
+            check_plan_version(client, plan)
+
+        # Nothing to Apply
+        return transaction_id
+
+    # Open Batch (Transaction Started and Committed if not Provided, Based on the Plan Version if Checked)
+    with client.transaction.batch(
+        force_reload=force_reload,
+        max_workers=max_workers,
+        transaction_id=transaction_id,
+        version=plan['version'] if check_version else None
+    ) as batch:
+
+        # Queue Operations
+        for operation in plan['operations']:
+            batch.queue(operation['client'], operation['method'], dict(operation['kwargs']), operation.get('level'))
+
+    # Return Transaction ID
+    return batch.transaction_id
@@ -0,0 +1,278 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .haproxy_async import AsyncClient, DEFAULT_MAX_PARALLEL
+
+
+class TransactionCoordinator:
+    """
+    Coordinate one Transaction per HAProxy node, so a change lands on all the nodes or on none.
+
+    The Transactions are opened on all the nodes in parallel, the same changes are staged
+    on each of them in parallel, then all the Transactions are committed concurrently.
+    If a Transaction cannot be opened or staged on any node, every open Transaction is
+    cancelled and nothing is committed.
+
+    Attributes:
+        base_urls (list): The base URLs of the nodes Data Plane APIs.
+        api_version (str): The HAProxy Data Plane API Version.
+        username (str): The username for HTTP basic authentication.
+        password (str): The password for HTTP basic authentication.
+        max_parallel (int): The maximum number of concurrent requests (all nodes).
+        options (dict): The Client options (pool_size, max_retries, timeout, snapshot_cache_dir, trace_file, metrics).
+    """
+
+    # Phase : Open Transactions
+    PHASE_OPEN = 'open'
+
+    # Phase : Stage Changes
+    PHASE_STAGE = 'stage'
+
+    # Phase : Commit Transactions
+    PHASE_COMMIT = 'commit'
+
+    def __init__(self, base_urls: list, api_version: str, username: str, password: str,
+                 max_parallel: int = DEFAULT_MAX_PARALLEL, **options):
+        """
+        Initializes the Transaction Coordinator.
+
+        Args:
+            base_urls (list): The base URLs of the nodes Data Plane APIs.
+            api_version (str): The HAProxy Data Plane API Version (v1 or v2)
+            username (str): The username for HTTP basic authentication.
+            password (str): The password for HTTP basic authentication.
+            max_parallel (int): The maximum number of concurrent requests (all nodes).
+            options: The Client options (pool_size, max_retries, timeout, snapshot_cache_dir, trace_file, metrics).
+        Raises:
+            ValueError: If no base URL is provided.
+        """
+
+        # If no Base URL is Provided
+        if not base_urls:
+
+            # Raise Value Exception
+            raise ValueError("[TransactionCoordinator] - Initialization failed : 'base_urls' is required")
+
+        # Initialize Nodes
+        self.base_urls = list(base_urls)
+
+        # Initialize Version
+        self.api_version = api_version
+
+        # Initialize Credentials
+        self.username = username
+        self.password = password
+
+        # Initialize Parallelism
+        self.max_parallel = max(1, max_parallel)
+
+        # Initialize Client Options
+        self.options = options
+
+    async def step(self, node: dict, phase: str, operation):
+        """
+        Run one phase operation on a node, recording its outcome in the node summary.
+
+        Any error of the operation is recorded as the node error, so the other nodes still
+        reach the commit or cancel phase.
+
+        Args:
+            node (dict): The node summary.
+            phase (str): The phase name.
+            operation: The coroutine to run.
+
+        Returns:
+            bool: True if the operation succeeded.
+        """
+
+        # Start Time
+        start = time.monotonic()
+
+        try:
+
+            # Run Operation
+            await operation
+
+            # Operation Succeeded
+            return True
+
+        except Exception as error:
+
+            # Record Failure
+            node['error'] = "[{0}] - {1}".format(phase, error)
+
+            # Operation Failed
+            return False
+
+        finally:
+
+            # Record Phase Time
+            node['elapsed'][phase] = round(time.monotonic() - start, 3)
+
+    async def open_transaction(self, client: AsyncClient, node: dict):
+        """
+        Open the Transaction of a node.
+
+        Args:
+            client (AsyncClient): The node client.
+            node (dict): The node summary.
+        """
+
+        # Start Transaction
+        node['transaction_id'] = (await client.transaction.create_transaction())['id']
+
+    async def commit_transaction(self, client: AsyncClient, node: dict, force_reload: bool):
+        """
+        Commit the Transaction of a node.
+
+        Args:
+            client (AsyncClient): The node client.
+            node (dict): The node summary.
+            force_reload (bool): Force reload HAProxy Configuration.
+        """
+
+        # Commit Transaction
+        await client.transaction.commit_transaction(transaction_id=node['transaction_id'], force_reload=force_reload)
+
+        # Mark as Committed
+        node['committed'] = True
+
+    async def cancel_transactions(self, clients: list, nodes: list):
+        """
+        Cancel all the open (not committed) Transactions.
+
+        Args:
+            clients (list): The nodes clients.
+            nodes (list): The nodes summaries.
+        """
+
+        # Cancel a Transaction (Cancel Errors are ignored : the Reported Error is the Phase Error)
+        async def cancel(client: AsyncClient, node: dict):
+
+            try:
+
+                # Cancel Transaction
+                await client.transaction.cancel_transaction(transaction_id=node['transaction_id'])
+
+                # Mark as Cancelled
+                node['cancelled'] = True
+
+            except Exception:
+
+                # Ignore Cancel Error
+                pass
+
+        # Cancel all Open Transactions Concurrently
+        await asyncio.gather(*(
+            cancel(client, node) for client, node in zip(clients, nodes) if node['transaction_id'] and not node['committed']
+        ))
+
+    async def execute(self, clients: list, stage, force_reload: bool):
+        """
+        Open, stage and commit the Transactions of all the nodes.
+
+        Args:
+            clients (list): The nodes clients.
+            stage: The coroutine function staging the changes (called with the node client and the Transaction ID).
+            force_reload (bool): Force reload HAProxy Configuration.
+
+        Returns:
+            dict: The coordination result ({'ok', 'phase', 'nodes'}).
+        """
+
+        # Initialize Nodes Summaries
+        nodes = [
+            dict(base_url=client.base_url, transaction_id=None, committed=False, cancelled=False, error=None, elapsed={})
+            for client in clients
+        ]
+
+        # Open Transactions Concurrently
+        opened = await asyncio.gather(*(
+            self.step(node, self.PHASE_OPEN, self.open_transaction(client, node)) for client, node in zip(clients, nodes)
+        ))
+
+        # Initialize Staged Status
+        staged = []
+
+        # If all Transactions are Open
+        if all(opened):
+
+            # Stage Changes Concurrently
+            staged = await asyncio.gather(*(
+                self.step(node, self.PHASE_STAGE, stage(client, node['transaction_id'])) for client, node in zip(clients, nodes)
+            ))
+
+        # If any Transaction cannot be Opened or Staged
+        if not all(opened) or not all(staged):
+
+            # Cancel all Open Transactions
+            await self.cancel_transactions(clients, nodes)
+
+            # Return Failure (Nothing Committed)
+            return dict(ok=False, phase=self.PHASE_OPEN if not all(opened) else self.PHASE_STAGE, nodes=nodes)
+
+        # Commit Transactions Concurrently
+        committed = await asyncio.gather(*(
+            self.step(node, self.PHASE_COMMIT, self.commit_transaction(client, node, force_reload)) for client, node in zip(clients, nodes)
+        ))
+
+        # If any Commit Failed
+        if not all(committed):
+
+            # Cancel the Transactions not Committed
+            await self.cancel_transactions(clients, nodes)
+
+            # Return Failure (Partially Committed)
+            return dict(ok=False, phase=self.PHASE_COMMIT, nodes=nodes)
+
+        # Return Success
+        return dict(ok=True, phase=self.PHASE_COMMIT, nodes=nodes)
+
+    def run(self, stage, force_reload: bool = True):
+        """
+        Apply a change on all the nodes, each inside its own Transaction.
+
+        Args:
+            stage: The coroutine function staging the changes of a node (called with the node
+                AsyncClient and the node Transaction ID).
+            force_reload (bool): Force reload HAProxy Configuration on commit.
+
+        Returns:
+            dict: The coordination result : 'ok' (all committed), 'phase' (last phase run) and
+                'nodes' (per-node transaction_id, committed, cancelled, error and phase timings).
+        """
+
+        # Initialize Shared Executor (Bounded Parallelism)
+        executor = ThreadPoolExecutor(max_workers=self.max_parallel)
+
+        # Build Node Clients
+        clients = [
+            AsyncClient(
+                base_url=base_url,
+                api_version=self.api_version,
+                username=self.username,
+                password=self.password,
+                executor=executor,
+                **self.options
+            ) for base_url in self.base_urls
+        ]
+
+        try:
+
+            # Run Event Loop
+            return asyncio.run(self.execute(clients, stage, force_reload))
+
+        finally:
+
+            # Iterate on Node Clients
+            for client in clients:
+
+                # Close Node Client
+                client.close()
+
+            # Release Executor
+            executor.shutdown(wait=True)
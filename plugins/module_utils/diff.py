@@ -0,0 +1,157 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from dataclasses import is_dataclass
+from enum import Enum
+from typing import Any, Dict
+
+from .commons import model_fields, unwrap_data
+
+
+# Convert Model or API Payload to Canonical Form
+def canonicalize(value: Any) -> Any:
+    """
+    Convert a model (dataclass) or a Data Plane API payload to a canonical form.
+
+    Dataclasses and dictionaries become dictionaries without None fields, Enums
+    become their values, and lists are converted item by item.
+
+    Args:
+        value (Any): The model, payload or value to convert.
+
+    Returns:
+        Any: The canonical value.
+    """
+
+    # If Value is a Model
+    if is_dataclass(value) and not isinstance(value, type):
+
+        # Return Canonical Fields
+        return {
+            name: canonicalize(getattr(value, name))
+            for name in model_fields(type(value)) if getattr(value, name) is not None
+        }
+
+    # If Value is an Enumeration
+    if isinstance(value, Enum):
+
+        # Return Enumeration Value
+        return value.value
+
+    # If Value is a Dictionary
+    if isinstance(value, dict):
+
+        # Return Canonical Items
+        return {key: canonicalize(item) for key, item in value.items() if item is not None}
+
+    # If Value is a List
+    if isinstance(value, (list, tuple)):
+
+        # Return Canonical Items
+        return [canonicalize(item) for item in value]
+
+    # Return Value
+    return value
+
+
+# Check if a Requested Value is Satisfied by an Existing Value
+def matches(existing: Any, requested: Any) -> bool:
+    """
+    Check if a canonical existing value satisfies a canonical requested value.
+
+    Dictionaries only compare the requested keys, so the fields filled in by the
+    Data Plane API (server-side defaults) are ignored. Lists must have the same
+    length and matching items.
+
+    Args:
+        existing (Any): The canonical existing value.
+        requested (Any): The canonical requested value.
+
+    Returns:
+        bool: True if the existing value satisfies the requested value.
+    """
+
+    # If Requested Value is an Empty Collection (Omitted by the Data Plane API)
+    if existing is None and requested in ([], {}):
+
+        # Empty Collection match Missing Value
+        return True
+
+    # If Requested Value is a Dictionary
+    if isinstance(requested, dict):
+
+        # Compare Requested Keys
+        return isinstance(existing, dict) and all(
+            matches(existing.get(key), item) for key, item in requested.items()
+        )
+
+    # If Requested Value is a List
+    if isinstance(requested, list):
+
+        # Compare Items
+        return isinstance(existing, list) and len(existing) == len(requested) and all(
+            matches(existing_item, requested_item) for existing_item, requested_item in zip(existing, requested)
+        )
+
+    # Compare Values
+    return existing == requested
+
+
+# Compute Field Diff between Existing and Requested Instance
+def compute_diff(existing: Any, requested: Any) -> Dict[str, Dict[str, Any]]:
+    """
+    Compute the field-level diff between an existing object (API payload) and a requested object (model).
+
+    Args:
+        existing (Any): The existing object, as returned by the Data Plane API (envelope accepted).
+        requested (Any): The requested object (model or dictionary).
+
+    Returns:
+        Dict[str, Dict[str, Any]]: The changed fields, as {field: {'before': ..., 'after': ...}}.
+    """
+
+    # Canonicalize Existing Instance
+    canonical_existing = canonicalize(unwrap_data(existing)) or {}
+
+    # Canonicalize Requested Instance
+    canonical_requested = canonicalize(requested) or {}
+
+    # Return Changed Fields
+    return {
+        name: dict(before=canonical_existing.get(name), after=value)
+        for name, value in canonical_requested.items() if not matches(canonical_existing.get(name), value)
+    }
+
+
+# Build Ansible Diff between Existing and Requested Instance
+def build_diff(existing: Any, requested: Any) -> Dict[str, Any]:
+    """
+    Build the Ansible '--diff' output between an existing object and a requested object.
+
+    The 'before' side only holds the requested fields, so server-side defaults do not show as changes.
+
+    Args:
+        existing (Any): The existing object (None if it does not exist).
+        requested (Any): The requested object (None if it is deleted).
+
+    Returns:
+        Dict[str, Any]: The diff, as {'before': ..., 'after': ...}.
+    """
+
+    # Canonicalize Existing Instance
+    canonical_existing = canonicalize(unwrap_data(existing)) if existing is not None else {}
+
+    # Canonicalize Requested Instance
+    canonical_requested = canonicalize(requested) if requested is not None else {}
+
+    # If Instance is Deleted
+    if requested is None:
+
+        # Return Full Existing Instance
+        return dict(before=canonical_existing, after={})
+
+    # Return Requested Fields
+    return dict(
+        before={name: canonical_existing[name] for name in canonical_requested if name in canonical_existing},
+        after=canonical_requested
+    )
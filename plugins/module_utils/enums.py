@@ -1,11 +1,41 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-from enum import Enum
+from enum import Enum, EnumMeta
+
+
+# Base Enumeration Metaclass
+class BaseEnumMeta(EnumMeta):
+    """
+    Enumeration metaclass building the lookup table of each enumeration once, at class creation.
+
+    The table maps the upper-cased name and value of every member to the member, so
+    BaseEnum.create is a single dictionary lookup.
+    """
+
+    def __new__(metacls, cls, bases, classdict, **kwargs):
+
+        # Build Enumeration Class
+        enum_class = super().__new__(metacls, cls, bases, classdict, **kwargs)
+
+        # Initialize Lookup Table
+        lookup = {}
+
+        # Iterate on Enum members (Values first, so Names win on a clash)
+        for member in enum_class:
+            lookup.setdefault(str(member.value).upper(), member)
+        for member in enum_class:
+            lookup[member.name.upper()] = member
+
+        # Keep Lookup Table
+        enum_class._lookup = lookup
+
+        # Return Enumeration Class
+        return enum_class
 
 
 # Base Enumeration
-class BaseEnum(str, Enum):
+class BaseEnum(str, Enum, metaclass=BaseEnumMeta):
 
     # Create Instance
     @classmethod
@@ -17,17 +47,8 @@ class BaseEnum(str, Enum):
             # Return None
             return None
 
-        # Iterate on Enum members
-        for member in cls:
-
-            # If member match on value
-            if member.name == value.upper() or member.value.upper == value.upper:
-
-                # Return the Member
-                return member
-
-        # Return None
-        return None
+        # Return the Member matching on Name or Value (None if no Member match)
+        return cls._lookup.get(str(value).upper())
 
     # Return Name List
     @classmethod
@@ -525,3 +546,33 @@ class HttpRequestRuleType(BaseEnum):
     WAIT_FOR_BODY = "wait-for-body"
     WAIT_FOR_HANDSHAKE = "wait-for-handshake"
     SET_BANDWIDTH_LIMIT = "set-bandwidth-limit"
+
+
+# Runtime Server Administrative State
+class ServerAdminState(BaseEnum):
+    """
+    Represents the Runtime Administrative State of a Server.
+
+    Attributes:
+        READY (str): The Server accepts traffic.
+        MAINT (str): The Server is in maintenance (no traffic).
+        DRAIN (str): The Server only accepts persistent connections (graceful shutdown).
+    """
+    READY = "ready"
+    MAINT = "maint"
+    DRAIN = "drain"
+
+
+# Runtime Server Operational State
+class ServerOperationalState(BaseEnum):
+    """
+    Represents the Runtime Operational State of a Server.
+
+    Attributes:
+        UP (str): The Server is up.
+        DOWN (str): The Server is down.
+        STOPPING (str): The Server is stopping.
+    """
+    UP = "up"
+    DOWN = "down"
+    STOPPING = "stopping"
@@ -1,16 +1,12 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-from .client_backends import BackendClient
-from .client_frontends import FrontendClient
-from .client_transactions import TransactionClient
 from .client_configurations import ConfigurationClient
-from .client_acls import AclClient
-from .client_servers import ServerClient
-from .client_backend_switching_rules import BackendSwitchingRuleClient
-from .client_http_request_rules import HttpRequestRuleClient
-from .client_binds import BindClient
-from .client_ssl_certificates import SslCertificateClient
+from .commons import build_session, DEFAULT_POOL_SIZE, DEFAULT_MAX_RETRIES, DEFAULT_TIMEOUT
+from .cache import FileCache
+from .metrics import RequestMetrics
+from .transport import transport_url
+from .snapshot import ConfigurationSnapshot, DEFAULT_SNAPSHOT_TTL
 
 try:
     from requests.auth import HTTPBasicAuth     # type: ignore
@@ -26,6 +22,11 @@ class Client:
     Attributes:
         base_url (str): The base URL of the HAProxy Data Plane API.
         auth (HTTPBasicAuth): The HTTP basic authentication credentials.
+        session (requests.Session): The keep-alive HTTP session shared by all sub-clients.
+        timeout (float): The HTTP requests timeout in seconds.
+        metrics (RequestMetrics): The requests recorder of the session.
+        configuration (ConfigurationClient): The Configuration Client shared by all sub-clients.
+        backend, frontend, transaction, acl, besr, bind, server, request_rule, ssl_certificate, reload: The Sub-Clients (built on first access).
     """
 
     # Servers URI
@@ -34,15 +35,38 @@ class Client:
     # URL Format
     URL_TEMPLATE = "{base_url}/{version}/{uri}"
 
-    def __init__(self, base_url: str, api_version: str, username: str, password: str):
+    # Sub-Clients Names (Built on First Access)
+    SUB_CLIENTS = (
+        'backend',
+        'frontend',
+        'transaction',
+        'acl',
+        'besr',
+        'bind',
+        'server',
+        'request_rule',
+        'ssl_certificate',
+        'reload'
+    )
+
+    def __init__(self, base_url: str, api_version: str, username: str, password: str,
+                 pool_size: int = DEFAULT_POOL_SIZE, max_retries: int = DEFAULT_MAX_RETRIES,
+                 timeout: float = DEFAULT_TIMEOUT, snapshot_cache_dir: str = None,
+                 trace_file: str = None, metrics: RequestMetrics = None):
         """
         Initializes the HAProxyClient with the given base URL and credentials.
 
         Args:
-            base_url (str): The base URL (scheme://host:port) of the HAProxy Data Plane API.
+            base_url (str): The base URL (scheme://host:port, or unix:///path/to/socket) of the HAProxy Data Plane API.
             api_version (str): The HAProxy Data Plane API Version (v1 or v2)
             username (str): The username for HTTP basic authentication.
             password (str): The password for HTTP basic authentication.
+            pool_size (int): The maximum number of pooled (keep-alive) connections.
+            max_retries (int): The maximum number of retries on connection and gateway errors.
+            timeout (float): The HTTP requests timeout in seconds.
+            snapshot_cache_dir (str): The Configuration Snapshot cache directory (lookups are served by the API if None).
+            trace_file (str): The JSON lines file each request is appended to (no trace if None).
+            metrics (RequestMetrics): A requests recorder shared with other Clients (a new one if None).
         Raises:
             ValueError: If any of the required parameters are not provided.
         """
@@ -65,6 +89,9 @@ class Client:
             # Raise Value Exception
             raise ValueError("[HAProxyClient] - Initialization failed : 'password' is required")
 
+        # Requests Base URL (Unix Domain Socket URLs are routed to the Socket Adapter)
+        base_url = transport_url(base_url)
+
         # Initialize Base URL
         self.base_url = base_url.rstrip('/')
 
@@ -74,75 +101,136 @@ class Client:
         # Initialize Basic Authentication
         self.auth = HTTPBasicAuth(username, password)
 
-        # Initialize Backend Client
-        self.backend = BackendClient(
-            base_url=base_url,
-            api_version=api_version,
-            auth=self.auth
-        )
+        # Initialize Requests Timeout
+        self.timeout = timeout
 
-        # Initialize Frontend Client
-        self.frontend = FrontendClient(
-            base_url=base_url,
-            api_version=api_version,
-            auth=self.auth
+        # Initialize HTTP Session (Shared by all Sub-Clients)
+        self.session = build_session(
+            pool_size=pool_size,
+            max_retries=max_retries
         )
 
-        # Initialize Transaction Client
-        self.transaction = TransactionClient(
-            base_url=base_url,
-            api_version=api_version,
-            auth=self.auth
-        )
+        # Initialize Requests Metrics (Records every Request of the Session)
+        self.metrics = metrics if metrics is not None else RequestMetrics(trace_file=trace_file)
+        self.metrics.attach(self.session)
 
-        # Initialize Configuration Client
+        # Initialize Configuration Client (Configuration Version Cache shared by all Sub-Clients)
         self.configuration = ConfigurationClient(
             base_url=base_url,
             api_version=api_version,
-            auth=self.auth
+            auth=self.auth,
+            session=self.session,
+            timeout=self.timeout
         )
 
-        # Initialize ACL Client
-        self.acl = AclClient(
-            base_url=base_url,
-            api_version=api_version,
-            auth=self.auth
-        )
+        # If Configuration Snapshot is Enabled
+        if snapshot_cache_dir:
 
-        # Initialize Backend Switching Rule Client
-        self.besr = BackendSwitchingRuleClient(
-            base_url=base_url,
-            api_version=api_version,
-            auth=self.auth
-        )
+            # Initialize Configuration Snapshot (Shared by all Sub-Clients through the Configuration Client)
+            self.configuration.snapshot = ConfigurationSnapshot(
+                configuration=self.configuration,
+                cache=FileCache(directory=snapshot_cache_dir, ttl=DEFAULT_SNAPSHOT_TTL)
+            )
 
-        # Initialize Bind Client
-        self.bind = BindClient(
-            base_url=base_url,
-            api_version=api_version,
-            auth=self.auth
-        )
+    def __getattr__(self, name: str):
+        """
+        Get a Sub-Client, built (and its module imported) on first access.
 
-        # Initialize Server Client
-        self.server = ServerClient(
-            base_url=base_url,
-            api_version=api_version,
-            auth=self.auth
-        )
+        A module only pays the import of the Sub-Clients it uses (and of their models).
 
-        # Initialize Http Request Rule Client
-        self.request_rule = HttpRequestRuleClient(
-            base_url=base_url,
-            api_version=api_version,
-            auth=self.auth
-        )
+        Args:
+            name (str): The Sub-Client name (see SUB_CLIENTS).
 
-        # Initialize SSL Certificate Client
-        self.ssl_certificate = SslCertificateClient(
-            base_url=base_url,
-            api_version=api_version,
-            auth=self.auth
+        Returns:
+            The Sub-Client, sharing the Client session and configuration.
+
+        Raises:
+            AttributeError: If the name is not a Sub-Client name.
+        """
+
+        # If Name is not a Sub-Client
+        if name not in self.SUB_CLIENTS:
+
+            # Raise Attribute Exception
+            raise AttributeError("[HAProxyClient] - Unknown attribute '{0}'".format(name))
+
+        # Build and Keep Sub-Client (Next Accesses do not go through __getattr__)
+        sub_client = sub_client_class(name)(
+            base_url=self.base_url,
+            api_version=self.api_version,
+            auth=self.auth,
+            session=self.session,
+            timeout=self.timeout,
+            configuration=self.configuration
         )
+        setattr(self, name, sub_client)
+
+        # Return Sub-Client
+        return sub_client
+
+
+# Import and Return a Sub-Client Class
+def sub_client_class(name: str):
+    """
+    Import and return the class of a Sub-Client.
+
+    Imports are explicit (not built from the name), so AnsiballZ still finds and ships the modules.
+
+    Args:
+        name (str): The Sub-Client name (see Client.SUB_CLIENTS).
+
+    Returns:
+        type: The Sub-Client class.
+    """
+
+    # Backend Client
+    if name == 'backend':
+        from .client_backends import BackendClient
+        return BackendClient
+
+    # Frontend Client
+    if name == 'frontend':
+        from .client_frontends import FrontendClient
+        return FrontendClient
+
+    # Transaction Client
+    if name == 'transaction':
+        from .client_transactions import TransactionClient
+        return TransactionClient
+
+    # ACL Client
+    if name == 'acl':
+        from .client_acls import AclClient
+        return AclClient
+
+    # Backend Switching Rule Client
+    if name == 'besr':
+        from .client_backend_switching_rules import BackendSwitchingRuleClient
+        return BackendSwitchingRuleClient
+
+    # Bind Client
+    if name == 'bind':
+        from .client_binds import BindClient
+        return BindClient
+
+    # Server Client
+    if name == 'server':
+        from .client_servers import ServerClient
+        return ServerClient
+
+    # Http Request Rule Client
+    if name == 'request_rule':
+        from .client_http_request_rules import HttpRequestRuleClient
+        return HttpRequestRuleClient
+
+    # Reload Client
+    if name == 'reload':
+        from .client_reloads import ReloadClient
+        return ReloadClient
+
+    # SSL Certificate Client
+    from .client_ssl_certificates import SslCertificateClient
+    return SslCertificateClient
 
 
 # Build and Return HA Proxy Client from Dictionnary Vars
@@ -165,5 +253,20 @@ def haproxy_client(params: dict):
         # Error Message for Module
         raise ValueError("Missing Client API Parameters")
 
+    # Optional Client Keys
+    option_keys = [
+        'pool_size',
+        'max_retries',
+        'timeout',
+        'snapshot_cache_dir',
+        'trace_file'
+    ]
+
+    # Build Client Arguments
+    client_arguments = {credential: params[credential] for credential in credential_keys}
+
+    # Add Provided Options
+    client_arguments.update({option: params[option] for option in option_keys if params.get(option) is not None})
+
     # Build and Return Client
-    return Client(**{credential: params[credential] for credential in credential_keys})
+    return Client(**client_arguments)
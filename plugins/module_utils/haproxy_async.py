@@ -0,0 +1,286 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import asyncio
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .haproxy import Client
+
+
+# Default Number of Concurrent Requests (All Nodes)
+DEFAULT_MAX_PARALLEL = 10
+
+
+class AsyncSubClient:
+    """
+    Asynchronous view of a Sub-Client (BackendClient, ServerClient...).
+
+    Each public method of the wrapped Sub-Client becomes a coroutine function, executed
+    in the shared executor, so the number of concurrent requests is bounded by the
+    executor size.
+
+    Attributes:
+        client: The wrapped (blocking) Sub-Client.
+        executor (ThreadPoolExecutor): The executor running the requests.
+    """
+
+    def __init__(self, client, executor: ThreadPoolExecutor = None):
+        """
+        Initializes the Asynchronous Sub-Client.
+
+        Args:
+            client: The wrapped (blocking) Sub-Client.
+            executor (ThreadPoolExecutor): The executor running the requests (loop default executor if None).
+        """
+
+        # Initialize Wrapped Sub-Client
+        self.client = client
+
+        # Initialize Executor
+        self.executor = executor
+
+    def __getattr__(self, name: str):
+        """
+        Get a wrapped Sub-Client attribute (public methods are returned as coroutine functions).
+
+        Args:
+            name (str): The attribute name.
+
+        Returns:
+            The attribute, or a coroutine function if the attribute is a public method.
+        """
+
+        # Wrapped Attribute
+        attribute = getattr(self.client, name)
+
+        # If Attribute is not a Public Method
+        if name.startswith('_') or not callable(attribute):
+
+            # Return Attribute
+            return attribute
+
+        # Coroutine Function running the Method in the Executor
+        @functools.wraps(attribute)
+        async def call(*args, **kwargs):
+
+            # Run Method in Executor
+            return await asyncio.get_running_loop().run_in_executor(
+                self.executor,
+                functools.partial(attribute, *args, **kwargs)
+            )
+
+        # Return Coroutine Function
+        return call
+
+
+class AsyncClient:
+    """
+    Asynchronous Client for interacting with the HAProxy Data Plane API.
+
+    Exposes the same Sub-Clients as Client (backend, frontend, server, acl, transaction...),
+    whose methods are coroutine functions.
+
+    Attributes:
+        client (Client): The wrapped (blocking) Client.
+        base_url (str): The base URL of the HAProxy Data Plane API.
+        executor (ThreadPoolExecutor): The executor running the requests.
+    """
+
+    # Sub-Clients Names
+    SUB_CLIENTS = ('configuration',) + Client.SUB_CLIENTS
+
+    def __init__(self, base_url: str, api_version: str, username: str, password: str,
+                 executor: ThreadPoolExecutor = None, **options):
+        """
+        Initializes the Asynchronous Client.
+
+        Args:
+            base_url (str): The base URL (scheme://host:port) of the HAProxy Data Plane API.
+            api_version (str): The HAProxy Data Plane API Version (v1 or v2)
+            username (str): The username for HTTP basic authentication.
+            password (str): The password for HTTP basic authentication.
+            executor (ThreadPoolExecutor): The executor running the requests (loop default executor if None).
+            options: The Client options (pool_size, max_retries, timeout, snapshot_cache_dir, trace_file, metrics).
+        Raises:
+            ValueError: If any of the required parameters are not provided.
+        """
+
+        # Initialize Wrapped Client
+        self.client = Client(
+            base_url=base_url,
+            api_version=api_version,
+            username=username,
+            password=password,
+            **options
+        )
+
+        # Initialize Base URL (as Provided, Unix Domain Socket URLs included)
+        self.base_url = base_url.rstrip('/')
+
+        # Initialize Executor
+        self.executor = executor
+
+    def __getattr__(self, name: str):
+        """
+        Get an Asynchronous Sub-Client (built on first access).
+
+        Args:
+            name (str): The Sub-Client name.
+
+        Returns:
+            AsyncSubClient: The Asynchronous Sub-Client.
+
+        Raises:
+            AttributeError: If the name is not a Sub-Client name.
+        """
+
+        # If Name is not a Sub-Client
+        if name not in self.SUB_CLIENTS:
+
+            # Raise Attribute Exception
+            raise AttributeError("[AsyncClient] - Unknown attribute '{0}'".format(name))
+
+        # Build and Keep Asynchronous Sub-Client
+        sub_client = AsyncSubClient(getattr(self.client, name), self.executor)
+        setattr(self, name, sub_client)
+
+        # Return Asynchronous Sub-Client
+        return sub_client
+
+    def close(self):
+        """
+        Close the HTTP Session of the Client.
+        """
+
+        # Close Session
+        self.client.session.close()
+
+
+# Run an Operation on a Node and Return the Node Summary
+async def run_on_node(client: AsyncClient, operation):
+    """
+    Run an operation on a node and build the node summary.
+
+    Any error of the operation is recorded as the node error, so one failing node never
+    aborts the other nodes.
+
+    Args:
+        client (AsyncClient): The node client.
+        operation: The coroutine function to run (called with the node client).
+
+    Returns:
+        dict: The node summary ({'base_url', 'ok', 'result', 'error', 'elapsed'}).
+    """
+
+    # Start Time
+    start = time.monotonic()
+
+    try:
+
+        # Run Operation
+        result = await operation(client)
+
+        # Return Success Summary
+        return dict(base_url=client.base_url, ok=True, result=result, error=None, elapsed=round(time.monotonic() - start, 3))
+
+    except Exception as error:
+
+        # Return Failure Summary
+        return dict(base_url=client.base_url, ok=False, result=None, error=str(error), elapsed=round(time.monotonic() - start, 3))
+
+
+# Run an Operation on many Nodes concurrently
+def run_on_nodes(base_urls: list, api_version: str, username: str, password: str, operation,
+                 max_parallel: int = DEFAULT_MAX_PARALLEL, **options):
+    """
+    Run an operation on many HAProxy nodes concurrently, with bounded parallelism.
+
+    Each node gets its own AsyncClient (and HTTP session); all the nodes share one executor,
+    so at most 'max_parallel' requests are in flight at the same time.
+
+    Args:
+        base_urls (list): The base URLs of the nodes Data Plane APIs.
+        api_version (str): The HAProxy Data Plane API Version (v1 or v2)
+        username (str): The username for HTTP basic authentication.
+        password (str): The password for HTTP basic authentication.
+        operation: The coroutine function to run on each node (called with the node AsyncClient).
+        max_parallel (int): The maximum number of concurrent requests.
+        options: The Client options (pool_size, max_retries, timeout, snapshot_cache_dir, trace_file, metrics).
+
+    Returns:
+        list: The node summaries, in the 'base_urls' order.
+
+    Raises:
+        ValueError: If no base URL is provided.
+    """
+
+    # If no Base URL is Provided
+    if not base_urls:
+
+        # Raise Value Exception
+        raise ValueError("[AsyncClient] - At least one 'base_url' is required")
+
+    # Initialize Shared Executor (Bounded Parallelism)
+    executor = ThreadPoolExecutor(max_workers=max(1, max_parallel))
+
+    # Build Node Clients
+    clients = [
+        AsyncClient(
+            base_url=base_url,
+            api_version=api_version,
+            username=username,
+            password=password,
+            executor=executor,
+            **options
+        ) for base_url in base_urls
+    ]
+
+    # Run Operation on all Nodes
+    async def run_all():
+        return await asyncio.gather(*(run_on_node(client, operation) for client in clients))
+
+    try:
+
+        # Run Event Loop
+        return list(asyncio.run(run_all()))
+
+    finally:
+
+        # Iterate on Node Clients
+        for client in clients:
+
+            # Close Node Client
+            client.close()
+
+        # Release Executor
+        executor.shutdown(wait=True)
+
+
+# Build and Return Fleet Base URLs from Dictionnary Vars
+def haproxy_nodes(params: dict):
+    """
+    Build the list of nodes base URLs from module parameters ('base_url' then 'nodes').
+
+    Args:
+        params (dict): The module parameters.
+
+    Returns:
+        list: The nodes base URLs (duplicates removed).
+    """
+
+    # Initialize Base URLs
+    base_urls = []
+
+    # Iterate on Provided Base URLs
+    for base_url in [params.get('base_url')] + list(params.get('nodes') or []):
+
+        # If Base URL is Provided and not Duplicated
+        if base_url and base_url.rstrip('/') not in base_urls:
+
+            # Add Base URL
+            base_urls.append(base_url.rstrip('/'))
+
+    # Return Base URLs
+    return base_urls
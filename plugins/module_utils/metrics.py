@@ -0,0 +1,247 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+import threading
+import time
+from urllib.parse import urlsplit, parse_qsl
+
+
+# Number of Collection Segments kept in the URI Template, by API Area (services/haproxy/<area>/...)
+AREA_SEGMENTS = {
+    'configuration': 2,
+    'runtime': 2,
+    'storage': 2,
+    'transactions': 1,
+    'reloads': 1
+}
+
+# API Areas whose Objects are addressed by ID
+ID_AREAS = ('transactions', 'reloads')
+
+
+# Compute the URI Template of a Request URL
+def uri_template(url: str) -> str:
+    """
+    Compute the URI template of a Data Plane API request URL : the object names, indexes
+    and IDs of the path, and the query values, are replaced by placeholders.
+
+    Example:
+        http://lb:5555/v2/services/haproxy/configuration/servers/web1?parent_name=app&version=4
+        => services/haproxy/configuration/servers/{name}?parent_name={parent_name}&version={version}
+
+    Args:
+        url (str): The request URL.
+
+    Returns:
+        str: The URI template.
+    """
+
+    # Split URL
+    parts = urlsplit(url)
+
+    # Path Segments (from the 'services' Segment, without the Base URL and the Version)
+    segments = parts.path.strip('/').split('/')
+    segments = segments[segments.index('services'):] if 'services' in segments else segments
+
+    # API Area
+    area = segments[2] if len(segments) > 2 else None
+
+    # Number of Segments kept as is (services/haproxy/<area>[/<collection>])
+    kept = 2 + AREA_SEGMENTS.get(area, len(segments))
+
+    # Object Placeholders
+    placeholders = [
+        '{id}' if area in ID_AREAS else '{index}' if segment.isdigit() else '{name}'
+        for segment in segments[kept:]
+    ]
+
+    # Query Placeholders
+    query = '&'.join('{0}={{{0}}}'.format(key) for key, _ in parse_qsl(parts.query, keep_blank_values=True))
+
+    # Return Template
+    return '/'.join(segments[:kept] + placeholders) + ('?' + query if query else '')
+
+
+class RequestMetrics:
+    """
+    Recorder of the HTTP requests of a Session (method, URI template, status, bytes, latency and reload ID).
+
+    Attached to a Session as a response hook, it sees every request made through the Session
+    (the sub-clients, the batches and the asynchronous clients share the Session of their Client).
+    Each request can also be appended to a JSON lines trace file.
+
+    Attributes:
+        trace_file (str): The JSON lines trace file path (no trace if None).
+        records (list): The requests records.
+        lock (threading.Lock): The records lock (requests are made from several threads).
+    """
+
+    # Delayed Reload ID Response Header
+    RELOAD_ID_HEADER = 'Reload-ID'
+
+    def __init__(self, trace_file: str = None):
+        """
+        Initializes the Request Metrics.
+
+        Args:
+            trace_file (str): The JSON lines trace file path (no trace if None).
+        """
+
+        # Initialize Trace File
+        self.trace_file = trace_file
+
+        # Initialize Records
+        self.records = []
+
+        # Initialize Lock
+        self.lock = threading.Lock()
+
+    def attach(self, session):
+        """
+        Record the requests of a Session.
+
+        Args:
+            session (requests.Session): The HTTP Session.
+
+        Returns:
+            requests.Session: The HTTP Session.
+        """
+
+        # Register Response Hook
+        session.hooks['response'].append(self.record)
+
+        # Keep Metrics on the Session (Reachable from every Sub-Client)
+        session.metrics = self
+
+        # Return Session
+        return session
+
+    def record(self, response, *args, **kwargs):
+        """
+        Record a request (Session response hook).
+
+        Args:
+            response (requests.Response): The HTTP response.
+
+        Returns:
+            requests.Response: The HTTP response (unchanged).
+        """
+
+        # Request
+        request = response.request
+
+        # Received Bytes (the Body of a Streamed Response is not read)
+        received = response.headers.get('Content-Length')
+        if received is None and not kwargs.get('stream'):
+            received = len(response.content)
+
+        # Build Record
+        record = dict(
+            time=round(time.time(), 6),
+            method=request.method,
+            uri=uri_template(request.url),
+            status=response.status_code,
+            bytes_sent=int(request.headers.get('Content-Length') or 0),
+            bytes_received=int(received or 0),
+            elapsed=round(response.elapsed.total_seconds(), 6)
+        )
+
+        # If Changes are Applied by a Delayed Reload
+        if response.headers.get(self.RELOAD_ID_HEADER):
+
+            # Record Reload ID
+            record['reload_id'] = response.headers[self.RELOAD_ID_HEADER]
+
+        with self.lock:
+
+            # Keep Record
+            self.records.append(record)
+
+            # If Trace File is Provided
+            if self.trace_file:
+
+                # Append Record to the Trace File
+                with open(self.trace_file, 'a') as trace:
+                    trace.write(json.dumps(record) + '\n')
+
+        # Return Response
+        return response
+
+    def summary(self):
+        """
+        Summarize the recorded requests, as a whole and by endpoint (method and URI template).
+
+        Returns:
+            dict: The summary ({'requests', 'elapsed', 'bytes_sent', 'bytes_received', 'reload_ids', 'endpoints'}),
+                  endpoints sorted by decreasing elapsed time, delayed reloads IDs in order of appearance.
+        """
+
+        # Endpoints Summaries by (Method, URI Template)
+        endpoints = {}
+
+        # Delayed Reloads IDs (Distinct)
+        reload_ids = {}
+
+        with self.lock:
+
+            # Iterate on Records
+            for record in self.records:
+
+                # Endpoint Summary
+                endpoint = endpoints.setdefault((record['method'], record['uri']), dict(
+                    method=record['method'],
+                    uri=record['uri'],
+                    requests=0,
+                    elapsed=0.0,
+                    bytes_sent=0,
+                    bytes_received=0,
+                    statuses={}
+                ))
+
+                # Add Record
+                endpoint['requests'] += 1
+                endpoint['elapsed'] += record['elapsed']
+                endpoint['bytes_sent'] += record['bytes_sent']
+                endpoint['bytes_received'] += record['bytes_received']
+                endpoint['statuses'][str(record['status'])] = endpoint['statuses'].get(str(record['status']), 0) + 1
+
+                # Add Reload ID
+                if 'reload_id' in record:
+                    reload_ids[record['reload_id']] = True
+
+        # Sort Endpoints by Elapsed Time
+        endpoints = sorted(endpoints.values(), key=lambda endpoint: endpoint['elapsed'], reverse=True)
+
+        # Round Elapsed Times
+        for endpoint in endpoints:
+            endpoint['elapsed'] = round(endpoint['elapsed'], 6)
+
+        # Return Summary
+        return dict(
+            requests=sum(endpoint['requests'] for endpoint in endpoints),
+            elapsed=round(sum(endpoint['elapsed'] for endpoint in endpoints), 6),
+            bytes_sent=sum(endpoint['bytes_sent'] for endpoint in endpoints),
+            bytes_received=sum(endpoint['bytes_received'] for endpoint in endpoints),
+            reload_ids=list(reload_ids),
+            endpoints=endpoints
+        )
+
+
+# Return the Requests Summary of a Client
+def request_metrics(client):
+    """
+    Return the requests summary of a Client or Sub-Client (see RequestMetrics.summary).
+
+    Args:
+        client: The Client or Sub-Client.
+
+    Returns:
+        dict: The requests summary (empty if the Client Session is not instrumented).
+    """
+
+    # Session Metrics
+    metrics = getattr(getattr(client, 'session', None), 'metrics', None)
+
+    # Return Summary
+    return metrics.summary() if metrics is not None else {}
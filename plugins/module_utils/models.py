@@ -1,19 +1,25 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import sys
+
 from typing import List, Dict, Optional
 from dataclasses import dataclass, field
+from .commons import model_fields
 from .enums import EnableDisableEnum, LoadBalancingAlgorithm, CookieType
 from .enums import WebSocketProtocol, HealthCheckType, TimeoutStatus
 from .enums import ErrorStatus, OkStatus, HttpMethod, ProxyProtocol, FrontendLevel
 from .enums import CompressionAlgorithm, SSLVersion, Requirement, MatchType
 from .enums import AdvancedHealthCheckType, MySqlVersionCheckType, ConditionType
 from .enums import HttpRequestRuleType, LogLevel, HttpRequestRuleNormalizerType
-from .enums import IPProtocol, RedirectType
+from .enums import IPProtocol, RedirectType, ServerAdminState, ServerOperationalState
+
+# Models Options (Slotted Instances : no per-instance __dict__, where supported)
+MODEL_OPTIONS = dict(slots=True) if sys.version_info >= (3, 10) else {}
 
 
 # Load Balancing Configuration
-@dataclass
+@dataclass(**MODEL_OPTIONS)
 class Balance:
     """
     Represents a load balancing algorithm configuration.
@@ -58,11 +64,11 @@ class Balance:
         """
         Returns a dictionary representation of the Balance object.
         """
-        return str(self.__dict__)
+        return str({name: getattr(self, name) for name in model_fields(type(self))})
 
 
 # Backend Cookie Configuration
-@dataclass
+@dataclass(**MODEL_OPTIONS)
 class Cookie:
     """
     Represents a session cookie configuration.
@@ -107,11 +113,11 @@ class Cookie:
         """
         Returns a dictionary representation of the Cookie object.
         """
-        return str(self.__dict__)
+        return str({name: getattr(self, name) for name in model_fields(type(self))})
 
 
 # Backend Configuration
-@dataclass
+@dataclass(**MODEL_OPTIONS)
 class Server:
     """
     Represents a server configuration with various parameters.
@@ -195,8 +201,30 @@ class Server:
             raise ValueError("[Server] - The 'name' field is required.")
 
 
+# Runtime Server State
+@dataclass(**MODEL_OPTIONS)
+class RuntimeServer:
+    """
+    Represents the runtime state of a server (changed without reloading HAProxy).
+
+    Attributes:
+        name (str, required): The name of the server.
+        admin_state (ServerAdminState, optional): The administrative state (ready/maint/drain).
+        operational_state (ServerOperationalState, optional): The operational state (up/down/stopping).
+    """
+    name: str
+    admin_state: Optional[ServerAdminState] = None
+    operational_state: Optional[ServerOperationalState] = None
+
+    def __post_init__(self):
+
+        # Ajoutez ici des validations si nécessaire
+        if not self.name:
+            raise ValueError("[RuntimeServer] - The 'name' field is required.")
+
+
 # HTTP HealthCheck Configuration
-@dataclass
+@dataclass(**MODEL_OPTIONS)
 class HttpHealthCheck:
     """
     Represents a health check configuration in HAProxy.
@@ -261,7 +289,7 @@ class HttpHealthCheck:
 
 
 # HTTP check parameters Configuration
-@dataclass
+@dataclass(**MODEL_OPTIONS)
 class HttpCheckParams:
     """
     Represents the HTTP check parameters for a HAProxy backend.
@@ -286,7 +314,7 @@ class HttpCheckParams:
 
 
 # Error Location
-@dataclass
+@dataclass(**MODEL_OPTIONS)
 class ErrorLoc:
     code: int
     url: str
@@ -303,7 +331,7 @@ class ErrorLoc:
 
 
 # Error File
-@dataclass
+@dataclass(**MODEL_OPTIONS)
 class ErrorFile:
     code: int
     file: str
@@ -320,7 +348,7 @@ class ErrorFile:
 
 
 # /BackendFrontend Compression
-@dataclass
+@dataclass(**MODEL_OPTIONS)
 class Compression:
     algorithms: Optional[List[CompressionAlgorithm]] = field(default_factory=list)
     offload: Optional[bool] = None
@@ -328,7 +356,7 @@ class Compression:
 
 
 # Backend/Frontend Forwarded For
-@dataclass
+@dataclass(**MODEL_OPTIONS)
 class ForwardFor:
     enabled: EnableDisableEnum
     header: Optional[str] = None
@@ -342,27 +370,27 @@ class ForwardFor:
 
 
 # Backend Check Params for MySQL
-@dataclass
+@dataclass(**MODEL_OPTIONS)
 class MySqlCheckParams:
     client_version: MySqlVersionCheckType
     username: Optional[str] = None
 
 
 # Backend Check Params for Posgres
-@dataclass
+@dataclass(**MODEL_OPTIONS)
 class PostgresSqlCheckParams:
     username: Optional[str] = None
 
 
 # Backend Check Params for SMTP
-@dataclass
+@dataclass(**MODEL_OPTIONS)
 class SmtpCheckParams:
     domain: Optional[str] = None
     hello: Optional[str] = None
 
 
 # Backend Redispatch
-@dataclass
+@dataclass(**MODEL_OPTIONS)
 class Redispatch:
     enabled: EnableDisableEnum
     interval: Optional[int] = None
@@ -375,7 +403,7 @@ class Redispatch:
 
 
 # Backend Ignore Persist
-@dataclass
+@dataclass(**MODEL_OPTIONS)
 class IgnorePersist:
     cond: ConditionType
     cond_test: str
@@ -392,7 +420,7 @@ class IgnorePersist:
 
 
 # HTTP Request Rule Configuration
-@dataclass
+@dataclass(**MODEL_OPTIONS)
 class HttpRequestRule:
     index: int
     type: Optional[HttpRequestRuleType] = None
@@ -441,7 +469,7 @@ class HttpRequestRule:
 
 
 # Backend Configuration
-@dataclass
+@dataclass(**MODEL_OPTIONS)
 class Backend:
     name: str
     mode: Optional[ProxyProtocol] = None
@@ -500,7 +528,7 @@ class Backend:
 
 
 # Frontend Configuration
-@dataclass
+@dataclass(**MODEL_OPTIONS)
 class Frontend:
     name: str
     mode: Optional[ProxyProtocol] = None
@@ -534,7 +562,7 @@ class Frontend:
 
 
 # Bind Configuration
-@dataclass
+@dataclass(**MODEL_OPTIONS)
 class Bind:
     name: str
     address: Optional[str] = None
@@ -595,7 +623,7 @@ class Bind:
 
 
 # ACL Configuration
-@dataclass
+@dataclass(**MODEL_OPTIONS)
 class Acl:
     acl_name: str
     criterion: str
@@ -604,7 +632,7 @@ class Acl:
 
 
 # Backend Switching Rule Configuration
-@dataclass
+@dataclass(**MODEL_OPTIONS)
 class BackendSwitchingRule:
     cond: ConditionType
     cond_test: str
@@ -0,0 +1,214 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from .client_transactions import TransactionClient
+from .commons import filter_none, unwrap_data
+from .diff import compute_diff
+
+
+# Edit Script Action : Entry Inserted at the Index (later Entries shift up)
+ACTION_INSERT = 'insert'
+
+# Edit Script Action : Entry Replaced at the Index
+ACTION_UPDATE = 'update'
+
+# Edit Script Action : Entry Removed at the Index (later Entries shift down)
+ACTION_DELETE = 'delete'
+
+
+# Check if an Existing Entry match a Requested Entry (whatever their Index)
+def same_entry(existing, requested) -> bool:
+    """
+    Check if an existing entry of an ordered list matches a requested entry, ignoring their index.
+
+    Args:
+        existing: The existing entry (API payload).
+        requested: The requested entry (model or dictionary).
+
+    Returns:
+        bool: True if the existing entry satisfies the requested entry.
+    """
+
+    # Compare all Fields but the Index
+    return not [name for name in compute_diff(existing, requested) if name != 'index']
+
+
+# Extract the Ordered Entries of a List Response
+def ordered_entries(payload) -> list:
+    """
+    Extract the entries of an index-addressed list response, ordered by index.
+
+    Args:
+        payload: The decoded list response (envelope accepted).
+
+    Returns:
+        list: The entries, ordered by index.
+    """
+
+    # Return Entries Ordered by Index
+    return sorted(unwrap_data(payload) or [], key=lambda entry: entry.get('index', 0))
+
+
+# Remove Entries from an Ordered List
+def without_entries(existing: list, removed: list) -> list:
+    """
+    Build the ordered list left once the entries matching any of the removed entries are deleted.
+
+    Args:
+        existing (list): The existing entries (API payloads).
+        removed (list): The entries to remove (models or dictionaries).
+
+    Returns:
+        list: The remaining existing entries, in order, indexed by their new position.
+    """
+
+    # Entries not Matching any Removed Entry
+    remaining = [entry for entry in existing if not any(same_entry(entry, item) for item in removed)]
+
+    # Return Remaining Entries (Indexed by their new Position)
+    return [dict(entry, index=position) for position, entry in enumerate(remaining)]
+
+
+# Compute the Minimal Edit Script between two Ordered Lists
+def edit_script(existing: list, requested: list) -> list:
+    """
+    Compute the minimal edit script turning an existing ordered list into a requested one.
+
+    Entries are aligned with an edit distance table (LCS-style dynamic programming) where
+    keeping a matching entry is free, and updating, inserting or deleting an entry costs
+    one write. The common head and tail of the lists are skipped first, so the quadratic
+    table only covers the changed middle part.
+
+    The operations are returned in application order, each with the index it applies to
+    once the previous ones are applied (as the Data Plane API shifts the following entries
+    on each insert and delete).
+
+    Args:
+        existing (list): The existing entries (API payloads), in order.
+        requested (list): The requested entries (models or dictionaries), in order.
+
+    Returns:
+        list: The operations ({'action' : insert, update or delete, 'index', 'before', 'after'}).
+    """
+
+    # Skip Common Head
+    start = 0
+    while start < len(existing) and start < len(requested) and same_entry(existing[start], requested[start]):
+        start += 1
+
+    # Skip Common Tail
+    existing_end, requested_end = len(existing), len(requested)
+    while existing_end > start and requested_end > start and same_entry(existing[existing_end - 1], requested[requested_end - 1]):
+        existing_end, requested_end = existing_end - 1, requested_end - 1
+
+    # Changed Middle Parts
+    before, after = existing[start:existing_end], requested[start:requested_end]
+
+    # Matching Entries Table
+    matching = [[same_entry(entry, item) for item in after] for entry in before]
+
+    # Edit Cost Table (cost[i][j] : Writes turning before[i:] into after[j:])
+    cost = [[0] * (len(after) + 1) for _ in range(len(before) + 1)]
+    for i in range(len(before), -1, -1):
+        for j in range(len(after), -1, -1):
+            if i == len(before) or j == len(after):
+                cost[i][j] = (len(before) - i) + (len(after) - j)
+            else:
+                cost[i][j] = min(
+                    cost[i + 1][j + 1] + (0 if matching[i][j] else 1),
+                    cost[i + 1][j] + 1,
+                    cost[i][j + 1] + 1
+                )
+
+    # Walk the Cheapest Path (Index of the Operations once the previous ones are Applied)
+    script, i, j, index = [], 0, 0, start
+    while i < len(before) or j < len(after):
+
+        # Keep or Update Entry
+        if i < len(before) and j < len(after) and cost[i][j] == cost[i + 1][j + 1] + (0 if matching[i][j] else 1):
+            if not matching[i][j]:
+                script.append(dict(action=ACTION_UPDATE, index=index, before=before[i], after=after[j]))
+            i, j, index = i + 1, j + 1, index + 1
+
+        # Delete Entry
+        elif i < len(before) and cost[i][j] == cost[i + 1][j] + 1:
+            script.append(dict(action=ACTION_DELETE, index=index, before=before[i], after=None))
+            i += 1
+
+        # Insert Entry
+        else:
+            script.append(dict(action=ACTION_INSERT, index=index, before=None, after=after[j]))
+            j, index = j + 1, index + 1
+
+    # Return Edit Script
+    return script
+
+
+# Reconcile an Ordered List in a single Transaction
+def reconcile(client, existing: list, requested: list, create, update, delete,
+              transaction_id: str = '', force_reload: bool = True, check_mode: bool = False):
+    """
+    Make an index-addressed list (ACLs, rules) match a requested ordered list with the fewest writes.
+
+    The edit script is applied in a single Transaction : the given one, or a Transaction
+    started (then committed with a single reload) for the occasion. Nothing is written if the
+    lists already match.
+
+    Args:
+        client: The Sub-Client of the list (its session, authentication and configuration are shared).
+        existing (list): The existing entries (API payloads), in order.
+        requested (list): The requested entries (models, indexed by their position), in order.
+        create: The function inserting an entry (called with index, entry and transaction_id).
+        update: The function replacing an entry (called with index, entry and transaction_id).
+        delete: The function removing an entry (called with index and transaction_id).
+        transaction_id (str): Started Transaction ID (a dedicated Transaction is used if not provided).
+        force_reload (bool): Force Reload HA Proxy Configuration on commit of the dedicated Transaction.
+        check_mode (bool): Only compute the edit script.
+
+    Returns:
+        dict: The outcome ({'operations', 'before', 'after'}), the operations being
+              {'action', 'index', 'instance'} dictionaries, in application order.
+
+    Raises:
+        requests.exceptions.HTTPError: If the API requests fail (the dedicated Transaction is cancelled).
+    """
+
+    # Compute Edit Script
+    script = edit_script(existing, requested)
+
+    # If Script must be Applied
+    if script and not check_mode:
+
+        # Build Transaction Client (Shared Session and Configuration)
+        transaction = TransactionClient(
+            base_url=client.base_url,
+            api_version=client.api_version,
+            auth=client.auth,
+            session=client.session,
+            timeout=client.timeout,
+            configuration=client.configuration
+        )
+
+        # Apply Operations in Order, in the Transaction (Started and Committed if not Provided)
+        with transaction.batch(force_reload=force_reload, transaction_id=transaction_id or None) as batch:
+            for operation in script:
+                if operation['action'] == ACTION_INSERT:
+                    create(index=operation['index'], entry=operation['after'], transaction_id=batch.transaction_id)
+                elif operation['action'] == ACTION_UPDATE:
+                    update(index=operation['index'], entry=operation['after'], transaction_id=batch.transaction_id)
+                else:
+                    delete(index=operation['index'], transaction_id=batch.transaction_id)
+
+    # Return Outcome
+    return dict(
+        operations=[
+            dict(
+                action=operation['action'],
+                index=operation['index'],
+                instance=filter_none(operation['after'] if operation['after'] is not None else operation['before'])
+            )
+            for operation in script
+        ],
+        before=existing,
+        after=[filter_none(entry) for entry in requested]
+    )
@@ -0,0 +1,304 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from .commons import is_2xx, unwrap_data
+
+# Default Snapshot Cache Entries Time To Live in seconds (Sections are also invalidated on Version change)
+DEFAULT_SNAPSHOT_TTL = 3600
+
+
+class ConfigurationSnapshot:
+    """
+    Snapshot of the HAProxy Configuration, keyed by Configuration Version.
+
+    Each section (a list endpoint, like the Backends or the Servers of a Backend) is
+    fetched once per Configuration Version, then all the existence and diff lookups
+    of the section are served from memory. Sections are stored in an optional file
+    cache, so they are shared by all the tasks of a play, and are invalidated as soon
+    as the Configuration Version changes.
+
+    Attributes:
+        configuration (ConfigurationClient): The Configuration Client (Version, Session, Authentication).
+        cache (FileCache): The Sections File Cache (sections are only kept in memory if None).
+        sections (dict): The loaded Sections, by Section Key.
+    """
+
+    # Sections (List URI, Object Key Field and Parent Query)
+    SECTIONS = {
+        'backends': dict(
+            uri="services/haproxy/configuration/backends",
+            key='name',
+            parent_query=None
+        ),
+        'frontends': dict(
+            uri="services/haproxy/configuration/frontends",
+            key='name',
+            parent_query=None
+        ),
+        'servers': dict(
+            uri="services/haproxy/configuration/servers",
+            key='name',
+            parent_query="parent_type={parent_type}&parent_name={parent_name}"
+        ),
+        'binds': dict(
+            uri="services/haproxy/configuration/binds",
+            key='name',
+            parent_query="parent_type={parent_type}&parent_name={parent_name}"
+        ),
+        'acls': dict(
+            uri="services/haproxy/configuration/acls",
+            key='index',
+            parent_query="parent_type={parent_type}&parent_name={parent_name}"
+        ),
+        'http_request_rules': dict(
+            uri="services/haproxy/configuration/http_request_rules",
+            key='index',
+            parent_query="parent_type={parent_type}&parent_name={parent_name}"
+        ),
+        'backend_switching_rules': dict(
+            uri="services/haproxy/configuration/backend_switching_rules",
+            key='index',
+            parent_query="frontend={parent_name}"
+        )
+    }
+
+    # URL Format
+    URL_TEMPLATE = "{base_url}/{version}/{uri}"
+
+    def __init__(self, configuration, cache=None):
+        """
+        Initializes the Configuration Snapshot.
+
+        Args:
+            configuration (ConfigurationClient): The Configuration Client.
+            cache (FileCache): The Sections File Cache (sections are only kept in memory if None).
+        Raises:
+            ValueError: If the configuration client is not provided.
+        """
+
+        # If Configuration Client is not Provided
+        if configuration is None:
+
+            # Raise Value Exception
+            raise ValueError("[ConfigurationSnapshot] - Initialization failed : 'configuration' is required")
+
+        # Initialize Configuration Client
+        self.configuration = configuration
+
+        # Initialize File Cache
+        self.cache = cache
+
+        # Initialize Loaded Sections
+        self.sections = {}
+
+    def section_key(self, collection: str, parent_name: str = None, parent_type: str = None):
+        """
+        Build the key of a Section.
+
+        Args:
+            collection (str): The Section Collection (see SECTIONS).
+            parent_name (str): The Parent Name (child sections only).
+            parent_type (str): The Parent Type (child sections only).
+
+        Returns:
+            str: The Section Key.
+        """
+
+        # Return Key (API Instance, Collection and Parent)
+        return "snapshot|{0}|{1}|{2}|{3}|{4}".format(
+            self.configuration.base_url,
+            self.configuration.api_version,
+            collection,
+            parent_type or '',
+            parent_name or ''
+        )
+
+    def fetch_section(self, collection: str, parent_name: str = None, parent_type: str = None, transaction_id: str = None):
+        """
+        Fetch a Section from the HAProxy Data Plane API.
+
+        Args:
+            collection (str): The Section Collection (see SECTIONS).
+            parent_name (str): The Parent Name (child sections only).
+            parent_type (str): The Parent Type (child sections only).
+            transaction_id (str): The Transaction the Section is read through (with its pending changes), if any.
+
+        Returns:
+            dict: The Section, as {'version': ..., 'data': [...]}.
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails.
+        """
+
+        # Section Definition
+        section = self.SECTIONS[collection]
+
+        # Section URI
+        uri = section['uri']
+
+        # Section Query (Parent and Transaction)
+        query = []
+
+        # If Section is a Child Section
+        if section['parent_query']:
+
+            # Add Parent Query
+            query.append(section['parent_query'].format(parent_name=parent_name, parent_type=parent_type))
+
+        # If Section is Read through a Transaction
+        if transaction_id:
+
+            # Add Transaction Query
+            query.append("transaction_id={0}".format(transaction_id))
+
+        # If a Query is Set
+        if query:
+
+            # Add Query
+            uri = "{0}?{1}".format(uri, '&'.join(query))
+
+        # Build the Operation URL
+        url = self.URL_TEMPLATE.format(
+            base_url=self.configuration.base_url,
+            uri=uri,
+            version=self.configuration.api_version
+        )
+
+        # Execute Request
+        response = self.configuration.session.get(url, auth=self.configuration.auth, timeout=self.configuration.timeout)
+
+        # If Request Failed
+        if not is_2xx(response.status_code):
+
+            # Raise Exception
+            response.raise_for_status()
+
+        # Extract Payload
+        payload = response.json()
+
+        # Configuration Version the Section is read at (the Payload one, not the Shared Cached one)
+        version = payload['_version'] if isinstance(payload, dict) and payload.get('_version') is not None else self.configuration.version
+
+        # Update Configuration Version (Committed Configuration only)
+        if not transaction_id:
+            self.configuration.version = version
+
+        # Return Section
+        return dict(version=version, data=unwrap_data(payload) or [])
+
+    def get_section(self, collection: str, parent_name: str = None, parent_type: str = None):
+        """
+        Get the Objects of a Section at the current Configuration Version.
+
+        Args:
+            collection (str): The Section Collection (see SECTIONS).
+            parent_name (str): The Parent Name (child sections only).
+            parent_type (str): The Parent Type (child sections only).
+
+        Returns:
+            list: The Section Objects in JSON format.
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails.
+        """
+
+        # Return Section Objects
+        return self.load_section(collection, parent_name, parent_type)['data']
+
+    def load_section(self, collection: str, parent_name: str = None, parent_type: str = None):
+        """
+        Load a Section at the current Configuration Version, with the Version it was read at.
+
+        Args:
+            collection (str): The Section Collection (see SECTIONS).
+            parent_name (str): The Parent Name (child sections only).
+            parent_type (str): The Parent Type (child sections only).
+
+        Returns:
+            dict: The Section, as {'version': ..., 'data': [...]}.
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails.
+        """
+
+        # Current Configuration Version
+        version = self.configuration.get_configuration_version()
+
+        # Section Key
+        key = self.section_key(collection, parent_name, parent_type)
+
+        # Find Loaded Section
+        section = self.sections.get(key)
+
+        # If Section is not Loaded at the current Version and a Cache is Set
+        if (section is None or section['version'] != version) and self.cache is not None:
+
+            # Find Cached Section
+            section = self.cache.get(key)
+
+        # If Section is not Known at the current Version
+        if section is None or section['version'] != version:
+
+            # Fetch Section
+            section = self.fetch_section(collection, parent_name, parent_type)
+
+            # If a Cache is Set
+            if self.cache is not None:
+
+                # Cache Section
+                self.cache.set(key, section)
+
+        # Keep Section in Memory
+        self.sections[key] = section
+
+        # Return Section
+        return section
+
+    def get_object(self, collection: str, key, parent_name: str = None, parent_type: str = None):
+        """
+        Get an Object of a Section at the current Configuration Version.
+
+        Args:
+            collection (str): The Section Collection (see SECTIONS).
+            key (str | int): The Object Name (or Index for the index-addressed Sections).
+            parent_name (str): The Parent Name (child sections only).
+            parent_type (str): The Parent Type (child sections only).
+
+        Returns:
+            dict: The Object in JSON format ({'_version': ..., 'data': ...}), or None if it does not exist.
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails.
+        """
+
+        # Object Key Field
+        key_field = self.SECTIONS[collection]['key']
+
+        # Iterate on Section Objects
+        for instance in self.get_section(collection, parent_name, parent_type):
+
+            # If Object Key match
+            if str(instance.get(key_field)) == str(key):
+
+                # Return Object (Same format as the API)
+                return {'_version': self.configuration.version, 'data': instance}
+
+        # Object does not exist
+        return None
+
+    def invalidate(self):
+        """
+        Drop all the loaded Sections (memory and cache).
+        """
+
+        # If a Cache is Set
+        if self.cache is not None:
+
+            # Iterate on Loaded Sections
+            for key in self.sections:
+
+                # Delete Cached Section
+                self.cache.delete(key)
+
+        # Drop Loaded Sections
+        self.sections = {}
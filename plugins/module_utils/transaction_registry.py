@@ -0,0 +1,145 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import contextlib
+import fcntl
+import os
+
+from .cache import FileCache
+
+# Transactions Registry Directory Name (in the Ansible Local Temporary Directory of the Run)
+REGISTRY_DIR_NAME = "haproxy_tx_lookup"
+
+
+# Default Transactions Registry Directory (Run Temporary Directory, shared by the Forked Workers and the Callbacks)
+def default_registry_dir(local_tmp: str):
+    """
+    Build the default registry directory of a run.
+
+    Args:
+        local_tmp (str): The Ansible local temporary directory of the run (DEFAULT_LOCAL_TMP).
+
+    Returns:
+        str: The registry directory.
+    """
+
+    # Return Directory
+    return os.path.join(local_tmp, REGISTRY_DIR_NAME)
+
+
+class TransactionRegistry:
+    """
+    Registry of the Transactions opened by the lookups of a run, shared by the controller processes.
+
+    Lookups are evaluated in the forked workers of the controller, so the registry is stored
+    in a file cache and updated under an exclusive file lock : concurrent evaluations of the
+    same lookup see (and reuse) the same Transaction.
+
+    Attributes:
+        cache (FileCache): The registry storage.
+        lock_path (str): The lock file path.
+    """
+
+    # Registry Entry Key
+    REGISTRY_KEY = "transactions|registry"
+
+    # Lock File Name
+    LOCK_FILE = "transactions.lock"
+
+    def __init__(self, directory: str):
+        """
+        Initializes the Transaction Registry.
+
+        Args:
+            directory (str): The registry directory (created if it does not exist).
+        Raises:
+            ValueError: If the directory is not provided.
+        """
+
+        # Initialize Storage
+        self.cache = FileCache(directory=directory)
+
+        # Initialize Lock File Path
+        self.lock_path = os.path.join(self.cache.directory, self.LOCK_FILE)
+
+    @contextlib.contextmanager
+    def lock(self):
+        """
+        Hold the registry exclusive lock (blocks until the lock is acquired).
+        """
+
+        with open(self.lock_path, 'a') as lock_file:
+
+            # Acquire Lock
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+            try:
+
+                # Run Locked Block
+                yield self
+
+            finally:
+
+                # Release Lock
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def entries(self):
+        """
+        Get all the registry entries.
+
+        Returns:
+            list: The entries ({'base_url', 'api_version', 'play', 'id', 'auto_cancel'}, never any credentials).
+        """
+
+        # Return Entries
+        return self.cache.get(self.REGISTRY_KEY, [])
+
+    def find(self, base_url: str, api_version: str, play: str):
+        """
+        Find the entry of a Data Plane API and a play.
+
+        Args:
+            base_url (str): The Data Plane API base URL.
+            api_version (str): The Data Plane API version.
+            play (str): The play key.
+
+        Returns:
+            dict: The entry, or None if there is none.
+        """
+
+        # Iterate on Entries
+        for entry in self.entries():
+
+            # If Entry match
+            if (entry['base_url'], entry['api_version'], entry['play']) == (base_url, api_version, play):
+
+                # Return Entry
+                return entry
+
+        # Entry not Found
+        return None
+
+    def register(self, entry: dict):
+        """
+        Add or replace the entry of a Data Plane API and a play (call it under the lock).
+
+        Args:
+            entry (dict): The entry ({'base_url', 'api_version', 'play', 'id', ...}).
+        """
+
+        # Keep Entries of the other APIs and Plays
+        entries = [
+            existing for existing in self.entries()
+            if (existing['base_url'], existing['api_version'], existing['play']) != (entry['base_url'], entry['api_version'], entry['play'])
+        ]
+
+        # Store Entries
+        self.cache.set(self.REGISTRY_KEY, entries + [entry])
+
+    def clear(self):
+        """
+        Remove all the entries (call it under the lock).
+        """
+
+        # Delete Entries
+        self.cache.delete(self.REGISTRY_KEY)
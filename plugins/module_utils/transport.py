@@ -0,0 +1,206 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import socket
+import threading
+from urllib.parse import quote, unquote, urlsplit
+
+try:
+    from requests.adapters import HTTPAdapter
+    from urllib3.connection import HTTPConnection
+    from urllib3.connectionpool import HTTPConnectionPool
+    IMPORTS_OK = True
+except ImportError:
+    HTTPAdapter = HTTPConnection = HTTPConnectionPool = object
+    IMPORTS_OK = False
+
+
+# Unix Domain Socket Base URL Scheme (unix:///var/run/data-plane.sock)
+UNIX_SCHEME = "unix://"
+
+# Unix Domain Socket Requests URL Scheme (http+unix://<quoted socket path>/<path>)
+HTTP_UNIX_SCHEME = "http+unix://"
+
+
+# Convert a Base URL to the URL used by the Requests
+def transport_url(base_url: str) -> str:
+    """
+    Convert a Data Plane API base URL to the base URL of its requests.
+
+    HTTP(S) base URLs are kept as is. Unix domain socket base URLs (unix:///var/run/data-plane.sock)
+    become 'http+unix' URLs holding the quoted socket path as host (http+unix://%2Fvar%2Frun%2Fdata-plane.sock),
+    so the requests paths can be appended as usual, and the requests are routed to the UnixSocketAdapter.
+
+    Args:
+        base_url (str): The Data Plane API base URL.
+
+    Returns:
+        str: The requests base URL.
+    """
+
+    # If Base URL is not a Unix Domain Socket
+    if not base_url.startswith(UNIX_SCHEME):
+
+        # Return Base URL
+        return base_url
+
+    # Return Unix Domain Socket Requests URL
+    return HTTP_UNIX_SCHEME + quote(base_url[len(UNIX_SCHEME):].rstrip('/'), safe='')
+
+
+class UnixSocketConnection(HTTPConnection):
+    """
+    HTTP Connection over a Unix domain socket.
+
+    Attributes:
+        socket_path (str): The Unix domain socket path.
+    """
+
+    def __init__(self, *args, socket_path: str = None, **kwargs):
+        """
+        Initializes the Connection.
+
+        Args:
+            socket_path (str): The Unix domain socket path.
+        """
+
+        # Initialize HTTP Connection
+        super().__init__(*args, **kwargs)
+
+        # Initialize Socket Path
+        self.socket_path = socket_path
+
+    def _new_conn(self):
+        """
+        Connect the Unix domain socket (instead of a TCP socket).
+
+        Returns:
+            socket.socket: The connected socket.
+        """
+
+        # Build Socket
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+        # Apply Connect Timeout (if any)
+        if isinstance(self.timeout, (int, float)):
+            sock.settimeout(self.timeout)
+
+        try:
+
+            # Connect Socket
+            sock.connect(self.socket_path)
+
+        except OSError:
+
+            # Release Socket
+            sock.close()
+            raise
+
+        # Return Socket
+        return sock
+
+
+class UnixSocketConnectionPool(HTTPConnectionPool):
+    """
+    Keep-Alive Connection Pool of a Unix domain socket.
+    """
+
+    # Connection Class
+    ConnectionCls = UnixSocketConnection
+
+
+class UnixSocketAdapter(HTTPAdapter):
+    """
+    Requests Transport Adapter for 'http+unix' URLs : one keep-alive connection pool per socket,
+    with the pool size and retry policy of the Session HTTP adapter.
+
+    Attributes:
+        pools (dict): The connection pools by socket path.
+        pools_lock (threading.Lock): The pools lock (requests are made from several threads).
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+        Initializes the Adapter (same arguments as requests.adapters.HTTPAdapter).
+        """
+
+        # Initialize Pools
+        self.pools = {}
+        self.pools_lock = threading.Lock()
+
+        # Initialize HTTP Adapter
+        super().__init__(*args, **kwargs)
+
+    def get_pool(self, url: str):
+        """
+        Get (or build) the connection pool of the socket of an 'http+unix' URL.
+
+        Args:
+            url (str): The request URL.
+
+        Returns:
+            UnixSocketConnectionPool: The connection pool.
+        """
+
+        # Socket Path (Quoted Host of the URL)
+        socket_path = unquote(urlsplit(url).netloc)
+
+        with self.pools_lock:
+
+            # Find Pool
+            pool = self.pools.get(socket_path)
+
+            # If Pool does not Exist
+            if pool is None:
+
+                # Build and Keep Pool
+                pool = self.pools[socket_path] = UnixSocketConnectionPool(
+                    host='localhost',
+                    maxsize=self._pool_maxsize,
+                    block=self._pool_block,
+                    socket_path=socket_path
+                )
+
+        # Return Pool
+        return pool
+
+    def get_connection_with_tls_context(self, request, verify, proxies=None, cert=None):
+        """
+        Get the connection pool of a request (requests >= 2.32).
+        """
+
+        # Return Socket Pool
+        return self.get_pool(request.url)
+
+    def get_connection(self, url, proxies=None):
+        """
+        Get the connection pool of a URL (requests < 2.32).
+        """
+
+        # Return Socket Pool
+        return self.get_pool(url)
+
+    def request_url(self, request, proxies):
+        """
+        Get the URL sent in the request line (the path : Unix domain sockets are never proxied).
+        """
+
+        # Return Path
+        return request.path_url
+
+    def close(self):
+        """
+        Close the connection pools.
+        """
+
+        with self.pools_lock:
+
+            # Close Pools
+            for pool in self.pools.values():
+                pool.close()
+
+            # Forget Pools
+            self.pools.clear()
+
+        # Close HTTP Adapter
+        super().close()
@@ -0,0 +1,87 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from .commons import unwrap_data
+from .diff import compute_diff
+
+try:
+    from requests import HTTPError  # type: ignore
+    IMPORTS_OK = True
+except ImportError:
+    IMPORTS_OK = False
+
+
+# Upsert Action : Object Created
+ACTION_CREATED = 'created'
+
+# Upsert Action : Object Updated
+ACTION_UPDATED = 'updated'
+
+# Upsert Action : Object Already as Requested
+ACTION_UNCHANGED = 'unchanged'
+
+
+# Create an Object, or Update it if it Already Exists
+def upsert(requested, create, get, update, configuration=None):
+    """
+    Create-first upsert of a name-addressed object (backend, frontend, server, bind...).
+
+    The creation is sent first, without lookup : a new object costs a single write.
+    If the object already exists (409 Conflict), it is looked up, compared with the
+    requested object, and updated only if it differs. A Configuration Version conflict
+    (left once the retries are exhausted) is raised instead, as the object may not exist.
+
+    Index-addressed objects (ACLs, rules) cannot use it : their creation inserts a new
+    object at the index instead of failing.
+
+    Args:
+        requested: The requested object (model).
+        create: The function creating the object (returns the write response body).
+        get: The function getting the existing object.
+        update: The function updating the object (returns the write response body).
+        configuration (ConfigurationClient): The Configuration Client telling Version conflicts apart (optional).
+
+    Returns:
+        dict: The outcome ({'action' : created, updated or unchanged, 'before', 'after', 'changes'}),
+              'before' and 'after' being the existing object and the write response body, and 'changes'
+              the changed fields ({field: {'before', 'after'}}, empty unless updated).
+
+    Raises:
+        requests.exceptions.HTTPError: If the API requests fail (other than the 'already exists' creation conflict).
+    """
+
+    try:
+
+        # Create Object
+        created = create()
+
+        # Return Outcome : Created
+        return dict(action=ACTION_CREATED, before=None, after=unwrap_data(created), changes={})
+
+    except HTTPError as api_error:
+
+        # If Failure is not an Existing Object Conflict (Other Error, or Configuration Version Conflict)
+        if api_error.response is None or api_error.response.status_code != 409 or (
+            configuration is not None and configuration.is_version_conflict(api_error.response)
+        ):
+
+            # Propagate Error
+            raise
+
+    # Get Existing Object
+    existing = unwrap_data(get())
+
+    # Compute Changed Fields
+    changes = compute_diff(existing, requested)
+
+    # If Existing Object match requested Object
+    if not changes:
+
+        # Return Outcome : Unchanged
+        return dict(action=ACTION_UNCHANGED, before=existing, after=existing, changes={})
+
+    # Update Object
+    updated = update()
+
+    # Return Outcome : Updated
+    return dict(action=ACTION_UPDATED, before=existing, after=unwrap_data(updated), changes=changes)
@@ -23,6 +23,7 @@ options:
     base_url:
         description:
         - The HA Proxy Dataplane API Base URL
+        - Or the Unix domain socket of the Dataplane API (V(unix:///var/run/data-plane.sock)), when the module runs on the HA Proxy host
         required: true
         type: str
     username:
@@ -41,6 +42,21 @@ options:
         required: false
         default: 'v2'
         type: str
+    trace_file:
+        description:
+        - The JSON lines file each Dataplane API request is appended to (on the host running the module)
+        - Each line holds the request method, URI template, status, bytes sent and received, and latency
+        required: false
+        type: path
+        version_added: "2.4.0"
+    snapshot_cache_dir:
+        description:
+        - The Configuration Snapshot cache directory (on the host running the module)
+        - If provided, the existing objects are looked up in a snapshot of their configuration section,
+          fetched once per Configuration Version and shared by all the tasks of the play
+        required: false
+        type: path
+        version_added: "2.4.0"
     transaction_id:
         description:
         - The Transaction ID
@@ -56,7 +72,8 @@ options:
     acl_index:
         description:
         - The ACL Index
-        required: true
+        - Required unless O(acls) is provided
+        required: false
         type: int
     acl_parent_name:
         description:
@@ -87,6 +104,32 @@ options:
         required: false
         default: ""
         type: str
+    acls:
+        description:
+        - The ordered list of all the ACLs of the parent (list mode, instead of O(acl_index))
+        - The existing ACLs are fetched once, and only the inserts, updates and deletes needed to match the list
+          are sent, in a single Transaction (the O(transaction_id) one, or a Transaction committed by the task)
+        - With O(state=absent), the listed ACLs are removed from the parent, and the other ones are kept in order
+        required: false
+        type: list
+        elements: dict
+        version_added: "2.4.0"
+        suboptions:
+            acl_name:
+                description:
+                - The ACL Name
+                required: true
+                type: str
+            criterion:
+                description:
+                - The ACL Criterion
+                required: true
+                type: str
+            value:
+                description:
+                - The ACL Value
+                required: false
+                type: str
     state:
         description:
         - The Transaction State
@@ -125,13 +168,32 @@ EXAMPLES = r'''
     acl_parent_name: "test_frontend"
     acl_parent_type: "frontend"
     state: 'absent'
+
+- name: "Set all the HA Proxy ACLs of a Frontend"
+  kube_cloud.haproxy.acl:
+    base_url: "http://localhost:5555"
+    username: "admin"
+    password: "admin"
+    acl_parent_name: "test_frontend"
+    acl_parent_type: "frontend"
+    acls:
+      - acl_name: "is_example"
+        criterion: "req.hdr(Host)"
+        value: "example.com"
+      - acl_name: "is_api"
+        criterion: "path_beg"
+        value: "/api"
+    state: 'present'
 '''
 
 from ansible.module_utils.basic import AnsibleModule
 from ..module_utils.client_acls import AclClient
 from ..module_utils.models import Acl
 from ..module_utils.haproxy import haproxy_client
+from ..module_utils.metrics import request_metrics
+from ..module_utils.builders import build_requested_acls, build_acl_specification
 from ..module_utils.commons import filter_none
+from ..module_utils.diff import compute_diff, build_diff, canonicalize
 
 try:
     from requests import HTTPError  # type: ignore
@@ -240,6 +302,35 @@ def delete_acl(module: AnsibleModule, client: AclClient, transaction_id: str, in
         )
 
 
+# Reconcile ACLs List
+def reconcile_acls(module: AnsibleModule, client: AclClient, transaction_id: str, parent_name: str, parent_type: str, acls: list, force_reload: bool):
+
+    try:
+
+        # Call Client
+        return client.reconcile_acls(
+            acls=acls,
+            transaction_id=transaction_id,
+            parent_name=parent_name,
+            parent_type=parent_type,
+            force_reload=force_reload,
+            absent=module.params['state'] == 'absent',
+            check_mode=module.check_mode
+        )
+
+    except HTTPError as api_error:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Reconcile ACLs] - Failed Reconcile HA Proxy ACLs (Parent : {0}:{1}): {2}".format(
+                parent_name,
+                parent_type,
+                api_error
+            ),
+            metrics=request_metrics(client)
+        )
+
+
 # Instantiate Ansible Module
 def build_ansible_module():
 
@@ -249,20 +340,30 @@ def build_ansible_module():
         username=dict(type='str', required=True, no_log=True),
         password=dict(type='str', required=True, no_log=True),
         api_version=dict(type='str', required=False, default='v2'),
+        trace_file=dict(type='path', required=False),
+        snapshot_cache_dir=dict(type='path', required=False),
         transaction_id=dict(type='str', required=False, default=''),
         force_reload=dict(type='bool', required=False, default=True),
-        acl_index=dict(type='int', required=True),
+        acl_index=dict(type='int', required=False),
         acl_parent_name=dict(type='str', required=True),
         acl_parent_type=dict(type='str', required=True, choices=['frontend', 'backend']),
         acl_name=dict(type='str', required=False, default=''),
         acl_criterion=dict(type='str', required=False, default=''),
         acl_value=dict(type='str', required=False, default=''),
+        acls=dict(
+            type='list',
+            elements='dict',
+            required=False,
+            options=build_acl_specification()
+        ),
         state=dict(type='str', required=False, default='present', choices=['present', 'absent'])
     )
 
     # Build ansible Module
     return AnsibleModule(
         argument_spec=module_specification,
+        required_one_of=[('acl_index', 'acls')],
+        mutually_exclusive=[('acl_index', 'acls')],
         supports_check_mode=True
     )
 
@@ -313,6 +414,35 @@ def run_module(module: AnsibleModule, client: AclClient):
     # ACL Parent Type
     acl_parent_type = module.params['acl_parent_type']
 
+    # If the ACLs List is Provided (List Mode)
+    if module.params['acls'] is not None:
+
+        # Reconcile ACLs List
+        outcome = reconcile_acls(
+            module=module,
+            client=client,
+            transaction_id=transaction_id,
+            parent_name=acl_parent_name,
+            parent_type=acl_parent_type,
+            acls=build_requested_acls(module.params['acls']),
+            force_reload=force_reload
+        )
+
+        # Module Response
+        module.exit_json(
+            operations=outcome['operations'],
+            diff=dict(before=canonicalize(outcome['before']), after=outcome['after']),
+            changed=bool(outcome['operations']),
+            acl_parent_name=acl_parent_name,
+            acl_parent_type=acl_parent_type,
+            msg="ACLs [Parent : {0}/{1}] {2}".format(
+                acl_parent_name,
+                acl_parent_type,
+                "Have Been Reconciled ({0} Operations)".format(len(outcome['operations'])) if outcome['operations'] else "Not Changed"
+            ),
+            metrics=request_metrics(client)
+        )
+
     # Build Requested Instance
     acl = build_requested_acl(module.params)
 
@@ -327,8 +457,11 @@ def run_module(module: AnsibleModule, client: AclClient):
     # If Requested State is 'present' and Instance Already exists
     if existing_instance and state == 'present':
 
+        # Compute Changed Fields
+        changes = compute_diff(existing_instance, acl)
+
         # If Existing Instance match requested Instance
-        if existing_instance == acl:
+        if not changes:
 
             # Initialize response (No Change)
             module.exit_json(
@@ -338,23 +471,29 @@ def run_module(module: AnsibleModule, client: AclClient):
                     acl.acl_name,
                     acl.index
                 ),
-                changed=False
+                changed=False,
+                metrics=request_metrics(client)
             )
 
-        # Update Existing Instance
-        update_acl(
-            module=module,
-            client=client,
-            transaction_id=transaction_id,
-            acl=acl,
-            index=acl.index,
-            parent_name=acl_parent_name,
-            parent_type=acl_parent_type,
-            force_reload=force_reload
-        )
+        # If not in Check Mode
+        if not module.check_mode:
+
+            # Update Existing Instance
+            update_acl(
+                module=module,
+                client=client,
+                transaction_id=transaction_id,
+                acl=acl,
+                index=acl.index,
+                parent_name=acl_parent_name,
+                parent_type=acl_parent_type,
+                force_reload=force_reload
+            )
 
         # Module Response : Changed
         module.exit_json(
+            changes=changes,
+            diff=build_diff(existing_instance, acl),
             changed=True,
             instance=filter_none(acl),
             acl_parent_name=acl_parent_name,
@@ -364,25 +503,30 @@ def run_module(module: AnsibleModule, client: AclClient):
                 acl_parent_type,
                 acl.acl_name,
                 acl.index
-            )
+            ),
+            metrics=request_metrics(client)
         )
 
     # If Requested State is 'present' and Instance don't exists
     if not existing_instance and state == 'present':
 
-        # Create Instance
-        create_acl(
-            module=module,
-            client=client,
-            transaction_id=transaction_id,
-            force_reload=force_reload,
-            parent_name=acl_parent_name,
-            parent_type=acl_parent_type,
-            acl=acl
-        )
+        # If not in Check Mode
+        if not module.check_mode:
+
+            # Create Instance
+            create_acl(
+                module=module,
+                client=client,
+                transaction_id=transaction_id,
+                force_reload=force_reload,
+                parent_name=acl_parent_name,
+                parent_type=acl_parent_type,
+                acl=acl
+            )
 
         # Initialize Module Response : Changed
         module.exit_json(
+            diff=build_diff(None, acl),
             changed=True,
             instance=filter_none(acl),
             acl_parent_name=acl_parent_name,
@@ -392,25 +536,30 @@ def run_module(module: AnsibleModule, client: AclClient):
                 acl_parent_type,
                 acl.acl_name,
                 acl.index
-            )
+            ),
+            metrics=request_metrics(client)
         )
 
     # If Requested State is 'absent' and Instance exists
     if existing_instance and state == 'absent':
 
-        # Delete Instance
-        delete_acl(
-            module=module,
-            client=client,
-            transaction_id=transaction_id,
-            force_reload=force_reload,
-            index=acl.index,
-            parent_name=acl_parent_name,
-            parent_type=acl_parent_type
-        )
+        # If not in Check Mode
+        if not module.check_mode:
+
+            # Delete Instance
+            delete_acl(
+                module=module,
+                client=client,
+                transaction_id=transaction_id,
+                force_reload=force_reload,
+                index=acl.index,
+                parent_name=acl_parent_name,
+                parent_type=acl_parent_type
+            )
 
         # Exit Module
         module.exit_json(
+            diff=build_diff(existing_instance, None),
             changed=True,
             instance=acl,
             acl_parent_name=acl_parent_name,
@@ -420,7 +569,8 @@ def run_module(module: AnsibleModule, client: AclClient):
                 acl_parent_type,
                 acl.acl_name,
                 acl.index
-            )
+            ),
+            metrics=request_metrics(client)
         )
 
     # If Requested State is 'absent' and Instance don't exists
@@ -434,7 +584,8 @@ def run_module(module: AnsibleModule, client: AclClient):
                 acl.acl_name,
                 acl.index
             ),
-            changed=False
+            changed=False,
+            metrics=request_metrics(client)
         )
 
 
@@ -23,6 +23,7 @@ options:
   base_url:
     description:
       - The HA Proxy Dataplane API Base URL
+      - Or the Unix domain socket of the Dataplane API (V(unix:///var/run/data-plane.sock)), when the module runs on the HA Proxy host
     required: true
     type: str
   username:
@@ -41,6 +42,21 @@ options:
     required: false
     default: 'v2'
     type: str
+  trace_file:
+    description:
+      - The JSON lines file each Dataplane API request is appended to (on the host running the module)
+      - Each line holds the request method, URI template, status, bytes sent and received, and latency
+    required: false
+    type: path
+    version_added: "2.4.0"
+  snapshot_cache_dir:
+    description:
+      - The Configuration Snapshot cache directory (on the host running the module)
+      - If provided, the existing objects are looked up in a snapshot of their configuration section,
+        fetched once per Configuration Version and shared by all the tasks of the play
+    required: false
+    type: path
+    version_added: "2.4.0"
   name:
     description:
       - The HA Proxy Backend Name
@@ -279,6 +295,16 @@ options:
     required: false
     default: true
     type: bool
+  upsert:
+    description:
+      - Create the backend without looking it up first, and only look it up (then update it if it differs)
+        when the creation fails because it already exists
+      - Saves the lookup request when the backend is new, at the cost of a failed creation when it already exists
+      - Only used with O(state=present), outside check mode
+    required: false
+    default: false
+    type: bool
+    version_added: "2.4.0"
   state:
     description:
       - The Transaction State
@@ -323,12 +349,12 @@ EXAMPLES = r'''
 from ansible.module_utils.basic import AnsibleModule
 from ..module_utils.client_backends import BackendClient
 from ..module_utils.haproxy import haproxy_client
-from ..module_utils.models import Balance, Backend, HttpHealthCheck, HttpCheckParams
-from ..module_utils.models import ForwardFor, PostgresSqlCheckParams
-from ..module_utils.enums import ProxyProtocol, LoadBalancingAlgorithm, HealthCheckType
-from ..module_utils.enums import MatchType, TimeoutStatus, ErrorStatus, OkStatus, HttpMethod
-from ..module_utils.enums import AdvancedHealthCheckType, EnableDisableEnum
+from ..module_utils.metrics import request_metrics
+from ..module_utils.models import Backend
+from ..module_utils.builders import build_requested_backend, build_backend_specification
 from ..module_utils.commons import filter_none
+from ..module_utils.diff import compute_diff, build_diff
+from ..module_utils.upsert import ACTION_CREATED, ACTION_UPDATED, ACTION_UNCHANGED
 
 try:
     from requests import HTTPError  # type: ignore
@@ -337,6 +363,14 @@ except ImportError:
     IMPORTS_OK = False
 
 
+# Upsert Outcome Messages
+UPSERT_MESSAGES = {
+    ACTION_CREATED: "Has Been Created",
+    ACTION_UPDATED: "Has Been Updated",
+    ACTION_UNCHANGED: "Not Changed"
+}
+
+
 # Find and Return Backend
 def get_backend(client: BackendClient, name: str):
 
@@ -400,6 +434,30 @@ def create_backend(module: AnsibleModule, client: BackendClient, transaction_id:
         )
 
 
+# Upsert Backend (Create, or Update if it Already Exists)
+def upsert_backend(module: AnsibleModule, client: BackendClient, transaction_id: str, backend: Backend, force_reload: bool):
+
+    try:
+
+        # Call Client
+        return client.upsert_backend(
+            backend=backend,
+            transaction_id=transaction_id,
+            force_reload=force_reload
+        )
+
+    except HTTPError as api_error:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Upsert Backend] - Failed Upsert HA Proxy Backend (Name : {0} : [{1}]): {2}".format(
+                backend.name,
+                backend,
+                api_error
+            )
+        )
+
+
 # Delete Backend
 def delete_backend(module: AnsibleModule, client: BackendClient, transaction_id: str, name: str, force_reload: bool):
 
@@ -432,52 +490,17 @@ def build_ansible_module():
         username=dict(type='str', required=True, no_log=True),
         password=dict(type='str', required=True, no_log=True),
         api_version=dict(type='str', required=False, default='v2'),
-        name=dict(type='str', required=True),
-        mode=dict(type='str', required=False, default='HTTP', choices=ProxyProtocol.names()),
-        adv_check=dict(type='str', required=False, choices=AdvancedHealthCheckType.names()),
-        balance=dict(type='dict', required=False, default=None),
-        httpchk=dict(type='dict', required=False, default=None),
-        httpchk_params=dict(type='dict', required=False, default=None),
-        pgsql_check_params=dict(type='dict', required=False, default=None),
-        ignore_persist=dict(type='dict', required=False, default=None),
-        abortonclose=dict(type='str', required=False, choices=EnableDisableEnum.names()),
-        accept_invalid_http_response=dict(type='str', required=False, choices=EnableDisableEnum.names()),
-        allbackups=dict(type='str', required=False, choices=EnableDisableEnum.names()),
-        checkcache=dict(type='str', required=False, choices=EnableDisableEnum.names()),
-        external_check=dict(type='str', required=False, choices=EnableDisableEnum.names()),
-        nolinger=dict(type='str', required=False, choices=EnableDisableEnum.names()),
-        prefer_last_server=dict(type='str', required=False, choices=EnableDisableEnum.names()),
-        splice_auto=dict(type='str', required=False, choices=EnableDisableEnum.names()),
-        splice_request=dict(type='str', required=False, choices=EnableDisableEnum.names()),
-        splice_response=dict(type='str', required=False, choices=EnableDisableEnum.names()),
-        spop_check=dict(type='str', required=False, choices=EnableDisableEnum.names()),
-        srvtcpka=dict(type='str', required=False, choices=EnableDisableEnum.names()),
-        independent_streams=dict(type='str', required=False, choices=EnableDisableEnum.names()),
-        log_health_checks=dict(type='str', required=False, choices=EnableDisableEnum.names()),
-        bind_process=dict(type='str', required=False),
-        check_timeout=dict(type='int', required=False),
-        connect_timeout=dict(type='int', required=False),
-        description=dict(type='str', required=False),
-        disabled=dict(type='bool', required=False),
-        enabled=dict(type='bool', required=False),
-        external_check_command=dict(type='str', required=False),
-        external_check_path=dict(type='str', required=False),
-        fullconn=dict(type='int', required=False),
-        queue_timeout=dict(type='int', required=False),
-        retries=dict(type='int', required=False),
-        retry_on=dict(type='str', required=False),
-        server_fin_timeout=dict(type='int', required=False),
-        server_state_file_name=dict(type='str', required=False),
-        server_timeout=dict(type='int', required=False),
-        srvtcpka_cnt=dict(type='int', required=False),
-        srvtcpka_idle=dict(type='int', required=False),
-        srvtcpka_intvl=dict(type='int', required=False),
-        forwardfor=dict(type='dict', required=False, default=None),
+        trace_file=dict(type='path', required=False),
+        snapshot_cache_dir=dict(type='path', required=False),
         transaction_id=dict(type='str', required=False, default=''),
         force_reload=dict(type='bool', required=False, default=True),
+        upsert=dict(type='bool', required=False, default=False),
         state=dict(type='str', required=False, default='present', choices=['present', 'absent'])
     )
 
+    # Add Backend Fields Specification
+    module_specification.update(build_backend_specification())
+
     # Build ansible Module
     return AnsibleModule(
         argument_spec=module_specification,
@@ -501,144 +524,6 @@ def build_client(module: AnsibleModule):
         )
 
 
-# Build Requested Backend from Configuration
-def build_requested_backend(params: dict) -> Backend:
-
-    # Base Parameters Name
-    base_param_names = [
-        "name", "bind_process", "check_timeout", "connect_timeout",
-        "description", "disabled", "enabled", "external_check_command",
-        "external_check_path", "fullconn", "queue_timeout", "retries",
-        "retry_on", "server_fin_timeout", "server_state_file_name",
-        "server_timeout", "srvtcpka_cnt", "srvtcpka_idle", "srvtcpka_intvl",
-    ]
-
-    # Build Requested Instance
-    backend = Backend(
-        **{k: v for k, v in params.items() if v is not None and k in base_param_names}
-    )
-
-    # Optional Initialization : mode
-    backend.mode = ProxyProtocol.create(params['mode'])
-    backend.adv_check = AdvancedHealthCheckType.create(params.get('adv_check', None))
-    backend.abortonclose = EnableDisableEnum.create(params.get('abortonclose', None))
-    backend.accept_invalid_http_response = EnableDisableEnum.create(params.get('accept_invalid_http_response', None))
-    backend.allbackups = EnableDisableEnum.create(params.get('allbackups', None))
-    backend.checkcache = EnableDisableEnum.create(params.get('checkcache', None))
-    backend.external_check = EnableDisableEnum.create(params.get('external_check', None))
-    backend.nolinger = EnableDisableEnum.create(params.get('nolinger', None))
-    backend.prefer_last_server = EnableDisableEnum.create(params.get('prefer_last_server', None))
-    backend.splice_auto = EnableDisableEnum.create(params.get('splice_auto', None))
-    backend.splice_request = EnableDisableEnum.create(params.get('splice_request', None))
-    backend.splice_response = EnableDisableEnum.create(params.get('splice_response', None))
-    backend.spop_check = EnableDisableEnum.create(params.get('spop_check', None))
-    backend.srvtcpka = EnableDisableEnum.create(params.get('srvtcpka', None))
-    backend.independent_streams = EnableDisableEnum.create(params.get('independent_streams', None))
-    backend.log_health_checks = EnableDisableEnum.create(params.get('log_health_checks', None))
-
-    # Optional Initialization : balance
-    if params.get('balance', None) is not None:
-
-        # Extract balance
-        p_balance = params['balance']
-
-        # Initialize Object
-        backend.balance = Balance(
-            algorithm=LoadBalancingAlgorithm.create(p_balance.get('algorithm', None)),
-            hash_expression=p_balance.get('hash_expression', None),
-            hdr_name=p_balance.get('hdr_name', None),
-            hdr_use_domain_only=p_balance.get('hdr_use_domain_only', None),
-            random_draws=p_balance.get('random_draws', None),
-            rdp_cookie_name=p_balance.get('rdp_cookie_name', None),
-            uri_depth=p_balance.get('uri_depth', None),
-            uri_len=p_balance.get('uri_len', None),
-            uri_path_only=p_balance.get('uri_path_only', None),
-            uri_whole=p_balance.get('uri_whole', None),
-            url_param=p_balance.get('url_param', None),
-            url_param_check_post=p_balance.get('url_param_check_post', None),
-            url_param_max_wait=p_balance.get('url_param_max_wait', None)
-        )
-
-    # Optional Initialization : httpchk
-    if params.get('httpchk', None) is not None:
-
-        # Extract httpchk
-        p_httpchk = params['httpchk']
-
-        # Initialize Object
-        backend.adv_check = AdvancedHealthCheckType.HTTPCHK
-        backend.httpchk = HttpHealthCheck(
-            type=HealthCheckType.create(p_httpchk.get('type', None)),
-            method=p_httpchk.get('method', None),
-            uri=p_httpchk.get('uri', None),
-            uri_log_format=p_httpchk.get('uri_log_format', None),
-            var_expr=p_httpchk.get('var_expr', None),
-            var_format=p_httpchk.get('var_format', None),
-            var_name=p_httpchk.get('var_name', None),
-            var_scope=p_httpchk.get('var_scope', None),
-            version=p_httpchk.get('version', None),
-            via_socks4=p_httpchk.get('via_socks4', None),
-            port=p_httpchk.get('port', None),
-            port_string=p_httpchk.get('port_string', None),
-            proto=p_httpchk.get('proto', None),
-            send_proxy=p_httpchk.get('send_proxy', None),
-            sni=p_httpchk.get('sni', None),
-            ssl=p_httpchk.get('ssl', None),
-            status_code=p_httpchk.get('status_code', None),
-            tout_status=TimeoutStatus.create(p_httpchk.get('tout_status', None)),
-            match=MatchType.create(p_httpchk.get('match', None)),
-            headers=p_httpchk.get('headers', None),
-            body=p_httpchk.get('body', None),
-            body_log_format=p_httpchk.get('body_log_format', None),
-            check_comment=p_httpchk.get('check_comment', None),
-            default=p_httpchk.get('default', None),
-            error_status=ErrorStatus.create(p_httpchk.get('error_status', None)),
-            ok_status=OkStatus.create(p_httpchk.get('ok_status', None))
-        )
-
-    # Optional Initialization : httpchk_params
-    if params.get('httpchk_params', None) is not None:
-
-        # Extract httpchk_params
-        p_httpchk_params = params['httpchk_params']
-
-        # Initialize Object
-        backend.adv_check = AdvancedHealthCheckType.HTTPCHK
-        backend.httpchk_params = HttpCheckParams(
-            method=HttpMethod.create(p_httpchk_params.get('method', None)),
-            uri=p_httpchk_params.get('uri', None),
-            version=p_httpchk_params.get('version', None)
-        )
-
-    # Optional Initialization : pgsql_check_params
-    if params.get('pgsql_check_params', None) is not None:
-
-        # Extract pgsql_check_params
-        p_pgsql_check_params = params['pgsql_check_params']
-
-        # Initialize Object
-        backend.adv_check = AdvancedHealthCheckType.PGSQL_CHECK
-        backend.pgsql_check_params = PostgresSqlCheckParams(
-            username=p_pgsql_check_params.get('username', None)
-        )
-
-    # Optional Initialization : forwardfor
-    if params.get('forwardfor', None) is not None:
-
-        # Extract ForwardedFor
-        p_formwardfor = params['forwardfor']
-
-        # Initialize Object
-        backend.forwardfor = ForwardFor(
-            enabled=EnableDisableEnum.create(p_formwardfor.get('enabled', None)),
-            header=p_formwardfor.get('header', None),
-            ifnone=p_formwardfor.get('ifnone', None)
-        )
-
-    # Return Backend
-    return backend
-
-
 # Porcess Module Execution
 def run_module(module: AnsibleModule, client: BackendClient):
 
@@ -654,6 +539,28 @@ def run_module(module: AnsibleModule, client: BackendClient):
     # Build Requested Instance
     backend = build_requested_backend(module.params)
 
+    # If Requested State is 'present' and Upsert is Requested (Create First, Lookup only if it Already Exists)
+    if module.params['upsert'] and state == 'present' and not module.check_mode:
+
+        # Upsert Instance
+        outcome = upsert_backend(
+            module=module,
+            client=client,
+            transaction_id=transaction_id,
+            backend=backend,
+            force_reload=force_reload
+        )
+
+        # Module Response
+        module.exit_json(
+            changes=outcome['changes'],
+            diff=build_diff(outcome['before'], backend),
+            changed=outcome['action'] != ACTION_UNCHANGED,
+            instance=filter_none(backend),
+            msg="Backend [{0} - {1}] {2}".format(backend.name, backend.mode, UPSERT_MESSAGES[outcome['action']]),
+            metrics=request_metrics(client)
+        )
+
     # Find Existing Instance
     existing_backend = get_backend(
         client=client,
@@ -663,67 +570,87 @@ def run_module(module: AnsibleModule, client: BackendClient):
     # If Requested State is 'present' and Instance Already exists
     if existing_backend and state == 'present':
 
+        # Compute Changed Fields
+        changes = compute_diff(existing_backend, backend)
+
         # If Existing Instance match requested Instance
-        if existing_backend == backend:
+        if not changes:
 
             # Initialize response (No Change)
             module.exit_json(
                 msg="Backend [{0} - {1}] Not Changed".format(backend.name, backend.mode),
-                changed=False
+                changed=False,
+                metrics=request_metrics(client)
             )
 
-        # Update Existing Instance
-        update_backend(
-            module=module,
-            client=client,
-            transaction_id=transaction_id,
-            name=backend.name,
-            backend=backend,
-            force_reload=force_reload
-        )
+        # If not in Check Mode
+        if not module.check_mode:
+
+            # Update Existing Instance
+            update_backend(
+                module=module,
+                client=client,
+                transaction_id=transaction_id,
+                name=backend.name,
+                backend=backend,
+                force_reload=force_reload
+            )
 
         # Module Response : Changed
         module.exit_json(
+            changes=changes,
+            diff=build_diff(existing_backend, backend),
             changed=True,
             instance=filter_none(backend),
-            msg="Backend [{0} - {1}] Has Been Updated".format(backend.name, backend.mode)
+            msg="Backend [{0} - {1}] Has Been Updated".format(backend.name, backend.mode),
+            metrics=request_metrics(client)
         )
 
     # If Requested State is 'present' and Instance don't exists
     if not existing_backend and state == 'present':
 
-        # Create Instance
-        create_backend(
-            module=module,
-            client=client,
-            transaction_id=transaction_id,
-            backend=backend,
-            force_reload=force_reload
-        )
+        # If not in Check Mode
+        if not module.check_mode:
+
+            # Create Instance
+            create_backend(
+                module=module,
+                client=client,
+                transaction_id=transaction_id,
+                backend=backend,
+                force_reload=force_reload
+            )
 
         # Initialize Module Response : Changed
         module.exit_json(
+            diff=build_diff(None, backend),
             changed=True,
             instance=filter_none(backend),
-            msg="[{0} - {1}] Has been Created".format(backend.name, backend.mode)
+            msg="[{0} - {1}] Has been Created".format(backend.name, backend.mode),
+            metrics=request_metrics(client)
         )
 
     # If Requested State is 'absent' and Instance exists
     if existing_backend and state == 'absent':
 
-        # Delete Instance
-        delete_backend(
-            module=module,
-            client=client,
-            transaction_id=transaction_id,
-            name=backend.name,
-            force_reload=force_reload
-        )
+        # If not in Check Mode
+        if not module.check_mode:
+
+            # Delete Instance
+            delete_backend(
+                module=module,
+                client=client,
+                transaction_id=transaction_id,
+                name=backend.name,
+                force_reload=force_reload
+            )
 
         # Exit Module
         module.exit_json(
+            diff=build_diff(existing_backend, None),
             msg="[{0} - {1}] Has been Deleted".format(backend.name, backend.mode),
-            changed=True
+            changed=True,
+            metrics=request_metrics(client)
         )
 
     # If Requested State is 'absent' and Instance don't exists
@@ -732,7 +659,8 @@ def run_module(module: AnsibleModule, client: BackendClient):
         # Initialize Response : No Change
         module.exit_json(
             msg="[{0} - {1}] Not Found".format(backend.name, backend.mode),
-            changed=False
+            changed=False,
+            metrics=request_metrics(client)
         )
 
 
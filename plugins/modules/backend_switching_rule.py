@@ -23,6 +23,7 @@ options:
     base_url:
         description:
         - The HA Proxy Dataplane API Base URL
+        - Or the Unix domain socket of the Dataplane API (V(unix:///var/run/data-plane.sock)), when the module runs on the HA Proxy host
         required: true
         type: str
     username:
@@ -41,6 +42,21 @@ options:
         required: false
         default: 'v2'
         type: str
+    trace_file:
+        description:
+        - The JSON lines file each Dataplane API request is appended to (on the host running the module)
+        - Each line holds the request method, URI template, status, bytes sent and received, and latency
+        required: false
+        type: path
+        version_added: "2.4.0"
+    snapshot_cache_dir:
+        description:
+        - The Configuration Snapshot cache directory (on the host running the module)
+        - If provided, the existing objects are looked up in a snapshot of their configuration section,
+          fetched once per Configuration Version and shared by all the tasks of the play
+        required: false
+        type: path
+        version_added: "2.4.0"
     transaction_id:
         description:
         - The Transaction ID
@@ -56,7 +72,8 @@ options:
     rule_index:
         description:
         - The Backend Switching Rule Index
-        required: true
+        - Required unless O(rules) is provided
+        required: false
         type: int
     rule_frontend:
         description:
@@ -79,6 +96,33 @@ options:
         - The Backend Switching Rule Name
         required: false
         type: str
+    rules:
+        description:
+        - The ordered list of all the Backend Switching Rules of the frontend (list mode, instead of O(rule_index))
+        - The existing rules are fetched once, and only the inserts, updates and deletes needed to match the list
+          are sent, in a single Transaction (the O(transaction_id) one, or a Transaction committed by the task)
+        - With O(state=absent), the listed rules are removed from the frontend, and the other ones are kept in order
+        required: false
+        type: list
+        elements: dict
+        version_added: "2.4.0"
+        suboptions:
+            name:
+                description:
+                - The Backend Switching Rule Name (the Backend)
+                required: true
+                type: str
+            cond:
+                description:
+                - The Backend Switching Rule Condition Type
+                required: false
+                choices: ['if', 'unless']
+                type: str
+            cond_test:
+                description:
+                - The Backend Switching Rule Condition
+                required: false
+                type: str
     state:
         description:
         - The Transaction State
@@ -115,14 +159,32 @@ EXAMPLES = r'''
     rule_index: 0
     rule_frontend: "test_frontend"
     state: 'absent'
+
+- name: "Set all the HA Proxy Backend Switching Rules of a Frontend"
+  kube_cloud.haproxy.backend_switching_rule:
+    base_url: "http://localhost:5555"
+    username: "admin"
+    password: "admin"
+    rule_frontend: "test_frontend"
+    rules:
+      - name: "api-backend"
+        cond: "if"
+        cond_test: "is_api"
+      - name: "jira-service-backend"
+        cond: "if"
+        cond_test: "is_exemple_acl"
+    state: 'present'
 '''
 
 from ansible.module_utils.basic import AnsibleModule
 from ..module_utils.client_backend_switching_rules import BackendSwitchingRuleClient
 from ..module_utils.models import BackendSwitchingRule
 from ..module_utils.haproxy import haproxy_client
+from ..module_utils.metrics import request_metrics
 from ..module_utils.enums import ConditionType
+from ..module_utils.builders import build_requested_backend_switching_rules, build_backend_switching_rule_specification
 from ..module_utils.commons import filter_none
+from ..module_utils.diff import compute_diff, build_diff, canonicalize
 
 try:
     from requests import HTTPError  # type: ignore
@@ -226,6 +288,33 @@ def delete_rule(module: AnsibleModule, client: BackendSwitchingRuleClient, trans
         )
 
 
+# Reconcile Rules List
+def reconcile_rules(module: AnsibleModule, client: BackendSwitchingRuleClient, transaction_id: str, frontend_name: str, rules: list, force_reload: bool):
+
+    try:
+
+        # Call Client
+        return client.reconcile_backend_switching_rules(
+            besrs=rules,
+            transaction_id=transaction_id,
+            frontend_name=frontend_name,
+            force_reload=force_reload,
+            absent=module.params['state'] == 'absent',
+            check_mode=module.check_mode
+        )
+
+    except HTTPError as api_error:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Reconcile Rules] - Failed Reconcile HA Proxy Backend Switching Rules (Frontend : {0}): {1}".format(
+                frontend_name,
+                api_error
+            ),
+            metrics=request_metrics(client)
+        )
+
+
 # Instantiate Ansible Module
 def build_ansible_module():
 
@@ -235,19 +324,29 @@ def build_ansible_module():
         username=dict(type='str', required=True, no_log=True),
         password=dict(type='str', required=True, no_log=True),
         api_version=dict(type='str', required=False, default='v2'),
+        trace_file=dict(type='path', required=False),
+        snapshot_cache_dir=dict(type='path', required=False),
         transaction_id=dict(type='str', required=False, default=''),
         force_reload=dict(type='bool', required=False, default=True),
-        rule_index=dict(type='int', required=True),
+        rule_index=dict(type='int', required=False),
         rule_frontend=dict(type='str', required=True),
         rule_cond=dict(type='str', required=False, choices=['if', 'unless']),
         rule_cond_test=dict(type='str', required=False),
         rule_name=dict(type='str', required=False),
+        rules=dict(
+            type='list',
+            elements='dict',
+            required=False,
+            options=build_backend_switching_rule_specification()
+        ),
         state=dict(type='str', required=False, default='present', choices=['present', 'absent'])
     )
 
     # Build ansible Module
     return AnsibleModule(
         argument_spec=module_specification,
+        required_one_of=[('rule_index', 'rules')],
+        mutually_exclusive=[('rule_index', 'rules')],
         supports_check_mode=True
     )
 
@@ -295,6 +394,31 @@ def run_module(module: AnsibleModule, client: BackendSwitchingRuleClient):
     # Rule Frontend Name
     rule_frontend = module.params['rule_frontend']
 
+    # If the Rules List is Provided (List Mode)
+    if module.params['rules'] is not None:
+
+        # Reconcile Rules List
+        outcome = reconcile_rules(
+            module=module,
+            client=client,
+            transaction_id=transaction_id,
+            frontend_name=rule_frontend,
+            rules=build_requested_backend_switching_rules(module.params['rules']),
+            force_reload=force_reload
+        )
+
+        # Module Response
+        module.exit_json(
+            operations=outcome['operations'],
+            diff=dict(before=canonicalize(outcome['before']), after=outcome['after']),
+            changed=bool(outcome['operations']),
+            msg="Backend Switching Rules [Frontend : {0}] {1}".format(
+                rule_frontend,
+                "Have Been Reconciled ({0} Operations)".format(len(outcome['operations'])) if outcome['operations'] else "Not Changed"
+            ),
+            metrics=request_metrics(client)
+        )
+
     # Build Requested Instance
     rule = build_requested_rule(module.params)
 
@@ -308,8 +432,11 @@ def run_module(module: AnsibleModule, client: BackendSwitchingRuleClient):
     # If Requested State is 'present' and Instance Already exists
     if existing_instance and state == 'present':
 
+        # Compute Changed Fields
+        changes = compute_diff(existing_instance, rule)
+
         # If Existing Instance match requested Instance
-        if existing_instance == rule:
+        if not changes:
 
             # Initialize response (No Change)
             module.exit_json(
@@ -318,22 +445,28 @@ def run_module(module: AnsibleModule, client: BackendSwitchingRuleClient):
                     rule.name,
                     rule.index
                 ),
-                changed=False
+                changed=False,
+                metrics=request_metrics(client)
             )
 
-        # Update Existing Instance
-        update_rule(
-            module=module,
-            client=client,
-            transaction_id=transaction_id,
-            rule=rule,
-            index=rule.index,
-            frontend_name=rule_frontend,
-            force_reload=force_reload
-        )
+        # If not in Check Mode
+        if not module.check_mode:
+
+            # Update Existing Instance
+            update_rule(
+                module=module,
+                client=client,
+                transaction_id=transaction_id,
+                rule=rule,
+                index=rule.index,
+                frontend_name=rule_frontend,
+                force_reload=force_reload
+            )
 
         # Module Response : Changed
         module.exit_json(
+            changes=changes,
+            diff=build_diff(existing_instance, rule),
             changed=True,
             instance=filter_none(rule),
             frontend=rule_frontend,
@@ -341,24 +474,29 @@ def run_module(module: AnsibleModule, client: BackendSwitchingRuleClient):
                 rule_frontend,
                 rule.name,
                 rule.index
-            )
+            ),
+            metrics=request_metrics(client)
         )
 
     # If Requested State is 'present' and Instance don't exists
     if not existing_instance and state == 'present':
 
-        # Create Instance
-        create_rule(
-            module=module,
-            client=client,
-            transaction_id=transaction_id,
-            force_reload=force_reload,
-            frontend_name=rule_frontend,
-            rule=rule
-        )
+        # If not in Check Mode
+        if not module.check_mode:
+
+            # Create Instance
+            create_rule(
+                module=module,
+                client=client,
+                transaction_id=transaction_id,
+                force_reload=force_reload,
+                frontend_name=rule_frontend,
+                rule=rule
+            )
 
         # Initialize Module Response : Changed
         module.exit_json(
+            diff=build_diff(None, rule),
             changed=True,
             instance=filter_none(rule),
             frontend=rule_frontend,
@@ -366,24 +504,29 @@ def run_module(module: AnsibleModule, client: BackendSwitchingRuleClient):
                 rule_frontend,
                 rule.name,
                 rule.index
-            )
+            ),
+            metrics=request_metrics(client)
         )
 
     # If Requested State is 'absent' and Instance exists
     if existing_instance and state == 'absent':
 
-        # Delete Instance
-        delete_rule(
-            module=module,
-            client=client,
-            transaction_id=transaction_id,
-            force_reload=force_reload,
-            index=rule.index,
-            frontend_name=rule_frontend
-        )
+        # If not in Check Mode
+        if not module.check_mode:
+
+            # Delete Instance
+            delete_rule(
+                module=module,
+                client=client,
+                transaction_id=transaction_id,
+                force_reload=force_reload,
+                index=rule.index,
+                frontend_name=rule_frontend
+            )
 
         # Exit Module
         module.exit_json(
+            diff=build_diff(existing_instance, None),
             changed=True,
             instance=rule,
             frontend=rule_frontend,
@@ -391,7 +534,8 @@ def run_module(module: AnsibleModule, client: BackendSwitchingRuleClient):
                 rule_frontend,
                 rule.name,
                 rule.index
-            )
+            ),
+            metrics=request_metrics(client)
         )
 
     # If Requested State is 'absent' and Instance don't exists
@@ -404,7 +548,8 @@ def run_module(module: AnsibleModule, client: BackendSwitchingRuleClient):
                 rule.name,
                 rule.index
             ),
-            changed=False
+            changed=False,
+            metrics=request_metrics(client)
         )
 
 
@@ -23,6 +23,7 @@ options:
   base_url:
     description:
       - The HA Proxy Dataplane API Base URL
+      - Or the Unix domain socket of the Dataplane API (V(unix:///var/run/data-plane.sock)), when the module runs on the HA Proxy host
     required: true
     type: str
   username:
@@ -41,6 +42,21 @@ options:
     required: false
     default: 'v2'
     type: str
+  trace_file:
+    description:
+      - The JSON lines file each Dataplane API request is appended to (on the host running the module)
+      - Each line holds the request method, URI template, status, bytes sent and received, and latency
+    required: false
+    type: path
+    version_added: "2.4.0"
+  snapshot_cache_dir:
+    description:
+      - The Configuration Snapshot cache directory (on the host running the module)
+      - If provided, the existing objects are looked up in a snapshot of their configuration section,
+        fetched once per Configuration Version and shared by all the tasks of the play
+    required: false
+    type: path
+    version_added: "2.4.0"
   parent_name:
     description:
       - The HA Proxy Bind Parent Name
@@ -319,6 +335,16 @@ options:
     required: false
     default: true
     type: bool
+  upsert:
+    description:
+      - Create the bind without looking it up first, and only look it up (then update it if it differs)
+        when the creation fails because it already exists
+      - Saves the lookup request when the bind is new, at the cost of a failed creation when it already exists
+      - Only used with O(state=present), outside check mode
+    required: false
+    default: false
+    type: bool
+    version_added: "2.4.0"
   state:
     description:
       - The Transaction State
@@ -358,9 +384,12 @@ EXAMPLES = r'''
 from ansible.module_utils.basic import AnsibleModule
 from ..module_utils.client_binds import BindClient
 from ..module_utils.haproxy import haproxy_client
+from ..module_utils.metrics import request_metrics
 from ..module_utils.models import Bind
-from ..module_utils.enums import Requirement, SSLVersion, FrontendLevel
+from ..module_utils.builders import build_requested_bind, build_bind_specification
 from ..module_utils.commons import filter_none
+from ..module_utils.diff import compute_diff, build_diff
+from ..module_utils.upsert import ACTION_CREATED, ACTION_UPDATED, ACTION_UNCHANGED
 
 try:
     from requests import HTTPError  # type: ignore
@@ -369,6 +398,14 @@ except ImportError:
     IMPORTS_OK = False
 
 
+# Upsert Outcome Messages
+UPSERT_MESSAGES = {
+    ACTION_CREATED: "Has Been Created",
+    ACTION_UPDATED: "Has Been Updated",
+    ACTION_UNCHANGED: "Not Changed"
+}
+
+
 # Find and Return Bind
 def get_bind(client: BindClient, name: str, parent_name: str, parent_type: str):
 
@@ -443,6 +480,33 @@ def create_bind(module: AnsibleModule, client: BindClient, transaction_id: str,
         )
 
 
+# Upsert Bind (Create, or Update if it Already Exists)
+def upsert_bind(module: AnsibleModule, client: BindClient, transaction_id: str, parent_name: str, parent_type: str, bind: Bind, force_reload: bool):
+
+    try:
+
+        # Call Client
+        return client.upsert_bind(
+            bind=bind,
+            parent_name=parent_name,
+            parent_type=parent_type,
+            transaction_id=transaction_id,
+            force_reload=force_reload
+        )
+
+    except HTTPError as api_error:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Upsert Bind] - Failed Upsert HA Proxy Bind (Name : {0}, Parent : {1}:{2}): {3}".format(
+                bind.name,
+                parent_name,
+                parent_type,
+                api_error
+            )
+        )
+
+
 # Delete Bind
 def delete_bind(module: AnsibleModule, client: BindClient, transaction_id: str, name: str, parent_name: str, parent_type: str, force_reload: bool):
 
@@ -479,63 +543,19 @@ def build_ansible_module():
         username=dict(type='str', required=True, no_log=True),
         password=dict(type='str', required=True, no_log=True),
         api_version=dict(type='str', required=False, default='v2'),
+        trace_file=dict(type='path', required=False),
+        snapshot_cache_dir=dict(type='path', required=False),
         parent_name=dict(type='str', required=True),
         parent_type=dict(type='str', required=False, default='frontend', choices=['frontend', 'backend']),
-        name=dict(type='str', required=True),
-        address=dict(type='str', required=False),
-        port=dict(type='int', required=False),
-        maxconn=dict(type='int', required=False),
-        ssl=dict(type='bool', required=False),
-        ssl_cafile=dict(type='str', required=False),
-        ssl_certificate=dict(type='str', required=False),
-        strict_sni=dict(type='bool', required=False),
-        tcp_user_timeout=dict(type='int', required=False),
-        tfo=dict(type='bool', required=False),
-        thread=dict(type='str', required=False),
-        tls_ticket_keys=dict(type='str', required=False, no_log=True),
-        transparent=dict(type='bool', required=False),
-        uid=dict(type='str', required=False),
-        user=dict(type='str', required=False),
-        v4v6=dict(type='bool', required=False),
-        v6only=dict(type='bool', required=False),
-        no_alpn=dict(type='bool', required=False),
-        no_ca_names=dict(type='bool', required=False),
-        no_sslv3=dict(type='bool', required=False),
-        no_tls_tickets=dict(type='bool', required=False),
-        no_tlsv10=dict(type='bool', required=False),
-        no_tlsv11=dict(type='bool', required=False),
-        no_tlsv12=dict(type='bool', required=False),
-        no_tlsv13=dict(type='bool', required=False),
-        force_sslv3=dict(type='bool', required=False),
-        force_tlsv10=dict(type='bool', required=False),
-        force_tlsv11=dict(type='bool', required=False),
-        force_tlsv12=dict(type='bool', required=False),
-        force_tlsv13=dict(type='bool', required=False),
-        generate_certificates=dict(type='bool', required=False),
-        crt_list=dict(type='str', required=False),
-        ca_ignore_err=dict(type='str', required=False),
-        ca_sign_file=dict(type='str', required=False),
-        ca_sign_pass=dict(type='str', required=False, no_log=True),
-        ca_verify_file=dict(type='str', required=False),
-        ciphers=dict(type='str', required=False),
-        ciphersuites=dict(type='str', required=False),
-        client_sigalgs=dict(type='str', required=False),
-        crl_file=dict(type='str', required=False),
-        crt_ignore_err=dict(type='str', required=False),
-        curves=dict(type='str', required=False),
-        defer_accept=dict(type='str', required=False),
-        accept_proxy=dict(type='bool', required=False),
-        allow_0rtt=dict(type='bool', required=False),
-        alpn=dict(type='str', required=False),
         transaction_id=dict(type='str', required=False, default=''),
         force_reload=dict(type='bool', required=False, default=True),
-        verify=dict(type='str', required=False, choices=[enum.value for enum in Requirement]),
-        ssl_max_ver=dict(type='str', required=False, choices=[enum.value for enum in SSLVersion]),
-        ssl_min_ver=dict(type='str', required=False, choices=[enum.value for enum in SSLVersion]),
-        level=dict(type='str', required=False, choices=[enum.value for enum in FrontendLevel]),
+        upsert=dict(type='bool', required=False, default=False),
         state=dict(type='str', required=False, default='present', choices=['present', 'absent'])
     )
 
+    # Add Bind Fields Specification
+    module_specification.update(build_bind_specification())
+
     # Build ansible Module
     return AnsibleModule(
         argument_spec=module_specification,
@@ -559,41 +579,6 @@ def build_client(module: AnsibleModule):
         )
 
 
-# Build Requested Bind from Configuration
-def build_requested_bind(params: dict) -> Bind:
-
-    # Base Parameters Name
-    base_param_names = [
-        "name", "address", "port", "maxconn", "ssl", "ssl_cafile", "ssl_certificate", "strict_sni",
-        "tcp_user_timeout", "tfo", "thread", "tls_ticket_keys", "transparent", "uid", "user", "v4v6",
-        "v6only", "no_alpn", "no_ca_names", "no_sslv3", "no_tls_tickets", "no_tlsv10", "no_tlsv11",
-        "no_tlsv12", "no_tlsv13", "force_sslv3", "force_tlsv10", "force_tlsv11", "force_tlsv12",
-        "force_tlsv13", "generate_certificates", "crt_list", "ca_ignore_err", "ca_sign_file", "ca_sign_pass",
-        "ca_verify_file", "ciphers", "ciphersuites", "client_sigalgs", "crl_file", "crt_ignore_err",
-        "curves", "defer_accept", "accept_proxy", "allow_0rtt", "alpn"
-    ]
-
-    # Build Requested Instance
-    bind = Bind(
-        **{k: v for k, v in params.items() if v is not None and k in base_param_names}
-    )
-
-    # Optional Initialization : verify
-    bind.verify = Requirement.create(params.get('verify', None))
-
-    # Optional Initialization : ssl_max_ver
-    bind.ssl_max_ver = SSLVersion.create(params.get('ssl_max_ver', None))
-
-    # Optional Initialization : ssl_min_ver
-    bind.ssl_min_ver = SSLVersion.create(params.get('ssl_min_ver', None))
-
-    # Optional Initialization : level
-    bind.level = FrontendLevel.create(params.get('level', None))
-
-    # Return Bind
-    return bind
-
-
 # Porcess Module Execution
 def run_module(module: AnsibleModule, client: BindClient):
 
@@ -615,6 +600,32 @@ def run_module(module: AnsibleModule, client: BindClient):
     # Build Requested Instance
     bind = build_requested_bind(module.params)
 
+    # If Requested State is 'present' and Upsert is Requested (Create First, Lookup only if it Already Exists)
+    if module.params['upsert'] and state == 'present' and not module.check_mode:
+
+        # Upsert Instance
+        outcome = upsert_bind(
+            module=module,
+            client=client,
+            transaction_id=transaction_id,
+            parent_name=parent_name,
+            parent_type=parent_type,
+            bind=bind,
+            force_reload=force_reload
+        )
+
+        # Module Response
+        module.exit_json(
+            changes=outcome['changes'],
+            diff=build_diff(outcome['before'], bind),
+            changed=outcome['action'] != ACTION_UNCHANGED,
+            instance=filter_none(bind),
+            parent_name=parent_name,
+            parent_type=parent_type,
+            msg="Bind [{0} - {1}/{2}] {3}".format(bind.name, parent_name, parent_type, UPSERT_MESSAGES[outcome['action']]),
+            metrics=request_metrics(client)
+        )
+
     # Find Existing Instance
     existing_bind = get_bind(
         client=client,
@@ -626,77 +637,97 @@ def run_module(module: AnsibleModule, client: BindClient):
     # If Requested State is 'present' and Instance Already exists
     if existing_bind and state == 'present':
 
+        # Compute Changed Fields
+        changes = compute_diff(existing_bind, bind)
+
         # If Existing Instance match requested Instance
-        if existing_bind == bind:
+        if not changes:
 
             # Initialize response (No Change)
             module.exit_json(
                 msg="Bind [{0} - {1}/{2}] Not Changed".format(bind.name, parent_name, parent_type),
-                changed=False
+                changed=False,
+                metrics=request_metrics(client)
             )
 
-        # Update Existing Instance
-        update_bind(
-            module=module,
-            client=client,
-            transaction_id=transaction_id,
-            name=bind.name,
-            parent_name=parent_name,
-            parent_type=parent_type,
-            bind=bind,
-            force_reload=force_reload
-        )
+        # If not in Check Mode
+        if not module.check_mode:
+
+            # Update Existing Instance
+            update_bind(
+                module=module,
+                client=client,
+                transaction_id=transaction_id,
+                name=bind.name,
+                parent_name=parent_name,
+                parent_type=parent_type,
+                bind=bind,
+                force_reload=force_reload
+            )
 
         # Module Response : Changed
         module.exit_json(
+            changes=changes,
+            diff=build_diff(existing_bind, bind),
             changed=True,
             parent_name=parent_name,
             parent_type=parent_type,
             instance=filter_none(bind),
-            msg="Bind [{0} - {1}/{2}] Has Been Updated".format(bind.name, parent_name, parent_type)
+            msg="Bind [{0} - {1}/{2}] Has Been Updated".format(bind.name, parent_name, parent_type),
+            metrics=request_metrics(client)
         )
 
     # If Requested State is 'present' and Instance don't exists
     if not existing_bind and state == 'present':
 
-        # Create Instance
-        create_bind(
-            module=module,
-            client=client,
-            transaction_id=transaction_id,
-            parent_name=parent_name,
-            parent_type=parent_type,
-            bind=bind,
-            force_reload=force_reload
-        )
+        # If not in Check Mode
+        if not module.check_mode:
+
+            # Create Instance
+            create_bind(
+                module=module,
+                client=client,
+                transaction_id=transaction_id,
+                parent_name=parent_name,
+                parent_type=parent_type,
+                bind=bind,
+                force_reload=force_reload
+            )
 
         # Initialize Module Response : Changed
         module.exit_json(
+            diff=build_diff(None, bind),
             changed=True,
             parent_name=parent_name,
             parent_type=parent_type,
             instance=filter_none(bind),
-            msg="Bind [{0} - {1}/{2}] Has Been Created".format(bind.name, parent_name, parent_type)
+            msg="Bind [{0} - {1}/{2}] Has Been Created".format(bind.name, parent_name, parent_type),
+            metrics=request_metrics(client)
         )
 
     # If Requested State is 'absent' and Instance exists
     if existing_bind and state == 'absent':
 
-        # Delete Instance
-        delete_bind(
-            module=module,
-            client=client,
-            transaction_id=transaction_id,
-            name=bind.name,
-            parent_name=parent_name,
-            parent_type=parent_type,
-            force_reload=force_reload
-        )
+        # If not in Check Mode
+        if not module.check_mode:
+
+            # Delete Instance
+            delete_bind(
+                module=module,
+                client=client,
+                transaction_id=transaction_id,
+                name=bind.name,
+                parent_name=parent_name,
+                parent_type=parent_type,
+                force_reload=force_reload
+            )
 
         # Exit Module
         module.exit_json(
+            diff=build_diff(existing_bind, None),
             msg="Bind [{0} - {1}/{2}] Has Been Deleted".format(bind.name, parent_name, parent_type),
-            changed=True
+            changed=True,
+            metrics=request_metrics(client)
         )
 
     # If Requested State is 'absent' and Instance don't exists
@@ -705,7 +736,8 @@ def run_module(module: AnsibleModule, client: BindClient):
         # Initialize Response : No Change
         module.exit_json(
             msg="Bind Not Found [{0} - {1}/{2}]".format(bind.name, parent_name, parent_type),
-            changed=False
+            changed=False,
+            metrics=request_metrics(client)
         )
 
 
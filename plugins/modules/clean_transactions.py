@@ -22,6 +22,7 @@ options:
   base_url:
     description:
       - The HA Proxy Dataplane API Base URL
+      - Or the Unix domain socket of the Dataplane API (V(unix:///var/run/data-plane.sock)), when the module runs on the HA Proxy host
     required: true
     type: str
   username:
@@ -40,6 +41,46 @@ options:
     required: false
     default: 'v2'
     type: str
+  trace_file:
+    description:
+      - The JSON lines file each Dataplane API request is appended to (on the host running the module)
+      - Each line holds the request method, URI template, status, bytes sent and received, and latency
+    required: false
+    type: path
+    version_added: "2.4.0"
+  status:
+    description:
+      - Only cancel the Transactions having one of these status (all if empty)
+    required: false
+    default: []
+    type: list
+    elements: str
+    choices: ['in_progress', 'failed']
+    version_added: "2.4.0"
+  config_version:
+    description:
+      - Only cancel the Transactions started on this Configuration Version (all if empty)
+    required: false
+    default: ""
+    type: str
+    version_added: "2.4.0"
+  min_version_lag:
+    description:
+      - Only cancel the Transactions started at least this number of Configuration Versions ago
+      - The Dataplane API does not timestamp Transactions, so the version lag is used as the Transaction age
+        (a lagging Transaction can no longer be committed)
+    required: false
+    type: int
+    version_added: "2.4.0"
+  max_workers:
+    description:
+      - The maximum number of concurrent cancel requests
+    required: false
+    default: 10
+    type: int
+    version_added: "2.4.0"
+notes:
+  - In check mode, the Transactions that would be cancelled are returned (and counted) but not cancelled
 '''
 
 EXAMPLES = r'''
@@ -49,11 +90,23 @@ EXAMPLES = r'''
     username: "admin"
     password: "admin"
     api_version: "v2"
+
+- name: "Cancel Outdated HA Proxy Dataplane API Transactions"
+  kube_cloud.haproxy.clean_transactions:
+    base_url: "http://localhost:5555"
+    username: "admin"
+    password: "admin"
+    status: ['in_progress']
+    min_version_lag: 1
+    max_workers: 20
 '''
 
+import time
+
 from ansible.module_utils.basic import AnsibleModule
 from ..module_utils.client_transactions import TransactionClient
 from ..module_utils.haproxy import haproxy_client
+from ..module_utils.metrics import request_metrics
 
 try:
     from requests import HTTPError  # type: ignore
@@ -68,7 +121,13 @@ def cancel_transactions(module: AnsibleModule, client: TransactionClient):
     try:
 
         # Call Client
-        return client.cancel_transactions()
+        return client.cancel_transactions(
+            config_version=module.params['config_version'],
+            status=module.params['status'],
+            min_version_lag=module.params['min_version_lag'],
+            max_workers=module.params['max_workers'],
+            dry_run=module.check_mode
+        )
 
     except HTTPError as api_error:
 
@@ -88,7 +147,12 @@ def build_ansible_module():
         base_url=dict(type='str', required=True),
         username=dict(type='str', required=True, no_log=True),
         password=dict(type='str', required=True, no_log=True),
-        api_version=dict(type='str', required=False, default='v2')
+        api_version=dict(type='str', required=False, default='v2'),
+        trace_file=dict(type='path', required=False),
+        status=dict(type='list', elements='str', required=False, default=[], choices=['in_progress', 'failed']),
+        config_version=dict(type='str', required=False, default=''),
+        min_version_lag=dict(type='int', required=False),
+        max_workers=dict(type='int', required=False, default=10)
     )
 
     # Build ansible Module
@@ -117,17 +181,42 @@ def build_client(module: AnsibleModule):
 # Porcess Module Execution
 def run_module(module: AnsibleModule, client: TransactionClient):
 
+    # Start Time
+    start = time.monotonic()
+
     # Cancel All Pending Transactions
     cleaned_transactions = cancel_transactions(
         module=module,
         client=client
     )
 
-    # Module Response : Changed
+    # Transactions not Cancelled (Errors)
+    failed_transactions = [tx for tx in cleaned_transactions if tx['error']]
+
+    # If any Transaction cannot be Cancelled
+    if failed_transactions:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Cancel All Transaction] - Failed Cancel {0} of {1} HA Proxy Dataplane API Transactions".format(
+                len(failed_transactions),
+                len(cleaned_transactions)
+            ),
+            changed=any(tx['cancelled'] for tx in cleaned_transactions),
+            cleaned=cleaned_transactions
+        )
+
+    # Module Response
     module.exit_json(
-        changed=True,
+        changed=bool(cleaned_transactions),
         cleaned=cleaned_transactions,
-        msg="Transactions are Cleaned"
+        count=len(cleaned_transactions),
+        elapsed=round(time.monotonic() - start, 3),
+        msg="{0} Transactions {1} Cleaned".format(
+            len(cleaned_transactions),
+            "would be" if module.check_mode else "are"
+        ),
+        metrics=request_metrics(client)
     )
 
 
@@ -23,6 +23,7 @@ options:
   base_url:
     description:
       - The HA Proxy Dataplane API Base URL
+      - Or the Unix domain socket of the Dataplane API (V(unix:///var/run/data-plane.sock)), when the module runs on the HA Proxy host
     required: true
     type: str
   username:
@@ -41,6 +42,21 @@ options:
     required: false
     default: 'v2'
     type: str
+  trace_file:
+    description:
+      - The JSON lines file each Dataplane API request is appended to (on the host running the module)
+      - Each line holds the request method, URI template, status, bytes sent and received, and latency
+    required: false
+    type: path
+    version_added: "2.4.0"
+  snapshot_cache_dir:
+    description:
+      - The Configuration Snapshot cache directory (on the host running the module)
+      - If provided, the existing objects are looked up in a snapshot of their configuration section,
+        fetched once per Configuration Version and shared by all the tasks of the play
+    required: false
+    type: path
+    version_added: "2.4.0"
   name:
     description:
       - The HA Proxy Frontend Name
@@ -126,6 +142,16 @@ options:
     required: false
     default: true
     type: bool
+  upsert:
+    description:
+      - Create the frontend without looking it up first, and only look it up (then update it if it differs)
+        when the creation fails because it already exists
+      - Saves the lookup request when the frontend is new, at the cost of a failed creation when it already exists
+      - Only used with O(state=present), outside check mode
+    required: false
+    default: false
+    type: bool
+    version_added: "2.4.0"
   state:
     description:
       - The Frontend State
@@ -170,9 +196,12 @@ EXAMPLES = r'''
 from ansible.module_utils.basic import AnsibleModule
 from ..module_utils.client_frontends import FrontendClient
 from ..module_utils.haproxy import haproxy_client
-from ..module_utils.models import Frontend, ForwardFor
-from ..module_utils.enums import ProxyProtocol, EnableDisableEnum
+from ..module_utils.metrics import request_metrics
+from ..module_utils.models import Frontend
+from ..module_utils.builders import build_requested_frontend, build_frontend_specification
 from ..module_utils.commons import filter_none
+from ..module_utils.diff import compute_diff, build_diff
+from ..module_utils.upsert import ACTION_CREATED, ACTION_UPDATED, ACTION_UNCHANGED
 
 try:
     from requests import HTTPError  # type: ignore
@@ -181,6 +210,14 @@ except ImportError:
     IMPORTS_OK = False
 
 
+# Upsert Outcome Messages
+UPSERT_MESSAGES = {
+    ACTION_CREATED: "Has Been Created",
+    ACTION_UPDATED: "Has Been Updated",
+    ACTION_UNCHANGED: "Not Changed"
+}
+
+
 # Find and Return Frontend
 def get_frontend(client: FrontendClient, name: str):
 
@@ -244,6 +281,30 @@ def create_frontend(module: AnsibleModule, client: FrontendClient, transaction_i
         )
 
 
+# Upsert Frontend (Create, or Update if it Already Exists)
+def upsert_frontend(module: AnsibleModule, client: FrontendClient, transaction_id: str, frontend: Frontend, force_reload: bool):
+
+    try:
+
+        # Call Client
+        return client.upsert_frontend(
+            frontend=frontend,
+            transaction_id=transaction_id,
+            force_reload=force_reload
+        )
+
+    except HTTPError as api_error:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Upsert Frontend] - Failed Upsert HA Proxy Frontend (Name : {0} : [{1}]): {2}".format(
+                frontend.name,
+                frontend,
+                api_error
+            )
+        )
+
+
 # Delete Frontend
 def delete_frontend(module: AnsibleModule, client: FrontendClient, transaction_id: str, name: str, force_reload: bool):
 
@@ -276,25 +337,17 @@ def build_ansible_module():
         username=dict(type='str', required=True, no_log=True),
         password=dict(type='str', required=True, no_log=True),
         api_version=dict(type='str', required=False, default='v2'),
-        name=dict(type='str', required=True),
-        mode=dict(type='str', required=False, default='HTTP', choices=['HTTP', 'TCP']),
-        default_backend=dict(type='str', required=False, default=None),
-        log_format=dict(type='str', required=False, default=None),
-        description=dict(type='str', required=False, default=None),
-        log_format_sd=dict(type='str', required=False, default=None),
-        log_tag=dict(type='str', required=False, default=None),
-        logsap=dict(type='str', required=False, default=None, choices=['enabled', 'disabled']),
-        maxconn=dict(type='int', required=False, default=None),
-        enabled=dict(type='bool', required=False, default=None),
-        httplog=dict(type='bool', required=False, default=None),
-        httpslog=dict(type='str', required=False, default=None),
-        error_log_format=dict(type='str', required=False, default=None),
-        forwardfor=dict(type='dict', required=False, default=None),
+        trace_file=dict(type='path', required=False),
+        snapshot_cache_dir=dict(type='path', required=False),
         transaction_id=dict(type='str', required=False, default=''),
         force_reload=dict(type='bool', required=False, default=True),
+        upsert=dict(type='bool', required=False, default=False),
         state=dict(type='str', required=False, default='present', choices=['present', 'absent'])
     )
 
+    # Add Frontend Fields Specification
+    module_specification.update(build_frontend_specification())
+
     # Build ansible Module
     return AnsibleModule(
         argument_spec=module_specification,
@@ -318,54 +371,6 @@ def build_client(module: AnsibleModule):
         )
 
 
-# Build Requested Frontend from Configuration
-def build_requested_frontend(params: dict) -> Frontend:
-
-    # Base Parameters Name
-    base_param_names = [
-        "name",
-        "default_backend",
-        "log_format",
-        "description",
-        "log_format_sd",
-        "log_tag",
-        "maxconn",
-        "enabled",
-        "error_log_format",
-        "httplog"
-    ]
-
-    # Build Requested Instance
-    frontend = Frontend(
-        **{k: v for k, v in params.items() if v is not None and k in base_param_names}
-    )
-
-    # Optional Initialization : mode
-    frontend.mode = ProxyProtocol.create(params['mode'])
-
-    # Optional Initialization : logsap
-    frontend.logsap = EnableDisableEnum.create(params['logsap'])
-
-    # Optional Initialization : httpslog
-    frontend.httpslog = EnableDisableEnum.create(params['httpslog'])
-
-    # Optional Initialization : forwardfor
-    if params['forwardfor']:
-
-        # Extract ForwardedFor
-        p_formwardfor = params['forwardfor']
-
-        # Initialize Object
-        frontend.forwardfor = ForwardFor(
-            enabled=EnableDisableEnum.create(p_formwardfor.get('enabled', None)),
-            header=p_formwardfor.get('header', None),
-            ifnone=p_formwardfor.get('ifnone', None)
-        )
-
-    # Return Frontend
-    return frontend
-
-
 # Porcess Module Execution
 def run_module(module: AnsibleModule, client: FrontendClient):
 
@@ -381,6 +386,28 @@ def run_module(module: AnsibleModule, client: FrontendClient):
     # Build Requested Frontend
     frontend = build_requested_frontend(module.params)
 
+    # If Requested State is 'present' and Upsert is Requested (Create First, Lookup only if it Already Exists)
+    if module.params['upsert'] and state == 'present' and not module.check_mode:
+
+        # Upsert Instance
+        outcome = upsert_frontend(
+            module=module,
+            client=client,
+            transaction_id=transaction_id,
+            frontend=frontend,
+            force_reload=force_reload
+        )
+
+        # Module Response
+        module.exit_json(
+            changes=outcome['changes'],
+            diff=build_diff(outcome['before'], frontend),
+            changed=outcome['action'] != ACTION_UNCHANGED,
+            instance=filter_none(frontend),
+            msg="Frontend [{0} - {1}] {2}".format(frontend.name, frontend.mode, UPSERT_MESSAGES[outcome['action']]),
+            metrics=request_metrics(client)
+        )
+
     # Find Existing Instance
     existing_frontend = get_frontend(
         client=client,
@@ -390,67 +417,87 @@ def run_module(module: AnsibleModule, client: FrontendClient):
     # If Requested State is 'present' and Instance Already exists
     if existing_frontend and state == 'present':
 
+        # Compute Changed Fields
+        changes = compute_diff(existing_frontend, frontend)
+
         # If Existing Instance match requested Instance
-        if existing_frontend == frontend:
+        if not changes:
 
             # Initialize response (No Change)
             module.exit_json(
                 msg="Frontend [{0} - {1}] Not Changed".format(frontend.name, frontend.mode),
-                changed=False
+                changed=False,
+                metrics=request_metrics(client)
             )
 
-        # Update Existing Instance
-        update_frontend(
-            module=module,
-            client=client,
-            transaction_id=transaction_id,
-            name=frontend.name,
-            frontend=frontend,
-            force_reload=force_reload
-        )
+        # If not in Check Mode
+        if not module.check_mode:
+
+            # Update Existing Instance
+            update_frontend(
+                module=module,
+                client=client,
+                transaction_id=transaction_id,
+                name=frontend.name,
+                frontend=frontend,
+                force_reload=force_reload
+            )
 
         # Module Response : Changed
         module.exit_json(
+            changes=changes,
+            diff=build_diff(existing_frontend, frontend),
             changed=True,
             instance=filter_none(frontend),
-            msg="Frontend [{0} - {1}] Has Been Updated".format(frontend.name, frontend.mode)
+            msg="Frontend [{0} - {1}] Has Been Updated".format(frontend.name, frontend.mode),
+            metrics=request_metrics(client)
         )
 
     # If Requested State is 'present' and Instance don't exists
     if not existing_frontend and state == 'present':
 
-        # Create Instance
-        create_frontend(
-            module=module,
-            client=client,
-            transaction_id=transaction_id,
-            frontend=frontend,
-            force_reload=force_reload
-        )
+        # If not in Check Mode
+        if not module.check_mode:
+
+            # Create Instance
+            create_frontend(
+                module=module,
+                client=client,
+                transaction_id=transaction_id,
+                frontend=frontend,
+                force_reload=force_reload
+            )
 
         # Initialize Module Response : Changed
         module.exit_json(
+            diff=build_diff(None, frontend),
             changed=True,
             instance=filter_none(frontend),
-            msg="[{0} - {1}] Has been Created".format(frontend.name, frontend.mode)
+            msg="[{0} - {1}] Has been Created".format(frontend.name, frontend.mode),
+            metrics=request_metrics(client)
         )
 
     # If Requested State is 'absent' and Instance exists
     if existing_frontend and state == 'absent':
 
-        # Delete Instance
-        delete_frontend(
-            module=module,
-            client=client,
-            transaction_id=transaction_id,
-            name=frontend.name,
-            force_reload=force_reload
-        )
+        # If not in Check Mode
+        if not module.check_mode:
+
+            # Delete Instance
+            delete_frontend(
+                module=module,
+                client=client,
+                transaction_id=transaction_id,
+                name=frontend.name,
+                force_reload=force_reload
+            )
 
         # Exit Module
         module.exit_json(
+            diff=build_diff(existing_frontend, None),
             msg="[{0} - {1}] Has been Deleted".format(frontend.name, frontend.mode),
-            changed=True
+            changed=True,
+            metrics=request_metrics(client)
         )
 
     # If Requested State is 'absent' and Instance don't exists
@@ -459,7 +506,8 @@ def run_module(module: AnsibleModule, client: FrontendClient):
         # Initialize Response : No Change
         module.exit_json(
             msg="[{0} - {1}] Not Found".format(frontend.name, frontend.mode),
-            changed=False
+            changed=False,
+            metrics=request_metrics(client)
         )
 
 
@@ -0,0 +1,1979 @@
+# (c) 2024, Jean-Jacques ETUNE NGI <jetune@kube-cloud.com>
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+
+DOCUMENTATION = '''
+---
+module: haproxy_config
+version_added: "2.4.0"
+short_description: Manage a whole HA Proxy Configuration declaratively
+description:
+    - Used to Manage HA Proxy Backends and Frontends with their Servers, Binds, ACLs, HTTP Request Rules
+      and Backend Switching Rules, in a single task
+    - The requested configuration is a dependency graph (Backends and Frontends, then their Servers, Binds
+      and ACLs, then their Rules), diffed against a single snapshot of the configuration sections it touches
+    - The changes are applied in a single Transaction, dependency level by dependency level, the changes of
+      a level running concurrently (the ACLs and Rules of a parent are written in order, with the fewest writes)
+    - The changes can also be computed ahead of time into a plan file (O(mode=plan)), then applied later as they
+      are (O(mode=apply_plan)), provided the configuration did not change in the meantime
+requirements:
+    - requests
+author: Jean-Jacques ETUNE NGI (@jetune) <jetune@kube-cloud.com>
+options:
+    base_url:
+        description:
+        - The HA Proxy Dataplane API Base URL
+        - Or the Unix domain socket of the Dataplane API (V(unix:///var/run/data-plane.sock)), when the module runs on the HA Proxy host
+        required: true
+        type: str
+    username:
+        description:
+        - The HA Proxy Dataplane API Admin Username
+        required: true
+        type: str
+    password:
+        description:
+        - The HA Proxy Dataplane API Password
+        required: true
+        type: str
+    api_version:
+        description:
+        - The HA Proxy Dataplane API Version
+        required: false
+        default: 'v2'
+        type: str
+    trace_file:
+        description:
+        - The JSON lines file each Dataplane API request is appended to (on the host running the module)
+        - Each line holds the request method, URI template, status, bytes sent and received, and latency
+        required: false
+        type: path
+    snapshot_cache_dir:
+        description:
+        - The Configuration Snapshot cache directory (on the host running the module)
+        - If provided, the configuration sections are fetched once per Configuration Version and shared by all the tasks of the play
+        required: false
+        type: path
+    transaction_id:
+        description:
+        - The Transaction ID
+        - If provided, the changes are computed against the configuration as staged in this Transaction (its pending changes included)
+        - If not provided, a Transaction is started, then committed once all the changes are applied
+        required: false
+        default: ""
+        type: str
+    force_reload:
+        description:
+        - Force reload HA Proxy Configuration (when the module commits its own Transaction)
+        required: false
+        default: true
+        type: bool
+    max_parallel:
+        description:
+        - The maximum number of concurrent requests (configuration reads and writes of a dependency level)
+        required: false
+        default: 10
+        type: int
+    purge:
+        description:
+        - Delete the existing Servers (and Binds) of the listed Backends (and Frontends) that are not listed
+        - Unlisted Backends and Frontends, and the child kinds not provided for a parent, are never modified
+        required: false
+        default: false
+        type: bool
+    mode:
+        description:
+        - V(apply) computes the changes against the live configuration, then applies them
+        - V(plan) computes the changes against the live configuration and writes them to O(plan_file), without applying them
+        - V(apply_plan) applies the changes of O(plan_file) as they are, in a single Transaction, without computing them again
+          (O(backends), O(frontends) and O(purge) are ignored); nothing is applied if the Configuration Version moved since
+          the plan was computed, or if the plan was computed on another Dataplane API
+        required: false
+        default: 'apply'
+        type: str
+        choices: ['apply', 'plan', 'apply_plan']
+    plan_file:
+        description:
+        - The plan file (on the host running the module), required by O(mode=plan) and O(mode=apply_plan)
+        - A compact JSON document holding the Dataplane API Base URL, the Configuration Version the plan was computed
+          against, and the operations to apply
+        required: false
+        type: path
+    backends:
+        description:
+        - The requested Backends
+        - Each item takes the Backend options of the M(kube_cloud.haproxy.backend) module, with the Servers, the ACLs
+          and the HTTP Request Rules of the Backend
+        required: false
+        default: []
+        type: list
+        elements: dict
+        suboptions:
+            name:
+                description:
+                - The HA Proxy Backend Name
+                required: true
+                type: str
+            mode:
+                description:
+                - The HA Proxy Backend Mode
+                required: false
+                default: 'HTTP'
+                type: str
+                choices: ['HTTP', 'TCP']
+            adv_check:
+                description:
+                - The HA Proxy Backend Advance Check
+                required: false
+                type: str
+                choices: [
+                    'SSL_HELLO_CHK', 'SMTPCHK', 'HTTPCHK', 'REDIS_CHECK', 'TCP_CHECK', 'PGSQL_CHECK', 'MYSQL_CHECK',
+                    'LDAP_CHECK'
+                ]
+            balance:
+                description:
+                - The HA Proxy Backend Load Balancing
+                required: false
+                type: dict
+            httpchk:
+                description:
+                - The HA Proxy Backend Default HealthCheck Configuration
+                required: false
+                type: dict
+            httpchk_params:
+                description:
+                - The HA Proxy Backend HealthCheck Configuration
+                required: false
+                type: dict
+            pgsql_check_params:
+                description:
+                - The HA Proxy Backend Postgres Healtcheck Configuration
+                required: false
+                type: dict
+            ignore_persist:
+                description:
+                - The HA Proxy Backend Ignore Persists
+                required: false
+                type: dict
+            abortonclose:
+                description:
+                - The HA Proxy Backend Abord On Close
+                required: false
+                type: str
+                choices: ['ENABLED', 'DISABLED']
+            accept_invalid_http_response:
+                description:
+                - The HA Proxy Backend Accept Invalid HTTP Response
+                required: false
+                type: str
+                choices: ['ENABLED', 'DISABLED']
+            allbackups:
+                description:
+                - The HA Proxy Backend All Backup
+                required: false
+                type: str
+                choices: ['ENABLED', 'DISABLED']
+            checkcache:
+                description:
+                - The HA Proxy Backend Check Cache
+                required: false
+                type: str
+                choices: ['ENABLED', 'DISABLED']
+            external_check:
+                description:
+                - The HA Proxy Backend External Check
+                required: false
+                type: str
+                choices: ['ENABLED', 'DISABLED']
+            nolinger:
+                description:
+                - The HA Proxy Backend No Linger
+                required: false
+                type: str
+                choices: ['ENABLED', 'DISABLED']
+            prefer_last_server:
+                description:
+                - The HA Proxy Backend Prefer Last Server
+                required: false
+                type: str
+                choices: ['ENABLED', 'DISABLED']
+            splice_auto:
+                description:
+                - The HA Proxy Backend Splice Automatically
+                required: false
+                type: str
+                choices: ['ENABLED', 'DISABLED']
+            splice_request:
+                description:
+                - The HA Proxy Backend Splice Request
+                required: false
+                type: str
+                choices: ['ENABLED', 'DISABLED']
+            splice_response:
+                description:
+                - The HA Proxy Backend Splice Response
+                required: false
+                type: str
+                choices: ['ENABLED', 'DISABLED']
+            spop_check:
+                description:
+                - The HA Proxy Backend Spop Check
+                required: false
+                type: str
+                choices: ['ENABLED', 'DISABLED']
+            srvtcpka:
+                description:
+                - The HA Proxy Backend Server TCP KA
+                required: false
+                type: str
+                choices: ['ENABLED', 'DISABLED']
+            independent_streams:
+                description:
+                - The HA Proxy Backend Independant Stream
+                required: false
+                type: str
+                choices: ['ENABLED', 'DISABLED']
+            log_health_checks:
+                description:
+                - The HA Proxy Backend Log Health
+                required: false
+                type: str
+                choices: ['ENABLED', 'DISABLED']
+            bind_process:
+                description:
+                - The HA Proxy Backend for bind_process
+                required: false
+                type: str
+            check_timeout:
+                description:
+                - The HA Proxy Backend for check_timeout
+                required: false
+                type: int
+            connect_timeout:
+                description:
+                - The HA Proxy Backend for connect_timeout
+                required: false
+                type: int
+            description:
+                description:
+                - The HA Proxy Backend for description
+                required: false
+                type: str
+            disabled:
+                description:
+                - The HA Proxy Backend for disabled
+                required: false
+                type: bool
+            enabled:
+                description:
+                - The HA Proxy Backend for enabled
+                required: false
+                type: bool
+            external_check_command:
+                description:
+                - The HA Proxy Backend for external_check_command
+                required: false
+                type: str
+            external_check_path:
+                description:
+                - The HA Proxy Backend for external_check_path
+                required: false
+                type: str
+            fullconn:
+                description:
+                - The HA Proxy Backend for fullconn
+                required: false
+                type: int
+            queue_timeout:
+                description:
+                - The HA Proxy Backend for queue_timeout
+                required: false
+                type: int
+            retries:
+                description:
+                - The HA Proxy Backend for retries
+                required: false
+                type: int
+            retry_on:
+                description:
+                - The HA Proxy Backend for retry_on
+                required: false
+                type: str
+            server_fin_timeout:
+                description:
+                - The HA Proxy Backend for server_fin_timeout
+                required: false
+                type: int
+            server_state_file_name:
+                description:
+                - The HA Proxy Backend for server_state_file_name
+                required: false
+                type: str
+            server_timeout:
+                description:
+                - The HA Proxy Backend for server_timeout
+                required: false
+                type: int
+            srvtcpka_cnt:
+                description:
+                - The HA Proxy Backend for srvtcpka_cnt
+                required: false
+                type: int
+            srvtcpka_idle:
+                description:
+                - The HA Proxy Backend for srvtcpka_idle
+                required: false
+                type: int
+            srvtcpka_intvl:
+                description:
+                - The HA Proxy Backend for srvtcpka_intvl
+                required: false
+                type: int
+            forwardfor:
+                description:
+                - The HA Proxy Backend Forwarded For
+                required: false
+                type: dict
+            servers:
+                description:
+                - The Servers of the Backend
+                required: false
+                type: list
+                elements: dict
+                suboptions:
+                    name:
+                        description:
+                        - The Server Name
+                        required: true
+                        type: str
+                    address:
+                        description:
+                        - The Server Address
+                        required: true
+                        type: str
+                    port:
+                        description:
+                        - The Server Port
+                        required: true
+                        type: int
+                    verify:
+                        description:
+                        - The HA Proxy Server Configuration verify
+                        required: false
+                        type: str
+                        choices: ['NONE', 'REQUIRED', 'OPTIONAL']
+                    verifyhost:
+                        description:
+                        - The HA Proxy Server Configuration verifyhost
+                        required: false
+                        type: str
+                    weight:
+                        description:
+                        - The HA Proxy Server Configuration weight
+                        required: false
+                        type: int
+                    track:
+                        description:
+                        - The HA Proxy Server Configuration track
+                        required: false
+                        type: str
+                    ws:
+                        description:
+                        - The HA Proxy Server Configuration ws
+                        required: false
+                        type: str
+                        choices: ['AUTO', 'H1', 'H2']
+                    check:
+                        description:
+                        - The HA Proxy Server Configuration check
+                        required: false
+                        type: str
+                        choices: ['ENABLED', 'DISABLED']
+                    health_check_address:
+                        description:
+                        - The HA Proxy Server Configuration health_check_address
+                        required: false
+                        type: str
+                    health_check_port:
+                        description:
+                        - The HA Proxy Server Configuration health_check_port
+                        required: false
+                        type: int
+                    max_reuse:
+                        description:
+                        - The HA Proxy Server Configuration max_reuse
+                        required: false
+                        type: int
+                    maxconn:
+                        description:
+                        - The HA Proxy Server Configuration maxconn
+                        required: false
+                        type: int
+                    maxqueue:
+                        description:
+                        - The HA Proxy Server Configuration maxqueue
+                        required: false
+                        type: int
+                    minconn:
+                        description:
+                        - The HA Proxy Server Configuration minconn
+                        required: false
+                        type: int
+                    npn:
+                        description:
+                        - The Backend Server Config Field 'npn'
+                        required: false
+                        type: str
+                    fall:
+                        description:
+                        - The Backend Server Config Field 'fall'
+                        required: false
+                        type: int
+                    rise:
+                        description:
+                        - The Backend Server Config Field 'rise'
+                        required: false
+                        type: int
+                    inter:
+                        description:
+                        - The Backend Server Config Field 'inter'
+                        required: false
+                        type: int
+                    fastinter:
+                        description:
+                        - The Backend Server Config Field 'fastinter'
+                        required: false
+                        type: int
+                    error_limit:
+                        description:
+                        - The Backend Server Config Field 'error_limit'
+                        required: false
+                        type: int
+                    pool_low_conn:
+                        description:
+                        - The Backend Server Config Field 'pool_low_conn'
+                        required: false
+                        type: int
+                    pool_max_conn:
+                        description:
+                        - The Backend Server Config Field 'pool_max_conn'
+                        required: false
+                        type: int
+                    pool_purge_delay:
+                        description:
+                        - The Backend Server Config Field 'pool_purge_delay'
+                        required: false
+                        type: int
+                    proto:
+                        description:
+                        - The Backend Server Config Field 'proto'
+                        required: false
+                        type: str
+                    redir:
+                        description:
+                        - The Backend Server Config Field 'redir'
+                        required: false
+                        type: str
+                    resolve_opts:
+                        description:
+                        - The Backend Server Config Field 'resolve_opts'
+                        required: false
+                        type: str
+                    resolvers:
+                        description:
+                        - The Backend Server Config Field 'resolvers'
+                        required: false
+                        type: str
+                    ssl_cafile:
+                        description:
+                        - The Backend Server Config Field 'ssl_cafile'
+                        required: false
+                        type: str
+                    ssl_certificate:
+                        description:
+                        - The Backend Server Config Field 'ssl_certificate'
+                        required: false
+                        type: str
+                    tcp_ut:
+                        description:
+                        - The Backend Server Config Field 'tcp_ut'
+                        required: false
+                        type: int
+                    maintenance:
+                        description:
+                        - The Backend Server Config Field 'maintenance'
+                        required: false
+                        type: str
+                        choices: ['ENABLED', 'DISABLED']
+                    no_sslv3:
+                        description:
+                        - The Backend Server Config Field 'no_sslv3'
+                        required: false
+                        type: str
+                        choices: ['ENABLED', 'DISABLED']
+                    no_tlsv10:
+                        description:
+                        - The Backend Server Config Field 'no_tlsv10'
+                        required: false
+                        type: str
+                        choices: ['ENABLED', 'DISABLED']
+                    no_tlsv11:
+                        description:
+                        - The Backend Server Config Field 'no_tlsv11'
+                        required: false
+                        type: str
+                        choices: ['ENABLED', 'DISABLED']
+                    no_tlsv12:
+                        description:
+                        - The Backend Server Config Field 'no_tlsv12'
+                        required: false
+                        type: str
+                        choices: ['ENABLED', 'DISABLED']
+                    no_tlsv13:
+                        description:
+                        - The Backend Server Config Field 'no_tlsv13'
+                        required: false
+                        type: str
+                        choices: ['ENABLED', 'DISABLED']
+                    no_verifyhost:
+                        description:
+                        - The Backend Server Config Field 'no_verifyhost'
+                        required: false
+                        type: str
+                        choices: ['ENABLED', 'DISABLED']
+                    stick:
+                        description:
+                        - The Backend Server Config Field 'stick'
+                        required: false
+                        type: str
+                        choices: ['ENABLED', 'DISABLED']
+                    tfo:
+                        description:
+                        - The Backend Server Config Field 'tfo'
+                        required: false
+                        type: str
+                        choices: ['ENABLED', 'DISABLED']
+                    send_proxy_v2_ssl:
+                        description:
+                        - The Backend Server Config Field 'send_proxy_v2_ssl'
+                        required: false
+                        type: str
+                        choices: ['ENABLED', 'DISABLED']
+                    send_proxy_v2_ssl_cn:
+                        description:
+                        - The Backend Server Config Field 'send_proxy_v2_ssl_cn'
+                        required: false
+                        type: str
+                        choices: ['ENABLED', 'DISABLED']
+                    ssl_reuse:
+                        description:
+                        - The Backend Server Config Field 'ssl_reuse'
+                        required: false
+                        type: str
+                        choices: ['ENABLED', 'DISABLED']
+                    ssl:
+                        description:
+                        - The Backend Server Config Field 'ssl'
+                        required: false
+                        type: str
+                        choices: ['ENABLED', 'DISABLED']
+                    ssl_max_ver:
+                        description:
+                        - The Backend Server Config Field 'ssl_max_ver'
+                        required: false
+                        type: str
+                        choices: ['SSLv3', 'TLSv1_0', 'TLSv1_1', 'TLSv1_2', 'TLSv1_3']
+                    ssl_min_ver:
+                        description:
+                        - The Backend Server Config Field 'ssl_min_ver'
+                        required: false
+                        type: str
+                        choices: ['SSLv3', 'TLSv1_0', 'TLSv1_1', 'TLSv1_2', 'TLSv1_3']
+            acls:
+                description:
+                - The full ordered list of ACLs of the Backend
+                required: false
+                type: list
+                elements: dict
+                suboptions:
+                    acl_name:
+                        description:
+                        - The ACL Name
+                        required: true
+                        type: str
+                    criterion:
+                        description:
+                        - The ACL Criterion
+                        required: true
+                        type: str
+                    value:
+                        description:
+                        - The ACL Value
+                        required: false
+                        type: str
+            http_request_rules:
+                description:
+                - The full ordered list of HTTP Request Rules of the Backend
+                required: false
+                type: list
+                elements: dict
+                suboptions:
+                    type:
+                        description:
+                        - The HTTP Request Rule Config Field type
+                        required: true
+                        type: str
+                        choices: [
+                            'ADD_ACL', 'ADD_HEADER', 'ALLOW', 'AUTH', 'CACHE_USE', 'CAPTURE', 'DEL_ACL', 'DEL_HEADER',
+                            'DEL_MAP', 'DENY', 'DISABLE_L7_RETRY', 'DO_RESOLVE', 'EARLY_HINT', 'LUA', 'NORMALIZE_URI',
+                            'REDIRECT', 'REJECT', 'REPLACE_HEADER', 'REPLACE_PATH', 'REPLACE_PATHQ', 'REPLACE_URI',
+                            'REPLACE_VALUE', 'RETURN', 'SC_ADD_GPC', 'SC_INC_GPC', 'SC_INC_GPC0', 'SC_INC_GPC1', 'SC_SET_GPT0',
+                            'SEND_SPOE_GROUP', 'SET_DST', 'SET_DST_PORT', 'SET_HEADER', 'SET_LOG_LEVEL', 'SET_MAP', 'SET_MARK',
+                            'SET_METHOD', 'SET_NICE', 'SET_PATH', 'SET_PATHQ', 'SET_PRIORITY_CLASS', 'SET_PRIORITY_OFFSET',
+                            'SET_QUERY', 'SET_SRC', 'SET_SRC_PORT', 'SET_TIMEOUT', 'SET_TOS', 'SET_URI', 'SET_VAR',
+                            'SILENT_DROP', 'STRICT_MODE', 'TARPIT', 'TRACK_SC0', 'TRACK_SC1', 'TRACK_SC2', 'UNSET_VAR',
+                            'USE_SERVICE', 'WAIT_FOR_BODY', 'WAIT_FOR_HANDSHAKE', 'SET_BANDWIDTH_LIMIT'
+                        ]
+                    acl_file:
+                        description:
+                        - The HTTP Request Rule Config Field acl_file
+                        required: false
+                        type: str
+                    acl_keyfmt:
+                        description:
+                        - The HTTP Request Rule Config Field acl_keyfmt
+                        required: false
+                        type: str
+                    auth_realm:
+                        description:
+                        - The HTTP Request Rule Config Field auth_realm
+                        required: false
+                        type: str
+                    bandwidth_limit_limit:
+                        description:
+                        - The HTTP Request Rule Config Field bandwidth_limit_limit
+                        required: false
+                        type: str
+                    bandwidth_limit_name:
+                        description:
+                        - The HTTP Request Rule Config Field bandwidth_limit_name
+                        required: false
+                        type: str
+                    bandwidth_limit_period:
+                        description:
+                        - The HTTP Request Rule Config Field bandwidth_limit_period
+                        required: false
+                        type: str
+                    capture_id:
+                        description:
+                        - The HTTP Request Rule Config Field capture_id
+                        required: false
+                        type: int
+                    capture_len:
+                        description:
+                        - The HTTP Request Rule Config Field capture_len
+                        required: false
+                        type: int
+                    capture_sample:
+                        description:
+                        - The HTTP Request Rule Config Field capture_sample
+                        required: false
+                        type: str
+                    cond:
+                        description:
+                        - The HTTP Request Rule Config Field cond
+                        required: false
+                        type: str
+                        choices: ['IF', 'UNLESS']
+                    cond_test:
+                        description:
+                        - The HTTP Request Rule Config Field cond_test
+                        required: false
+                        type: str
+                    deny_status:
+                        description:
+                        - The HTTP Request Rule Config Field deny_status
+                        required: false
+                        type: int
+                    expr:
+                        description:
+                        - The HTTP Request Rule Config Field expr
+                        required: false
+                        type: str
+                    hdr_format:
+                        description:
+                        - The HTTP Request Rule Config Field hdr_format
+                        required: false
+                        type: str
+                    hdr_match:
+                        description:
+                        - The HTTP Request Rule Config Field hdr_match
+                        required: false
+                        type: str
+                    hdr_method:
+                        description:
+                        - The HTTP Request Rule Config Field hdr_method
+                        required: false
+                        type: str
+                    hdr_name:
+                        description:
+                        - The HTTP Request Rule Config Field hdr_name
+                        required: false
+                        type: str
+                    hint_format:
+                        description:
+                        - The HTTP Request Rule Config Field hint_format
+                        required: false
+                        type: str
+                    hint_name:
+                        description:
+                        - The HTTP Request Rule Config Field hint_name
+                        required: false
+                        type: str
+                    log_level:
+                        description:
+                        - The HTTP Request Rule Config Field log_level
+                        required: false
+                        type: str
+                        choices: ['EMERG', 'ALERT', 'CRIT', 'ERR', 'WARNING', 'NOTICE', 'INFO', 'DEBUG', 'SILENT']
+                    lua_action:
+                        description:
+                        - The HTTP Request Rule Config Field lua_action
+                        required: false
+                        type: str
+                    lua_params:
+                        description:
+                        - The HTTP Request Rule Config Field lua_params
+                        required: false
+                        type: str
+                    map_file:
+                        description:
+                        - The HTTP Request Rule Config Field map_file
+                        required: false
+                        type: str
+                    map_keyfmt:
+                        description:
+                        - The HTTP Request Rule Config Field map_keyfmt
+                        required: false
+                        type: str
+                    map_valuefmt:
+                        description:
+                        - The HTTP Request Rule Config Field map_valuefmt
+                        required: false
+                        type: str
+                    mark_value:
+                        description:
+                        - The HTTP Request Rule Config Field mark_value
+                        required: false
+                        type: str
+                    method_fmt:
+                        description:
+                        - The HTTP Request Rule Config Field method_fmt
+                        required: false
+                        type: str
+                    nice_value:
+                        description:
+                        - The HTTP Request Rule Config Field nice_value
+                        required: false
+                        type: int
+                    normalizer:
+                        description:
+                        - The HTTP Request Rule Config Field normalizer
+                        required: false
+                        type: str
+                        choices: [
+                            'FRAGMENT_ENCODE', 'FRAGMENT_STRIP', 'PATH_MERGE_SLASHES', 'PATH_STRIP_DOT', 'PATH_STRIP_DOTDOT',
+                            'PERCENT_DECODE_UNRESERVED', 'PERCENT_TO_UPPERCASE', 'QUERY_SORT_BY_NAME'
+                        ]
+                    normalizer_full:
+                        description:
+                        - The HTTP Request Rule Config Field normalizer_full
+                        required: false
+                        type: bool
+                    normalizer_strict:
+                        description:
+                        - The HTTP Request Rule Config Field normalizer_strict
+                        required: false
+                        type: bool
+                    path_fmt:
+                        description:
+                        - The HTTP Request Rule Config Field path_fmt
+                        required: false
+                        type: str
+                    path_match:
+                        description:
+                        - The HTTP Request Rule Config Field path_match
+                        required: false
+                        type: str
+                    protocol:
+                        description:
+                        - The HTTP Request Rule Config Field protocol
+                        required: false
+                        type: str
+                        choices: ['IPV4', 'IPV6']
+                    redir_code:
+                        description:
+                        - The HTTP Request Rule Config Field redir_code
+                        required: false
+                        type: int
+                    redir_option:
+                        description:
+                        - The HTTP Request Rule Config Field redir_option
+                        required: false
+                        type: str
+                    redir_type:
+                        description:
+                        - The HTTP Request Rule Config Field redir_type
+                        required: false
+                        type: str
+                        choices: ['LOCATION', 'PREFIX', 'SCHEME']
+                    redir_value:
+                        description:
+                        - The HTTP Request Rule Config Field redir_value
+                        required: false
+                        type: str
+                    resolvers:
+                        description:
+                        - The HTTP Request Rule Config Field resolvers
+                        required: false
+                        type: str
+                    return_content:
+                        description:
+                        - The HTTP Request Rule Config Field return_content
+                        required: false
+                        type: str
+                    return_content_type:
+                        description:
+                        - The HTTP Request Rule Config Field return_content_type
+                        required: false
+                        type: str
+                    return_status_code:
+                        description:
+                        - The HTTP Request Rule Config Field return_status_code
+                        required: false
+                        type: int
+    frontends:
+        description:
+        - The requested Frontends
+        - Each item takes the Frontend options of the M(kube_cloud.haproxy.frontend) module, with the Binds, the ACLs,
+          the HTTP Request Rules and the Backend Switching Rules of the Frontend
+        required: false
+        default: []
+        type: list
+        elements: dict
+        suboptions:
+            name:
+                description:
+                - The HA Proxy Frontend Name
+                required: true
+                type: str
+            mode:
+                description:
+                - The HA Proxy Frontend Mode
+                required: false
+                default: 'HTTP'
+                type: str
+                choices: ['HTTP', 'TCP']
+            default_backend:
+                description:
+                - The HA Proxy Frontend Default Backend
+                required: false
+                type: str
+            log_format:
+                description:
+                - The HA Proxy Frontend Log Format
+                required: false
+                type: str
+            description:
+                description:
+                - The HA Proxy Frontend Description
+                required: false
+                type: str
+            log_format_sd:
+                description:
+                - The HA Proxy Frontend  Log Format SD
+                required: false
+                type: str
+            log_tag:
+                description:
+                - The HA Proxy Frontend  Log TAG
+                required: false
+                type: str
+            logsap:
+                description:
+                - The HA Proxy Frontend  Log SAP
+                required: false
+                type: str
+                choices: ['enabled', 'disabled']
+            maxconn:
+                description:
+                - The HA Proxy Frontend  Max Connexion
+                required: false
+                type: int
+            enabled:
+                description:
+                - The HA Proxy Frontend Enabled
+                required: false
+                type: bool
+            httplog:
+                description:
+                - The HA Proxy Frontend HTTP Log Enabled Flag
+                required: false
+                type: bool
+            httpslog:
+                description:
+                - The HA Proxy Frontend HTTPS Log Enabled Flag
+                required: false
+                type: str
+            error_log_format:
+                description:
+                - The HA Proxy Frontend Error Log Format
+                required: false
+                type: str
+            forwardfor:
+                description:
+                - The HA Proxy Frontend Forwarded For
+                required: false
+                type: dict
+            binds:
+                description:
+                - The Binds of the Frontend
+                required: false
+                type: list
+                elements: dict
+                suboptions:
+                    name:
+                        description:
+                        - The HA Proxy Bind Name
+                        required: true
+                        type: str
+                    address:
+                        description:
+                        - The HA Proxy Bind Address
+                        required: false
+                        type: str
+                    port:
+                        description:
+                        - The HA Proxy Bind Port
+                        required: false
+                        type: int
+                    maxconn:
+                        description:
+                        - The HA Proxy Bind Maxconn
+                        required: false
+                        type: int
+                    ssl:
+                        description:
+                        - The HA Proxy Bind ssl
+                        required: false
+                        type: bool
+                    ssl_cafile:
+                        description:
+                        - The HA Proxy Bind ssl ca file
+                        required: false
+                        type: str
+                    ssl_certificate:
+                        description:
+                        - The HA Proxy Bind ssl certificate
+                        required: false
+                        type: str
+                    strict_sni:
+                        description:
+                        - The HA Proxy Bind ssl srting sni
+                        required: false
+                        type: bool
+                    tcp_user_timeout:
+                        description:
+                        - The HA Proxy Bind tcp user timeout
+                        required: false
+                        type: int
+                    tfo:
+                        description:
+                        - The HA Proxy Bind tfo
+                        required: false
+                        type: bool
+                    thread:
+                        description:
+                        - The HA Proxy Bind thread
+                        required: false
+                        type: str
+                    tls_ticket_keys:
+                        description:
+                        - The HA Proxy Bind tls_ticket_keys
+                        required: false
+                        type: str
+                    transparent:
+                        description:
+                        - The HA Proxy Bind transparent
+                        required: false
+                        type: bool
+                    uid:
+                        description:
+                        - The HA Proxy Bind uid
+                        required: false
+                        type: str
+                    user:
+                        description:
+                        - The HA Proxy Bind user
+                        required: false
+                        type: str
+                    v4v6:
+                        description:
+                        - The HA Proxy Bind v4v6
+                        required: false
+                        type: bool
+                    v6only:
+                        description:
+                        - The HA Proxy Bind v6only
+                        required: false
+                        type: bool
+                    no_alpn:
+                        description:
+                        - The HA Proxy Bind no_alpn
+                        required: false
+                        type: bool
+                    no_ca_names:
+                        description:
+                        - The HA Proxy Bind no_ca_names
+                        required: false
+                        type: bool
+                    no_sslv3:
+                        description:
+                        - The HA Proxy Bind no_sslv3
+                        required: false
+                        type: bool
+                    no_tls_tickets:
+                        description:
+                        - The HA Proxy Bind no_tls_tickets
+                        required: false
+                        type: bool
+                    no_tlsv10:
+                        description:
+                        - The HA Proxy Bind no_tlsv10
+                        required: false
+                        type: bool
+                    no_tlsv11:
+                        description:
+                        - The HA Proxy Bind no_tlsv11
+                        required: false
+                        type: bool
+                    no_tlsv12:
+                        description:
+                        - The HA Proxy Bind no_tlsv12
+                        required: false
+                        type: bool
+                    no_tlsv13:
+                        description:
+                        - The HA Proxy Bind no_tlsv13
+                        required: false
+                        type: bool
+                    force_sslv3:
+                        description:
+                        - The HA Proxy Bind force_sslv3
+                        required: false
+                        type: bool
+                    force_tlsv10:
+                        description:
+                        - The HA Proxy Bind force_tlsv10
+                        required: false
+                        type: bool
+                    force_tlsv11:
+                        description:
+                        - The HA Proxy Bind force_tlsv11
+                        required: false
+                        type: bool
+                    force_tlsv12:
+                        description:
+                        - The HA Proxy Bind force_tlsv12
+                        required: false
+                        type: bool
+                    force_tlsv13:
+                        description:
+                        - The HA Proxy Bind force_tlsv13
+                        required: false
+                        type: bool
+                    generate_certificates:
+                        description:
+                        - The HA Proxy Bind generate_certificates
+                        required: false
+                        type: bool
+                    crt_list:
+                        description:
+                        - The HA Proxy Bind crt_list
+                        required: false
+                        type: str
+                    ca_ignore_err:
+                        description:
+                        - The HA Proxy Bind ca_ignore_err
+                        required: false
+                        type: str
+                    ca_sign_file:
+                        description:
+                        - The HA Proxy Bind ca_sign_file
+                        required: false
+                        type: str
+                    ca_sign_pass:
+                        description:
+                        - The HA Proxy Bind ca_sign_pass
+                        required: false
+                        type: str
+                    ca_verify_file:
+                        description:
+                        - The HA Proxy Bind ca_verify_file
+                        required: false
+                        type: str
+                    ciphers:
+                        description:
+                        - The HA Proxy Bind ciphers
+                        required: false
+                        type: str
+                    ciphersuites:
+                        description:
+                        - The HA Proxy Bind ciphersuites
+                        required: false
+                        type: str
+                    client_sigalgs:
+                        description:
+                        - The HA Proxy Bind client_sigalgs
+                        required: false
+                        type: str
+                    crl_file:
+                        description:
+                        - The HA Proxy Bind crl_file
+                        required: false
+                        type: str
+                    crt_ignore_err:
+                        description:
+                        - The HA Proxy Bind crt_ignore_err
+                        required: false
+                        type: str
+                    curves:
+                        description:
+                        - The HA Proxy Bind curves
+                        required: false
+                        type: str
+                    defer_accept:
+                        description:
+                        - The HA Proxy Bind defer_accept
+                        required: false
+                        type: str
+                    accept_proxy:
+                        description:
+                        - The HA Proxy Bind accept_proxy
+                        required: false
+                        type: bool
+                    allow_0rtt:
+                        description:
+                        - The HA Proxy Bind allow_0rtt
+                        required: false
+                        type: bool
+                    alpn:
+                        description:
+                        - The HA Proxy Bind alpn
+                        required: false
+                        type: str
+                    verify:
+                        description:
+                        - The HA Proxy Bind SSL Verify
+                        required: false
+                        type: str
+                        choices: ['none', 'required', 'optional']
+                    ssl_max_ver:
+                        description:
+                        - The HA Proxy Bind ssl max version
+                        required: false
+                        type: str
+                        choices: ['SSLv3', 'TLSv1.0', 'TLSv1.1', 'TLSv1.2', 'TLSv1.3']
+                    ssl_min_ver:
+                        description:
+                        - The HA Proxy Bind ssl min version
+                        required: false
+                        type: str
+                        choices: ['SSLv3', 'TLSv1.0', 'TLSv1.1', 'TLSv1.2', 'TLSv1.3']
+                    level:
+                        description:
+                        - The HA Proxy Bind level
+                        required: false
+                        type: str
+                        choices: ['user', 'operator', 'admin']
+            acls:
+                description:
+                - The full ordered list of ACLs of the Frontend
+                required: false
+                type: list
+                elements: dict
+                suboptions:
+                    acl_name:
+                        description:
+                        - The ACL Name
+                        required: true
+                        type: str
+                    criterion:
+                        description:
+                        - The ACL Criterion
+                        required: true
+                        type: str
+                    value:
+                        description:
+                        - The ACL Value
+                        required: false
+                        type: str
+            http_request_rules:
+                description:
+                - The full ordered list of HTTP Request Rules of the Frontend
+                required: false
+                type: list
+                elements: dict
+                suboptions:
+                    type:
+                        description:
+                        - The HTTP Request Rule Config Field type
+                        required: true
+                        type: str
+                        choices: [
+                            'ADD_ACL', 'ADD_HEADER', 'ALLOW', 'AUTH', 'CACHE_USE', 'CAPTURE', 'DEL_ACL', 'DEL_HEADER',
+                            'DEL_MAP', 'DENY', 'DISABLE_L7_RETRY', 'DO_RESOLVE', 'EARLY_HINT', 'LUA', 'NORMALIZE_URI',
+                            'REDIRECT', 'REJECT', 'REPLACE_HEADER', 'REPLACE_PATH', 'REPLACE_PATHQ', 'REPLACE_URI',
+                            'REPLACE_VALUE', 'RETURN', 'SC_ADD_GPC', 'SC_INC_GPC', 'SC_INC_GPC0', 'SC_INC_GPC1', 'SC_SET_GPT0',
+                            'SEND_SPOE_GROUP', 'SET_DST', 'SET_DST_PORT', 'SET_HEADER', 'SET_LOG_LEVEL', 'SET_MAP', 'SET_MARK',
+                            'SET_METHOD', 'SET_NICE', 'SET_PATH', 'SET_PATHQ', 'SET_PRIORITY_CLASS', 'SET_PRIORITY_OFFSET',
+                            'SET_QUERY', 'SET_SRC', 'SET_SRC_PORT', 'SET_TIMEOUT', 'SET_TOS', 'SET_URI', 'SET_VAR',
+                            'SILENT_DROP', 'STRICT_MODE', 'TARPIT', 'TRACK_SC0', 'TRACK_SC1', 'TRACK_SC2', 'UNSET_VAR',
+                            'USE_SERVICE', 'WAIT_FOR_BODY', 'WAIT_FOR_HANDSHAKE', 'SET_BANDWIDTH_LIMIT'
+                        ]
+                    acl_file:
+                        description:
+                        - The HTTP Request Rule Config Field acl_file
+                        required: false
+                        type: str
+                    acl_keyfmt:
+                        description:
+                        - The HTTP Request Rule Config Field acl_keyfmt
+                        required: false
+                        type: str
+                    auth_realm:
+                        description:
+                        - The HTTP Request Rule Config Field auth_realm
+                        required: false
+                        type: str
+                    bandwidth_limit_limit:
+                        description:
+                        - The HTTP Request Rule Config Field bandwidth_limit_limit
+                        required: false
+                        type: str
+                    bandwidth_limit_name:
+                        description:
+                        - The HTTP Request Rule Config Field bandwidth_limit_name
+                        required: false
+                        type: str
+                    bandwidth_limit_period:
+                        description:
+                        - The HTTP Request Rule Config Field bandwidth_limit_period
+                        required: false
+                        type: str
+                    capture_id:
+                        description:
+                        - The HTTP Request Rule Config Field capture_id
+                        required: false
+                        type: int
+                    capture_len:
+                        description:
+                        - The HTTP Request Rule Config Field capture_len
+                        required: false
+                        type: int
+                    capture_sample:
+                        description:
+                        - The HTTP Request Rule Config Field capture_sample
+                        required: false
+                        type: str
+                    cond:
+                        description:
+                        - The HTTP Request Rule Config Field cond
+                        required: false
+                        type: str
+                        choices: ['IF', 'UNLESS']
+                    cond_test:
+                        description:
+                        - The HTTP Request Rule Config Field cond_test
+                        required: false
+                        type: str
+                    deny_status:
+                        description:
+                        - The HTTP Request Rule Config Field deny_status
+                        required: false
+                        type: int
+                    expr:
+                        description:
+                        - The HTTP Request Rule Config Field expr
+                        required: false
+                        type: str
+                    hdr_format:
+                        description:
+                        - The HTTP Request Rule Config Field hdr_format
+                        required: false
+                        type: str
+                    hdr_match:
+                        description:
+                        - The HTTP Request Rule Config Field hdr_match
+                        required: false
+                        type: str
+                    hdr_method:
+                        description:
+                        - The HTTP Request Rule Config Field hdr_method
+                        required: false
+                        type: str
+                    hdr_name:
+                        description:
+                        - The HTTP Request Rule Config Field hdr_name
+                        required: false
+                        type: str
+                    hint_format:
+                        description:
+                        - The HTTP Request Rule Config Field hint_format
+                        required: false
+                        type: str
+                    hint_name:
+                        description:
+                        - The HTTP Request Rule Config Field hint_name
+                        required: false
+                        type: str
+                    log_level:
+                        description:
+                        - The HTTP Request Rule Config Field log_level
+                        required: false
+                        type: str
+                        choices: ['EMERG', 'ALERT', 'CRIT', 'ERR', 'WARNING', 'NOTICE', 'INFO', 'DEBUG', 'SILENT']
+                    lua_action:
+                        description:
+                        - The HTTP Request Rule Config Field lua_action
+                        required: false
+                        type: str
+                    lua_params:
+                        description:
+                        - The HTTP Request Rule Config Field lua_params
+                        required: false
+                        type: str
+                    map_file:
+                        description:
+                        - The HTTP Request Rule Config Field map_file
+                        required: false
+                        type: str
+                    map_keyfmt:
+                        description:
+                        - The HTTP Request Rule Config Field map_keyfmt
+                        required: false
+                        type: str
+                    map_valuefmt:
+                        description:
+                        - The HTTP Request Rule Config Field map_valuefmt
+                        required: false
+                        type: str
+                    mark_value:
+                        description:
+                        - The HTTP Request Rule Config Field mark_value
+                        required: false
+                        type: str
+                    method_fmt:
+                        description:
+                        - The HTTP Request Rule Config Field method_fmt
+                        required: false
+                        type: str
+                    nice_value:
+                        description:
+                        - The HTTP Request Rule Config Field nice_value
+                        required: false
+                        type: int
+                    normalizer:
+                        description:
+                        - The HTTP Request Rule Config Field normalizer
+                        required: false
+                        type: str
+                        choices: [
+                            'FRAGMENT_ENCODE', 'FRAGMENT_STRIP', 'PATH_MERGE_SLASHES', 'PATH_STRIP_DOT', 'PATH_STRIP_DOTDOT',
+                            'PERCENT_DECODE_UNRESERVED', 'PERCENT_TO_UPPERCASE', 'QUERY_SORT_BY_NAME'
+                        ]
+                    normalizer_full:
+                        description:
+                        - The HTTP Request Rule Config Field normalizer_full
+                        required: false
+                        type: bool
+                    normalizer_strict:
+                        description:
+                        - The HTTP Request Rule Config Field normalizer_strict
+                        required: false
+                        type: bool
+                    path_fmt:
+                        description:
+                        - The HTTP Request Rule Config Field path_fmt
+                        required: false
+                        type: str
+                    path_match:
+                        description:
+                        - The HTTP Request Rule Config Field path_match
+                        required: false
+                        type: str
+                    protocol:
+                        description:
+                        - The HTTP Request Rule Config Field protocol
+                        required: false
+                        type: str
+                        choices: ['IPV4', 'IPV6']
+                    redir_code:
+                        description:
+                        - The HTTP Request Rule Config Field redir_code
+                        required: false
+                        type: int
+                    redir_option:
+                        description:
+                        - The HTTP Request Rule Config Field redir_option
+                        required: false
+                        type: str
+                    redir_type:
+                        description:
+                        - The HTTP Request Rule Config Field redir_type
+                        required: false
+                        type: str
+                        choices: ['LOCATION', 'PREFIX', 'SCHEME']
+                    redir_value:
+                        description:
+                        - The HTTP Request Rule Config Field redir_value
+                        required: false
+                        type: str
+                    resolvers:
+                        description:
+                        - The HTTP Request Rule Config Field resolvers
+                        required: false
+                        type: str
+                    return_content:
+                        description:
+                        - The HTTP Request Rule Config Field return_content
+                        required: false
+                        type: str
+                    return_content_type:
+                        description:
+                        - The HTTP Request Rule Config Field return_content_type
+                        required: false
+                        type: str
+                    return_status_code:
+                        description:
+                        - The HTTP Request Rule Config Field return_status_code
+                        required: false
+                        type: int
+            backend_switching_rules:
+                description:
+                - The full ordered list of Backend Switching Rules of the Frontend
+                required: false
+                type: list
+                elements: dict
+                suboptions:
+                    name:
+                        description:
+                        - The Backend Switching Rule Name (the Backend)
+                        required: true
+                        type: str
+                    cond:
+                        description:
+                        - The Backend Switching Rule Condition Type
+                        required: false
+                        type: str
+                        choices: ['if', 'unless']
+                    cond_test:
+                        description:
+                        - The Backend Switching Rule Condition
+                        required: false
+                        type: str
+notes:
+  - In check mode, the changes are computed and returned, but not applied, and the plan file is not written
+  - With O(mode=apply_plan) in check mode, the plan changes are returned once the Configuration Version is checked
+'''
+
+EXAMPLES = r'''
+- name: "Manage HA Proxy Configuration"
+  kube_cloud.haproxy.haproxy_config:
+    base_url: "http://localhost:5555"
+    username: "admin"
+    password: "admin"
+    max_parallel: 20
+    purge: true
+    backends:
+      - name: "app"
+        mode: "HTTP"
+        balance:
+          algorithm: "ROUNDROBIN"
+        servers:
+          - name: "app1"
+            address: "10.0.0.1"
+            port: 8080
+          - name: "app2"
+            address: "10.0.0.2"
+            port: 8080
+      - name: "api"
+        mode: "HTTP"
+        servers:
+          - name: "api1"
+            address: "10.0.1.1"
+            port: 9090
+    frontends:
+      - name: "www"
+        mode: "HTTP"
+        default_backend: "app"
+        binds:
+          - name: "http"
+            address: "0.0.0.0"
+            port: 80
+        acls:
+          - acl_name: "is_api"
+            criterion: "path_beg"
+            value: "/api"
+        http_request_rules:
+          - type: "SET_HEADER"
+            hdr_name: "X-Forwarded-Proto"
+            hdr_format: "http"
+        backend_switching_rules:
+          - name: "api"
+            cond: "if"
+            cond_test: "is_api"
+
+- name: "Compute the HA Proxy Configuration Plan of each Node (Off-Peak)"
+  kube_cloud.haproxy.haproxy_config:
+    base_url: "http://{{ inventory_hostname }}:5555"
+    username: "admin"
+    password: "admin"
+    mode: "plan"
+    plan_file: "plans/{{ inventory_hostname }}.json"
+    backends: "{{ haproxy_backends }}"
+    frontends: "{{ haproxy_frontends }}"
+  delegate_to: localhost
+
+- name: "Apply the HA Proxy Configuration Plan of each Node (Change Window)"
+  kube_cloud.haproxy.haproxy_config:
+    base_url: "http://{{ inventory_hostname }}:5555"
+    username: "admin"
+    password: "admin"
+    mode: "apply_plan"
+    plan_file: "plans/{{ inventory_hostname }}.json"
+  delegate_to: localhost
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+from ..module_utils.haproxy import Client, haproxy_client
+from ..module_utils.metrics import request_metrics
+from ..module_utils.config_plan import plan_configuration, apply_plan, check_plan_version, read_plan, write_plan
+from ..module_utils.builders import build_requested_backend, build_requested_frontend, build_requested_server, build_requested_bind
+from ..module_utils.builders import build_requested_acls, build_requested_http_request_rules, build_requested_backend_switching_rules
+from ..module_utils.builders import build_backend_specification, build_frontend_specification, build_server_specification
+from ..module_utils.builders import build_bind_specification, build_acl_specification, build_http_request_rule_specification
+from ..module_utils.builders import build_backend_switching_rule_specification
+
+try:
+    from requests import HTTPError  # type: ignore
+    IMPORTS_OK = True
+except ImportError:
+    IMPORTS_OK = False
+
+
+# Child Options of each Parent Kind (Option Name, Child Kind)
+CHILD_OPTIONS = {
+    'backend': (
+        ('servers', 'server'),
+        ('acls', 'acl'),
+        ('http_request_rules', 'http_request_rule')
+    ),
+    'frontend': (
+        ('binds', 'bind'),
+        ('acls', 'acl'),
+        ('http_request_rules', 'http_request_rule'),
+        ('backend_switching_rules', 'backend_switching_rule')
+    )
+}
+
+
+# Build the Fields Arguments Specification of a Child Kind (Children List Entries)
+def build_child_specification(child_kind: str):
+
+    # Return Child Fields Specification
+    if child_kind == 'server':
+        return build_server_specification()
+    elif child_kind == 'bind':
+        return build_bind_specification()
+    elif child_kind == 'acl':
+        return build_acl_specification()
+    elif child_kind == 'http_request_rule':
+        return build_http_request_rule_specification(entry=True)
+    else:
+        return build_backend_switching_rule_specification()
+
+
+# Build the Arguments Specification of a Parent Kind (Parents List Entries, with their Children Lists)
+def build_parent_specification(kind: str):
+
+    # Parent Fields Specification
+    specification = build_backend_specification() if kind == 'backend' else build_frontend_specification()
+
+    # Add Children Lists Specification
+    for option, child_kind in CHILD_OPTIONS[kind]:
+        specification[option] = dict(type='list', elements='dict', required=False, options=build_child_specification(child_kind))
+
+    # Return Parent Specification
+    return specification
+
+
+# Build a Requested Parent (Backend or Frontend) and its Children from Configuration
+def build_requested_parent(module: AnsibleModule, kind: str, params: dict):
+
+    # Requested Children (only the Provided Kinds)
+    children = {}
+
+    # Iterate on Child Options
+    for option, child_kind in CHILD_OPTIONS[kind]:
+
+        # If Children are not Provided
+        if params.get(option) is None:
+            continue
+
+        # Build Requested Children
+        if child_kind == 'server':
+            children[child_kind] = {entry['name']: build_requested_server(entry) for entry in params[option]}
+        elif child_kind == 'bind':
+            children[child_kind] = {entry['name']: build_requested_bind(entry) for entry in params[option]}
+        elif child_kind == 'acl':
+            children[child_kind] = build_requested_acls(params[option])
+        elif child_kind == 'http_request_rule':
+            children[child_kind] = build_requested_http_request_rules(params[option])
+        else:
+            children[child_kind] = build_requested_backend_switching_rules(params[option])
+
+        # If Children Names are Duplicated
+        if child_kind in ('server', 'bind') and len(children[child_kind]) != len(params[option]):
+
+            # Set Module Error
+            module.fail_json(
+                msg="[Build Configuration] - {0} '{1}' defines a {2} more than once".format(kind, params['name'], child_kind)
+            )
+
+    # Build Requested Parent
+    instance = build_requested_backend(params) if kind == 'backend' else build_requested_frontend(params)
+
+    # Return Requested Parent
+    return dict(kind=kind, instance=instance, children=children)
+
+
+# Build the Requested Configuration
+def build_requested_configuration(module: AnsibleModule):
+
+    # Requested Parents
+    parents = []
+
+    try:
+
+        # Iterate on Requested Backends and Frontends
+        for kind, option in (('backend', 'backends'), ('frontend', 'frontends')):
+            for params in module.params[option]:
+                parents.append(build_requested_parent(module, kind, params))
+
+    except (ValueError, TypeError, AttributeError) as error:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Build Configuration] - Invalid HA Proxy Configuration : {0}".format(error)
+        )
+
+    # Names of the Requested Parents (by Kind)
+    names = [(parent['kind'], parent['instance'].name) for parent in parents]
+
+    # If a Parent is Duplicated
+    if len(set(names)) != len(names):
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Build Configuration] - Backends and Frontends must be defined once : {0}".format(
+                ', '.join(sorted(set('{0} {1}'.format(*name) for name in names if names.count(name) > 1)))
+            )
+        )
+
+    # Return Requested Parents
+    return parents
+
+
+# Compute the Configuration Changes
+def plan_changes(module: AnsibleModule, client: Client, parents: list):
+
+    try:
+
+        # Call Planner
+        return plan_configuration(
+            client=client,
+            parents=parents,
+            purge=module.params['purge'],
+            max_workers=module.params['max_parallel'],
+            transaction_id=provided_transaction_id(module)
+        )
+
+    except (HTTPError, ValueError) as error:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Plan Configuration] - Failed Get HA Proxy Configuration : {0}".format(error),
+            metrics=request_metrics(client)
+        )
+
+
+# Extract the Provided Transaction ID (None if not Provided)
+def provided_transaction_id(module: AnsibleModule):
+
+    # Extract Trasaction ID
+    transaction_id = module.params['transaction_id']
+
+    # Return Normalized Transaction ID
+    return transaction_id.strip() if transaction_id and transaction_id.strip() else None
+
+
+# Apply the Configuration Changes inside a single Transaction
+def apply_changes(module: AnsibleModule, client: Client, plan: dict, check_version: bool = False):
+
+    try:
+
+        # Apply Plan (Owned Transaction if none is Provided)
+        return apply_plan(
+            client=client,
+            plan=plan,
+            transaction_id=provided_transaction_id(module),
+            force_reload=module.params['force_reload'],
+            max_workers=module.params['max_parallel'],
+            check_version=check_version
+        )
+
+    except (HTTPError, ValueError) as error:
+
+        # Set Module Error (Owned Transaction is Cancelled by the Batch)
+        module.fail_json(
+            msg="[Apply Configuration] - Failed Apply HA Proxy Configuration : {0}".format(error),
+            changes=plan['changes'],
+            metrics=request_metrics(client)
+        )
+
+
+# Write the Plan File
+def write_plan_file(module: AnsibleModule, plan: dict):
+
+    try:
+
+        # Write Plan (Keyed by its Configuration Version)
+        write_plan(
+            path=module.params['plan_file'],
+            plan=plan,
+            base_url=module.params['base_url']
+        )
+
+    except OSError as error:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Write Plan] - Failed Write Plan File '{0}' : {1}".format(module.params['plan_file'], error)
+        )
+
+
+# Read the Plan File
+def read_plan_file(module: AnsibleModule):
+
+    try:
+
+        # Read Plan (Computed on the same Dataplane API)
+        return read_plan(
+            path=module.params['plan_file'],
+            base_url=module.params['base_url']
+        )
+
+    except (OSError, ValueError) as error:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Read Plan] - Failed Read Plan File '{0}' : {1}".format(module.params['plan_file'], error)
+        )
+
+
+# Check the Configuration Version of the Plan
+def check_version(module: AnsibleModule, client: Client, plan: dict):
+
+    try:
+
+        # Call Planner
+        check_plan_version(client=client, plan=plan)
+
+    except (HTTPError, ValueError) as error:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Check Plan] - Failed Check HA Proxy Configuration Plan : {0}".format(error),
+            changes=plan['changes'],
+            metrics=request_metrics(client)
+        )
+
+
+# Instantiate Ansible Module
+def build_ansible_module():
+
+    # Build Module Arguments Specification
+    module_specification = dict(
+        base_url=dict(type='str', required=True),
+        username=dict(type='str', required=True, no_log=True),
+        password=dict(type='str', required=True, no_log=True),
+        api_version=dict(type='str', required=False, default='v2'),
+        trace_file=dict(type='path', required=False),
+        snapshot_cache_dir=dict(type='path', required=False),
+        transaction_id=dict(type='str', required=False, default=''),
+        force_reload=dict(type='bool', required=False, default=True),
+        max_parallel=dict(type='int', required=False, default=10),
+        purge=dict(type='bool', required=False, default=False),
+        mode=dict(type='str', required=False, default='apply', choices=['apply', 'plan', 'apply_plan']),
+        plan_file=dict(type='path', required=False),
+        backends=dict(type='list', elements='dict', required=False, default=[], options=build_parent_specification('backend')),
+        frontends=dict(type='list', elements='dict', required=False, default=[], options=build_parent_specification('frontend'))
+    )
+
+    # Build ansible Module
+    return AnsibleModule(
+        argument_spec=module_specification,
+        required_if=[
+            ('mode', 'plan', ['plan_file']),
+            ('mode', 'apply_plan', ['plan_file'])
+        ],
+        supports_check_mode=True
+    )
+
+
+# Instantiate Ansible Module
+def build_client(module: AnsibleModule):
+
+    try:
+
+        # Build Client from Module
+        return haproxy_client(module.params)
+
+    except ValueError:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Build Client] - Failed Build HA Proxy Dataplane API Client"
+        )
+
+
+# Process Module Execution on a Plan File (Apply Plan Mode)
+def run_plan_file(module: AnsibleModule, client: Client):
+
+    # Read Plan File
+    plan = read_plan_file(module)
+
+    # Transaction ID (Provided one, or the Owned one once Applied)
+    transaction_id = provided_transaction_id(module)
+
+    # If in Check Mode
+    if module.check_mode:
+
+        # Check Configuration Version
+        check_version(module=module, client=client, plan=plan)
+
+    else:
+
+        # Apply Plan as is (Refused if the Configuration Version Moved)
+        transaction_id = apply_changes(module=module, client=client, plan=plan, check_version=True)
+
+    # Module Response
+    module.exit_json(
+        changed=bool(plan['operations']),
+        changes=plan['changes'],
+        transaction_id=transaction_id,
+        version=plan['version'],
+        plan_file=module.params['plan_file'],
+        msg="HA Proxy Configuration Plan Applied ({0} Changes, {1} Operations)".format(
+            len(plan['changes']),
+            len(plan['operations'])
+        ) if plan['operations'] else "HA Proxy Configuration Not Changed",
+        metrics=request_metrics(client)
+    )
+
+
+# Porcess Module Execution
+def run_module(module: AnsibleModule, client: Client):
+
+    # If a Plan File is Applied
+    if module.params['mode'] == 'apply_plan':
+
+        # Apply Plan File
+        return run_plan_file(module=module, client=client)
+
+    # Build Requested Configuration
+    parents = build_requested_configuration(module)
+
+    # Compute Changes (Single Configuration Snapshot)
+    plan = plan_changes(module=module, client=client, parents=parents)
+
+    # If the Plan is Written (Plan Mode)
+    if module.params['mode'] == 'plan':
+
+        # Write Plan File (not in Check Mode)
+        if not module.check_mode:
+            write_plan_file(module=module, plan=plan)
+
+        # Module Response (Changes Pending)
+        module.exit_json(
+            changed=bool(plan['operations']),
+            changes=plan['changes'],
+            diff=plan['diff'],
+            version=plan['version'],
+            plan_file=module.params['plan_file'],
+            msg="HA Proxy Configuration Plan Computed ({0} Changes, {1} Operations)".format(
+                len(plan['changes']),
+                len(plan['operations'])
+            ),
+            metrics=request_metrics(client)
+        )
+
+    # Transaction ID (Provided one, or the Owned one once Applied)
+    transaction_id = provided_transaction_id(module)
+
+    # If Changed and not in Check Mode
+    if plan['operations'] and not module.check_mode:
+
+        # Apply Changes (Single Transaction, Concurrent Dependency Levels)
+        transaction_id = apply_changes(module=module, client=client, plan=plan)
+
+    # Module Response
+    module.exit_json(
+        changed=bool(plan['operations']),
+        changes=plan['changes'],
+        diff=plan['diff'],
+        transaction_id=transaction_id,
+        version=plan['version'],
+        msg="HA Proxy Configuration Applied ({0} Changes, {1} Operations)".format(
+            len(plan['changes']),
+            len(plan['operations'])
+        ) if plan['operations'] else "HA Proxy Configuration Not Changed",
+        metrics=request_metrics(client)
+    )
+
+
+# Entrypoint Function
+def main():
+
+    # Build Module
+    module = build_ansible_module()
+
+    # Build Client from Module
+    client = build_client(module)
+
+    # Execute Module
+    run_module(module, client)
+
+
+# If file is executed directly
+if __name__ == '__main__':
+
+    # Launch Entrypoint
+    main()
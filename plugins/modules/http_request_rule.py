@@ -23,6 +23,7 @@ options:
     base_url:
         description:
             - The HA Proxy Dataplane API Base URL
+            - Or the Unix domain socket of the Dataplane API (V(unix:///var/run/data-plane.sock)), when the module runs on the HA Proxy host
         required: true
         type: str
     username:
@@ -41,6 +42,21 @@ options:
         required: false
         default: 'v2'
         type: str
+    trace_file:
+        description:
+            - The JSON lines file each Dataplane API request is appended to (on the host running the module)
+            - Each line holds the request method, URI template, status, bytes sent and received, and latency
+        required: false
+        type: path
+        version_added: "2.4.0"
+    snapshot_cache_dir:
+        description:
+            - The Configuration Snapshot cache directory (on the host running the module)
+            - If provided, the existing objects are looked up in a snapshot of their configuration section,
+              fetched once per Configuration Version and shared by all the tasks of the play
+        required: false
+        type: path
+        version_added: "2.4.0"
     transaction_id:
         description:
             - The Transaction ID
@@ -309,6 +325,259 @@ options:
             - The HTTP Request Rule Config Field return_status_code
         required: false
         type: int
+    rules:
+        description:
+            - The ordered list of all the HTTP Request Rules of the parent (list mode, instead of O(index))
+            - Each rule takes the HTTP Request Rule Config Fields above (O(type), O(cond), O(cond_test)...), except O(index)
+              (the position of the rule in the list)
+            - The existing rules are fetched once, and only the inserts, updates and deletes needed to match the list
+              are sent, in a single Transaction (the O(transaction_id) one, or a Transaction committed by the task)
+            - With O(state=absent), the listed rules are removed from the parent, and the other ones are kept in order
+        required: false
+        type: list
+        elements: dict
+        version_added: "2.4.0"
+        suboptions:
+            type:
+                description:
+                    - The HTTP Request Rule Config Field type
+                required: true
+                type: str
+                choices: [
+                    "ADD_ACL", "ADD_HEADER", "ALLOW", "AUTH", "CACHE_USE", "CAPTURE", "DEL_ACL", "DEL_HEADER",
+                    "DEL_MAP", "DENY", "DISABLE_L7_RETRY", "DO_RESOLVE", "EARLY_HINT", "LUA", "NORMALIZE_URI",
+                    "REDIRECT", "REJECT", "REPLACE_HEADER", "REPLACE_PATH", "REPLACE_PATHQ", "REPLACE_URI",
+                    "REPLACE_VALUE", "RETURN", "SC_ADD_GPC", "SC_INC_GPC", "SC_INC_GPC0", "SC_INC_GPC1",
+                    "SC_SET_GPT0", "SEND_SPOE_GROUP", "SET_DST", "SET_DST_PORT", "SET_HEADER", "SET_LOG_LEVEL",
+                    "SET_MAP", "SET_MARK", "SET_METHOD", "SET_NICE", "SET_PATH", "SET_PATHQ", "SET_PRIORITY_CLASS",
+                    "SET_PRIORITY_OFFSET", "SET_QUERY", "SET_SRC", "SET_SRC_PORT", "SET_TIMEOUT", "SET_TOS",
+                    "SET_URI", "SET_VAR", "SILENT_DROP", "STRICT_MODE", "TARPIT", "TRACK_SC0", "TRACK_SC1",
+                    "TRACK_SC2", "UNSET_VAR", "USE_SERVICE", "WAIT_FOR_BODY", "WAIT_FOR_HANDSHAKE", "SET_BANDWIDTH_LIMIT"
+                ]
+            acl_file:
+                description:
+                    - The HTTP Request Rule Config Field acl_file
+                required: false
+                type: str
+            acl_keyfmt:
+                description:
+                    - The HTTP Request Rule Config Field acl_keyfmt
+                required: false
+                type: str
+            auth_realm:
+                description:
+                    - The HTTP Request Rule Config Field auth_realm
+                required: false
+                type: str
+            bandwidth_limit_limit:
+                description:
+                    - The HTTP Request Rule Config Field bandwidth_limit_limit
+                required: false
+                type: str
+            bandwidth_limit_name:
+                description:
+                    - The HTTP Request Rule Config Field bandwidth_limit_name
+                required: false
+                type: str
+            bandwidth_limit_period:
+                description:
+                    - The HTTP Request Rule Config Field bandwidth_limit_period
+                required: false
+                type: str
+            capture_id:
+                description:
+                    - The HTTP Request Rule Config Field capture_id
+                required: false
+                type: int
+            capture_len:
+                description:
+                    - The HTTP Request Rule Config Field capture_len
+                required: false
+                type: int
+            capture_sample:
+                description:
+                    - The HTTP Request Rule Config Field capture_sample
+                required: false
+                type: str
+            cond:
+                description:
+                    - The HTTP Request Rule Config Field cond
+                required: false
+                type: str
+                choices: ["IF", "UNLESS"]
+            cond_test:
+                description:
+                    - The HTTP Request Rule Config Field cond_test
+                required: false
+                type: str
+            deny_status:
+                description:
+                    - The HTTP Request Rule Config Field deny_status
+                required: false
+                type: int
+            expr:
+                description:
+                    - The HTTP Request Rule Config Field expr
+                required: false
+                type: str
+            hdr_format:
+                description:
+                    - The HTTP Request Rule Config Field hdr_format
+                required: false
+                type: str
+            hdr_match:
+                description:
+                    - The HTTP Request Rule Config Field hdr_match
+                required: false
+                type: str
+            hdr_method:
+                description:
+                    - The HTTP Request Rule Config Field hdr_method
+                required: false
+                type: str
+            hdr_name:
+                description:
+                    - The HTTP Request Rule Config Field hdr_name
+                required: false
+                type: str
+            hint_format:
+                description:
+                    - The HTTP Request Rule Config Field hint_format
+                required: false
+                type: str
+            hint_name:
+                description:
+                    - The HTTP Request Rule Config Field hint_name
+                required: false
+                type: str
+            log_level:
+                description:
+                    - The HTTP Request Rule Config Field log_level
+                required: false
+                type: str
+                choices: [
+                    "EMERG", "ALERT", "CRIT", "ERR", "WARNING",
+                    "NOTICE", "INFO", "DEBUG", "SILENT"
+                ]
+            lua_action:
+                description:
+                    - The HTTP Request Rule Config Field lua_action
+                required: false
+                type: str
+            lua_params:
+                description:
+                    - The HTTP Request Rule Config Field lua_params
+                required: false
+                type: str
+            map_file:
+                description:
+                    - The HTTP Request Rule Config Field map_file
+                required: false
+                type: str
+            map_keyfmt:
+                description:
+                    - The HTTP Request Rule Config Field map_keyfmt
+                required: false
+                type: str
+            map_valuefmt:
+                description:
+                    - The HTTP Request Rule Config Field map_valuefmt
+                required: false
+                type: str
+            mark_value:
+                description:
+                    - The HTTP Request Rule Config Field mark_value
+                required: false
+                type: str
+            method_fmt:
+                description:
+                    - The HTTP Request Rule Config Field method_fmt
+                required: false
+                type: str
+            nice_value:
+                description:
+                    - The HTTP Request Rule Config Field nice_value
+                required: false
+                type: int
+            normalizer:
+                description:
+                    - The HTTP Request Rule Config Field normalizer
+                required: false
+                type: str
+                choices: [
+                    "FRAGMENT_ENCODE", "FRAGMENT_STRIP", "PATH_MERGE_SLASHES", "PATH_STRIP_DOT",
+                    "PATH_STRIP_DOTDOT", "PERCENT_DECODE_UNRESERVED", "PERCENT_TO_UPPERCASE",
+                    "QUERY_SORT_BY_NAME"
+                ]
+            normalizer_full:
+                description:
+                    - The HTTP Request Rule Config Field normalizer_full
+                required: false
+                type: bool
+            normalizer_strict:
+                description:
+                    - The HTTP Request Rule Config Field normalizer_strict
+                required: false
+                type: bool
+            path_fmt:
+                description:
+                    - The HTTP Request Rule Config Field path_fmt
+                required: false
+                type: str
+            path_match:
+                description:
+                    - The HTTP Request Rule Config Field path_match
+                required: false
+                type: str
+            protocol:
+                description:
+                    - The HTTP Request Rule Config Field protocol
+                required: false
+                type: str
+                choices: ["IPV4", "IPV6"]
+            redir_code:
+                description:
+                    - The HTTP Request Rule Config Field redir_code
+                required: false
+                type: int
+            redir_option:
+                description:
+                    - The HTTP Request Rule Config Field redir_option
+                required: false
+                type: str
+            redir_type:
+                description:
+                    - The HTTP Request Rule Config Field redir_type
+                required: false
+                type: str
+                choices: [
+                    "LOCATION", "PREFIX", "SCHEME"
+                ]
+            redir_value:
+                description:
+                    - The HTTP Request Rule Config Field redir_value
+                required: false
+                type: str
+            resolvers:
+                description:
+                    - The HTTP Request Rule Config Field resolvers
+                required: false
+                type: str
+            return_content:
+                description:
+                    - The HTTP Request Rule Config Field return_content
+                required: false
+                type: str
+            return_content_type:
+                description:
+                    - The HTTP Request Rule Config Field return_content_type
+                required: false
+                type: str
+            return_status_code:
+                description:
+                    - The HTTP Request Rule Config Field return_status_code
+                required: false
+                type: int
     state:
         description:
         - The Transaction State
@@ -346,15 +615,35 @@ EXAMPLES = r'''
     parent_name: "test_frontend"
     parent_type: "frontend"
     state: 'absent'
+
+- name: "Set all the HA Proxy HTTP Request Rules of a Frontend"
+  kube_cloud.haproxy.http_request_rule:
+    base_url: "http://localhost:5555"
+    username: "admin"
+    password: "admin"
+    parent_name: "test_frontend"
+    parent_type: "frontend"
+    rules:
+      - type: "DENY"
+        cond: "IF"
+        cond_test: "{ path /admin.php } !{ src 192.168.50.20/24 }"
+      - type: "REDIRECT"
+        redir_type: "SCHEME"
+        redir_value: "https"
+        cond: "UNLESS"
+        cond_test: "{ ssl_fc }"
+    state: 'present'
 '''
 
 from ansible.module_utils.basic import AnsibleModule
 from ..module_utils.client_http_request_rules import HttpRequestRuleClient
 from ..module_utils.models import HttpRequestRule
 from ..module_utils.haproxy import haproxy_client
+from ..module_utils.metrics import request_metrics
+from ..module_utils.builders import build_requested_http_request_rule, build_requested_http_request_rules
+from ..module_utils.builders import build_http_request_rule_specification
 from ..module_utils.commons import filter_none
-from ..module_utils.enums import HttpRequestRuleType, ConditionType, LogLevel
-from ..module_utils.enums import HttpRequestRuleNormalizerType, IPProtocol, RedirectType
+from ..module_utils.diff import compute_diff, build_diff, canonicalize
 
 try:
     from requests import HTTPError  # type: ignore
@@ -466,6 +755,36 @@ def delete_rule(module: AnsibleModule, client: HttpRequestRuleClient, transactio
         )
 
 
+# Reconcile Rules List
+def reconcile_rules(module: AnsibleModule, client: HttpRequestRuleClient, transaction_id: str,
+                    parent_name: str, parent_type: str, rules: list, force_reload: bool):
+
+    try:
+
+        # Call Client
+        return client.reconcile_rules(
+            rules=rules,
+            transaction_id=transaction_id,
+            parent_name=parent_name,
+            parent_type=parent_type,
+            force_reload=force_reload,
+            absent=module.params['state'] == 'absent',
+            check_mode=module.check_mode
+        )
+
+    except HTTPError as api_error:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Reconcile Rules] - Failed Reconcile HA Proxy HTTP Request Rules (Parent : {0}:{1}): {2}".format(
+                parent_name,
+                parent_type,
+                api_error
+            ),
+            metrics=request_metrics(client)
+        )
+
+
 # Instantiate Ansible Module
 def build_ansible_module():
 
@@ -475,60 +794,25 @@ def build_ansible_module():
         username=dict(type='str', required=True, no_log=True),
         password=dict(type='str', required=True, no_log=True),
         api_version=dict(type='str', required=False, default='v2'),
+        trace_file=dict(type='path', required=False),
+        snapshot_cache_dir=dict(type='path', required=False),
         transaction_id=dict(type='str', required=False, default=''),
         force_reload=dict(type='bool', required=False, default=True),
         parent_name=dict(type='str', required=True),
         parent_type=dict(type='str', required=True, choices=['frontend', 'backend']),
         index=dict(type='int', required=False),
-        type=dict(type='str', required=False, choices=HttpRequestRuleType.names()),
-        acl_file=dict(type='str', required=False),
-        acl_keyfmt=dict(type='str', required=False, no_log=True),
-        auth_realm=dict(type='str', required=False),
-        bandwidth_limit_limit=dict(type='str', required=False),
-        bandwidth_limit_name=dict(type='str', required=False),
-        bandwidth_limit_period=dict(type='str', required=False),
-        capture_id=dict(type='int', required=False),
-        capture_len=dict(type='int', required=False),
-        capture_sample=dict(type='str', required=False),
-        cond=dict(type='str', required=False, choices=ConditionType.names()),
-        cond_test=dict(type='str', required=False),
-        deny_status=dict(type='int', required=False),
-        expr=dict(type='str', required=False),
-        hdr_format=dict(type='str', required=False),
-        hdr_match=dict(type='str', required=False),
-        hdr_method=dict(type='str', required=False),
-        hdr_name=dict(type='str', required=False),
-        hint_format=dict(type='str', required=False),
-        hint_name=dict(type='str', required=False),
-        log_level=dict(type='str', required=False, choices=LogLevel.names()),
-        lua_action=dict(type='str', required=False),
-        lua_params=dict(type='str', required=False),
-        map_file=dict(type='str', required=False),
-        map_keyfmt=dict(type='str', required=False, no_log=True),
-        map_valuefmt=dict(type='str', required=False),
-        mark_value=dict(type='str', required=False),
-        method_fmt=dict(type='str', required=False),
-        nice_value=dict(type='int', required=False),
-        normalizer=dict(type='str', required=False, choices=HttpRequestRuleNormalizerType.names()),
-        normalizer_full=dict(type='bool', required=False),
-        normalizer_strict=dict(type='bool', required=False),
-        path_fmt=dict(type='str', required=False),
-        path_match=dict(type='str', required=False),
-        protocol=dict(type='str', required=False, choices=IPProtocol.names()),
-        redir_code=dict(type='int', required=False),
-        redir_option=dict(type='str', required=False),
-        redir_type=dict(type='str', required=False, choices=RedirectType.names()),
-        redir_value=dict(type='str', required=False),
-        resolvers=dict(type='str', required=False),
-        return_content=dict(type='str', required=False),
-        return_content_type=dict(type='str', required=False),
-        return_status_code=dict(type='int', required=False),
+        rules=dict(type='list', elements='dict', required=False, options=build_http_request_rule_specification(entry=True)),
         state=dict(type='str', required=False, default='present', choices=['present', 'absent'])
     )
 
+    # Add Http Request Rule Fields Specification
+    module_specification.update(build_http_request_rule_specification())
+
     # Build ansible Module
     return AnsibleModule(
         argument_spec=module_specification,
+        required_one_of=[('index', 'rules')],
+        mutually_exclusive=[('index', 'rules')],
         supports_check_mode=True
     )
 
@@ -549,38 +833,6 @@ def build_client(module: AnsibleModule):
         )
 
 
-# Build Requested Http Request Rule from Configuration
-def build_requested_rule(params: dict) -> HttpRequestRule:
-
-    # Base Parameters Name
-    base_param_names = [
-        "index", "acl_file", "acl_keyfmt", "auth_realm", "bandwidth_limit_limit",
-        "bandwidth_limit_name", "bandwidth_limit_period", "capture_id", "capture_len",
-        "capture_sample", "cond_test", "deny_status", "expr", "hdr_format", "hdr_match",
-        "hdr_method", "hdr_name", "hint_format", "hint_name", "lua_action", "lua_params",
-        "map_file", "map_keyfmt", "map_valuefmt", "mark_value", "method_fmt", "nice_value",
-        "normalizer_full", "normalizer_strict", "path_fmt", "path_match", "redir_code",
-        "redir_option", "redir_value", "resolvers", "return_content", "return_content_type",
-        "return_status_code"
-    ]
-
-    # Build Requested Instance
-    rule = HttpRequestRule(
-        **{k: v for k, v in params.items() if v is not None and k in base_param_names}
-    )
-
-    # Optional Initialization : mode
-    rule.type = HttpRequestRuleType.create(params.get('type', None))
-    rule.cond = ConditionType.create(params.get('cond', None))
-    rule.log_level = LogLevel.create(params.get('log_level', None))
-    rule.normalizer = HttpRequestRuleNormalizerType.create(params.get('normalizer', None))
-    rule.protocol = IPProtocol.create(params.get('protocol', None))
-    rule.redir_type = RedirectType.create(params.get('redir_type', None))
-
-    # Build Requested Instance
-    return rule
-
-
 # Porcess Module Execution
 def run_module(module: AnsibleModule, client: HttpRequestRuleClient):
 
@@ -599,8 +851,37 @@ def run_module(module: AnsibleModule, client: HttpRequestRuleClient):
     # Rule Parent Type
     parent_type = module.params['parent_type']
 
+    # If the Rules List is Provided (List Mode)
+    if module.params['rules'] is not None:
+
+        # Reconcile Rules List
+        outcome = reconcile_rules(
+            module=module,
+            client=client,
+            transaction_id=transaction_id,
+            parent_name=parent_name,
+            parent_type=parent_type,
+            rules=build_requested_http_request_rules(module.params['rules']),
+            force_reload=force_reload
+        )
+
+        # Module Response
+        module.exit_json(
+            operations=outcome['operations'],
+            diff=dict(before=canonicalize(outcome['before']), after=outcome['after']),
+            changed=bool(outcome['operations']),
+            parent_name=parent_name,
+            parent_type=parent_type,
+            msg="HTTP Request Rules [Parent : {0}/{1}] {2}".format(
+                parent_name,
+                parent_type,
+                "Have Been Reconciled ({0} Operations)".format(len(outcome['operations'])) if outcome['operations'] else "Not Changed"
+            ),
+            metrics=request_metrics(client)
+        )
+
     # Build Requested Instance
-    rule = build_requested_rule(module.params)
+    rule = build_requested_http_request_rule(module.params)
 
     # Find Existing Instance
     existing_instance = get_rule(
@@ -613,8 +894,11 @@ def run_module(module: AnsibleModule, client: HttpRequestRuleClient):
     # If Requested State is 'present' and Instance Already exists
     if existing_instance and state == 'present':
 
+        # Compute Changed Fields
+        changes = compute_diff(existing_instance, rule)
+
         # If Existing Instance match requested Instance
-        if existing_instance == rule:
+        if not changes:
 
             # Initialize response (No Change)
             module.exit_json(
@@ -623,23 +907,29 @@ def run_module(module: AnsibleModule, client: HttpRequestRuleClient):
                     parent_type,
                     rule.index
                 ),
-                changed=False
+                changed=False,
+                metrics=request_metrics(client)
             )
 
-        # Update Existing Instance
-        update_rule(
-            module=module,
-            client=client,
-            transaction_id=transaction_id,
-            rule=rule,
-            index=rule.index,
-            parent_name=parent_name,
-            parent_type=parent_type,
-            force_reload=force_reload
-        )
+        # If not in Check Mode
+        if not module.check_mode:
+
+            # Update Existing Instance
+            update_rule(
+                module=module,
+                client=client,
+                transaction_id=transaction_id,
+                rule=rule,
+                index=rule.index,
+                parent_name=parent_name,
+                parent_type=parent_type,
+                force_reload=force_reload
+            )
 
         # Module Response : Changed
         module.exit_json(
+            changes=changes,
+            diff=build_diff(existing_instance, rule),
             changed=True,
             instance=filter_none(rule),
             parent_name=parent_name,
@@ -648,25 +938,30 @@ def run_module(module: AnsibleModule, client: HttpRequestRuleClient):
                 parent_name,
                 parent_type,
                 rule.index
-            )
+            ),
+            metrics=request_metrics(client)
         )
 
     # If Requested State is 'present' and Instance don't exists
     if not existing_instance and state == 'present':
 
-        # Create Instance
-        create_rule(
-            module=module,
-            client=client,
-            transaction_id=transaction_id,
-            force_reload=force_reload,
-            parent_name=parent_name,
-            parent_type=parent_type,
-            rule=rule
-        )
+        # If not in Check Mode
+        if not module.check_mode:
+
+            # Create Instance
+            create_rule(
+                module=module,
+                client=client,
+                transaction_id=transaction_id,
+                force_reload=force_reload,
+                parent_name=parent_name,
+                parent_type=parent_type,
+                rule=rule
+            )
 
         # Initialize Module Response : Changed
         module.exit_json(
+            diff=build_diff(None, rule),
             changed=True,
             instance=filter_none(rule),
             parent_name=parent_name,
@@ -675,25 +970,30 @@ def run_module(module: AnsibleModule, client: HttpRequestRuleClient):
                 parent_name,
                 parent_type,
                 rule.index
-            )
+            ),
+            metrics=request_metrics(client)
         )
 
     # If Requested State is 'absent' and Instance exists
     if existing_instance and state == 'absent':
 
-        # Delete Instance
-        delete_rule(
-            module=module,
-            client=client,
-            transaction_id=transaction_id,
-            force_reload=force_reload,
-            index=rule.index,
-            parent_name=parent_name,
-            parent_type=parent_type
-        )
+        # If not in Check Mode
+        if not module.check_mode:
+
+            # Delete Instance
+            delete_rule(
+                module=module,
+                client=client,
+                transaction_id=transaction_id,
+                force_reload=force_reload,
+                index=rule.index,
+                parent_name=parent_name,
+                parent_type=parent_type
+            )
 
         # Exit Module
         module.exit_json(
+            diff=build_diff(existing_instance, None),
             changed=True,
             instance=rule,
             parent_name=parent_name,
@@ -702,7 +1002,8 @@ def run_module(module: AnsibleModule, client: HttpRequestRuleClient):
                 parent_name,
                 parent_type,
                 rule.index
-            )
+            ),
+            metrics=request_metrics(client)
         )
 
     # If Requested State is 'absent' and Instance don't exists
@@ -715,7 +1016,8 @@ def run_module(module: AnsibleModule, client: HttpRequestRuleClient):
                 parent_type,
                 rule.index
             ),
-            changed=False
+            changed=False,
+            metrics=request_metrics(client)
         )
 
 
@@ -0,0 +1,308 @@
+# (c) 2024, Jean-Jacques ETUNE NGI <jetune@kube-cloud.com>
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+
+DOCUMENTATION = '''
+---
+module: reload
+version_added: "2.4.0"
+short_description: Reload HA Proxy once, after deferred changes
+description:
+  - Used to apply the changes made without forced reload (O(force_reload=false)) with a single HA Proxy reload,
+    typically from a handler notified by the changing tasks, or at the end of the play
+  - Waits for the pending delayed reloads of the Dataplane API (or for a given reload ID), and optionally
+    forces an immediate reload first
+requirements:
+  - requests
+author: Jean-Jacques ETUNE NGI (@jetune) <jetune@kube-cloud.com>
+options:
+  base_url:
+    description:
+      - The HA Proxy Dataplane API Base URL
+      - Or the Unix domain socket of the Dataplane API (V(unix:///var/run/data-plane.sock)), when the module runs on the HA Proxy host
+    required: true
+    type: str
+  username:
+    description:
+      - The HA Proxy Dataplane API Admin Username
+    required: true
+    type: str
+  password:
+    description:
+      - The HA Proxy Dataplane API Password
+    required: true
+    type: str
+  api_version:
+    description:
+      - The HA Proxy Dataplane API Version
+    required: false
+    default: 'v2'
+    type: str
+  trace_file:
+    description:
+      - The JSON lines file each Dataplane API request is appended to (on the host running the module)
+      - Each line holds the request method, URI template, status, bytes sent and received, and latency
+    required: false
+    type: path
+  reload_id:
+    description:
+      - The ID of the reload to wait for (the C(metrics.reload_ids) of the changing tasks results)
+      - If not provided, all the pending reloads are waited for
+    required: false
+    type: str
+  force:
+    description:
+      - Force an immediate HA Proxy reload (an empty Transaction committed with forced reload),
+        instead of waiting for the Dataplane API reload delay
+    required: false
+    default: false
+    type: bool
+  wait:
+    description:
+      - Wait for the reloads to run, and fail if any of them failed
+    required: false
+    default: true
+    type: bool
+  wait_timeout:
+    description:
+      - The maximum time waiting for each reload, in seconds
+    required: false
+    default: 60
+    type: int
+  wait_interval:
+    description:
+      - The interval between two reload status polls, in seconds
+    required: false
+    default: 1.0
+    type: float
+notes:
+  - Set O(force_reload=false) on all the changing tasks at once with
+    C(module_defaults) and the C(group/kube_cloud.haproxy.haproxy) action group
+  - In check mode, the pending reloads are returned but neither forced nor waited for
+'''
+
+EXAMPLES = r'''
+- name: "Deploy Backends without Reload"
+  hosts: loadbalancers
+  module_defaults:
+    group/kube_cloud.haproxy.haproxy:
+      force_reload: false
+  tasks:
+    - name: "Add Server"
+      kube_cloud.haproxy.server:
+        base_url: "http://localhost:5555"
+        username: "admin"
+        password: "admin"
+        name: "web3"
+        parent_name: "app"
+        parent_type: "backend"
+        address: "10.0.0.3"
+        port: 8080
+      notify: "Reload HA Proxy"
+  handlers:
+    - name: "Reload HA Proxy"
+      kube_cloud.haproxy.reload:
+        base_url: "http://localhost:5555"
+        username: "admin"
+        password: "admin"
+        wait_timeout: 30
+
+- name: "Reload HA Proxy Now"
+  kube_cloud.haproxy.reload:
+    base_url: "http://localhost:5555"
+    username: "admin"
+    password: "admin"
+    force: true
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+from ..module_utils.haproxy import Client, haproxy_client
+from ..module_utils.metrics import request_metrics
+
+try:
+    from requests import HTTPError  # type: ignore
+    IMPORTS_OK = True
+except ImportError:
+    IMPORTS_OK = False
+
+
+# Get Pending Reloads
+def get_pending_reloads(module: AnsibleModule, client: Client):
+
+    try:
+
+        # Call Client
+        return client.reload.get_pending_reloads()
+
+    except HTTPError as api_error:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Get Reloads] - Failed Get HA Proxy Pending Reloads : {0}".format(api_error)
+        )
+
+
+# Force Reload (Empty Transaction Committed with Forced Reload)
+def force_reload(module: AnsibleModule, client: Client):
+
+    try:
+
+        # Commit an Empty Batch with Forced Reload (its Transaction is Cancelled if the Commit Fails)
+        with client.transaction.batch(force_reload=True):
+            pass
+
+    except HTTPError as api_error:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Force Reload] - Failed Force HA Proxy Reload : {0}".format(api_error),
+            metrics=request_metrics(client)
+        )
+
+
+# Wait for a Reload
+def wait_reload(module: AnsibleModule, client: Client, reload_id: str):
+
+    try:
+
+        # Call Client
+        return client.reload.wait_reload(
+            reload_id=reload_id,
+            timeout=module.params['wait_timeout'],
+            interval=module.params['wait_interval']
+        )
+
+    except (HTTPError, ValueError) as error:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Wait Reload] - Failed Wait HA Proxy Reload (ID : {0}) : {1}".format(reload_id, error),
+            metrics=request_metrics(client)
+        )
+
+
+# Instantiate Ansible Module
+def build_ansible_module():
+
+    # Build Module Arguments Specification
+    module_specification = dict(
+        base_url=dict(type='str', required=True),
+        username=dict(type='str', required=True, no_log=True),
+        password=dict(type='str', required=True, no_log=True),
+        api_version=dict(type='str', required=False, default='v2'),
+        trace_file=dict(type='path', required=False),
+        reload_id=dict(type='str', required=False),
+        force=dict(type='bool', required=False, default=False),
+        wait=dict(type='bool', required=False, default=True),
+        wait_timeout=dict(type='int', required=False, default=60),
+        wait_interval=dict(type='float', required=False, default=1.0)
+    )
+
+    # Build ansible Module
+    return AnsibleModule(
+        argument_spec=module_specification,
+        supports_check_mode=True
+    )
+
+
+# Instantiate Ansible Module
+def build_client(module: AnsibleModule):
+
+    try:
+
+        # Build Client from Module
+        return haproxy_client(module.params)
+
+    except ValueError:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Build Client] - Failed Build HA Proxy Dataplane API Client"
+        )
+
+
+# Porcess Module Execution
+def run_module(module: AnsibleModule, client: Client):
+
+    # Reloads to Wait for (the Requested one, or all the Pending ones)
+    reload_ids = [module.params['reload_id']] if module.params['reload_id'] else get_pending_reloads(module=module, client=client)
+
+    # If in Check Mode
+    if module.check_mode:
+
+        # Module Response (Nothing Forced nor Waited for)
+        module.exit_json(
+            changed=bool(reload_ids) or module.params['force'],
+            reload_ids=reload_ids,
+            reloads=[],
+            msg="{0} Pending HA Proxy Reloads".format(len(reload_ids)),
+            metrics=request_metrics(client)
+        )
+
+    # If Reload is Forced
+    if module.params['force']:
+
+        # Force Reload
+        force_reload(module=module, client=client)
+
+    # Reloads Run
+    reloads = []
+
+    # If Reloads are Waited for
+    if module.params['wait']:
+
+        # Wait for each Reload
+        reloads = [wait_reload(module=module, client=client, reload_id=reload_id) for reload_id in reload_ids]
+
+    # Failed Reloads
+    failed = [reload for reload in reloads if reload.get('status') == client.reload.STATUS_FAILED]
+
+    # If any Reload Failed
+    if failed:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Reload] - HA Proxy Reloads Failed : {0}".format(', '.join(reload['id'] for reload in failed)),
+            changed=True,
+            reload_ids=reload_ids,
+            reloads=reloads,
+            metrics=request_metrics(client)
+        )
+
+    # Module Response
+    module.exit_json(
+        changed=bool(reload_ids) or module.params['force'],
+        reload_ids=reload_ids,
+        reloads=reloads,
+        msg="HA Proxy Reloaded ({0} Pending Reloads{1})".format(
+            len(reload_ids),
+            ", Forced" if module.params['force'] else ""
+        ) if reload_ids or module.params['force'] else "No Pending HA Proxy Reload",
+        metrics=request_metrics(client)
+    )
+
+
+# Entrypoint Function
+def main():
+
+    # Build Module
+    module = build_ansible_module()
+
+    # Build Client from Module
+    client = build_client(module)
+
+    # Execute Module
+    run_module(module, client)
+
+
+# If file is executed directly
+if __name__ == '__main__':
+
+    # Launch Entrypoint
+    main()
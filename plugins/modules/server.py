@@ -23,6 +23,7 @@ options:
     base_url:
         description:
         - The HA Proxy Dataplane API Base URL
+        - Or the Unix domain socket of the Dataplane API (V(unix:///var/run/data-plane.sock)), when the module runs on the HA Proxy host
         required: true
         type: str
     username:
@@ -41,6 +42,21 @@ options:
         required: false
         default: 'v2'
         type: str
+    trace_file:
+        description:
+        - The JSON lines file each Dataplane API request is appended to (on the host running the module)
+        - Each line holds the request method, URI template, status, bytes sent and received, and latency
+        required: false
+        type: path
+        version_added: "2.4.0"
+    snapshot_cache_dir:
+        description:
+        - The Configuration Snapshot cache directory (on the host running the module)
+        - If provided, the existing objects are looked up in a snapshot of their configuration section,
+          fetched once per Configuration Version and shared by all the tasks of the play
+        required: false
+        type: path
+        version_added: "2.4.0"
     transaction_id:
         description:
         - The Transaction ID
@@ -53,6 +69,16 @@ options:
         required: false
         default: true
         type: bool
+    upsert:
+        description:
+        - Create the server without looking it up first, and only look it up (then update it if it differs)
+          when the creation fails because it already exists
+        - Saves the lookup request when the server is new, at the cost of a failed creation when it already exists
+        - Only used with O(state=present), outside check mode
+        required: false
+        default: false
+        type: bool
+        version_added: "2.4.0"
     parent_name:
         description:
         - The Server Parent Name
@@ -312,6 +338,34 @@ options:
         required: false
         type: str
         choices: ['SSLv3', 'TLSv1_0', 'TLSv1_1', 'TLSv1_2', 'TLSv1_3']
+    runtime:
+        description:
+            - Apply the change through the Runtime API, without reloading HA Proxy
+            - The Server must exist and only O(admin_state), O(address), O(port) and O(weight) may change
+            - O(admin_state) is applied on the runtime servers endpoint, O(address), O(port) and O(weight) are written to the
+              configuration outside any transaction with force_reload disabled, so the Data Plane API applies them at runtime
+            - Cannot be used with O(transaction_id)
+        required: false
+        default: false
+        type: bool
+        version_added: "2.4.0"
+    admin_state:
+        description:
+            - The Server Runtime Administrative State (requires O(runtime=true))
+        required: false
+        type: str
+        choices: ['READY', 'MAINT', 'DRAIN']
+        version_added: "2.4.0"
+    persist:
+        description:
+            - Also write the Runtime Administrative State to the configuration ('maintenance' field), with force_reload disabled,
+              so the state survives the next reload (the reload itself is left to the Data Plane API)
+            - V(MAINT) sets the maintenance flag, V(READY) only clears it when it is set (a missing flag already means disabled)
+            - The 'DRAIN' state has no configuration equivalent and is never persisted
+        required: false
+        default: false
+        type: bool
+        version_added: "2.4.0"
     state:
         description:
             - The Transaction State
@@ -339,6 +393,23 @@ EXAMPLES = r'''
     check: 'NONE'
     state: 'present'
 
+- name: "Put HA Proxy Server in Maintenance without Reload"
+  kube_cloud.haproxy.server:
+    base_url: "http://localhost:5555"
+    username: "admin"
+    password: "admin"
+    api_version: "v2"
+    parent_name: "test_backend"
+    parent_type: "backend"
+    name: "server1"
+    address: "127.0.0.1"
+    port: 8080
+    weight: 50
+    runtime: true
+    admin_state: 'MAINT'
+    persist: true
+    state: 'present'
+
 - name: "Cancel HA Proxy Dataplane API Transaction"
   kube_cloud.haproxy.server:
     base_url: "http://localhost:5555"
@@ -355,10 +426,14 @@ EXAMPLES = r'''
 
 from ansible.module_utils.basic import AnsibleModule
 from ..module_utils.client_servers import ServerClient
-from ..module_utils.models import Server
+from ..module_utils.models import Server, RuntimeServer
 from ..module_utils.haproxy import haproxy_client
-from ..module_utils.enums import WebSocketProtocol, Requirement, EnableDisableEnum, SSLVersion
-from ..module_utils.commons import filter_none
+from ..module_utils.metrics import request_metrics
+from ..module_utils.enums import EnableDisableEnum, ServerAdminState
+from ..module_utils.builders import build_requested_server, build_server_specification
+from ..module_utils.commons import filter_none, unwrap_data
+from ..module_utils.diff import compute_diff, build_diff
+from ..module_utils.upsert import ACTION_CREATED, ACTION_UPDATED, ACTION_UNCHANGED
 
 try:
     from requests import HTTPError  # type: ignore
@@ -367,6 +442,18 @@ except ImportError:
     IMPORTS_OK = False
 
 
+# Upsert Outcome Messages
+UPSERT_MESSAGES = {
+    ACTION_CREATED: "Has Been Created",
+    ACTION_UPDATED: "Has Been Updated",
+    ACTION_UNCHANGED: "Not Changed"
+}
+
+
+# Configuration Fields Applied at Runtime by the Data Plane API (when written without Transaction nor Reload)
+RUNTIME_FIELDS = ('address', 'port', 'weight', 'maintenance')
+
+
 # Find and Return Server
 def get_server(client: ServerClient, name: str, parent_name: str, parent_type: str):
 
@@ -442,6 +529,33 @@ def create_server(module: AnsibleModule, client: ServerClient, transaction_id: s
         )
 
 
+# Upsert Server (Create, or Update if it Already Exists)
+def upsert_server(module: AnsibleModule, client: ServerClient, transaction_id: str, parent_name: str, parent_type: str, server: Server, force_reload: bool):
+
+    try:
+
+        # Call Client
+        return client.upsert_server(
+            server=server,
+            parent_name=parent_name,
+            parent_type=parent_type,
+            transaction_id=transaction_id,
+            force_reload=force_reload
+        )
+
+    except HTTPError as api_error:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Upsert Server] - Failed Upsert HA Proxy Server (Name : {0}, Parent : {1}:{2}): {3}".format(
+                server.name,
+                parent_name,
+                parent_type,
+                api_error
+            )
+        )
+
+
 # Delete Backend
 def delete_server(module: AnsibleModule, client: ServerClient, transaction_id: str,
                   name: str, parent_name: str, parent_type: str, force_reload: bool):
@@ -470,6 +584,52 @@ def delete_server(module: AnsibleModule, client: ServerClient, transaction_id: s
         )
 
 
+# Find and Return Runtime Server
+def get_runtime_server(module: AnsibleModule, client: ServerClient, name: str, backend: str):
+
+    try:
+
+        # Call Client
+        return client.get_runtime_server(
+            name=name,
+            backend=backend
+        )
+
+    except HTTPError as api_error:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Get Runtime Server] - Failed Get HA Proxy Runtime Server (Name :  {0}, Backend : {1}): {2}".format(
+                name,
+                backend,
+                api_error
+            )
+        )
+
+
+# Update Runtime Server
+def update_runtime_server(module: AnsibleModule, client: ServerClient, runtime_server: RuntimeServer, backend: str):
+
+    try:
+
+        # Call Client
+        return client.update_runtime_server(
+            runtime_server=runtime_server,
+            backend=backend
+        )
+
+    except HTTPError as api_error:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Update Runtime Server] - Failed Update HA Proxy Runtime Server (Name :  {0}, Backend : {1}): {2}".format(
+                runtime_server.name,
+                backend,
+                api_error
+            )
+        )
+
+
 # Instantiate Ansible Module
 def build_ansible_module():
 
@@ -479,59 +639,22 @@ def build_ansible_module():
         username=dict(type='str', required=True, no_log=True),
         password=dict(type='str', required=True, no_log=True),
         api_version=dict(type='str', required=False, default='v2'),
+        trace_file=dict(type='path', required=False),
+        snapshot_cache_dir=dict(type='path', required=False),
         transaction_id=dict(type='str', required=False, default=''),
         force_reload=dict(type='bool', required=False, default=True),
+        upsert=dict(type='bool', required=False, default=False),
         parent_name=dict(type='str', required=True),
         parent_type=dict(type='str', required=True, choices=['frontend', 'backend']),
-        name=dict(type='str', required=True),
-        address=dict(type='str', required=True),
-        port=dict(type='int', required=True),
-        verify=dict(type='str', required=False, choices=Requirement.names()),
-        verifyhost=dict(type='str', required=False),
-        weight=dict(type='int', required=False),
-        track=dict(type='str', required=False),
-        ws=dict(type='str', required=False, choices=WebSocketProtocol.names()),
-        check=dict(type='str', required=False, choices=EnableDisableEnum.names()),
-        health_check_address=dict(type='str', required=False),
-        health_check_port=dict(type='int', required=False),
-        max_reuse=dict(type='int', required=False),
-        maxconn=dict(type='int', required=False),
-        maxqueue=dict(type='int', required=False),
-        minconn=dict(type='int', required=False),
-        npn=dict(type='str', required=False),
-        fall=dict(type='int', required=False),
-        rise=dict(type='int', required=False),
-        inter=dict(type='int', required=False),
-        fastinter=dict(type='int', required=False),
-        error_limit=dict(type='int', required=False),
-        pool_low_conn=dict(type='int', required=False),
-        pool_max_conn=dict(type='int', required=False),
-        pool_purge_delay=dict(type='int', required=False),
-        proto=dict(type='str', required=False),
-        redir=dict(type='str', required=False),
-        resolve_opts=dict(type='str', required=False),
-        resolvers=dict(type='str', required=False),
-        ssl_cafile=dict(type='str', required=False),
-        ssl_certificate=dict(type='str', required=False),
-        tcp_ut=dict(type='int', required=False),
-        maintenance=dict(type='str', required=False, choices=EnableDisableEnum.names()),
-        no_sslv3=dict(type='str', required=False, choices=EnableDisableEnum.names()),
-        no_tlsv10=dict(type='str', required=False, choices=EnableDisableEnum.names()),
-        no_tlsv11=dict(type='str', required=False, choices=EnableDisableEnum.names()),
-        no_tlsv12=dict(type='str', required=False, choices=EnableDisableEnum.names()),
-        no_tlsv13=dict(type='str', required=False, choices=EnableDisableEnum.names()),
-        no_verifyhost=dict(type='str', required=False, choices=EnableDisableEnum.names()),
-        stick=dict(type='str', required=False, choices=EnableDisableEnum.names()),
-        tfo=dict(type='str', required=False, choices=EnableDisableEnum.names()),
-        send_proxy_v2_ssl=dict(type='str', required=False, choices=EnableDisableEnum.names()),
-        send_proxy_v2_ssl_cn=dict(type='str', required=False, choices=EnableDisableEnum.names()),
-        ssl_reuse=dict(type='str', required=False, choices=EnableDisableEnum.names()),
-        ssl=dict(type='str', required=False, choices=EnableDisableEnum.names()),
-        ssl_max_ver=dict(type='str', required=False, choices=SSLVersion.names()),
-        ssl_min_ver=dict(type='str', required=False, choices=SSLVersion.names()),
+        runtime=dict(type='bool', required=False, default=False),
+        admin_state=dict(type='str', required=False, choices=ServerAdminState.names()),
+        persist=dict(type='bool', required=False, default=False),
         state=dict(type='str', required=False, default='present', choices=['present', 'absent'])
     )
 
+    # Add Server Fields Specification
+    module_specification.update(build_server_specification())
+
     # Build ansible Module
     return AnsibleModule(
         argument_spec=module_specification,
@@ -555,52 +678,160 @@ def build_client(module: AnsibleModule):
         )
 
 
-# Build Requested Server from Configuration
-def build_requested_server(params: dict) -> Server:
+# Process Module Execution in Runtime Mode (No Reload)
+def run_runtime(module: AnsibleModule, client: ServerClient):
 
-    # Base Parameters Name
-    base_param_names = [
-        "name", "address", "port",
-        "verifyhost", "weight", "track", "health_check_address",
-        "health_check_port", "max_reuse", "maxconn", "maxqueue",
-        "minconn", "npn", "fall", "rise", "inter", "fastinter",
-        "error_limit", "pool_low_conn", "pool_max_conn",
-        "pool_purge_delay", "proto", "redir", "resolve_opts",
-        "resolvers", "ssl_cafile", "ssl_certificate", "tcp_ut"
-    ]
+    # Server Name
+    name = module.params['name']
 
-    # Build Requested Instance
-    server = Server(
-        **{k: v for k, v in params.items() if v is not None and k in base_param_names}
+    # Server Parent Name
+    parent_name = module.params['parent_name']
+
+    # Server Parent Type
+    parent_type = module.params['parent_type']
+
+    # Requested Administrative State
+    admin_state = ServerAdminState.create(module.params['admin_state'])
+
+    # If a Transaction is Provided (Runtime Changes are not Transactional)
+    if module.params['transaction_id']:
+
+        # Set Module Error
+        module.fail_json(msg="[Runtime Server] - 'runtime' cannot be used with 'transaction_id'")
+
+    # If the Server is not a Backend Server or is to be Deleted
+    if parent_type != 'backend' or module.params['state'] != 'present':
+
+        # Set Module Error
+        module.fail_json(msg="[Runtime Server] - 'runtime' only updates existing backend servers (state 'present')")
+
+    # Find Existing Instance
+    existing_instance = get_server(
+        client=client,
+        name=name,
+        parent_name=parent_name,
+        parent_type=parent_type
     )
 
-    # Initialize Enums
-    server.verify = Requirement.create(params.get('verify', None))
-    server.ws = WebSocketProtocol.create(params.get('ws', None))
-    server.check = EnableDisableEnum.create(params.get('check', None))
-    server.maintenance = EnableDisableEnum.create(params.get('maintenance', None))
-    server.no_sslv3 = EnableDisableEnum.create(params.get('no_sslv3', None))
-    server.no_tlsv10 = EnableDisableEnum.create(params.get('no_tlsv10', None))
-    server.no_tlsv11 = EnableDisableEnum.create(params.get('no_tlsv11', None))
-    server.no_tlsv12 = EnableDisableEnum.create(params.get('no_tlsv12', None))
-    server.no_tlsv13 = EnableDisableEnum.create(params.get('no_tlsv13', None))
-    server.no_verifyhost = EnableDisableEnum.create(params.get('no_verifyhost', None))
-    server.stick = EnableDisableEnum.create(params.get('stick', None))
-    server.tfo = EnableDisableEnum.create(params.get('tfo', None))
-    server.send_proxy_v2_ssl = EnableDisableEnum.create(params.get('send_proxy_v2_ssl', None))
-    server.send_proxy_v2_ssl_cn = EnableDisableEnum.create(params.get('send_proxy_v2_ssl_cn', None))
-    server.ssl_reuse = EnableDisableEnum.create(params.get('ssl_reuse', None))
-    server.ssl = EnableDisableEnum.create(params.get('ssl', None))
-    server.ssl_max_ver = SSLVersion.create(params.get('ssl_max_ver', None))
-    server.ssl_min_ver = SSLVersion.create(params.get('ssl_min_ver', None))
+    # If Instance don't exists (Servers cannot be Created at Runtime)
+    if not existing_instance:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Runtime Server] - Server Not Found [Parent : {0}/{1}, Name : {2}]".format(parent_name, parent_type, name)
+        )
 
     # Build Requested Instance
-    return server
+    server = build_requested_server(module.params)
+
+    # Existing Maintenance Flag (a missing Flag means Disabled)
+    existing_maintenance = (unwrap_data(existing_instance) or {}).get('maintenance') or EnableDisableEnum.DISABLED.value
+
+    # If the Maintenance State is Persisted
+    if module.params['persist'] and admin_state == ServerAdminState.MAINT:
+
+        # Persist State as Maintenance Flag
+        server.maintenance = EnableDisableEnum.ENABLED
+
+    # If the Ready State is Persisted and the Maintenance Flag is Set
+    elif module.params['persist'] and admin_state == ServerAdminState.READY and existing_maintenance != EnableDisableEnum.DISABLED.value:
+
+        # Clear Maintenance Flag
+        server.maintenance = EnableDisableEnum.DISABLED
+
+    # Compute Changed Configuration Fields
+    changes = compute_diff(existing_instance, server)
+
+    # Fields not Applicable at Runtime
+    rejected = sorted(field for field in changes if field not in RUNTIME_FIELDS)
+
+    # If any Changed Field needs a Reload
+    if rejected:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Runtime Server] - Fields {0} cannot be changed at runtime, use 'runtime: false'".format(', '.join(rejected))
+        )
+
+    # Find Runtime Instance
+    runtime_instance = get_runtime_server(module=module, client=client, name=name, backend=parent_name) if admin_state else None
+
+    # If Administrative State Changes
+    if admin_state and (runtime_instance or {}).get('admin_state') != admin_state.value:
+
+        # Add Runtime Change
+        changes['admin_state'] = dict(before=(runtime_instance or {}).get('admin_state'), after=admin_state.value)
+
+    # If Nothing Changes
+    if not changes:
+
+        # Initialize response (No Change)
+        module.exit_json(
+            msg="Server [Parent : {0}/{1}, Name : {2}] Not Changed".format(parent_name, parent_type, name),
+            changed=False,
+            metrics=request_metrics(client)
+        )
+
+    # If not in Check Mode
+    if not module.check_mode:
+
+        # If Administrative State Changes
+        if 'admin_state' in changes:
+
+            # Apply State at Runtime (Immediate)
+            update_runtime_server(
+                module=module,
+                client=client,
+                runtime_server=RuntimeServer(name=name, admin_state=admin_state),
+                backend=parent_name
+            )
+
+        # If Configuration Fields Change
+        if set(changes) - {'admin_state'}:
+
+            # Write Configuration without Reload (Applied at Runtime by the Data Plane API)
+            update_server(
+                module=module,
+                client=client,
+                transaction_id=None,
+                server=server,
+                name=name,
+                parent_name=parent_name,
+                parent_type=parent_type,
+                force_reload=False
+            )
+
+    # Module Response : Changed
+    module.exit_json(
+        changes=changes,
+        diff=dict(
+            before={field: change['before'] for field, change in changes.items()},
+            after={field: change['after'] for field, change in changes.items()}
+        ),
+        changed=True,
+        instance=filter_none(server),
+        parent_name=parent_name,
+        parent_type=parent_type,
+        msg="Server [Parent : {0}/{1}, Name : {2}] Has Been Updated at Runtime".format(parent_name, parent_type, name),
+        metrics=request_metrics(client)
+    )
 
 
 # Porcess Module Execution
 def run_module(module: AnsibleModule, client: ServerClient):
 
+    # If a Runtime State is Requested without Runtime Mode
+    if module.params['admin_state'] and not module.params['runtime']:
+
+        # Set Module Error (the State would be Ignored)
+        module.fail_json(msg="[Runtime Server] - 'admin_state' requires 'runtime: true'")
+
+    # If Runtime Mode is Requested
+    if module.params['runtime']:
+
+        # Process Runtime Change
+        run_runtime(module, client)
+
     # Extract Trasaction ID
     transaction_id = module.params['transaction_id']
 
@@ -619,6 +850,35 @@ def run_module(module: AnsibleModule, client: ServerClient):
     # Server Parent Type
     parent_type = module.params['parent_type']
 
+    # Build Requested Instance
+    server = build_requested_server(module.params)
+
+    # If Requested State is 'present' and Upsert is Requested (Create First, Lookup only if it Already Exists)
+    if module.params['upsert'] and state == 'present' and not module.check_mode:
+
+        # Upsert Instance
+        outcome = upsert_server(
+            module=module,
+            client=client,
+            transaction_id=transaction_id,
+            parent_name=parent_name,
+            parent_type=parent_type,
+            server=server,
+            force_reload=force_reload
+        )
+
+        # Module Response
+        module.exit_json(
+            changes=outcome['changes'],
+            diff=build_diff(outcome['before'], server),
+            changed=outcome['action'] != ACTION_UNCHANGED,
+            instance=filter_none(server),
+            parent_name=parent_name,
+            parent_type=parent_type,
+            msg="Server [Parent : {0}/{1}, Name : {2}] {3}".format(parent_name, parent_type, server.name, UPSERT_MESSAGES[outcome['action']]),
+            metrics=request_metrics(client)
+        )
+
     # Find Existing Instance
     existing_instance = get_server(
         client=client,
@@ -627,14 +887,14 @@ def run_module(module: AnsibleModule, client: ServerClient):
         parent_type=parent_type
     )
 
-    # Build Requested Instance
-    server = build_requested_server(module.params)
-
     # If Requested State is 'present' and Instance Already exists
     if existing_instance and state == 'present':
 
+        # Compute Changed Fields
+        changes = compute_diff(existing_instance, server)
+
         # If Existing Instance match requested Instance
-        if existing_instance == name:
+        if not changes:
 
             # Initialize response (No Change)
             module.exit_json(
@@ -643,23 +903,29 @@ def run_module(module: AnsibleModule, client: ServerClient):
                     parent_type,
                     server.name
                 ),
-                changed=False
+                changed=False,
+                metrics=request_metrics(client)
             )
 
-        # Update Existing Instance
-        update_server(
-            module=module,
-            client=client,
-            transaction_id=transaction_id,
-            server=server,
-            name=name,
-            parent_name=parent_name,
-            parent_type=parent_type,
-            force_reload=force_reload
-        )
+        # If not in Check Mode
+        if not module.check_mode:
+
+            # Update Existing Instance
+            update_server(
+                module=module,
+                client=client,
+                transaction_id=transaction_id,
+                server=server,
+                name=name,
+                parent_name=parent_name,
+                parent_type=parent_type,
+                force_reload=force_reload
+            )
 
         # Module Response : Changed
         module.exit_json(
+            changes=changes,
+            diff=build_diff(existing_instance, server),
             changed=True,
             instance=filter_none(server),
             parent_name=parent_name,
@@ -668,25 +934,30 @@ def run_module(module: AnsibleModule, client: ServerClient):
                 parent_name,
                 parent_type,
                 server.name
-            )
+            ),
+            metrics=request_metrics(client)
         )
 
     # If Requested State is 'present' and Instance don't exists
     if not existing_instance and state == 'present':
 
-        # Create Instance
-        create_server(
-            module=module,
-            client=client,
-            transaction_id=transaction_id,
-            force_reload=force_reload,
-            parent_name=parent_name,
-            parent_type=parent_type,
-            server=server
-        )
+        # If not in Check Mode
+        if not module.check_mode:
+
+            # Create Instance
+            create_server(
+                module=module,
+                client=client,
+                transaction_id=transaction_id,
+                force_reload=force_reload,
+                parent_name=parent_name,
+                parent_type=parent_type,
+                server=server
+            )
 
         # Initialize Module Response : Changed
         module.exit_json(
+            diff=build_diff(None, server),
             changed=True,
             instance=filter_none(server),
             parent_name=parent_name,
@@ -695,25 +966,30 @@ def run_module(module: AnsibleModule, client: ServerClient):
                 parent_name,
                 parent_type,
                 server.name
-            )
+            ),
+            metrics=request_metrics(client)
         )
 
     # If Requested State is 'absent' and Instance exists
     if existing_instance and state == 'absent':
 
-        # Delete Instance
-        delete_server(
-            module=module,
-            client=client,
-            transaction_id=transaction_id,
-            force_reload=force_reload,
-            name=server.name,
-            parent_name=parent_name,
-            parent_type=parent_type
-        )
+        # If not in Check Mode
+        if not module.check_mode:
+
+            # Delete Instance
+            delete_server(
+                module=module,
+                client=client,
+                transaction_id=transaction_id,
+                force_reload=force_reload,
+                name=server.name,
+                parent_name=parent_name,
+                parent_type=parent_type
+            )
 
         # Exit Module
         module.exit_json(
+            diff=build_diff(existing_instance, None),
             changed=True,
             instance=filter_none(server),
             parent_name=parent_name,
@@ -722,7 +998,8 @@ def run_module(module: AnsibleModule, client: ServerClient):
                 parent_name,
                 parent_type,
                 server.name
-            )
+            ),
+            metrics=request_metrics(client)
         )
 
     # If Requested State is 'absent' and Instance don't exists
@@ -735,7 +1012,8 @@ def run_module(module: AnsibleModule, client: ServerClient):
                 parent_type,
                 server.name
             ),
-            changed=False
+            changed=False,
+            metrics=request_metrics(client)
         )
 
 
@@ -0,0 +1,943 @@
+# (c) 2024, Jean-Jacques ETUNE NGI <jetune@kube-cloud.com>
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+
+DOCUMENTATION = '''
+---
+module: servers
+version_added: "2.4.0"
+short_description: Reconcile the Servers of a Parent
+description:
+    - Used to Manage all the HA Proxy Servers of a Backend (or Frontend) at once
+    - Fetch the current Servers once, compute the Create, Update and Delete operations locally
+      and apply them inside a single Transaction
+requirements:
+    - requests
+author: Jean-Jacques ETUNE NGI (@jetune) <jetune@kube-cloud.com>
+options:
+    base_url:
+        description:
+        - The HA Proxy Dataplane API Base URL
+        - Or the Unix domain socket of the Dataplane API (V(unix:///var/run/data-plane.sock)), when the module runs on the HA Proxy host
+        required: true
+        type: str
+    username:
+        description:
+        - The HA Proxy Dataplane API Admin Username
+        required: true
+        type: str
+    password:
+        description:
+        - The HA Proxy Dataplane API Password
+        required: true
+        type: str
+    api_version:
+        description:
+        - The HA Proxy Dataplane API Version
+        required: false
+        default: 'v2'
+        type: str
+    trace_file:
+        description:
+        - The JSON lines file each Dataplane API request is appended to (on the host running the module)
+        - Each line holds the request method, URI template, status, bytes sent and received, and latency
+        required: false
+        type: path
+        version_added: "2.4.0"
+    snapshot_cache_dir:
+        description:
+        - The Configuration Snapshot cache directory (on the host running the module)
+        - If provided, the existing objects are looked up in a snapshot of their configuration section,
+          fetched once per Configuration Version and shared by all the tasks of the play
+        required: false
+        type: path
+        version_added: "2.4.0"
+    transaction_id:
+        description:
+        - The Transaction ID
+        - If not provided, a Transaction is started, then committed once all the changes are applied
+        required: false
+        default: ""
+        type: str
+    force_reload:
+        description:
+        - Force reload HA Proxy Configuration (when the module commits its own Transaction)
+        required: false
+        default: true
+        type: bool
+    parent_name:
+        description:
+        - The Servers Parent Name
+        required: true
+        type: str
+    parent_type:
+        description:
+        - The Servers Parent Type
+        required: false
+        default: 'backend'
+        type: str
+        choices: ['backend', 'frontend']
+    servers:
+        description:
+        - The full desired list of Servers of the Parent
+        - Each item accepts the Server options of the M(kube_cloud.haproxy.server) module
+          (C(name), C(address) and C(port) are required)
+        required: true
+        type: list
+        elements: dict
+        suboptions:
+            name:
+                description:
+                - The Server Name
+                required: true
+                type: str
+            address:
+                description:
+                - The Server Address
+                required: true
+                type: str
+            port:
+                description:
+                - The Server Port
+                required: true
+                type: int
+            verify:
+                description:
+                    - The HA Proxy Server Configuration verify
+                required: false
+                type: str
+                choices: ['NONE', 'REQUIRED', 'OPTIONAL']
+            verifyhost:
+                description:
+                    - The HA Proxy Server Configuration verifyhost
+                required: false
+                type: str
+            weight:
+                description:
+                    - The HA Proxy Server Configuration weight
+                required: false
+                type: int
+            track:
+                description:
+                    - The HA Proxy Server Configuration track
+                required: false
+                type: str
+            ws:
+                description:
+                    - The HA Proxy Server Configuration ws
+                required: false
+                type: str
+                choices: ['AUTO', 'H1', 'H2']
+            check:
+                description:
+                    - The HA Proxy Server Configuration check
+                required: false
+                type: str
+                choices: ['ENABLED', 'DISABLED']
+            health_check_address:
+                description:
+                    - The HA Proxy Server Configuration health_check_address
+                required: false
+                type: str
+            health_check_port:
+                description:
+                    - The HA Proxy Server Configuration health_check_port
+                required: false
+                type: int
+            max_reuse:
+                description:
+                    - The HA Proxy Server Configuration max_reuse
+                required: false
+                type: int
+            maxconn:
+                description:
+                    - The HA Proxy Server Configuration maxconn
+                required: false
+                type: int
+            maxqueue:
+                description:
+                    - The HA Proxy Server Configuration maxqueue
+                required: false
+                type: int
+            minconn:
+                description:
+                    - The HA Proxy Server Configuration minconn
+                required: false
+                type: int
+            npn:
+                description:
+                    - The Backend Server Config Field 'npn'
+                required: false
+                type: str
+            fall:
+                description:
+                    - The Backend Server Config Field 'fall'
+                required: false
+                type: int
+            rise:
+                description:
+                    - The Backend Server Config Field 'rise'
+                required: false
+                type: int
+            inter:
+                description:
+                    - The Backend Server Config Field 'inter'
+                required: false
+                type: int
+            fastinter:
+                description:
+                    - The Backend Server Config Field 'fastinter'
+                required: false
+                type: int
+            error_limit:
+                description:
+                    - The Backend Server Config Field 'error_limit'
+                required: false
+                type: int
+            pool_low_conn:
+                description:
+                    - The Backend Server Config Field 'pool_low_conn'
+                required: false
+                type: int
+            pool_max_conn:
+                description:
+                    - The Backend Server Config Field 'pool_max_conn'
+                required: false
+                type: int
+            pool_purge_delay:
+                description:
+                    - The Backend Server Config Field 'pool_purge_delay'
+                required: false
+                type: int
+            proto:
+                description:
+                    - The Backend Server Config Field 'proto'
+                required: false
+                type: str
+            redir:
+                description:
+                    - The Backend Server Config Field 'redir'
+                required: false
+                type: str
+            resolve_opts:
+                description:
+                    - The Backend Server Config Field 'resolve_opts'
+                required: false
+                type: str
+            resolvers:
+                description:
+                    - The Backend Server Config Field 'resolvers'
+                required: false
+                type: str
+            ssl_cafile:
+                description:
+                    - The Backend Server Config Field 'ssl_cafile'
+                required: false
+                type: str
+            ssl_certificate:
+                description:
+                    - The Backend Server Config Field 'ssl_certificate'
+                required: false
+                type: str
+            tcp_ut:
+                description:
+                    - The Backend Server Config Field 'tcp_ut'
+                required: false
+                type: int
+            maintenance:
+                description:
+                    - The Backend Server Config Field 'maintenance'
+                required: false
+                type: str
+                choices: ['ENABLED', 'DISABLED']
+            no_sslv3:
+                description:
+                    - The Backend Server Config Field 'no_sslv3'
+                required: false
+                type: str
+                choices: ['ENABLED', 'DISABLED']
+            no_tlsv10:
+                description:
+                    - The Backend Server Config Field 'no_tlsv10'
+                required: false
+                type: str
+                choices: ['ENABLED', 'DISABLED']
+            no_tlsv11:
+                description:
+                    - The Backend Server Config Field 'no_tlsv11'
+                required: false
+                type: str
+                choices: ['ENABLED', 'DISABLED']
+            no_tlsv12:
+                description:
+                    - The Backend Server Config Field 'no_tlsv12'
+                required: false
+                type: str
+                choices: ['ENABLED', 'DISABLED']
+            no_tlsv13:
+                description:
+                    - The Backend Server Config Field 'no_tlsv13'
+                required: false
+                type: str
+                choices: ['ENABLED', 'DISABLED']
+            no_verifyhost:
+                description:
+                    - The Backend Server Config Field 'no_verifyhost'
+                required: false
+                type: str
+                choices: ['ENABLED', 'DISABLED']
+            stick:
+                description:
+                    - The Backend Server Config Field 'stick'
+                required: false
+                type: str
+                choices: ['ENABLED', 'DISABLED']
+            tfo:
+                description:
+                    - The Backend Server Config Field 'tfo'
+                required: false
+                type: str
+                choices: ['ENABLED', 'DISABLED']
+            send_proxy_v2_ssl:
+                description:
+                    - The Backend Server Config Field 'send_proxy_v2_ssl'
+                required: false
+                type: str
+                choices: ['ENABLED', 'DISABLED']
+            send_proxy_v2_ssl_cn:
+                description:
+                    - The Backend Server Config Field 'send_proxy_v2_ssl_cn'
+                required: false
+                type: str
+                choices: ['ENABLED', 'DISABLED']
+            ssl_reuse:
+                description:
+                    - The Backend Server Config Field 'ssl_reuse'
+                required: false
+                type: str
+                choices: ['ENABLED', 'DISABLED']
+            ssl:
+                description:
+                    - The Backend Server Config Field 'ssl'
+                required: false
+                type: str
+                choices: ['ENABLED', 'DISABLED']
+            ssl_max_ver:
+                description:
+                    - The Backend Server Config Field 'ssl_max_ver'
+                required: false
+                type: str
+                choices: ['SSLv3', 'TLSv1_0', 'TLSv1_1', 'TLSv1_2', 'TLSv1_3']
+            ssl_min_ver:
+                description:
+                    - The Backend Server Config Field 'ssl_min_ver'
+                required: false
+                type: str
+                choices: ['SSLv3', 'TLSv1_0', 'TLSv1_1', 'TLSv1_2', 'TLSv1_3']
+    purge:
+        description:
+        - Delete the existing Servers of the Parent that are not in the desired list
+        - Disabled by default, so a Server missing from the list is never deleted by mistake
+        required: false
+        default: false
+        type: bool
+    nodes:
+        description:
+        - Additional HA Proxy Dataplane API Base URLs (same credentials) to reconcile concurrently with O(base_url)
+        - The changes are staged in one Transaction per node, and committed only if they could be staged
+          on all the nodes (all the Transactions are cancelled otherwise); a per-node summary is returned
+        - Cannot be used with O(transaction_id)
+        required: false
+        default: []
+        type: list
+        elements: str
+    max_parallel:
+        description:
+        - The maximum number of concurrent requests (all nodes) when O(nodes) is provided
+        required: false
+        default: 10
+        type: int
+'''
+
+EXAMPLES = r'''
+- name: "Reconcile HA Proxy Servers of Backend"
+  kube_cloud.haproxy.servers:
+    base_url: "http://localhost:5555"
+    username: "admin"
+    password: "admin"
+    api_version: "v2"
+    parent_name: "app_backend"
+    parent_type: "backend"
+    servers:
+      - name: "app1"
+        address: "10.0.0.1"
+        port: 8080
+        check: 'ENABLED'
+      - name: "app2"
+        address: "10.0.0.2"
+        port: 8080
+        weight: 50
+    purge: true
+
+- name: "Reconcile HA Proxy Servers of Backend on all the Nodes"
+  kube_cloud.haproxy.servers:
+    base_url: "http://haproxy-1:5555"
+    nodes:
+      - "http://haproxy-2:5555"
+      - "http://haproxy-3:5555"
+    max_parallel: 10
+    username: "admin"
+    password: "admin"
+    parent_name: "app_backend"
+    servers:
+      - name: "app1"
+        address: "10.0.0.1"
+        port: 8080
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+from ..module_utils.haproxy import Client, haproxy_client
+from ..module_utils.metrics import RequestMetrics, request_metrics
+from ..module_utils.haproxy_async import AsyncClient, haproxy_nodes, run_on_nodes
+from ..module_utils.coordinator import TransactionCoordinator
+from ..module_utils.batch import TransactionBatch
+from ..module_utils.builders import build_requested_server, build_server_specification
+from ..module_utils.commons import filter_none, unwrap_data
+from ..module_utils.diff import build_diff, compute_diff
+
+try:
+    from requests import HTTPError  # type: ignore
+    IMPORTS_OK = True
+except ImportError:
+    IMPORTS_OK = False
+
+
+# Find and Return Existing Servers (By Name)
+def get_servers(module: AnsibleModule, client: Client, parent_name: str, parent_type: str):
+
+    try:
+
+        # Call Client
+        servers = unwrap_data(
+            client.server.get_servers(
+                parent_name=parent_name,
+                parent_type=parent_type
+            )
+        )
+
+    except HTTPError as api_error:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Get Servers] - Failed Get HA Proxy Servers (Parent : {0}:{1}): {2}".format(
+                parent_name,
+                parent_type,
+                api_error
+            )
+        )
+
+    # Return Servers by Name
+    return {server['name']: server for server in (servers or [])}
+
+
+# Instantiate Ansible Module
+def build_ansible_module():
+
+    # Build Module Arguments Specification
+    module_specification = dict(
+        base_url=dict(type='str', required=True),
+        username=dict(type='str', required=True, no_log=True),
+        password=dict(type='str', required=True, no_log=True),
+        api_version=dict(type='str', required=False, default='v2'),
+        trace_file=dict(type='path', required=False),
+        snapshot_cache_dir=dict(type='path', required=False),
+        transaction_id=dict(type='str', required=False, default=''),
+        force_reload=dict(type='bool', required=False, default=True),
+        parent_name=dict(type='str', required=True),
+        parent_type=dict(type='str', required=False, default='backend', choices=['frontend', 'backend']),
+        servers=dict(type='list', elements='dict', required=True, options=build_server_specification()),
+        purge=dict(type='bool', required=False, default=False),
+        nodes=dict(type='list', elements='str', required=False, default=[]),
+        max_parallel=dict(type='int', required=False, default=10)
+    )
+
+    # Build ansible Module
+    return AnsibleModule(
+        argument_spec=module_specification,
+        supports_check_mode=True
+    )
+
+
+# Instantiate Ansible Module
+def build_client(module: AnsibleModule):
+
+    try:
+
+        # Build Client from Module
+        return haproxy_client(module.params)
+
+    except ValueError:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Build Client] - Failed Build HA Proxy Dataplane API Client"
+        )
+
+
+# Build Requested Servers from Configuration
+def build_requested_servers(module: AnsibleModule):
+
+    # Requested Servers by Name
+    requested_servers = {}
+
+    # Iterate on Servers Configurations (Validated against the Server Fields Specification)
+    for params in module.params['servers']:
+
+        # If Server is Duplicated
+        if params['name'] in requested_servers:
+
+            # Set Module Error
+            module.fail_json(
+                msg="[Build Servers] - Server '{0}' is defined more than once".format(params['name'])
+            )
+
+        # Build Requested Server
+        requested_servers[params['name']] = build_requested_server(params)
+
+    # Return Requested Servers
+    return requested_servers
+
+
+# Compute Operations (Create, Update, Delete)
+def plan_changes(existing_servers: dict, requested_servers: dict, purge: bool):
+
+    # Initialize Operations
+    changes = []
+
+    # Iterate on Requested Servers
+    for name, server in requested_servers.items():
+
+        # If Server don't exists
+        if name not in existing_servers:
+
+            # Create Server
+            changes.append(dict(name=name, action='create', server=server, fields=sorted(filter_none(server))))
+            continue
+
+        # Compute Changed Fields
+        fields = compute_diff(existing_servers[name], server)
+
+        # If Server Changed
+        if fields:
+
+            # Update Server
+            changes.append(dict(name=name, action='update', server=server, fields=sorted(fields)))
+
+    # If Unlisted Servers must be Deleted
+    if purge:
+
+        # Iterate on Unlisted Servers
+        for name in sorted(set(existing_servers) - set(requested_servers)):
+
+            # Delete Server
+            changes.append(dict(name=name, action='delete', server=None, fields=[]))
+
+    # Return Operations
+    return changes
+
+
+# Apply one Operation in Transaction
+def apply_change(client: Client, change: dict, transaction_id: str, parent_name: str, parent_type: str):
+
+    # Create Server
+    if change['action'] == 'create':
+
+        # Call Client
+        return client.server.create_server(
+            server=change['server'],
+            transaction_id=transaction_id,
+            parent_name=parent_name,
+            parent_type=parent_type
+        )
+
+    # Update Server
+    if change['action'] == 'update':
+
+        # Call Client
+        return client.server.update_server(
+            name=change['name'],
+            server=change['server'],
+            transaction_id=transaction_id,
+            parent_name=parent_name,
+            parent_type=parent_type
+        )
+
+    # Delete Server
+    return client.server.delete_server(
+        name=change['name'],
+        transaction_id=transaction_id,
+        parent_name=parent_name,
+        parent_type=parent_type
+    )
+
+
+# Queue one Operation in a Transaction Batch
+def queue_change(batch: TransactionBatch, change: dict, parent_name: str, parent_type: str):
+
+    # Create Server
+    if change['action'] == 'create':
+
+        # Queue Operation
+        return batch.server.create_server(
+            server=change['server'],
+            parent_name=parent_name,
+            parent_type=parent_type
+        )
+
+    # Update Server
+    if change['action'] == 'update':
+
+        # Queue Operation
+        return batch.server.update_server(
+            name=change['name'],
+            server=change['server'],
+            parent_name=parent_name,
+            parent_type=parent_type
+        )
+
+    # Delete Server
+    return batch.server.delete_server(
+        name=change['name'],
+        parent_name=parent_name,
+        parent_type=parent_type
+    )
+
+
+# Apply Operations inside a single Transaction
+def apply_changes(module: AnsibleModule, client: Client, changes: list, parent_name: str, parent_type: str):
+
+    # Extract Trasaction ID
+    transaction_id = module.params['transaction_id']
+
+    # Transaction Batch (Owns a Transaction if none is Provided)
+    batch = client.transaction.batch(
+        force_reload=module.params['force_reload'],
+        transaction_id=transaction_id.strip() if transaction_id and transaction_id.strip() else None
+    )
+
+    try:
+
+        # Open Batch
+        with batch:
+
+            # Iterate on Operations
+            for change in changes:
+
+                # Queue Operation (Flushed Concurrently, then Committed Once)
+                queue_change(
+                    batch=batch,
+                    change=change,
+                    parent_name=parent_name,
+                    parent_type=parent_type
+                )
+
+    except HTTPError as api_error:
+
+        # Set Module Error (Owned Transaction is Cancelled by the Batch)
+        module.fail_json(
+            msg="[Apply Servers] - Failed Apply HA Proxy Servers (Parent : {0}:{1}): {2}".format(
+                parent_name,
+                parent_type,
+                api_error
+            )
+        )
+
+    # Return Transaction ID
+    return batch.transaction_id
+
+
+# Build the Planning Operation of a Node (Fleet Mode)
+def build_plan_operation(module: AnsibleModule, requested_servers: dict):
+
+    # Servers Parent Name
+    parent_name = module.params['parent_name']
+
+    # Servers Parent Type
+    parent_type = module.params['parent_type']
+
+    # Compute the Operations of a Node
+    async def plan_node(client: AsyncClient):
+
+        # Find Existing Servers (Single Request)
+        servers = unwrap_data(await client.server.get_servers(parent_name=parent_name, parent_type=parent_type))
+
+        # Return Operations
+        return plan_changes(
+            existing_servers={server['name']: server for server in (servers or [])},
+            requested_servers=requested_servers,
+            purge=module.params['purge']
+        )
+
+    # Return Operation
+    return plan_node
+
+
+# Build the Staging Operation of the Nodes (Fleet Mode)
+def build_stage_operation(module: AnsibleModule, node_changes: dict):
+
+    # Servers Parent Name
+    parent_name = module.params['parent_name']
+
+    # Servers Parent Type
+    parent_type = module.params['parent_type']
+
+    # Stage the Operations of a Node in its Transaction
+    async def stage_node(client: AsyncClient, transaction_id: str):
+
+        # Iterate on Node Operations
+        for change in node_changes[client.base_url]:
+
+            # Apply Operation (Asynchronous Client calls return Coroutines)
+            await apply_change(
+                client=client,
+                change=change,
+                transaction_id=transaction_id,
+                parent_name=parent_name,
+                parent_type=parent_type
+            )
+
+    # Return Operation
+    return stage_node
+
+
+# Process Module Execution on many Nodes (Fleet Mode)
+def run_fleet(module: AnsibleModule):
+
+    # Servers Parent Name
+    parent_name = module.params['parent_name']
+
+    # Servers Parent Type
+    parent_type = module.params['parent_type']
+
+    # If a Transaction is Provided
+    if module.params['transaction_id'] and module.params['transaction_id'].strip():
+
+        # Set Module Error (Transactions are Node specific)
+        module.fail_json(
+            msg="[Reconcile Servers] - 'transaction_id' cannot be used with 'nodes'"
+        )
+
+    # Requests Metrics (Shared by the Clients of all Nodes)
+    metrics = RequestMetrics(trace_file=module.params['trace_file'])
+
+    # Nodes Client Parameters
+    client_parameters = dict(
+        api_version=module.params['api_version'],
+        username=module.params['username'],
+        password=module.params['password'],
+        max_parallel=module.params['max_parallel'],
+        snapshot_cache_dir=module.params['snapshot_cache_dir'],
+        metrics=metrics
+    )
+
+    # Compute the Operations of all Nodes Concurrently
+    plans = run_on_nodes(
+        base_urls=haproxy_nodes(module.params),
+        operation=build_plan_operation(module, build_requested_servers(module)),
+        **client_parameters
+    )
+
+    # Initialize Nodes Summaries
+    summaries = [
+        dict(
+            base_url=plan['base_url'],
+            changed=bool(plan['result']),
+            changes=[dict(name=change['name'], action=change['action'], fields=change['fields']) for change in plan['result'] or []],
+            transaction_id=None,
+            committed=False,
+            error=plan['error']
+        ) for plan in plans
+    ]
+
+    # If any Node cannot be Read
+    if not all(plan['ok'] for plan in plans):
+
+        # Set Module Error (Nothing Applied)
+        module.fail_json(
+            msg="[Reconcile Servers] - Failed Get HA Proxy Servers (Parent : {0}:{1}) on Nodes : {2}".format(
+                parent_name,
+                parent_type,
+                ', '.join(plan['base_url'] for plan in plans if not plan['ok'])
+            ),
+            changed=False,
+            nodes=summaries
+        )
+
+    # Operations of the Changed Nodes
+    node_changes = {plan['base_url']: plan['result'] for plan in plans if plan['result']}
+
+    # If Changed and not in Check Mode
+    if node_changes and not module.check_mode:
+
+        # Apply Operations on all Changed Nodes (All or Nothing)
+        result = TransactionCoordinator(
+            base_urls=list(node_changes),
+            **client_parameters
+        ).run(
+            stage=build_stage_operation(module, node_changes),
+            force_reload=module.params['force_reload']
+        )
+
+        # Nodes Transactions Outcomes
+        outcomes = {node['base_url']: node for node in result['nodes']}
+
+        # Iterate on Nodes Summaries
+        for summary in summaries:
+
+            # Node Transaction Outcome
+            outcome = outcomes.get(summary['base_url'], {})
+
+            # Report Node Transaction
+            summary.update(
+                transaction_id=outcome.get('transaction_id'),
+                committed=outcome.get('committed', False),
+                error=outcome.get('error')
+            )
+
+        # If Operations are not Applied on all Nodes
+        if not result['ok']:
+
+            # Set Module Error
+            module.fail_json(
+                msg="[Reconcile Servers] - Failed Apply HA Proxy Servers (Parent : {0}:{1}) at phase '{2}' on Nodes : {3}".format(
+                    parent_name,
+                    parent_type,
+                    result['phase'],
+                    ', '.join(node['base_url'] for node in result['nodes'] if node['error'])
+                ),
+                changed=any(summary['committed'] for summary in summaries),
+                nodes=summaries
+            )
+
+    # Module Response
+    module.exit_json(
+        changed=bool(node_changes),
+        nodes=summaries,
+        parent_name=parent_name,
+        parent_type=parent_type,
+        msg="Servers [Parent : {0}/{1}] Have Been Reconciled on {2} Nodes".format(parent_name, parent_type, len(summaries)),
+        metrics=metrics.summary()
+    )
+
+
+# Porcess Module Execution
+def run_module(module: AnsibleModule, client: Client):
+
+    # If Additional Nodes are Provided
+    if module.params['nodes']:
+
+        # Reconcile all Nodes
+        run_fleet(module)
+
+    # Servers Parent Name
+    parent_name = module.params['parent_name']
+
+    # Servers Parent Type
+    parent_type = module.params['parent_type']
+
+    # Build Requested Servers
+    requested_servers = build_requested_servers(module)
+
+    # Find Existing Servers (Single Request)
+    existing_servers = get_servers(
+        module=module,
+        client=client,
+        parent_name=parent_name,
+        parent_type=parent_type
+    )
+
+    # Compute Operations
+    changes = plan_changes(
+        existing_servers=existing_servers,
+        requested_servers=requested_servers,
+        purge=module.params['purge']
+    )
+
+    # Per-Server Changes Report
+    report = [dict(name=change['name'], action=change['action'], fields=change['fields']) for change in changes]
+
+    # If Nothing Changed
+    if not changes:
+
+        # Initialize response (No Change)
+        module.exit_json(
+            msg="Servers [Parent : {0}/{1}] Not Changed".format(parent_name, parent_type),
+            changed=False,
+            changes=report,
+            metrics=request_metrics(client)
+        )
+
+    # If not in Check Mode
+    if not module.check_mode:
+
+        # Apply Operations
+        apply_changes(
+            module=module,
+            client=client,
+            changes=changes,
+            parent_name=parent_name,
+            parent_type=parent_type
+        )
+
+    # Build Servers Diff (Keyed by Server Name)
+    diff = dict(before={}, after={})
+
+    # Iterate on Operations
+    for change in changes:
+
+        # Build Server Diff
+        server_diff = build_diff(existing_servers.get(change['name']), change['server'])
+
+        # Add Server Diff
+        diff['before'][change['name']] = server_diff['before']
+        diff['after'][change['name']] = server_diff['after']
+
+    # Module Response : Changed
+    module.exit_json(
+        changed=True,
+        changes=report,
+        diff=diff,
+        created=[change['name'] for change in changes if change['action'] == 'create'],
+        updated=[change['name'] for change in changes if change['action'] == 'update'],
+        deleted=[change['name'] for change in changes if change['action'] == 'delete'],
+        parent_name=parent_name,
+        parent_type=parent_type,
+        msg="Servers [Parent : {0}/{1}] Have Been Reconciled".format(parent_name, parent_type),
+        metrics=request_metrics(client)
+    )
+
+
+# Entrypoint Function
+def main():
+
+    # Build Module
+    module = build_ansible_module()
+
+    # Build Client from Module
+    client = build_client(module)
+
+    # Execute Module
+    run_module(module, client)
+
+
+# If file is executed directly (pythos ovh_dns_record.py [not imported])
+if __name__ == '__main__':
+
+    # Launch Entrypoint
+    main()
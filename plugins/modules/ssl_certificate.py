@@ -23,6 +23,7 @@ options:
   base_url:
     description:
       - The HA Proxy Dataplane API Base URL
+      - Or the Unix domain socket of the Dataplane API (V(unix:///var/run/data-plane.sock)), when the module runs on the HA Proxy host
     required: true
     type: str
   username:
@@ -41,6 +42,13 @@ options:
     required: false
     default: 'v2'
     type: str
+  trace_file:
+    description:
+      - The JSON lines file each Dataplane API request is appended to (on the host running the module)
+      - Each line holds the request method, URI template, status, bytes sent and received, and latency
+    required: false
+    type: path
+    version_added: "2.4.0"
   name:
     description:
       - The Certificate Name
@@ -58,6 +66,16 @@ options:
     required: false
     default: true
     type: bool
+  skip_identical:
+    description:
+      - Skip the upload (and the reload) when the existing certificate has the same SHA-256 fingerprint as the local file
+      - The fingerprint covers the leaf certificate only, so a new private key or chain for the same certificate is not
+        uploaded when enabled; only enable it when the key and the chain never change without the certificate
+      - Needs a Data Plane API reporting 'sha256_finger_print', the certificate is uploaded otherwise
+    required: false
+    default: false
+    type: bool
+    version_added: "2.4.0"
   force_reload:
     description:
       - Force reload HA Proxy Configuration
@@ -99,6 +117,7 @@ EXAMPLES = r'''
 from ansible.module_utils.basic import AnsibleModule
 from ..module_utils.client_ssl_certificates import SslCertificateClient
 from ..module_utils.haproxy import haproxy_client
+from ..module_utils.metrics import request_metrics
 
 try:
     from requests import HTTPError  # type: ignore
@@ -200,9 +219,11 @@ def build_ansible_module():
         username=dict(type='str', required=True, no_log=True),
         password=dict(type='str', required=True, no_log=True),
         api_version=dict(type='str', required=False, default='v2'),
+        trace_file=dict(type='path', required=False),
         name=dict(type='str', required=True),
         path=dict(type='str', required=False, default=""),
         force_update=dict(type='bool', required=False, default=True),
+        skip_identical=dict(type='bool', required=False, default=False),
         force_reload=dict(type='bool', required=False, default=True),
         state=dict(type='str', required=False, default='present', choices=['present', 'absent'])
     )
@@ -258,14 +279,15 @@ def run_module(module: AnsibleModule, client: SslCertificateClient):
     if existing_certificate and state == 'present':
 
         # If Existing Instance match requested Instance
-        if not force_update:
+        if not force_update or (module.params['skip_identical'] and client.is_identical(existing_certificate, path)):
 
             # Initialize response (No Change)
             module.exit_json(
                 msg="Certificate [{0}] Not Changed".format(
                     name
                 ),
-                changed=False
+                changed=False,
+                metrics=request_metrics(client)
             )
 
         # Update Existing Instance
@@ -281,7 +303,8 @@ def run_module(module: AnsibleModule, client: SslCertificateClient):
         module.exit_json(
             changed=True,
             instance=existing_certificate,
-            msg="Certificate [{0}] Has Been Updated".format(name)
+            msg="Certificate [{0}] Has Been Updated".format(name),
+            metrics=request_metrics(client)
         )
 
     # If Requested State is 'present' and Instance don't exists
@@ -300,7 +323,8 @@ def run_module(module: AnsibleModule, client: SslCertificateClient):
         module.exit_json(
             changed=True,
             instance=certificate,
-            msg="Certificate[{0}] Has been Created".format(name)
+            msg="Certificate[{0}] Has been Created".format(name),
+            metrics=request_metrics(client)
         )
 
     # If Requested State is 'absent' and Instance exists
@@ -317,7 +341,8 @@ def run_module(module: AnsibleModule, client: SslCertificateClient):
         # Exit Module
         module.exit_json(
             msg="[{0}] Has been Deleted".format(name),
-            changed=True
+            changed=True,
+            metrics=request_metrics(client)
         )
 
     # If Requested State is 'absent' and Instance don't exists
@@ -326,7 +351,8 @@ def run_module(module: AnsibleModule, client: SslCertificateClient):
         # Initialize Response : No Change
         module.exit_json(
             msg="[{0}] Not Found".format(name),
-            changed=False
+            changed=False,
+            metrics=request_metrics(client)
         )
 
 
@@ -0,0 +1,266 @@
+# (c) 2024, Jean-Jacques ETUNE NGI <jetune@kube-cloud.com>
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+
+DOCUMENTATION = '''
+---
+module: ssl_certificates_sync
+version_added: "2.4.0"
+short_description: Synchronize SSL Certificates with a local directory
+description:
+  - Used to Synchronize the HA Proxy SSL Certificates Storage with a local directory of PEM files
+  - Only the missing and changed certificates are uploaded (and, optionally, the extra ones deleted),
+    concurrently, with a single HA Proxy reload at the end
+requirements:
+  - requests
+author: Jean-Jacques ETUNE NGI (@jetune) <jetune@kube-cloud.com>
+options:
+  base_url:
+    description:
+      - The HA Proxy Dataplane API Base URL
+      - Or the Unix domain socket of the Dataplane API (V(unix:///var/run/data-plane.sock)), when the module runs on the HA Proxy host
+    required: true
+    type: str
+  username:
+    description:
+      - The HA Proxy Dataplane API Admin Username
+    required: true
+    type: str
+  password:
+    description:
+      - The HA Proxy Dataplane API Password
+    required: true
+    type: str
+  api_version:
+    description:
+      - The HA Proxy Dataplane API Version
+    required: false
+    default: 'v2'
+    type: str
+  trace_file:
+    description:
+      - The JSON lines file each Dataplane API request is appended to (on the host running the module)
+      - Each line holds the request method, URI template, status, bytes sent and received, and latency
+    required: false
+    type: path
+    version_added: "2.4.0"
+  directory:
+    description:
+      - The local directory holding the PEM files (on the host running the module)
+      - The file name is used as the certificate storage name
+    required: true
+    type: path
+  pattern:
+    description:
+      - The file name pattern of the PEM files to synchronize
+    required: false
+    default: '*.pem'
+    type: str
+  delete:
+    description:
+      - Delete the stored certificates without local file
+    required: false
+    default: false
+    type: bool
+  force_reload:
+    description:
+      - Force reload HA Proxy Configuration once, with the last change
+      - If disabled, the changes are left to the Dataplane API delayed reload
+    required: false
+    default: true
+    type: bool
+  max_workers:
+    description:
+      - The maximum number of concurrent fingerprint computations and requests
+    required: false
+    default: 10
+    type: int
+notes:
+  - A stored certificate is identical to a local file if their leaf certificates have the same SHA-256 fingerprint
+    (the private key and the chain are not compared)
+  - In check mode, the changes are computed and returned but not applied
+'''
+
+EXAMPLES = r'''
+- name: "Synchronize HA Proxy SSL Certificates"
+  kube_cloud.haproxy.ssl_certificates_sync:
+    base_url: "http://localhost:5555"
+    username: "admin"
+    password: "admin"
+    api_version: "v2"
+    directory: "/etc/ssl/haproxy"
+    pattern: "*.pem"
+    delete: true
+    max_workers: 20
+'''
+
+import time
+
+from ansible.module_utils.basic import AnsibleModule
+from ..module_utils.client_ssl_certificates import SslCertificateClient
+from ..module_utils.haproxy import haproxy_client
+from ..module_utils.metrics import request_metrics
+
+try:
+    from requests import HTTPError  # type: ignore
+    IMPORTS_OK = True
+except ImportError:
+    IMPORTS_OK = False
+
+
+# Compute Certificates Changes
+def plan_sync(module: AnsibleModule, client: SslCertificateClient):
+
+    try:
+
+        # Call Client
+        return client.plan_sync(
+            directory=module.params['directory'],
+            pattern=module.params['pattern'],
+            delete=module.params['delete'],
+            max_workers=module.params['max_workers']
+        )
+
+    except (HTTPError, ValueError) as error:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Sync Certificates] - Failed Compare HA Proxy Certificates with [{0}] : {1}".format(
+                module.params['directory'],
+                error
+            )
+        )
+
+
+# Apply Certificates Changes
+def apply_sync(module: AnsibleModule, client: SslCertificateClient, changes: list):
+
+    # Call Client
+    return client.apply_sync(
+        changes=changes,
+        force_reload=module.params['force_reload'],
+        max_workers=module.params['max_workers']
+    )
+
+
+# Instantiate Ansible Module
+def build_ansible_module():
+
+    # Build Module Arguments Specification
+    module_specification = dict(
+        base_url=dict(type='str', required=True),
+        username=dict(type='str', required=True, no_log=True),
+        password=dict(type='str', required=True, no_log=True),
+        api_version=dict(type='str', required=False, default='v2'),
+        trace_file=dict(type='path', required=False),
+        directory=dict(type='path', required=True),
+        pattern=dict(type='str', required=False, default='*.pem'),
+        delete=dict(type='bool', required=False, default=False),
+        force_reload=dict(type='bool', required=False, default=True),
+        max_workers=dict(type='int', required=False, default=10)
+    )
+
+    # Build ansible Module
+    return AnsibleModule(
+        argument_spec=module_specification,
+        supports_check_mode=True
+    )
+
+
+# Instantiate Ansible Module
+def build_client(module: AnsibleModule):
+
+    try:
+
+        # Build Client from Module
+        return haproxy_client(module.params)
+
+    except ValueError:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Build Client] - Failed Build HA Proxy Dataplane API Client"
+        )
+
+
+# Porcess Module Execution
+def run_module(module: AnsibleModule, client: SslCertificateClient):
+
+    # Start Time
+    start = time.monotonic()
+
+    # Compute Changes
+    changes = plan_sync(module=module, client=client)
+
+    # Effective Changes
+    effective = [change for change in changes if change['action'] != 'none']
+
+    # If not in Check Mode
+    if not module.check_mode and effective:
+
+        # Apply Changes
+        changes = apply_sync(module=module, client=client, changes=changes)
+
+    # Names by Action
+    names = {
+        action: [change['name'] for change in changes if change['action'] == action]
+        for action in ('create', 'update', 'delete', 'none')
+    }
+
+    # Changes not Applied (Errors)
+    failed = [change for change in changes if change.get('error')]
+
+    # If any Change cannot be Applied
+    if failed:
+
+        # Set Module Error
+        module.fail_json(
+            msg="[Sync Certificates] - Failed Apply {0} of {1} HA Proxy Certificates Changes".format(len(failed), len(effective)),
+            changed=any(change.get('applied') for change in changes),
+            certificates=changes
+        )
+
+    # Module Response
+    module.exit_json(
+        changed=bool(effective),
+        certificates=changes,
+        created=names['create'],
+        updated=names['update'],
+        deleted=names['delete'],
+        unchanged=names['none'],
+        elapsed=round(time.monotonic() - start, 3),
+        msg="{0} Certificates {1} Synchronized ({2} created, {3} updated, {4} deleted)".format(
+            len(effective),
+            "would be" if module.check_mode else "are",
+            len(names['create']),
+            len(names['update']),
+            len(names['delete'])
+        ),
+        metrics=request_metrics(client)
+    )
+
+
+# Entrypoint Function
+def main():
+
+    # Build Module
+    module = build_ansible_module()
+
+    # Build Client from Module
+    client = build_client(module).ssl_certificate
+
+    # Execute Module
+    run_module(module, client)
+
+
+# If file is executed directly
+if __name__ == '__main__':
+
+    # Launch Entrypoint
+    main()
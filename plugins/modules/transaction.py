@@ -23,6 +23,7 @@ options:
   base_url:
     description:
       - The HA Proxy Dataplane API Base URL
+      - Or the Unix domain socket of the Dataplane API (V(unix:///var/run/data-plane.sock)), when the module runs on the HA Proxy host
     required: true
     type: str
   username:
@@ -41,6 +42,13 @@ options:
     required: false
     default: 'v2'
     type: str
+  trace_file:
+    description:
+      - The JSON lines file each Dataplane API request is appended to (on the host running the module)
+      - Each line holds the request method, URI template, status, bytes sent and received, and latency
+    required: false
+    type: path
+    version_added: "2.4.0"
   transaction_id:
     description:
       - The Transaction ID
@@ -86,6 +94,7 @@ EXAMPLES = r'''
 from ansible.module_utils.basic import AnsibleModule
 from ..module_utils.client_transactions import TransactionClient
 from ..module_utils.haproxy import haproxy_client
+from ..module_utils.metrics import request_metrics
 
 try:
     from requests import HTTPError  # type: ignore
@@ -163,6 +172,7 @@ def build_ansible_module():
         username=dict(type='str', required=True, no_log=True),
         password=dict(type='str', required=True, no_log=True),
         api_version=dict(type='str', required=False, default='v2'),
+        trace_file=dict(type='path', required=False),
         transaction_id=dict(type='str', required=False, default=''),
         force_reload=dict(type='bool', required=False, default=True),
         state=dict(type='str', required=False, default='committed', choices=['committed', 'cancelled'])
@@ -223,7 +233,8 @@ def run_module(module: AnsibleModule, client: TransactionClient):
         # Module Response : Changed
         module.exit_json(
             changed=True,
-            msg="Transaction [ID : {0}, Reload : {1}] Has Been Committed".format(transaction_id, force_reload)
+            msg="Transaction [ID : {0}, Reload : {1}] Has Been Committed".format(transaction_id, force_reload),
+            metrics=request_metrics(client)
         )
 
     # If Requested State is 'committed' and Instance Not exists
@@ -247,7 +258,8 @@ def run_module(module: AnsibleModule, client: TransactionClient):
         # Exit Module
         module.exit_json(
             msg="Transaction [ID : {0}] Has been Cancelled".format(transaction_id),
-            changed=True
+            changed=True,
+            metrics=request_metrics(client)
         )
 
     # If Requested State is 'absent' and Instance don't exists
@@ -256,7 +268,8 @@ def run_module(module: AnsibleModule, client: TransactionClient):
         # Initialize Response : No Change
         module.exit_json(
             msg="Transaction [ID : {0}] Not Found".format(transaction_id),
-            changed=False
+            changed=False,
+            metrics=request_metrics(client)
         )
 
 